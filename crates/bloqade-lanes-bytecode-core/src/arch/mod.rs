@@ -11,10 +11,12 @@
 //! - [`Word`], [`Grid`], [`Bus`], [`Zone`] — building blocks
 //! - [`LocationAddr`], [`LaneAddr`], [`ZoneAddr`] — bit-packed addresses
 //! - [`Direction`], [`MoveType`] — transport enums
+//! - [`ArchTables`] — precomputed dense lookups for hot queries
 
 pub mod addr;
 pub mod metrics;
 pub mod query;
+pub mod tables;
 pub mod types;
 pub mod validate;
 
@@ -23,5 +25,6 @@ pub use addr::{
 };
 pub use metrics::MotionModel;
 pub use query::ArchSpecLoadError;
+pub use tables::ArchTables;
 pub use types::{ArchSpec, Bus, Grid, Mode, TransportPath, Word, Zone};
 pub use validate::ArchSpecError;
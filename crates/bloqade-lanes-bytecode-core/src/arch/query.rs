@@ -4,6 +4,7 @@
 use std::collections::{HashMap, HashSet};
 use std::fmt;
 
+use rayon::prelude::*;
 use thiserror::Error;
 
 use super::addr::{Direction, LaneAddr, LocationAddr, MoveType, SiteRef, WordRef, ZonedWordRef};
@@ -376,6 +377,43 @@ impl ArchSpec {
         Some(wid * spw + sid)
     }
 
+    /// Number of locations across all zones: `zones × words × sites_per_word`.
+    ///
+    /// Together with [`Self::location_ordinal`] this enumerates every
+    /// location as `0..num_locations()`, for dense per-location tables.
+    pub fn num_locations(&self) -> usize {
+        self.zones.len() * self.words.len() * self.sites_per_word()
+    }
+
+    /// Dense ordinal of a location — O(1).
+    ///
+    /// Zone-major: `(zone_id * words + word_id) * sites_per_word + site_id`,
+    /// i.e. [`Self::zone_location_index`] offset by the zone. Returns `None`
+    /// if the zone, word or site is out of range.
+    pub fn location_ordinal(&self, loc: &LocationAddr) -> Option<usize> {
+        let zid = loc.zone_id as usize;
+        if zid >= self.zones.len() {
+            return None;
+        }
+        let index = self.zone_location_index(loc, loc.zone_id)?;
+        Some(zid * self.words.len() * self.sites_per_word() + index)
+    }
+
+    /// Inverse of [`Self::location_ordinal`].
+    pub fn location_at_ordinal(&self, ordinal: usize) -> Option<LocationAddr> {
+        if ordinal >= self.num_locations() {
+            return None;
+        }
+        let spw = self.sites_per_word();
+        let per_zone = self.words.len() * spw;
+        let index = ordinal % per_zone;
+        Some(LocationAddr {
+            zone_id: (ordinal / per_zone) as u32,
+            word_id: (index / spw) as u32,
+            site_id: (index % spw) as u32,
+        })
+    }
+
     /// Construct a candidate `LaneAddr` from the origin location and
     /// check whether its resolved endpoints match `(origin, target)`.
     fn check_lane_candidate(
@@ -525,10 +563,8 @@ impl ArchSpec {
     /// addressing scheme; callers depend only on this, not on the word/site
     /// layout.
     pub fn location_at(&self, zone_id: u32, row: u32, col: u32) -> Option<LocationAddr> {
-        // TODO: this does an O(words * sites) linear scan and rebuilds
-        // `word_zone_map()` on every call. Replace with a lazily-evaluated,
-        // cached `HashMap` keyed by `(zone_id, row, col) -> LocationAddr` so
-        // repeated lookups during compilation are O(1).
+        // O(words * sites) scan that rebuilds `word_zone_map()` on every
+        // call; repeated lookups should go through `ArchTables::location_at`.
         self.zones.get(zone_id as usize)?;
         let word_zone = self.word_zone_map();
         for (word_id, word) in self.words.iter().enumerate() {
@@ -854,6 +890,50 @@ impl ArchSpec {
         errors
     }
 
+    /// Validate many location groups at once, in parallel.
+    ///
+    /// Group `i` is `locations[offsets[i]..offsets[i + 1]]`, so `offsets` has
+    /// one more entry than there are groups and must be non-decreasing and
+    /// bounded by `locations.len()`. Returns `(group index, error)` pairs in
+    /// group order, each group's errors as [`Self::check_locations`] reports
+    /// them.
+    pub fn check_location_groups(
+        &self,
+        locations: &[LocationAddr],
+        offsets: &[usize],
+    ) -> Vec<(usize, LocationGroupError)> {
+        offsets
+            .par_windows(2)
+            .enumerate()
+            .flat_map_iter(|(group, bounds)| {
+                self.check_locations(&locations[bounds[0]..bounds[1]])
+                    .into_iter()
+                    .map(move |error| (group, error))
+            })
+            .collect()
+    }
+
+    /// Validate many lane groups at once, in parallel.
+    ///
+    /// Groups are delimited by `offsets` as in
+    /// [`Self::check_location_groups`]; each group's errors are those of
+    /// [`Self::check_lanes`].
+    pub fn check_lane_groups(
+        &self,
+        lanes: &[LaneAddr],
+        offsets: &[usize],
+    ) -> Vec<(usize, LaneGroupError)> {
+        offsets
+            .par_windows(2)
+            .enumerate()
+            .flat_map_iter(|(group, bounds)| {
+                self.check_lanes(&lanes[bounds[0]..bounds[1]])
+                    .into_iter()
+                    .map(move |error| (group, error))
+            })
+            .collect()
+    }
+
     /// Check AOD grid constraint: lane positions must form a complete grid
     /// (Cartesian product of unique X and Y values).
     pub fn check_lane_group_geometry(&self, lanes: &[LaneAddr]) -> Vec<String> {
@@ -878,20 +958,18 @@ impl ArchSpec {
         let unique_x: BTreeSet<u64> = positions.iter().map(|(x, _)| x.to_bits()).collect();
         let unique_y: BTreeSet<u64> = positions.iter().map(|(_, y)| y.to_bits()).collect();
 
-        let expected: BTreeSet<(u64, u64)> = unique_x
-            .iter()
-            .flat_map(|x| unique_y.iter().map(move |y| (*x, *y)))
-            .collect();
-
         let actual: BTreeSet<(u64, u64)> = positions
             .iter()
             .map(|(x, y)| (x.to_bits(), y.to_bits()))
             .collect();
 
-        if actual != expected {
+        // Every actual position lies on the unique_x × unique_y grid, so the
+        // grid is complete exactly when the counts match; no need to build it.
+        let expected = unique_x.len() * unique_y.len();
+        if actual.len() != expected {
             vec![format!(
                 "lanes do not form a complete grid: expected {} positions ({}x * {}y), got {} unique positions",
-                expected.len(),
+                expected,
                 unique_x.len(),
                 unique_y.len(),
                 actual.len()
@@ -1049,6 +1127,43 @@ mod tests {
         assert!(pos.is_none());
     }
 
+    // ── location ordinal tests ──
+
+    #[test]
+    fn test_location_ordinal_round_trips_every_location() {
+        let spec = make_valid_two_zone_spec();
+        assert_eq!(spec.num_locations(), 2 * 2 * 2);
+        for ordinal in 0..spec.num_locations() {
+            let loc = spec.location_at_ordinal(ordinal).unwrap();
+            assert_eq!(spec.location_ordinal(&loc), Some(ordinal));
+        }
+        assert!(spec.location_at_ordinal(spec.num_locations()).is_none());
+    }
+
+    #[test]
+    fn test_location_ordinal_rejects_out_of_range_addresses() {
+        let spec = make_valid_two_zone_spec();
+        for loc in [
+            LocationAddr {
+                zone_id: 2,
+                word_id: 0,
+                site_id: 0,
+            },
+            LocationAddr {
+                zone_id: 0,
+                word_id: 2,
+                site_id: 0,
+            },
+            LocationAddr {
+                zone_id: 0,
+                word_id: 0,
+                site_id: 2,
+            },
+        ] {
+            assert_eq!(spec.location_ordinal(&loc), None);
+        }
+    }
+
     // ── get_cz_partner tests ──
 
     #[test]
@@ -1566,6 +1681,31 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_check_location_groups_maps_errors_to_groups() {
+        let spec = make_valid_two_zone_spec();
+        let loc = |zone_id, site_id| LocationAddr {
+            zone_id,
+            word_id: 0,
+            site_id,
+        };
+        let locs = vec![loc(0, 0), loc(0, 1), loc(99, 0), loc(0, 0), loc(0, 0)];
+        let offsets = [0, 2, 2, 3, 5];
+
+        let errors = spec.check_location_groups(&locs, &offsets);
+
+        let groups: Vec<usize> = errors.iter().map(|(group, _)| *group).collect();
+        assert_eq!(groups, vec![2, 3]);
+        assert!(matches!(
+            errors[0].1,
+            LocationGroupError::InvalidAddress { zone_id: 99, .. }
+        ));
+        assert!(matches!(
+            errors[1].1,
+            LocationGroupError::DuplicateAddress { .. }
+        ));
+    }
+
     // ── Derived topology query tests (#464 phase 2) ──
 
     #[test]
@@ -0,0 +1,397 @@
+//! Dense, precomputed lookup tables for hot [`ArchSpec`] queries.
+//!
+//! The query methods on [`ArchSpec`] derive their answers from the raw
+//! topology on every call: `word_partner_map` and `word_zone_map` build
+//! fresh maps, `lane_for_endpoints` tries every bus, and `location_at`
+//! scans every word. [`ArchTables`] materializes those answers once,
+//! indexed by location ordinal (see [`ArchSpec::location_ordinal`]) and by
+//! lane ordinal (an index into [`ArchTables::lanes`]), so per-atom and
+//! per-lane lookups become array or hash-map reads.
+//!
+//! Every table entry is computed with the corresponding [`ArchSpec`]
+//! query, so table lookups return exactly what the direct query would.
+
+use std::collections::HashMap;
+
+use super::addr::{Direction, LaneAddr, LocationAddr, MoveType, ZonedWordRef};
+use super::metrics::MotionModel;
+use super::types::ArchSpec;
+
+/// Precomputed lookups for an [`ArchSpec`].
+///
+/// Built with [`ArchTables::new`]; holds no reference to the spec, so it
+/// can be shared (e.g. behind an `Arc`) alongside it. The tables describe
+/// the spec they were built from and must be rebuilt if it changes.
+#[derive(Debug, Clone, Default)]
+pub struct ArchTables {
+    num_zones: usize,
+    num_words: usize,
+    sites_per_word: usize,
+    /// Physical position per location ordinal.
+    positions: Vec<Option<(f64, f64)>>,
+    /// CZ partner per location ordinal.
+    cz_partners: Vec<Option<LocationAddr>>,
+    word_partners: HashMap<u32, u32>,
+    word_zones: HashMap<u32, u32>,
+    /// Every valid lane, grouped by zone, move type, bus and direction.
+    lanes: Vec<LaneAddr>,
+    /// `(src, dst)` per lane ordinal.
+    lane_endpoints: Vec<(LocationAddr, LocationAddr)>,
+    lane_ordinals: HashMap<LaneAddr, usize>,
+    /// `(src, dst)` → the lane [`ArchSpec::lane_for_endpoints`] picks.
+    lanes_by_endpoints: HashMap<(LocationAddr, LocationAddr), LaneAddr>,
+    /// `(zone_id, row, col)` → the location [`ArchSpec::location_at`] picks.
+    grid_locations: HashMap<(u32, u32, u32), LocationAddr>,
+}
+
+impl ArchTables {
+    /// Build the tables for `spec`.
+    ///
+    /// Does not require a validated spec: entries the direct queries cannot
+    /// resolve are stored as absent.
+    pub fn new(spec: &ArchSpec) -> Self {
+        let mut tables = Self {
+            num_zones: spec.zones.len(),
+            num_words: spec.words.len(),
+            sites_per_word: spec.sites_per_word(),
+            word_partners: spec.word_partner_map(),
+            word_zones: spec.word_zone_map(),
+            ..Self::default()
+        };
+
+        let num_locations = spec.num_locations();
+        tables.positions.reserve(num_locations);
+        tables.cz_partners.reserve(num_locations);
+        for ordinal in 0..num_locations {
+            let loc = spec
+                .location_at_ordinal(ordinal)
+                .expect("ordinal is below num_locations");
+            tables.positions.push(spec.location_position(&loc));
+            tables.cz_partners.push(spec.get_cz_partner(&loc));
+        }
+
+        for lane in candidate_lanes(spec) {
+            if tables.lane_ordinals.contains_key(&lane) {
+                continue;
+            }
+            let Some((src, dst)) = spec.lane_endpoints(&lane) else {
+                continue;
+            };
+            tables.lane_ordinals.insert(lane, tables.lanes.len());
+            tables.lanes.push(lane);
+            tables.lane_endpoints.push((src, dst));
+            tables
+                .lanes_by_endpoints
+                .entry((src, dst))
+                .or_insert_with(|| {
+                    spec.lane_for_endpoints(&src, &dst)
+                        .expect("a lane connects these endpoints")
+                });
+        }
+
+        for (word_id, word) in spec.words.iter().enumerate() {
+            let wid = word_id as u32;
+            let zone_id = tables.word_zones.get(&wid).copied().unwrap_or(0);
+            if zone_id as usize >= spec.zones.len() {
+                continue;
+            }
+            for (site_id, site) in word.sites.iter().enumerate() {
+                tables
+                    .grid_locations
+                    .entry((zone_id, site[1], site[0]))
+                    .or_insert(LocationAddr {
+                        zone_id,
+                        word_id: wid,
+                        site_id: site_id as u32,
+                    });
+            }
+        }
+
+        tables
+    }
+
+    /// Dense ordinal of a location; same as [`ArchSpec::location_ordinal`].
+    pub fn location_ordinal(&self, loc: &LocationAddr) -> Option<usize> {
+        let (zid, wid, sid) = (
+            loc.zone_id as usize,
+            loc.word_id as usize,
+            loc.site_id as usize,
+        );
+        if zid >= self.num_zones || wid >= self.num_words || sid >= self.sites_per_word {
+            return None;
+        }
+        Some((zid * self.num_words + wid) * self.sites_per_word + sid)
+    }
+
+    /// Number of location ordinals.
+    pub fn num_locations(&self) -> usize {
+        self.positions.len()
+    }
+
+    /// Physical `(x, y)` per location ordinal.
+    pub fn positions(&self) -> &[Option<(f64, f64)>] {
+        &self.positions
+    }
+
+    /// CZ partner per location ordinal.
+    pub fn cz_partners(&self) -> &[Option<LocationAddr>] {
+        &self.cz_partners
+    }
+
+    /// Every valid lane of the spec, in lane-ordinal order.
+    pub fn lanes(&self) -> &[LaneAddr] {
+        &self.lanes
+    }
+
+    /// `(src, dst)` per lane ordinal.
+    pub fn lane_endpoint_pairs(&self) -> &[(LocationAddr, LocationAddr)] {
+        &self.lane_endpoints
+    }
+
+    /// Index of `lane` in [`Self::lanes`], or `None` if it is not a valid lane.
+    pub fn lane_ordinal(&self, lane: &LaneAddr) -> Option<usize> {
+        self.lane_ordinals.get(lane).copied()
+    }
+
+    /// Table-backed [`ArchSpec::word_partner_map`].
+    pub fn word_partner_map(&self) -> &HashMap<u32, u32> {
+        &self.word_partners
+    }
+
+    /// Table-backed [`ArchSpec::word_zone_map`].
+    pub fn word_zone_map(&self) -> &HashMap<u32, u32> {
+        &self.word_zones
+    }
+
+    /// Table-backed [`ArchSpec::location_position`] for locations that have
+    /// an ordinal.
+    ///
+    /// Returns `None` both for unresolvable locations and for locations
+    /// outside the ordinal range; callers that must support unvalidated
+    /// specs with ragged words can fall back to the direct query when
+    /// [`Self::location_ordinal`] is `None`.
+    pub fn location_position(&self, loc: &LocationAddr) -> Option<(f64, f64)> {
+        self.positions[self.location_ordinal(loc)?]
+    }
+
+    /// Table-backed [`ArchSpec::get_cz_partner`] for locations that have an
+    /// ordinal.
+    pub fn get_cz_partner(&self, loc: &LocationAddr) -> Option<LocationAddr> {
+        self.cz_partners[self.location_ordinal(loc)?]
+    }
+
+    /// Table-backed [`ArchSpec::lane_endpoints`].
+    pub fn lane_endpoints(&self, lane: &LaneAddr) -> Option<(LocationAddr, LocationAddr)> {
+        Some(self.lane_endpoints[self.lane_ordinal(lane)?])
+    }
+
+    /// Table-backed [`ArchSpec::lane_for_endpoints`].
+    pub fn lane_for_endpoints(&self, src: &LocationAddr, dst: &LocationAddr) -> Option<LaneAddr> {
+        self.lanes_by_endpoints.get(&(*src, *dst)).copied()
+    }
+
+    /// Table-backed [`ArchSpec::location_at`].
+    pub fn location_at(&self, zone_id: u32, row: u32, col: u32) -> Option<LocationAddr> {
+        self.grid_locations.get(&(zone_id, row, col)).copied()
+    }
+
+    /// Duration (µs) of every lane under `model`, indexed by lane ordinal.
+    ///
+    /// A lane's path is its transport path in `spec` if it has one, else
+    /// the straight segment between its endpoints — the same rule as the
+    /// Python `ArchSpec.get_path`. A lane whose endpoints have no position
+    /// gets NaN.
+    pub fn lane_durations_us(
+        &self,
+        spec: &ArchSpec,
+        model: &MotionModel,
+        amplitude_delta: f64,
+    ) -> Vec<f64> {
+        let paths: HashMap<u64, &[[f64; 2]]> = spec
+            .paths
+            .iter()
+            .flatten()
+            .map(|tp| (tp.lane, tp.waypoints.as_slice()))
+            .collect();
+        let position = |loc: &LocationAddr| {
+            self.location_position(loc)
+                .or_else(|| spec.location_position(loc))
+        };
+        self.lanes
+            .iter()
+            .zip(&self.lane_endpoints)
+            .map(|(lane, (src, dst))| match paths.get(&lane.encode_u64()) {
+                Some(waypoints) => model.lane_duration_us(waypoints, amplitude_delta),
+                None => match (position(src), position(dst)) {
+                    (Some((x0, y0)), Some((x1, y1))) => {
+                        model.lane_duration_us(&[[x0, y0], [x1, y1]], amplitude_delta)
+                    }
+                    _ => f64::NAN,
+                },
+            })
+            .collect()
+    }
+}
+
+/// Every lane address that can pass [`ArchSpec::check_lane`]: bus sources
+/// crossed with the zone's membership lists (or every site, for zone
+/// buses), in both directions. May contain duplicates and invalid lanes;
+/// [`ArchTables::new`] filters both.
+fn candidate_lanes(spec: &ArchSpec) -> Vec<LaneAddr> {
+    let sites_per_word = spec.sites_per_word() as u32;
+    let mut lanes = Vec::new();
+    for (zone_idx, zone) in spec.zones.iter().enumerate() {
+        let zone_id = zone_idx as u32;
+        for (bus_id, bus) in zone.site_buses.iter().enumerate() {
+            for direction in [Direction::Forward, Direction::Backward] {
+                for &word_id in &zone.words_with_site_buses {
+                    for src in &bus.src {
+                        lanes.push(LaneAddr {
+                            direction,
+                            move_type: MoveType::SiteBus,
+                            zone_id,
+                            word_id,
+                            site_id: src.0 as u32,
+                            bus_id: bus_id as u32,
+                        });
+                    }
+                }
+            }
+        }
+        for (bus_id, bus) in zone.word_buses.iter().enumerate() {
+            for direction in [Direction::Forward, Direction::Backward] {
+                for src in &bus.src {
+                    for &site_id in &zone.sites_with_word_buses {
+                        lanes.push(LaneAddr {
+                            direction,
+                            move_type: MoveType::WordBus,
+                            zone_id,
+                            word_id: src.0 as u32,
+                            site_id,
+                            bus_id: bus_id as u32,
+                        });
+                    }
+                }
+            }
+        }
+    }
+    for (bus_id, bus) in spec.zone_buses.iter().enumerate() {
+        for direction in [Direction::Forward, Direction::Backward] {
+            for &ZonedWordRef { zone_id, word_id } in &bus.src {
+                for site_id in 0..sites_per_word {
+                    lanes.push(LaneAddr {
+                        direction,
+                        move_type: MoveType::ZoneBus,
+                        zone_id: zone_id as u32,
+                        word_id: word_id as u32,
+                        site_id,
+                        bus_id: bus_id as u32,
+                    });
+                }
+            }
+        }
+    }
+    lanes
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    const FULL_ARCH_JSON: &str = include_str!("../../../../examples/arch/full.json");
+
+    fn all_locations(spec: &ArchSpec) -> Vec<LocationAddr> {
+        (0..spec.num_locations())
+            .map(|i| spec.location_at_ordinal(i).unwrap())
+            .collect()
+    }
+
+    #[test]
+    fn test_location_tables_match_direct_queries() {
+        let spec = ArchSpec::from_json_validated(FULL_ARCH_JSON).unwrap();
+        let tables = ArchTables::new(&spec);
+        assert_eq!(tables.num_locations(), spec.num_locations());
+        for loc in all_locations(&spec) {
+            assert_eq!(tables.location_ordinal(&loc), spec.location_ordinal(&loc));
+            assert_eq!(tables.location_position(&loc), spec.location_position(&loc));
+            assert_eq!(tables.get_cz_partner(&loc), spec.get_cz_partner(&loc));
+        }
+        assert_eq!(tables.word_partner_map(), &spec.word_partner_map());
+        assert_eq!(tables.word_zone_map(), &spec.word_zone_map());
+    }
+
+    #[test]
+    fn test_lane_durations_follow_endpoint_segments() {
+        let spec = ArchSpec::from_json_validated(FULL_ARCH_JSON).unwrap();
+        let tables = ArchTables::new(&spec);
+        let model = MotionModel::default();
+        let durations = tables.lane_durations_us(&spec, &model, 1.0);
+        assert_eq!(durations.len(), tables.lanes().len());
+        for ((src, dst), &duration) in tables.lane_endpoint_pairs().iter().zip(&durations) {
+            let (x0, y0) = spec.location_position(src).unwrap();
+            let (x1, y1) = spec.location_position(dst).unwrap();
+            let expected = model.lane_duration_us(&[[x0, y0], [x1, y1]], 1.0);
+            assert_eq!(duration, expected);
+        }
+    }
+
+    #[test]
+    fn test_lane_tables_match_direct_queries() {
+        let spec = ArchSpec::from_json_validated(FULL_ARCH_JSON).unwrap();
+        let tables = ArchTables::new(&spec);
+        assert!(!tables.lanes().is_empty());
+        for (ordinal, lane) in tables.lanes().iter().enumerate() {
+            assert_eq!(tables.lane_ordinal(lane), Some(ordinal));
+            assert_eq!(tables.lane_endpoints(lane), spec.lane_endpoints(lane));
+        }
+        let locations = all_locations(&spec);
+        for src in &locations {
+            for dst in &locations {
+                assert_eq!(
+                    tables.lane_for_endpoints(src, dst),
+                    spec.lane_for_endpoints(src, dst),
+                    "{src:?} -> {dst:?}"
+                );
+            }
+        }
+    }
+
+    #[test]
+    fn test_grid_table_matches_location_at() {
+        let spec = ArchSpec::from_json_validated(FULL_ARCH_JSON).unwrap();
+        let tables = ArchTables::new(&spec);
+        for zone_id in 0..spec.zones.len() as u32 + 1 {
+            for row in 0..8 {
+                for col in 0..12 {
+                    assert_eq!(
+                        tables.location_at(zone_id, row, col),
+                        spec.location_at(zone_id, row, col)
+                    );
+                }
+            }
+        }
+    }
+
+    #[test]
+    fn test_out_of_range_addresses_are_absent() {
+        let spec = ArchSpec::from_json_validated(FULL_ARCH_JSON).unwrap();
+        let tables = ArchTables::new(&spec);
+        let loc = LocationAddr {
+            zone_id: 0,
+            word_id: spec.words.len() as u32,
+            site_id: 0,
+        };
+        assert_eq!(tables.location_ordinal(&loc), None);
+        assert_eq!(tables.location_position(&loc), None);
+        let lane = LaneAddr {
+            direction: Direction::Forward,
+            move_type: MoveType::SiteBus,
+            zone_id: 0,
+            word_id: 0,
+            site_id: 0,
+            bus_id: 99,
+        };
+        assert_eq!(tables.lane_ordinal(&lane), None);
+        assert_eq!(tables.lane_endpoints(&lane), None);
+    }
+}
@@ -4,6 +4,9 @@
 //! are located in the architecture as atoms move through transport lanes.
 //! It is the core data structure used by the IR analysis pipeline to simulate
 //! atom movement, detect collisions, and identify CZ gate pairings.
+//!
+//! [`DenseAtomState`] is its index-addressed, in-place twin for replaying a
+//! long sequence of move layers: convert once, step in place, convert back.
 
 use std::collections::{HashMap, HashSet};
 use std::hash::{Hash, Hasher};
@@ -250,31 +253,6 @@ impl AtomStateData {
         })
     }
 
-    /// Resolve each lane against the pre-move state into `(qubit, src, dst,
-    /// lane)` mover entries. Lanes whose source holds no atom contribute no
-    /// entry; a source consumed by an earlier lane is not consumed again
-    /// (first lane wins, matching first-match bus endpoint resolution).
-    ///
-    /// Returns `None` if any lane cannot be resolved to endpoints.
-    fn resolve_movers(
-        &self,
-        lanes: &[LaneAddr],
-        arch_spec: &ArchSpec,
-    ) -> Option<Vec<(u32, LocationAddr, LocationAddr, LaneAddr)>> {
-        let mut movers = Vec::with_capacity(lanes.len());
-        let mut seen_srcs: HashSet<LocationAddr> = HashSet::new();
-        for lane in lanes {
-            let (src, dst) = arch_spec.lane_endpoints(lane)?;
-            if !seen_srcs.insert(src) {
-                continue;
-            }
-            if let Some(&qubit) = self.locations_to_qubit.get(&src) {
-                movers.push((qubit, src, dst, *lane));
-            }
-        }
-        Some(movers)
-    }
-
     /// Apply a group of lane moves simultaneously and return the resulting
     /// state.
     ///
@@ -297,7 +275,7 @@ impl AtomStateData {
     /// bus, word, or site). The `prev_lanes` field is reset to contain only
     /// the lanes used in this call; `move_count` is accumulated.
     pub fn apply_moves(&self, lanes: &[LaneAddr], arch_spec: &ArchSpec) -> Option<Self> {
-        let mut movers = self.resolve_movers(lanes, arch_spec)?;
+        let mut movers = resolve_movers(|loc| self.get_qubit(loc), lanes, arch_spec)?;
         // Deterministic landing order regardless of lane slice order; only
         // observable through which qubit a `collision` entry is keyed on
         // when two movers contest one destination (ill-formed bus).
@@ -381,77 +359,7 @@ impl AtomStateData {
         lanes: &[LaneAddr],
         arch_spec: &ArchSpec,
     ) -> Result<ValidatedMoves, Vec<MoveValidationError>> {
-        let mut errors: Vec<MoveValidationError> = arch_spec
-            .check_lanes(lanes)
-            .into_iter()
-            .map(MoveValidationError::LaneGroup)
-            .collect();
-
-        // `lane_endpoints` fails exactly when `check_lane` already reported
-        // `InvalidLane`, so only surface `UnresolvableLane` when it would
-        // otherwise go unreported (a true shouldn't-happen).
-        let invalid_lane_reported = errors.iter().any(|e| {
-            matches!(
-                e,
-                MoveValidationError::LaneGroup(LaneGroupError::InvalidLane { .. })
-            )
-        });
-
-        // Duplicate lane addresses are reported by `check_lanes`; dedup here
-        // so a repeated lane doesn't also self-report as a contested
-        // destination or double-report an occupied one.
-        let mut seen_lanes: HashSet<u64> = HashSet::new();
-        let mut resolved: Vec<(LaneAddr, LocationAddr, LocationAddr)> =
-            Vec::with_capacity(lanes.len());
-        for lane in lanes {
-            if !seen_lanes.insert(lane.encode_u64()) {
-                continue;
-            }
-            match arch_spec.lane_endpoints(lane) {
-                Some((src, dst)) => resolved.push((*lane, src, dst)),
-                None if !invalid_lane_reported => {
-                    errors.push(MoveValidationError::UnresolvableLane { lane: *lane })
-                }
-                None => {}
-            }
-        }
-
-        let mover_srcs: HashSet<LocationAddr> = resolved
-            .iter()
-            .filter(|(_, src, _)| self.locations_to_qubit.contains_key(src))
-            .map(|&(_, src, _)| src)
-            .collect();
-
-        let mut claimed_dsts: HashMap<LocationAddr, LaneAddr> = HashMap::new();
-        for &(lane, _, dst) in &resolved {
-            if let Some(&occupant) = self.locations_to_qubit.get(&dst)
-                && !mover_srcs.contains(&dst)
-            {
-                errors.push(MoveValidationError::DestinationOccupiedByStationaryAtom {
-                    lane,
-                    dst,
-                    occupant,
-                });
-            }
-            if let Some(&first) = claimed_dsts.get(&dst) {
-                errors.push(MoveValidationError::ContestedDestination {
-                    dst,
-                    first,
-                    second: lane,
-                });
-            } else {
-                claimed_dsts.insert(dst, lane);
-            }
-        }
-
-        if !errors.is_empty() {
-            return Err(errors);
-        }
-
-        let movers = self
-            .resolve_movers(lanes, arch_spec)
-            .expect("all lanes resolved above");
-        Ok(ValidatedMoves { movers })
+        validate_moves(|loc| self.get_qubit(loc), lanes, arch_spec)
     }
 
     /// Apply a validated lane group and return the resulting state.
@@ -474,31 +382,7 @@ impl AtomStateData {
         &self,
         moves: &ValidatedMoves,
     ) -> Result<Self, Vec<MoveValidationError>> {
-        let mover_srcs: HashSet<LocationAddr> =
-            moves.movers.iter().map(|&(_, src, _, _)| src).collect();
-        let mut errors: Vec<MoveValidationError> = Vec::new();
-        for &(qubit, src, dst, lane) in &moves.movers {
-            if self.locations_to_qubit.get(&src) != Some(&qubit) {
-                errors.push(MoveValidationError::StaleMoverSource {
-                    lane,
-                    src,
-                    expected: qubit,
-                });
-                continue;
-            }
-            if let Some(&occupant) = self.locations_to_qubit.get(&dst)
-                && !mover_srcs.contains(&dst)
-            {
-                errors.push(MoveValidationError::DestinationOccupiedByStationaryAtom {
-                    lane,
-                    dst,
-                    occupant,
-                });
-            }
-        }
-        if !errors.is_empty() {
-            return Err(errors);
-        }
+        check_token(|loc| self.get_qubit(loc), moves)?;
 
         let mut qubit_to_locations = self.qubit_to_locations.clone();
         let mut locations_to_qubit = self.locations_to_qubit.clone();
@@ -547,60 +431,532 @@ impl AtomStateData {
         zone: &ZoneAddr,
         arch_spec: &ArchSpec,
     ) -> Option<(Vec<u32>, Vec<u32>, Vec<u32>)> {
-        // In the zone-centric model, all zones share the same words.
-        // Filter qubits by checking if their zone_id matches the requested zone.
-        let _zone_data = arch_spec.zone_by_id(zone.zone_id)?;
-        let zone_id = zone.zone_id;
+        // Sort by qubit id for deterministic iteration order
+        let mut sorted_qubits: Vec<(u32, LocationAddr)> = self
+            .qubit_to_locations
+            .iter()
+            .map(|(&qubit, &loc)| (qubit, loc))
+            .collect();
+        sorted_qubits.sort_by_key(|&(qubit, _)| qubit);
+        qubit_pairing(sorted_qubits, |loc| self.get_qubit(loc), zone, arch_spec)
+    }
+}
+impl Default for AtomStateData {
+    fn default() -> Self {
+        Self::new()
+    }
+}
 
-        let mut controls = Vec::new();
-        let mut targets = Vec::new();
-        let mut unpaired = Vec::new();
-        let mut visited = std::collections::HashSet::new();
+/// Pair the qubits of `zone` with their CZ partners; the shared body of the
+/// `get_qubit_pairing` methods. `qubit_locations` must be sorted by qubit id.
+fn qubit_pairing(
+    qubit_locations: impl IntoIterator<Item = (u32, LocationAddr)>,
+    occupant_at: impl Fn(&LocationAddr) -> Option<u32>,
+    zone: &ZoneAddr,
+    arch_spec: &ArchSpec,
+) -> Option<(Vec<u32>, Vec<u32>, Vec<u32>)> {
+    // In the zone-centric model, all zones share the same words.
+    // Filter qubits by checking if their zone_id matches the requested zone.
+    let _zone_data = arch_spec.zone_by_id(zone.zone_id)?;
+    let zone_id = zone.zone_id;
+
+    let mut controls = Vec::new();
+    let mut targets = Vec::new();
+    let mut unpaired = Vec::new();
+    let mut visited = HashSet::new();
+
+    for (qubit, loc) in qubit_locations {
+        if !visited.insert(qubit) {
+            continue;
+        }
 
-        // Sort by qubit id for deterministic iteration order
-        let mut sorted_qubits: Vec<_> = self.qubit_to_locations.iter().collect();
-        sorted_qubits.sort_by_key(|(qubit, _)| **qubit);
+        if loc.zone_id != zone_id {
+            continue;
+        }
 
-        for (qubit, loc) in &sorted_qubits {
-            let qubit = **qubit;
-            let loc = **loc;
-            if visited.contains(&qubit) {
-                continue;
+        let Some(blockaded) = arch_spec.get_cz_partner(&loc) else {
+            unpaired.push(qubit);
+            continue;
+        };
+
+        let Some(target_qubit) = occupant_at(&blockaded) else {
+            unpaired.push(qubit);
+            continue;
+        };
+
+        controls.push(qubit);
+        targets.push(target_qubit);
+        visited.insert(target_qubit);
+    }
+
+    Some((controls, targets, unpaired))
+}
+
+/// Resolve each lane against the pre-move occupancy into `(qubit, src, dst,
+/// lane)` mover entries. Lanes whose source holds no atom contribute no
+/// entry; a source consumed by an earlier lane is not consumed again (first
+/// lane wins, matching first-match bus endpoint resolution).
+///
+/// Returns `None` if any lane cannot be resolved to endpoints.
+fn resolve_movers(
+    occupant_at: impl Fn(&LocationAddr) -> Option<u32>,
+    lanes: &[LaneAddr],
+    arch_spec: &ArchSpec,
+) -> Option<Vec<(u32, LocationAddr, LocationAddr, LaneAddr)>> {
+    let mut movers = Vec::with_capacity(lanes.len());
+    let mut seen_srcs: HashSet<LocationAddr> = HashSet::new();
+    for lane in lanes {
+        let (src, dst) = arch_spec.lane_endpoints(lane)?;
+        if !seen_srcs.insert(src) {
+            continue;
+        }
+        if let Some(qubit) = occupant_at(&src) {
+            movers.push((qubit, src, dst, *lane));
+        }
+    }
+    Some(movers)
+}
+
+/// [`AtomStateData::validate_moves`] against an arbitrary occupancy lookup,
+/// shared with [`DenseAtomState::validate_moves`].
+fn validate_moves(
+    occupant_at: impl Fn(&LocationAddr) -> Option<u32>,
+    lanes: &[LaneAddr],
+    arch_spec: &ArchSpec,
+) -> Result<ValidatedMoves, Vec<MoveValidationError>> {
+    let mut errors: Vec<MoveValidationError> = arch_spec
+        .check_lanes(lanes)
+        .into_iter()
+        .map(MoveValidationError::LaneGroup)
+        .collect();
+
+    // `lane_endpoints` fails exactly when `check_lane` already reported
+    // `InvalidLane`, so only surface `UnresolvableLane` when it would
+    // otherwise go unreported (a true shouldn't-happen).
+    let invalid_lane_reported = errors.iter().any(|e| {
+        matches!(
+            e,
+            MoveValidationError::LaneGroup(LaneGroupError::InvalidLane { .. })
+        )
+    });
+
+    // Duplicate lane addresses are reported by `check_lanes`; dedup here
+    // so a repeated lane doesn't also self-report as a contested
+    // destination or double-report an occupied one.
+    let mut seen_lanes: HashSet<u64> = HashSet::new();
+    let mut resolved: Vec<(LaneAddr, LocationAddr, LocationAddr)> = Vec::with_capacity(lanes.len());
+    for lane in lanes {
+        if !seen_lanes.insert(lane.encode_u64()) {
+            continue;
+        }
+        match arch_spec.lane_endpoints(lane) {
+            Some((src, dst)) => resolved.push((*lane, src, dst)),
+            None if !invalid_lane_reported => {
+                errors.push(MoveValidationError::UnresolvableLane { lane: *lane })
             }
-            visited.insert(qubit);
+            None => {}
+        }
+    }
 
-            if loc.zone_id != zone_id {
-                continue;
+    let mover_srcs: HashSet<LocationAddr> = resolved
+        .iter()
+        .filter(|(_, src, _)| occupant_at(src).is_some())
+        .map(|&(_, src, _)| src)
+        .collect();
+
+    let mut claimed_dsts: HashMap<LocationAddr, LaneAddr> = HashMap::new();
+    for &(lane, _, dst) in &resolved {
+        if let Some(occupant) = occupant_at(&dst)
+            && !mover_srcs.contains(&dst)
+        {
+            errors.push(MoveValidationError::DestinationOccupiedByStationaryAtom {
+                lane,
+                dst,
+                occupant,
+            });
+        }
+        if let Some(&first) = claimed_dsts.get(&dst) {
+            errors.push(MoveValidationError::ContestedDestination {
+                dst,
+                first,
+                second: lane,
+            });
+        } else {
+            claimed_dsts.insert(dst, lane);
+        }
+    }
+
+    if !errors.is_empty() {
+        return Err(errors);
+    }
+
+    let movers = resolve_movers(occupant_at, lanes, arch_spec).expect("all lanes resolved above");
+    Ok(ValidatedMoves { movers })
+}
+
+/// Reject a [`ValidatedMoves`] token that no longer matches the occupancy it
+/// is about to be applied to: every mover must still sit at its recorded
+/// source, and no destination may have gained a stationary occupant.
+fn check_token(
+    occupant_at: impl Fn(&LocationAddr) -> Option<u32>,
+    moves: &ValidatedMoves,
+) -> Result<(), Vec<MoveValidationError>> {
+    let mover_srcs: HashSet<LocationAddr> =
+        moves.movers.iter().map(|&(_, src, _, _)| src).collect();
+    let mut errors: Vec<MoveValidationError> = Vec::new();
+    for &(qubit, src, dst, lane) in &moves.movers {
+        if occupant_at(&src) != Some(qubit) {
+            errors.push(MoveValidationError::StaleMoverSource {
+                lane,
+                src,
+                expected: qubit,
+            });
+            continue;
+        }
+        if let Some(occupant) = occupant_at(&dst)
+            && !mover_srcs.contains(&dst)
+        {
+            errors.push(MoveValidationError::DestinationOccupiedByStationaryAtom {
+                lane,
+                dst,
+                occupant,
+            });
+        }
+    }
+    if errors.is_empty() {
+        Ok(())
+    } else {
+        Err(errors)
+    }
+}
+
+/// Sentinel in [`DenseAtomState`]'s occupancy table for an empty location.
+const EMPTY: u32 = u32::MAX;
+
+/// Index-addressed, in-place counterpart of [`AtomStateData`] for replaying
+/// many move layers.
+///
+/// Carries the same five fields as [`AtomStateData`], but as dense tables:
+/// qubits are numbered `0..n` in id order, their locations live in a
+/// qubit-indexed `Vec`, and the reverse map is a `Vec<u32>` indexed by
+/// [`ArchSpec::location_ordinal`]. A move step therefore touches O(movers)
+/// entries in place instead of cloning five hash maps.
+///
+/// Convert at the ends of a replay with [`Self::from_state`] and
+/// [`Self::to_state`]; in between, [`Self::validate_moves`],
+/// [`Self::apply_validated`] and [`Self::apply_moves`] follow exactly the
+/// semantics of their [`AtomStateData`] namesakes.
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub struct DenseAtomState {
+    /// `(zones, words, sites_per_word)` of the arch the ordinals refer to.
+    shape: (usize, usize, usize),
+    /// Sorted qubit ids; a qubit's position here is its dense index.
+    qubit_ids: Vec<u32>,
+    /// Dense qubit index → current location (`None` once collided).
+    locations: Vec<Option<LocationAddr>>,
+    /// Location ordinal → dense qubit index, or [`EMPTY`].
+    occupants: Vec<u32>,
+    /// Same as [`AtomStateData::collision`], keyed by qubit id.
+    collision: HashMap<u32, u32>,
+    /// Dense qubit index → lane taken in the most recent step.
+    prev_lanes: Vec<Option<LaneAddr>>,
+    /// Dense indices with a `prev_lanes` entry, so a step resets only those.
+    moved: Vec<u32>,
+    /// Dense qubit index → cumulative move count (`None` if never counted).
+    move_count: Vec<Option<u32>>,
+}
+
+impl DenseAtomState {
+    /// An empty state over `arch_spec`'s locations with `qubits` registered
+    /// but not yet placed; put them on sites with [`Self::place`].
+    pub fn with_qubits(qubits: impl IntoIterator<Item = u32>, arch_spec: &ArchSpec) -> Self {
+        let mut qubit_ids: Vec<u32> = qubits.into_iter().collect();
+        qubit_ids.sort_unstable();
+        qubit_ids.dedup();
+        let n = qubit_ids.len();
+        Self {
+            shape: (
+                arch_spec.zones.len(),
+                arch_spec.words.len(),
+                arch_spec.sites_per_word(),
+            ),
+            qubit_ids,
+            locations: vec![None; n],
+            occupants: vec![EMPTY; arch_spec.num_locations()],
+            collision: HashMap::new(),
+            prev_lanes: vec![None; n],
+            moved: Vec::new(),
+            move_count: vec![None; n],
+        }
+    }
+
+    /// Build a dense copy of `state` over `arch_spec`'s location enumeration.
+    ///
+    /// Returns `None` if a location in `state` is not a location of
+    /// `arch_spec`, or if the two location maps of `state` are not inverse
+    /// to each other.
+    pub fn from_state(state: &AtomStateData, arch_spec: &ArchSpec) -> Option<Self> {
+        if state.locations_to_qubit.len() != state.qubit_to_locations.len() {
+            return None;
+        }
+        let qubit_ids: Vec<u32> = state
+            .qubit_to_locations
+            .keys()
+            .chain(state.prev_lanes.keys())
+            .chain(state.move_count.keys())
+            .copied()
+            .collect();
+
+        let mut dense = Self::with_qubits(qubit_ids, arch_spec);
+        dense.collision = state.collision.clone();
+        for (&qubit, loc) in &state.qubit_to_locations {
+            if state.locations_to_qubit.get(loc) != Some(&qubit) {
+                return None;
+            }
+            dense.place(qubit, *loc).ok()?;
+        }
+        for (&qubit, &lane) in &state.prev_lanes {
+            let index = dense.index_of(qubit)?;
+            dense.prev_lanes[index as usize] = Some(lane);
+            dense.moved.push(index);
+        }
+        for (&qubit, &count) in &state.move_count {
+            let index = dense.index_of(qubit)?;
+            dense.move_count[index as usize] = Some(count);
+        }
+        Some(dense)
+    }
+
+    /// Convert back to the map-based [`AtomStateData`].
+    pub fn to_state(&self) -> AtomStateData {
+        let mut state = AtomStateData::new();
+        for (&qubit, loc) in self.qubit_ids.iter().zip(&self.locations) {
+            if let Some(loc) = *loc {
+                state.qubit_to_locations.insert(qubit, loc);
+                state.locations_to_qubit.insert(loc, qubit);
+            }
+        }
+        state.collision = self.collision.clone();
+        for &index in &self.moved {
+            if let Some(lane) = self.prev_lanes[index as usize] {
+                state
+                    .prev_lanes
+                    .insert(self.qubit_ids[index as usize], lane);
+            }
+        }
+        for (&qubit, count) in self.qubit_ids.iter().zip(&self.move_count) {
+            if let Some(count) = *count {
+                state.move_count.insert(qubit, count);
             }
+        }
+        state
+    }
 
-            let blockaded = match arch_spec.get_cz_partner(&loc) {
-                Some(b) => b,
-                None => {
-                    unpaired.push(qubit);
-                    continue;
-                }
-            };
+    fn index_of(&self, qubit: u32) -> Option<u32> {
+        self.qubit_ids.binary_search(&qubit).ok().map(|i| i as u32)
+    }
+
+    /// [`ArchSpec::location_ordinal`] for the arch this state was built on.
+    fn ordinal(&self, loc: &LocationAddr) -> Option<usize> {
+        let (zones, words, sites_per_word) = self.shape;
+        let (zid, wid, sid) = (
+            loc.zone_id as usize,
+            loc.word_id as usize,
+            loc.site_id as usize,
+        );
+        (zid < zones && wid < words && sid < sites_per_word)
+            .then(|| (zid * words + wid) * sites_per_word + sid)
+    }
 
-            let target_qubit = match self.get_qubit(&blockaded) {
-                Some(t) => t,
-                None => {
-                    unpaired.push(qubit);
-                    continue;
-                }
+    /// Look up which qubit (if any) occupies the given location.
+    pub fn get_qubit(&self, location: &LocationAddr) -> Option<u32> {
+        let index = *self.occupants.get(self.ordinal(location)?)?;
+        (index != EMPTY).then(|| self.qubit_ids[index as usize])
+    }
+
+    /// Current location of `qubit`, or `None` if it is unknown or collided.
+    pub fn location_of(&self, qubit: u32) -> Option<LocationAddr> {
+        self.locations[self.index_of(qubit)? as usize]
+    }
+
+    /// `(qubit, location)` for every qubit still on a site, in id order.
+    pub fn qubit_locations(&self) -> impl Iterator<Item = (u32, LocationAddr)> + '_ {
+        self.qubit_ids
+            .iter()
+            .zip(&self.locations)
+            .filter_map(|(&qubit, loc)| loc.map(|loc| (qubit, loc)))
+    }
+
+    /// Cumulative collision record; see [`AtomStateData::collision`].
+    pub fn collision(&self) -> &HashMap<u32, u32> {
+        &self.collision
+    }
+
+    /// `(qubit, lane)` for each qubit that moved in the most recent step.
+    pub fn prev_lanes(&self) -> impl Iterator<Item = (u32, LaneAddr)> + '_ {
+        self.moved.iter().filter_map(|&index| {
+            self.prev_lanes[index as usize].map(|lane| (self.qubit_ids[index as usize], lane))
+        })
+    }
+
+    /// Put a registered qubit that is not on a site onto an empty location.
+    ///
+    /// Unlike [`AtomStateData::add_atoms`], this leaves the move history
+    /// (`collision`, `prev_lanes`, `move_count`) untouched. Returns `Err` if
+    /// the qubit is unregistered or already placed, or if the location is
+    /// occupied or not part of the architecture.
+    pub fn place(&mut self, qubit: u32, location: LocationAddr) -> Result<(), &'static str> {
+        let index = self
+            .index_of(qubit)
+            .ok_or("Attempted to place an unregistered qubit")?;
+        let ordinal = self
+            .ordinal(&location)
+            .ok_or("Attempted to add atom outside the architecture")?;
+        if self.locations[index as usize].is_some() {
+            return Err("Attempted to add atom that already exists");
+        }
+        if self.occupants[ordinal] != EMPTY {
+            return Err("Attempted to add atom to occupied location");
+        }
+        self.occupants[ordinal] = index;
+        self.locations[index as usize] = Some(location);
+        Ok(())
+    }
+
+    /// Dense equivalent of [`AtomStateData::get_qubit_pairing`].
+    pub fn get_qubit_pairing(
+        &self,
+        zone: &ZoneAddr,
+        arch_spec: &ArchSpec,
+    ) -> Option<(Vec<u32>, Vec<u32>, Vec<u32>)> {
+        qubit_pairing(
+            self.qubit_locations(),
+            |loc| self.get_qubit(loc),
+            zone,
+            arch_spec,
+        )
+    }
+
+    /// Dense equivalent of [`AtomStateData::validate_moves`].
+    pub fn validate_moves(
+        &self,
+        lanes: &[LaneAddr],
+        arch_spec: &ArchSpec,
+    ) -> Result<ValidatedMoves, Vec<MoveValidationError>> {
+        validate_moves(|loc| self.get_qubit(loc), lanes, arch_spec)
+    }
+
+    /// In-place equivalent of [`AtomStateData::apply_validated`].
+    ///
+    /// On `Err` (a stale token) the state is left unchanged.
+    pub fn apply_validated(
+        &mut self,
+        moves: &ValidatedMoves,
+    ) -> Result<(), Vec<MoveValidationError>> {
+        check_token(|loc| self.get_qubit(loc), moves)?;
+
+        // The token check places every mover's qubit and source on this
+        // state; only a destination from a different arch can fail here.
+        let mut movers: Vec<(u32, usize, usize, LocationAddr, LaneAddr)> =
+            Vec::with_capacity(moves.movers.len());
+        for &(qubit, src, dst, lane) in &moves.movers {
+            let Some(dst_ordinal) = self.ordinal(&dst) else {
+                return Err(vec![MoveValidationError::UnresolvableLane { lane }]);
             };
+            let index = self.index_of(qubit).expect("token checked above");
+            let src = self.ordinal(&src).expect("token checked above");
+            movers.push((index, src, dst_ordinal, dst, lane));
+        }
 
-            controls.push(qubit);
-            targets.push(target_qubit);
-            visited.insert(target_qubit);
+        self.clear_prev_lanes();
+        for &(index, src, ..) in &movers {
+            self.occupants[src] = EMPTY;
+            self.locations[index as usize] = None;
         }
+        for &(index, _, dst_ordinal, dst, lane) in &movers {
+            self.record_move(index, lane);
+            self.occupants[dst_ordinal] = index;
+            self.locations[index as usize] = Some(dst);
+        }
+        Ok(())
+    }
+
+    /// In-place equivalent of [`AtomStateData::apply_moves`], including its
+    /// collision handling.
+    ///
+    /// Returns `None`, leaving the state unchanged, if any lane cannot be
+    /// resolved to endpoints.
+    pub fn apply_moves(&mut self, lanes: &[LaneAddr], arch_spec: &ArchSpec) -> Option<()> {
+        // (index, src ordinal, dst ordinal, dst, lane, pre-move dst occupant)
+        let mut movers: Vec<(u32, usize, usize, LocationAddr, LaneAddr, u32)> =
+            Vec::with_capacity(lanes.len());
+        for (qubit, src, dst, lane) in resolve_movers(|loc| self.get_qubit(loc), lanes, arch_spec)?
+        {
+            let dst_ordinal = self.ordinal(&dst)?;
+            movers.push((
+                self.index_of(qubit)?,
+                self.ordinal(&src)?,
+                dst_ordinal,
+                dst,
+                lane,
+                self.occupants[dst_ordinal],
+            ));
+        }
+        // Dense indices follow id order, matching `apply_moves`' landing order.
+        movers.sort_unstable_by_key(|&(index, ..)| index);
+
+        self.clear_prev_lanes();
+        // Phase 1: every mover vacates its source.
+        for &(index, src, ..) in &movers {
+            self.occupants[src] = EMPTY;
+            self.locations[index as usize] = None;
+        }
+        // A pre-move destination occupant that is still placed after phase 1
+        // did not move: it is stationary for the whole of phase 2.
+        let stationary: Vec<Option<u32>> = movers
+            .iter()
+            .map(|&(.., before)| {
+                (before != EMPTY && self.locations[before as usize].is_some()).then_some(before)
+            })
+            .collect();
+
+        // Phase 2: land, judging occupancy against the pre-move state.
+        for (&(index, _, dst_ordinal, dst, lane, _), stationary) in movers.iter().zip(stationary) {
+            self.record_move(index, lane);
+            let qubit = self.qubit_ids[index as usize];
+
+            if let Some(other) = stationary {
+                self.occupants[dst_ordinal] = EMPTY;
+                self.locations[other as usize] = None;
+                self.collision.insert(qubit, self.qubit_ids[other as usize]);
+                continue;
+            }
 
-        Some((controls, targets, unpaired))
+            let other = self.occupants[dst_ordinal];
+            if other != EMPTY {
+                self.occupants[dst_ordinal] = EMPTY;
+                self.locations[other as usize] = None;
+                self.collision.insert(qubit, self.qubit_ids[other as usize]);
+                continue;
+            }
+
+            self.occupants[dst_ordinal] = index;
+            self.locations[index as usize] = Some(dst);
+        }
+        Some(())
     }
-}
 
-impl Default for AtomStateData {
-    fn default() -> Self {
-        Self::new()
+    fn clear_prev_lanes(&mut self) {
+        for index in self.moved.drain(..) {
+            self.prev_lanes[index as usize] = None;
+        }
+    }
+
+    fn record_move(&mut self, index: u32, lane: LaneAddr) {
+        let count = &mut self.move_count[index as usize];
+        *count = Some(count.unwrap_or(0) + 1);
+        self.prev_lanes[index as usize] = Some(lane);
+        self.moved.push(index);
     }
 }
 
@@ -1590,4 +1946,73 @@ mod tests {
         assert_eq!(result.qubit_to_locations[&0], word_loc(3));
         assert_eq!(result.locations_to_qubit.len(), 1);
     }
+
+    #[test]
+    fn dense_state_round_trips_and_rejects_off_arch_locations() {
+        let spec = make_chain_spec();
+        let state = AtomStateData::from_locations(&[(3, word_loc(0)), (7, word_loc(2))])
+            .apply_moves(&[chain_lane(2)], &spec)
+            .unwrap();
+        let dense = DenseAtomState::from_state(&state, &spec).unwrap();
+        assert_eq!(dense.to_state(), state);
+        assert_eq!(dense.get_qubit(&word_loc(3)), Some(7));
+        assert_eq!(dense.location_of(3), Some(word_loc(0)));
+
+        let off_arch = AtomStateData::from_locations(&[(0, word_loc(99))]);
+        assert!(DenseAtomState::from_state(&off_arch, &spec).is_none());
+    }
+
+    #[test]
+    fn dense_apply_moves_matches_map_state_step_for_step() {
+        let spec = make_chain_spec();
+        let steps: [&[LaneAddr]; 3] = [
+            &[chain_lane(1), chain_lane(0)],
+            // Word 3 holds a stationary atom: qubit 1 collides with it.
+            &[chain_lane(2), chain_lane(1)],
+            &[chain_lane(0)],
+        ];
+        let mut state =
+            AtomStateData::from_locations(&[(0, word_loc(0)), (1, word_loc(1)), (2, word_loc(3))]);
+        let mut dense = DenseAtomState::from_state(&state, &spec).unwrap();
+
+        for lanes in steps {
+            state = state.apply_moves(lanes, &spec).unwrap();
+            dense.apply_moves(lanes, &spec).unwrap();
+            assert_eq!(dense.to_state(), state);
+        }
+        assert_eq!(dense.collision(), &HashMap::from([(1, 2)]));
+
+        let invalid = LaneAddr {
+            bus_id: 9,
+            ..chain_lane(0)
+        };
+        assert!(dense.apply_moves(&[invalid], &spec).is_none());
+        assert_eq!(dense.to_state(), state);
+    }
+
+    #[test]
+    fn dense_apply_validated_matches_map_state_and_rejects_stale_tokens() {
+        let spec = make_chain_spec();
+        let state = AtomStateData::from_locations(&[(0, word_loc(0)), (1, word_loc(1))]);
+        let mut dense = DenseAtomState::from_state(&state, &spec).unwrap();
+        let lanes = [chain_lane(0), chain_lane(1)];
+
+        let validated = dense.validate_moves(&lanes, &spec).expect("chain is valid");
+        assert_eq!(validated, state.validate_moves(&lanes, &spec).unwrap());
+        dense.apply_validated(&validated).expect("token is fresh");
+        let expected = state.apply_validated(&validated).unwrap();
+        assert_eq!(dense.to_state(), expected);
+        assert_eq!(
+            dense.prev_lanes().collect::<HashMap<_, _>>(),
+            expected.prev_lanes
+        );
+
+        let errors = dense.apply_validated(&validated).unwrap_err();
+        assert!(
+            errors
+                .iter()
+                .any(|e| matches!(e, MoveValidationError::StaleMoverSource { .. }))
+        );
+        assert_eq!(dense.to_state(), expected);
+    }
 }
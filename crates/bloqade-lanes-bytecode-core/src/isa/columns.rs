@@ -0,0 +1,344 @@
+//! Columnar (struct-of-arrays) view of a program's instructions.
+//!
+//! Every instruction maps to one row of four fixed-width columns:
+//!
+//! ```text
+//! op       : u8   index into OP_NAMES (a dense, stable id per op_name)
+//! operand0 : u64  const_loc / const_lane / const_zone address bits,
+//!                 the arity of initial_fill / fill / move / local_r /
+//!                 local_rz / measure, get_item's ndims, new_array's
+//!                 type_tag, or the raw bits of a const_float / const_int
+//! operand1 : u32  new_array dim0
+//! operand2 : u32  new_array dim1
+//! ```
+//!
+//! Unused operands are zero. The op id is *not* the vihaco opcode byte: all
+//! nested vihaco-cpu ops share one outer opcode, so the column uses the
+//! [`Instruction::op_name`] dispatch names instead. Only the instructions the
+//! Python bindings can construct have a column id; [`to_columns`] rejects any
+//! other nested vihaco-cpu op.
+//!
+//! Bulk consumers (NumPy in the Python bindings) read and build whole
+//! programs through these columns instead of one instruction object per row.
+
+use vihaco::value::Value;
+use vihaco_cpu::Instruction as Cpu;
+
+use super::Instruction;
+
+/// Column op id → op name; the id of an instruction is its index here.
+pub const OP_NAMES: [&str; 24] = [
+    "pop",
+    "swap",
+    "return",
+    "const_loc",
+    "const_lane",
+    "const_zone",
+    "initial_fill",
+    "fill",
+    "move",
+    "local_rz",
+    "local_r",
+    "global_rz",
+    "global_r",
+    "cz",
+    "measure",
+    "await_measure",
+    "new_array",
+    "get_item",
+    "set_detector",
+    "set_observable",
+    "const_float",
+    "const_int",
+    "dup",
+    "halt",
+];
+
+/// Struct-of-arrays form of an instruction list; see the module docs for the
+/// column layout. All four columns have the same length.
+#[derive(Debug, Clone, Default, PartialEq, Eq)]
+pub struct ProgramColumns {
+    pub ops: Vec<u8>,
+    pub operand0: Vec<u64>,
+    pub operand1: Vec<u32>,
+    pub operand2: Vec<u32>,
+}
+
+impl ProgramColumns {
+    pub fn with_capacity(capacity: usize) -> Self {
+        Self {
+            ops: Vec::with_capacity(capacity),
+            operand0: Vec::with_capacity(capacity),
+            operand1: Vec::with_capacity(capacity),
+            operand2: Vec::with_capacity(capacity),
+        }
+    }
+
+    pub fn len(&self) -> usize {
+        self.ops.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.ops.is_empty()
+    }
+
+    /// Append one instruction as a row.
+    pub fn push(&mut self, pc: usize, inst: &Instruction) -> Result<(), ColumnsError> {
+        let (op, operand0, operand1, operand2) = match inst {
+            Instruction::Pop => (0, 0, 0, 0),
+            Instruction::Swap => (1, 0, 0, 0),
+            Instruction::Return => (2, 0, 0, 0),
+            Instruction::ConstLoc(bits) => (3, *bits, 0, 0),
+            Instruction::ConstLane(bits) => (4, *bits, 0, 0),
+            Instruction::ConstZone(bits) => (5, u64::from(*bits), 0, 0),
+            Instruction::InitialFill(arity) => (6, u64::from(*arity), 0, 0),
+            Instruction::Fill(arity) => (7, u64::from(*arity), 0, 0),
+            Instruction::Move(arity) => (8, u64::from(*arity), 0, 0),
+            Instruction::LocalRz(arity) => (9, u64::from(*arity), 0, 0),
+            Instruction::LocalR(arity) => (10, u64::from(*arity), 0, 0),
+            Instruction::GlobalRz => (11, 0, 0, 0),
+            Instruction::GlobalR => (12, 0, 0, 0),
+            Instruction::Cz => (13, 0, 0, 0),
+            Instruction::Measure(arity) => (14, u64::from(*arity), 0, 0),
+            Instruction::AwaitMeasure => (15, 0, 0, 0),
+            Instruction::NewArray(type_tag, dim0, dim1) => (16, u64::from(*type_tag), *dim0, *dim1),
+            Instruction::GetItem(ndims) => (17, u64::from(*ndims), 0, 0),
+            Instruction::SetDetector => (18, 0, 0, 0),
+            Instruction::SetObservable => (19, 0, 0, 0),
+            Instruction::Cpu(Cpu::Const(Value::F64(value))) => (20, value.to_bits(), 0, 0),
+            Instruction::Cpu(Cpu::Const(Value::I64(value))) => (21, *value as u64, 0, 0),
+            Instruction::Cpu(Cpu::Dup) => (22, 0, 0, 0),
+            Instruction::Cpu(Cpu::Halt) => (23, 0, 0, 0),
+            Instruction::Cpu(_) => {
+                return Err(ColumnsError::Unsupported {
+                    pc,
+                    op_name: inst.op_name(),
+                });
+            }
+        };
+        self.ops.push(op);
+        self.operand0.push(operand0);
+        self.operand1.push(operand1);
+        self.operand2.push(operand2);
+        Ok(())
+    }
+}
+
+/// Error converting between instructions and columns.
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub enum ColumnsError {
+    /// The operand columns are not as long as the op column.
+    LengthMismatch {
+        column: &'static str,
+        expected: usize,
+        got: usize,
+    },
+    /// An op id with no entry in [`OP_NAMES`].
+    UnknownOp { pc: usize, op: u8 },
+    /// A `u32` operand stored in `operand0` does not fit in 32 bits.
+    OperandOverflow {
+        pc: usize,
+        op_name: &'static str,
+        value: u64,
+    },
+    /// A nested vihaco-cpu op with no column id.
+    Unsupported { pc: usize, op_name: &'static str },
+}
+
+impl std::fmt::Display for ColumnsError {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        match self {
+            ColumnsError::LengthMismatch {
+                column,
+                expected,
+                got,
+            } => write!(f, "column {column} has {got} entries, expected {expected}"),
+            ColumnsError::UnknownOp { pc, op } => {
+                write!(f, "unknown op id {op} at instruction {pc}")
+            }
+            ColumnsError::OperandOverflow { pc, op_name, value } => write!(
+                f,
+                "operand {value} of {op_name} at instruction {pc} does not fit in u32"
+            ),
+            ColumnsError::Unsupported { pc, op_name } => {
+                write!(f, "instruction {pc} ({op_name}) has no columnar encoding")
+            }
+        }
+    }
+}
+
+impl std::error::Error for ColumnsError {}
+
+/// Encode an instruction list as columns.
+pub fn to_columns(code: &[Instruction]) -> Result<ProgramColumns, ColumnsError> {
+    let mut columns = ProgramColumns::with_capacity(code.len());
+    for (pc, inst) in code.iter().enumerate() {
+        columns.push(pc, inst)?;
+    }
+    Ok(columns)
+}
+
+/// Decode columns back into an instruction list (the inverse of
+/// [`to_columns`]).
+pub fn from_columns(
+    ops: &[u8],
+    operand0: &[u64],
+    operand1: &[u32],
+    operand2: &[u32],
+) -> Result<Vec<Instruction>, ColumnsError> {
+    for (column, len) in [
+        ("operand0", operand0.len()),
+        ("operand1", operand1.len()),
+        ("operand2", operand2.len()),
+    ] {
+        if len != ops.len() {
+            return Err(ColumnsError::LengthMismatch {
+                column,
+                expected: ops.len(),
+                got: len,
+            });
+        }
+    }
+
+    let mut code = Vec::with_capacity(ops.len());
+    for (pc, &op) in ops.iter().enumerate() {
+        let a0 = operand0[pc];
+        let narrow = || {
+            u32::try_from(a0).map_err(|_| ColumnsError::OperandOverflow {
+                pc,
+                op_name: OP_NAMES[op as usize],
+                value: a0,
+            })
+        };
+        let inst = match op {
+            0 => Instruction::Pop,
+            1 => Instruction::Swap,
+            2 => Instruction::Return,
+            3 => Instruction::ConstLoc(a0),
+            4 => Instruction::ConstLane(a0),
+            5 => Instruction::ConstZone(narrow()?),
+            6 => Instruction::InitialFill(narrow()?),
+            7 => Instruction::Fill(narrow()?),
+            8 => Instruction::Move(narrow()?),
+            9 => Instruction::LocalRz(narrow()?),
+            10 => Instruction::LocalR(narrow()?),
+            11 => Instruction::GlobalRz,
+            12 => Instruction::GlobalR,
+            13 => Instruction::Cz,
+            14 => Instruction::Measure(narrow()?),
+            15 => Instruction::AwaitMeasure,
+            16 => Instruction::NewArray(narrow()?, operand1[pc], operand2[pc]),
+            17 => Instruction::GetItem(narrow()?),
+            18 => Instruction::SetDetector,
+            19 => Instruction::SetObservable,
+            20 => Instruction::Cpu(Cpu::Const(Value::F64(f64::from_bits(a0)))),
+            21 => Instruction::Cpu(Cpu::Const(Value::I64(a0 as i64))),
+            22 => Instruction::Cpu(Cpu::Dup),
+            23 => Instruction::Cpu(Cpu::Halt),
+            _ => return Err(ColumnsError::UnknownOp { pc, op }),
+        };
+        code.push(inst);
+    }
+    Ok(code)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn sample() -> Vec<Instruction> {
+        vec![
+            Instruction::Cpu(Cpu::Const(Value::F64(-0.25))),
+            Instruction::Cpu(Cpu::Const(Value::I64(-42))),
+            Instruction::Cpu(Cpu::Dup),
+            Instruction::Pop,
+            Instruction::Swap,
+            Instruction::ConstLoc(0x0100_0002_0003_0000),
+            Instruction::ConstLane(0xA020_0000_0001_0002),
+            Instruction::ConstZone(3),
+            Instruction::InitialFill(2),
+            Instruction::Fill(1),
+            Instruction::Move(1),
+            Instruction::LocalRz(1),
+            Instruction::LocalR(3),
+            Instruction::GlobalRz,
+            Instruction::GlobalR,
+            Instruction::Cz,
+            Instruction::Measure(1),
+            Instruction::AwaitMeasure,
+            Instruction::NewArray(2, 10, 20),
+            Instruction::GetItem(2),
+            Instruction::SetDetector,
+            Instruction::SetObservable,
+            Instruction::Cpu(Cpu::Halt),
+            Instruction::Return,
+        ]
+    }
+
+    #[test]
+    fn op_ids_match_op_names() {
+        let code = sample();
+        let columns = to_columns(&code).unwrap();
+        for (inst, &op) in code.iter().zip(&columns.ops) {
+            assert_eq!(OP_NAMES[op as usize], inst.op_name());
+        }
+    }
+
+    #[test]
+    fn columns_round_trip() {
+        let code = sample();
+        let columns = to_columns(&code).unwrap();
+        assert_eq!(columns.len(), code.len());
+        assert_eq!(columns.operand0[0], (-0.25f64).to_bits());
+        assert_eq!(columns.operand0[1] as i64, -42);
+        assert_eq!(
+            (
+                columns.operand0[18],
+                columns.operand1[18],
+                columns.operand2[18]
+            ),
+            (2, 10, 20)
+        );
+        let decoded = from_columns(
+            &columns.ops,
+            &columns.operand0,
+            &columns.operand1,
+            &columns.operand2,
+        )
+        .unwrap();
+        assert_eq!(decoded, code);
+    }
+
+    #[test]
+    fn from_columns_rejects_bad_input() {
+        assert_eq!(
+            from_columns(&[0, 1], &[0, 0], &[0], &[0, 0]),
+            Err(ColumnsError::LengthMismatch {
+                column: "operand1",
+                expected: 2,
+                got: 1
+            })
+        );
+        assert_eq!(
+            from_columns(&[0, 99], &[0, 0], &[0, 0], &[0, 0]),
+            Err(ColumnsError::UnknownOp { pc: 1, op: 99 })
+        );
+        assert_eq!(
+            from_columns(&[8], &[1 << 32], &[0], &[0]),
+            Err(ColumnsError::OperandOverflow {
+                pc: 0,
+                op_name: "move",
+                value: 1 << 32
+            })
+        );
+    }
+
+    #[test]
+    fn to_columns_rejects_unsupported_cpu_op() {
+        let code = vec![Instruction::Cpu(Cpu::Print)];
+        assert!(matches!(
+            to_columns(&code),
+            Err(ColumnsError::Unsupported { pc: 0, .. })
+        ));
+    }
+}
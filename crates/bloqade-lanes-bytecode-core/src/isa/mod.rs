@@ -34,9 +34,11 @@
 //! Consequence: CPU text syntax is now vihaco-cpu's (`const.i64 42`,
 //! `const.f64 1.5`, `dup`, `halt`), not the legacy `const_int` / `const_float`.
 
+pub mod columns;
 pub mod def;
 pub mod parse_helpers;
 pub mod program;
+pub mod replay;
 pub mod text;
 pub mod validate;
 
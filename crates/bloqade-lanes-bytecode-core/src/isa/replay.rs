@@ -0,0 +1,657 @@
+//! Whole-program replay: execute a program's atom arrangement once and
+//! record what every move layer did, column by column.
+//!
+//! [`replay`] walks the instruction stream with an operand stack (only
+//! address operands are tracked concretely), runs `initial_fill` / `fill` /
+//! `move` on a [`DenseAtomState`], and reads the CZ pairing off that state at
+//! every `cz`. The result, [`ProgramReplay`], is a set of flat columns — one
+//! entry per qubit per layer, per lane, per layer, or per CZ — so analyses
+//! and renderers can work on whole arrays instead of stepping an
+//! [`AtomStateData`](crate::atom_state::AtomStateData) statement by
+//! statement.
+//!
+//! Qubit ids follow load order: the locations of `initial_fill`, in push
+//! order, are qubits `0..n`, and every later `fill` continues the numbering.
+//! Execution stops at the first `return` or `halt`.
+
+use std::collections::HashMap;
+use std::fmt;
+
+use vihaco_cpu::Instruction as Cpu;
+
+use super::{Instruction, Program};
+use crate::arch::addr::{LaneAddr, LocationAddr, ZoneAddr};
+use crate::arch::metrics::MotionModel;
+use crate::arch::types::ArchSpec;
+use crate::atom_state::{DenseAtomState, MoveValidationError};
+
+/// How [`replay`] executes and times move layers.
+#[derive(Debug, Clone, Copy, PartialEq)]
+pub struct ReplayOptions {
+    /// Timing model for lane durations.
+    pub motion_model: MotionModel,
+    /// Pick/drop amplitude; see [`MotionModel::lane_duration_us`].
+    pub amplitude_delta: f64,
+    /// Validate each lane group before applying it and fail on one that
+    /// cannot execute. When `false`, groups are applied with
+    /// [`DenseAtomState::apply_moves`] collision semantics and collisions are
+    /// recorded instead.
+    pub validate: bool,
+}
+
+impl Default for ReplayOptions {
+    fn default() -> Self {
+        Self {
+            motion_model: MotionModel::default(),
+            amplitude_delta: 1.0,
+            validate: true,
+        }
+    }
+}
+
+/// A replay failure, tagged with the offending instruction's program counter.
+#[derive(Debug, Clone, PartialEq)]
+pub enum ReplayError {
+    /// The stack did not hold the operands the instruction consumes (too
+    /// few, or an address of the wrong kind).
+    Operands { pc: usize },
+    /// An `initial_fill` / `fill` location could not be loaded.
+    Fill {
+        pc: usize,
+        location: LocationAddr,
+        message: &'static str,
+    },
+    /// A `move` lane group cannot execute against the current state.
+    Move {
+        pc: usize,
+        errors: Vec<MoveValidationError>,
+    },
+    /// A `move` lane does not resolve to endpoints (unvalidated replay).
+    UnresolvableLane { pc: usize },
+    /// A `cz` names a zone that is not part of the architecture.
+    InvalidZone { pc: usize, zone_id: u32 },
+}
+
+impl fmt::Display for ReplayError {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        match self {
+            ReplayError::Operands { pc } => {
+                write!(f, "pc {pc}: missing or mistyped stack operands")
+            }
+            ReplayError::Fill {
+                pc,
+                location,
+                message,
+            } => write!(f, "pc {pc}: cannot load {location:?}: {message}"),
+            ReplayError::Move { pc, errors } => {
+                write!(f, "pc {pc}: move is not executable")?;
+                for error in errors {
+                    write!(f, "; {error}")?;
+                }
+                Ok(())
+            }
+            ReplayError::UnresolvableLane { pc } => {
+                write!(f, "pc {pc}: move lane does not resolve to endpoints")
+            }
+            ReplayError::InvalidZone { pc, zone_id } => {
+                write!(f, "pc {pc}: invalid cz zone {zone_id}")
+            }
+        }
+    }
+}
+
+impl std::error::Error for ReplayError {}
+
+/// Columnar record of a whole-program replay; see the [module docs](self).
+///
+/// "Layer" means one executed `move`. Per-qubit tables are row-major with
+/// `num_qubits` columns; variable-length per-layer and per-CZ data is stored
+/// flat with an offsets column (`offsets[k]..offsets[k + 1]` is entry `k`).
+#[derive(Debug, Clone, Default, PartialEq)]
+pub struct ProgramReplay {
+    /// Number of qubits the program loads.
+    pub num_qubits: usize,
+    /// Qubit locations when the first layer starts (row 0) and right after
+    /// each layer (row `k + 1`): `(num_layers + 1) × num_qubits`. `None` for
+    /// a qubit that is not loaded yet or was lost to a collision.
+    pub locations: Vec<Option<LocationAddr>>,
+    /// `num_layers × num_qubits`: the qubit was on a site when the layer
+    /// started and was lost to a collision in it.
+    pub collided: Vec<bool>,
+    /// Program counter of each layer's `move`.
+    pub layer_pcs: Vec<usize>,
+    /// Duration of each layer: its slowest lane, or 0 for an empty layer.
+    pub layer_durations_us: Vec<f64>,
+    /// `num_layers + 1` offsets into the per-lane columns.
+    pub lane_offsets: Vec<usize>,
+    /// Every lane of every layer, in push order.
+    pub lanes: Vec<LaneAddr>,
+    /// Qubit carried by each lane, or `None` if its source was empty.
+    pub lane_qubits: Vec<Option<u32>>,
+    /// Duration of each lane (NaN if its endpoints have no position).
+    pub lane_durations_us: Vec<f64>,
+    /// Program counter of each `cz`.
+    pub cz_pcs: Vec<usize>,
+    /// Layers executed before each `cz`, i.e. its row in `locations`.
+    pub cz_layers: Vec<usize>,
+    /// `num_czs + 1` offsets into `cz_controls` / `cz_targets`.
+    pub cz_offsets: Vec<usize>,
+    /// Control qubit of each CZ pair, by qubit id within each `cz`.
+    pub cz_controls: Vec<u32>,
+    /// Target qubit paired with the matching `cz_controls` entry.
+    pub cz_targets: Vec<u32>,
+}
+
+impl ProgramReplay {
+    /// Number of executed `move` layers.
+    pub fn num_layers(&self) -> usize {
+        self.layer_pcs.len()
+    }
+
+    /// Row `row` of [`Self::locations`]: all qubit locations at that point.
+    pub fn locations_at(&self, row: usize) -> &[Option<LocationAddr>] {
+        &self.locations[row * self.num_qubits..(row + 1) * self.num_qubits]
+    }
+
+    /// Total move time: the sum of the layer durations.
+    pub fn total_move_time_us(&self) -> f64 {
+        self.layer_durations_us.iter().sum()
+    }
+}
+
+/// A tracked stack value. Only addresses are kept concretely; everything
+/// else the program pushes is opaque to the replay.
+#[derive(Debug, Clone, Copy)]
+enum Slot {
+    Location(u64),
+    Lane(u64),
+    Zone(u32),
+    Other,
+}
+
+/// The replay's operand stack.
+struct OperandStack {
+    slots: Vec<Slot>,
+}
+
+impl OperandStack {
+    fn pop(&mut self, pc: usize) -> Result<Slot, ReplayError> {
+        self.slots.pop().ok_or(ReplayError::Operands { pc })
+    }
+
+    /// Pop `n` values, returned bottom-to-top (i.e. in push order).
+    fn pop_n(&mut self, n: u32, pc: usize) -> Result<std::vec::Drain<'_, Slot>, ReplayError> {
+        let start = self
+            .slots
+            .len()
+            .checked_sub(n as usize)
+            .ok_or(ReplayError::Operands { pc })?;
+        Ok(self.slots.drain(start..))
+    }
+
+    fn pop_locations(&mut self, n: u32, pc: usize) -> Result<Vec<LocationAddr>, ReplayError> {
+        self.pop_n(n, pc)?
+            .map(|slot| match slot {
+                Slot::Location(bits) => Ok(LocationAddr::decode(bits)),
+                _ => Err(ReplayError::Operands { pc }),
+            })
+            .collect()
+    }
+
+    fn pop_lanes(&mut self, n: u32, pc: usize) -> Result<Vec<LaneAddr>, ReplayError> {
+        self.pop_n(n, pc)?
+            .map(|slot| match slot {
+                Slot::Lane(bits) => Ok(LaneAddr::decode_u64(bits)),
+                _ => Err(ReplayError::Operands { pc }),
+            })
+            .collect()
+    }
+
+    fn pop_zone(&mut self, pc: usize) -> Result<ZoneAddr, ReplayError> {
+        match self.pop(pc)? {
+            Slot::Zone(bits) => Ok(ZoneAddr::decode(bits)),
+            _ => Err(ReplayError::Operands { pc }),
+        }
+    }
+
+    fn discard(&mut self, n: u32, pc: usize) -> Result<(), ReplayError> {
+        self.pop_n(n, pc).map(drop)
+    }
+}
+
+/// Lane durations, computed once per distinct lane.
+///
+/// A lane's path is its transport path from the arch spec if it has one,
+/// else the straight segment between its endpoints — the same rule as the
+/// Python `ArchSpec.get_path`.
+struct LaneTimer<'a> {
+    arch: &'a ArchSpec,
+    motion_model: MotionModel,
+    amplitude_delta: f64,
+    paths: HashMap<u64, &'a [[f64; 2]]>,
+    durations: HashMap<u64, f64>,
+}
+
+impl<'a> LaneTimer<'a> {
+    fn new(arch: &'a ArchSpec, options: &ReplayOptions) -> Self {
+        let paths = arch
+            .paths
+            .iter()
+            .flatten()
+            .map(|tp| (tp.lane, tp.waypoints.as_slice()))
+            .collect();
+        Self {
+            arch,
+            motion_model: options.motion_model,
+            amplitude_delta: options.amplitude_delta,
+            paths,
+            durations: HashMap::new(),
+        }
+    }
+
+    fn duration_us(&mut self, lane: &LaneAddr) -> f64 {
+        let key = lane.encode_u64();
+        if let Some(&duration) = self.durations.get(&key) {
+            return duration;
+        }
+        let duration = match self.paths.get(&key) {
+            Some(waypoints) => self
+                .motion_model
+                .lane_duration_us(waypoints, self.amplitude_delta),
+            None => {
+                let segment = self.arch.lane_endpoints(lane).and_then(|(src, dst)| {
+                    let (x0, y0) = self.arch.location_position(&src)?;
+                    let (x1, y1) = self.arch.location_position(&dst)?;
+                    Some([[x0, y0], [x1, y1]])
+                });
+                match segment {
+                    Some(segment) => self
+                        .motion_model
+                        .lane_duration_us(&segment, self.amplitude_delta),
+                    None => f64::NAN,
+                }
+            }
+        };
+        self.durations.insert(key, duration);
+        duration
+    }
+}
+
+/// Number of qubits loaded before the first terminator.
+fn count_loaded_qubits(program: &Program) -> usize {
+    program
+        .code
+        .iter()
+        .take_while(|inst| !matches!(inst, Instruction::Return | Instruction::Cpu(Cpu::Halt)))
+        .map(|inst| match inst {
+            Instruction::InitialFill(arity) | Instruction::Fill(arity) => *arity as usize,
+            _ => 0,
+        })
+        .sum()
+}
+
+/// Replay `program` against `arch` and record every move layer and CZ.
+///
+/// The program should pass [`validate_structure`](super::validate::validate_structure)
+/// and [`simulate_stack`](super::validate::simulate_stack); a stack it cannot
+/// follow is reported as [`ReplayError::Operands`] rather than guessed at.
+pub fn replay(
+    program: &Program,
+    arch: &ArchSpec,
+    options: &ReplayOptions,
+) -> Result<ProgramReplay, ReplayError> {
+    let num_qubits = count_loaded_qubits(program);
+    let qubit_ids = 0..u32::try_from(num_qubits).expect("qubit count fits in u32");
+    let mut state = DenseAtomState::with_qubits(qubit_ids.clone(), arch);
+    let mut stack = OperandStack { slots: Vec::new() };
+    let mut timer = LaneTimer::new(arch, options);
+    let mut next_qubit = 0u32;
+
+    let mut out = ProgramReplay {
+        num_qubits,
+        lane_offsets: vec![0],
+        cz_offsets: vec![0],
+        ..ProgramReplay::default()
+    };
+    let snapshot = |state: &DenseAtomState, out: &mut ProgramReplay| {
+        out.locations
+            .extend(qubit_ids.clone().map(|qubit| state.location_of(qubit)));
+    };
+
+    for (pc, inst) in program.code.iter().enumerate() {
+        match inst {
+            Instruction::ConstLoc(bits) => stack.slots.push(Slot::Location(*bits)),
+            Instruction::ConstLane(bits) => stack.slots.push(Slot::Lane(*bits)),
+            Instruction::ConstZone(bits) => stack.slots.push(Slot::Zone(*bits)),
+            Instruction::Cpu(Cpu::Const(_)) => stack.slots.push(Slot::Other),
+
+            Instruction::Pop => stack.discard(1, pc)?,
+            Instruction::Swap => {
+                let len = stack.slots.len();
+                if len < 2 {
+                    return Err(ReplayError::Operands { pc });
+                }
+                stack.slots.swap(len - 1, len - 2);
+            }
+            Instruction::Cpu(Cpu::Dup) => {
+                let top = *stack.slots.last().ok_or(ReplayError::Operands { pc })?;
+                stack.slots.push(top);
+            }
+
+            Instruction::InitialFill(arity) | Instruction::Fill(arity) => {
+                for location in stack.pop_locations(*arity, pc)? {
+                    state
+                        .place(next_qubit, location)
+                        .map_err(|message| ReplayError::Fill {
+                            pc,
+                            location,
+                            message,
+                        })?;
+                    next_qubit += 1;
+                }
+            }
+
+            Instruction::Move(arity) => {
+                let lanes = stack.pop_lanes(*arity, pc)?;
+                if out.layer_pcs.is_empty() {
+                    snapshot(&state, &mut out);
+                }
+                let placed: Vec<bool> = qubit_ids
+                    .clone()
+                    .map(|qubit| state.location_of(qubit).is_some())
+                    .collect();
+
+                if options.validate {
+                    state
+                        .validate_moves(&lanes, arch)
+                        .and_then(|moves| state.apply_validated(&moves))
+                        .map_err(|errors| ReplayError::Move { pc, errors })?;
+                } else if state.apply_moves(&lanes, arch).is_none() {
+                    return Err(ReplayError::UnresolvableLane { pc });
+                }
+
+                let carried: HashMap<u64, u32> = state
+                    .prev_lanes()
+                    .map(|(qubit, lane)| (lane.encode_u64(), qubit))
+                    .collect();
+                let mut layer_duration = 0.0f64;
+                for lane in &lanes {
+                    let duration = timer.duration_us(lane);
+                    layer_duration = layer_duration.max(duration);
+                    out.lane_durations_us.push(duration);
+                    out.lane_qubits
+                        .push(carried.get(&lane.encode_u64()).copied());
+                }
+                out.lanes.extend_from_slice(&lanes);
+                out.lane_offsets.push(out.lanes.len());
+                out.layer_pcs.push(pc);
+                out.layer_durations_us.push(layer_duration);
+
+                snapshot(&state, &mut out);
+                let row = &out.locations[out.locations.len() - num_qubits..];
+                out.collided.extend(
+                    placed
+                        .iter()
+                        .zip(row)
+                        .map(|(&before, after)| before && after.is_none()),
+                );
+            }
+
+            Instruction::LocalR(arity) => {
+                stack.discard(2, pc)?;
+                stack.pop_locations(*arity, pc)?;
+            }
+            Instruction::LocalRz(arity) => {
+                stack.discard(1, pc)?;
+                stack.pop_locations(*arity, pc)?;
+            }
+            Instruction::GlobalR => stack.discard(2, pc)?,
+            Instruction::GlobalRz => stack.discard(1, pc)?,
+
+            Instruction::Cz => {
+                let zone = stack.pop_zone(pc)?;
+                let (controls, targets, _unpaired) =
+                    state
+                        .get_qubit_pairing(&zone, arch)
+                        .ok_or(ReplayError::InvalidZone {
+                            pc,
+                            zone_id: zone.zone_id,
+                        })?;
+                out.cz_pcs.push(pc);
+                out.cz_layers.push(out.layer_pcs.len());
+                out.cz_controls.extend(controls);
+                out.cz_targets.extend(targets);
+                out.cz_offsets.push(out.cz_controls.len());
+            }
+
+            Instruction::Measure(arity) => {
+                stack.discard(*arity, pc)?;
+                stack
+                    .slots
+                    .extend(std::iter::repeat_n(Slot::Other, *arity as usize));
+            }
+            Instruction::AwaitMeasure | Instruction::SetDetector | Instruction::SetObservable => {
+                stack.discard(1, pc)?;
+                stack.slots.push(Slot::Other);
+            }
+            Instruction::NewArray(_type_tag, dim0, dim1) => {
+                stack.discard(dim0.saturating_mul((*dim1).max(1)), pc)?;
+                stack.slots.push(Slot::Other);
+            }
+            Instruction::GetItem(ndims) => {
+                stack.discard(ndims.saturating_add(1), pc)?;
+                stack.slots.push(Slot::Other);
+            }
+
+            Instruction::Return | Instruction::Cpu(Cpu::Halt) => break,
+
+            // Other reused vihaco-cpu ops are not emitted by the lanes
+            // pipeline and do not touch atoms; `simulate_stack` does not
+            // model them either.
+            Instruction::Cpu(_) => {}
+        }
+    }
+
+    if out.layer_pcs.is_empty() {
+        snapshot(&state, &mut out);
+    }
+    Ok(out)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::arch::addr::{Direction, MoveType};
+    use crate::version::Version;
+
+    /// Two words of two sites in one zone; word 0 is CZ-paired with word 1.
+    const PAIRED_ARCH_JSON: &str = r#"{
+        "version": "2.0",
+        "words": [{"sites": [[0, 0], [0, 1]]}, {"sites": [[1, 0], [1, 1]]}],
+        "zones": [{
+            "grid": {"x_start": 0.0, "y_start": 0.0, "x_spacing": [5.0], "y_spacing": [3.0]},
+            "site_buses": [{"src": [0], "dst": [1]}],
+            "word_buses": [{"src": [0], "dst": [1]}],
+            "words_with_site_buses": [0, 1],
+            "sites_with_word_buses": [0, 1],
+            "entangling_pairs": [[0, 1]]
+        }],
+        "zone_buses": [],
+        "modes": [{"name": "default", "zones": [0], "bitstring_order": []}]
+    }"#;
+
+    fn arch() -> ArchSpec {
+        ArchSpec::from_json(PAIRED_ARCH_JSON).unwrap()
+    }
+
+    fn loc(word_id: u32, site_id: u32) -> LocationAddr {
+        LocationAddr {
+            zone_id: 0,
+            word_id,
+            site_id,
+        }
+    }
+
+    fn lane(move_type: MoveType, word_id: u32, site_id: u32, direction: Direction) -> LaneAddr {
+        LaneAddr {
+            move_type,
+            zone_id: 0,
+            word_id,
+            site_id,
+            bus_id: 0,
+            direction,
+        }
+    }
+
+    fn program(instructions: Vec<Instruction>) -> Program {
+        crate::isa::program::from_code(Version::new(1, 0), instructions)
+    }
+
+    /// q0 at (w0, s0) and q1 at (w1, s1); q1 steps back to (w1, s0) so the
+    /// two face each other for a CZ, then q0 is pushed onto q1's site.
+    fn pairing_then_collision() -> Program {
+        let back = lane(MoveType::SiteBus, 1, 0, Direction::Backward);
+        let across = lane(MoveType::WordBus, 0, 0, Direction::Forward);
+        program(vec![
+            Instruction::ConstLoc(loc(0, 0).encode()),
+            Instruction::ConstLoc(loc(1, 1).encode()),
+            Instruction::InitialFill(2),
+            Instruction::ConstLane(back.encode_u64()),
+            Instruction::Move(1),
+            Instruction::ConstZone(0),
+            Instruction::Cz,
+            Instruction::ConstLane(across.encode_u64()),
+            Instruction::Move(1),
+            Instruction::Cpu(Cpu::Halt),
+        ])
+    }
+
+    #[test]
+    fn replay_records_layers_lanes_and_cz_pairs() {
+        let arch = arch();
+        let unvalidated = ReplayOptions {
+            validate: false,
+            ..ReplayOptions::default()
+        };
+        let out = replay(&pairing_then_collision(), &arch, &unvalidated).unwrap();
+
+        assert_eq!(out.num_qubits, 2);
+        assert_eq!(out.num_layers(), 2);
+        assert_eq!(out.layer_pcs, vec![4, 8]);
+        assert_eq!(out.locations_at(0), &[Some(loc(0, 0)), Some(loc(1, 1))]);
+        assert_eq!(out.locations_at(1), &[Some(loc(0, 0)), Some(loc(1, 0))]);
+        assert_eq!(out.locations_at(2), &[None, None]);
+        assert_eq!(out.collided, vec![false, false, true, true]);
+
+        assert_eq!(out.lane_offsets, vec![0, 1, 2]);
+        assert_eq!(out.lane_qubits, vec![Some(1), Some(0)]);
+        let timing = MotionModel::default();
+        let ramps = 2.0 / timing.max_ramp_us;
+        // The site hop spans 3 µm, the word hop 5 µm.
+        assert_eq!(
+            out.lane_durations_us,
+            vec![
+                ramps + timing.const_jerk_min_duration_us(3.0),
+                ramps + timing.const_jerk_min_duration_us(5.0),
+            ]
+        );
+        assert_eq!(out.layer_durations_us, out.lane_durations_us);
+        assert_eq!(
+            out.total_move_time_us(),
+            out.lane_durations_us.iter().sum::<f64>()
+        );
+
+        assert_eq!(out.cz_pcs, vec![6]);
+        assert_eq!(out.cz_layers, vec![1]);
+        assert_eq!(out.cz_offsets, vec![0, 1]);
+        assert_eq!((out.cz_controls, out.cz_targets), (vec![0], vec![1]));
+    }
+
+    #[test]
+    fn validated_replay_rejects_an_inexecutable_layer() {
+        let err = replay(
+            &pairing_then_collision(),
+            &arch(),
+            &ReplayOptions::default(),
+        );
+
+        assert!(matches!(err, Err(ReplayError::Move { pc: 8, .. })));
+    }
+
+    #[test]
+    fn replay_matches_step_by_step_atom_state() {
+        use crate::atom_state::AtomStateData;
+
+        let arch = arch();
+        let fwd = lane(MoveType::WordBus, 0, 0, Direction::Forward);
+        let fwd2 = lane(MoveType::WordBus, 0, 1, Direction::Forward);
+        let p = program(vec![
+            Instruction::ConstLoc(loc(0, 0).encode()),
+            Instruction::ConstLoc(loc(0, 1).encode()),
+            Instruction::InitialFill(2),
+            Instruction::ConstLane(fwd.encode_u64()),
+            Instruction::ConstLane(fwd2.encode_u64()),
+            Instruction::Move(2),
+            Instruction::Return,
+        ]);
+        let out = replay(&p, &arch, &ReplayOptions::default()).unwrap();
+
+        let expected = AtomStateData::from_locations(&[(0, loc(0, 0)), (1, loc(0, 1))])
+            .apply_moves(&[fwd, fwd2], &arch)
+            .unwrap();
+        let row: Vec<Option<LocationAddr>> = (0..2)
+            .map(|q| expected.qubit_to_locations.get(&q).copied())
+            .collect();
+        assert_eq!(out.locations_at(1), row.as_slice());
+        assert_eq!(out.lanes, vec![fwd, fwd2]);
+        assert_eq!(out.lane_qubits, vec![Some(0), Some(1)]);
+        assert!(out.collided.iter().all(|&c| !c));
+    }
+
+    #[test]
+    fn replay_without_moves_has_one_location_row() {
+        let p = program(vec![
+            Instruction::ConstLoc(loc(1, 1).encode()),
+            Instruction::InitialFill(1),
+            Instruction::ConstLoc(loc(0, 0).encode()),
+            Instruction::Fill(1),
+            Instruction::Return,
+        ]);
+        let out = replay(&p, &arch(), &ReplayOptions::default()).unwrap();
+
+        assert_eq!(out.num_layers(), 0);
+        assert_eq!(out.lane_offsets, vec![0]);
+        assert_eq!(out.locations, vec![Some(loc(1, 1)), Some(loc(0, 0))]);
+    }
+
+    #[test]
+    fn replay_reports_bad_operands_and_fills() {
+        let arch = arch();
+        let missing = program(vec![Instruction::Move(1), Instruction::Return]);
+        assert_eq!(
+            replay(&missing, &arch, &ReplayOptions::default()),
+            Err(ReplayError::Operands { pc: 0 })
+        );
+
+        let mistyped = program(vec![
+            Instruction::ConstZone(0),
+            Instruction::InitialFill(1),
+            Instruction::Return,
+        ]);
+        assert_eq!(
+            replay(&mistyped, &arch, &ReplayOptions::default()),
+            Err(ReplayError::Operands { pc: 1 })
+        );
+
+        let doubled = program(vec![
+            Instruction::ConstLoc(loc(0, 0).encode()),
+            Instruction::Cpu(Cpu::Dup),
+            Instruction::InitialFill(2),
+            Instruction::Return,
+        ]);
+        assert!(matches!(
+            replay(&doubled, &arch, &ReplayOptions::default()),
+            Err(ReplayError::Fill { pc: 2, .. })
+        ));
+    }
+}
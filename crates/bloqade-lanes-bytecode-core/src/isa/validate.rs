@@ -8,7 +8,10 @@
 //! [`validate`] runs the arch-dependent capability + address checks below.
 //! [`validate_structure`] adds arch-independent structural checks, and
 //! [`simulate_stack`] adds optional stack-type simulation (underflow, type
-//! mismatches, and lane/location group validation).
+//! mismatches, and lane/location group validation). The per-instruction arch
+//! checks and the group checks run in parallel chunks on large programs; the
+//! stack walk itself stays sequential. [`validate_appended`] runs all three
+//! over only the instructions appended since a [`ValidationCheckpoint`].
 //!
 //! ## Capability checks
 //!
@@ -171,6 +174,31 @@ impl fmt::Display for ValidationError {
 
 impl std::error::Error for ValidationError {}
 
+impl ValidationError {
+    /// Program counter of the offending instruction; `None` only for
+    /// [`EmptyProgram`](Self::EmptyProgram).
+    pub fn pc(&self) -> Option<usize> {
+        match self {
+            ValidationError::EmptyProgram => None,
+            ValidationError::ControlFlowRequiresFeedForward { pc, .. }
+            | ValidationError::MultipleMeasuresRequireFeedForward { pc }
+            | ValidationError::FillRequiresAtomReloading { pc }
+            | ValidationError::InvalidLocation { pc, .. }
+            | ValidationError::InvalidLane { pc, .. }
+            | ValidationError::InvalidZone { pc, .. }
+            | ValidationError::NewArrayZeroDim0 { pc }
+            | ValidationError::NewArrayInvalidTypeTag { pc, .. }
+            | ValidationError::InitialFillNotFirst { pc }
+            | ValidationError::MissingTerminator { pc }
+            | ValidationError::UnreachableInstruction { pc }
+            | ValidationError::StackUnderflow { pc }
+            | ValidationError::TypeMismatch { pc, .. }
+            | ValidationError::LocationGroupValidation { pc, .. }
+            | ValidationError::LaneGroupValidation { pc, .. } => Some(*pc),
+        }
+    }
+}
+
 /// If `cpu` is a control-flow instruction, return its canonical mnemonic.
 ///
 /// `Return` is deliberately excluded: it is a terminator, not a feed-forward
@@ -186,59 +214,144 @@ fn control_flow_mnemonic(cpu: &Cpu) -> Option<&'static str> {
     }
 }
 
+/// Programs (and stack-simulated operand groups) smaller than these are
+/// checked on the calling thread; below them, spawning workers costs more
+/// than it saves.
+const PARALLEL_MIN_INSTRUCTIONS: usize = 1 << 14;
+const PARALLEL_MIN_GROUPS: usize = 1 << 10;
+
+/// Worker threads for the parallel checks: one per available core.
+fn available_workers() -> usize {
+    std::thread::available_parallelism().map_or(1, |n| n.get())
+}
+
+/// Apply `f` to contiguous chunks of `items` on up to `workers` scoped
+/// threads and concatenate the results in order. `f` receives each chunk's
+/// offset into `items`. Runs inline below `min_len` items.
+fn map_chunks<T, R, F>(workers: usize, items: &[T], min_len: usize, f: F) -> Vec<R>
+where
+    T: Sync,
+    R: Send,
+    F: Fn(usize, &[T]) -> Vec<R> + Sync,
+{
+    if workers < 2 || items.len() < min_len {
+        return f(0, items);
+    }
+    let chunk_len = items.len().div_ceil(workers);
+    std::thread::scope(|scope| {
+        let f = &f;
+        let handles: Vec<_> = items
+            .chunks(chunk_len)
+            .enumerate()
+            .map(|(i, chunk)| scope.spawn(move || f(i * chunk_len, chunk)))
+            .collect();
+        handles
+            .into_iter()
+            .flat_map(|handle| {
+                handle
+                    .join()
+                    .unwrap_or_else(|panic| std::panic::resume_unwind(panic))
+            })
+            .collect()
+    })
+}
+
 /// Validate a program's arch-dependent constraints (capabilities + addresses).
 ///
 /// When `arch` is `None`, all checks are skipped and an empty list is returned.
 /// Otherwise every violation is collected in program order (the validator does
 /// not stop at the first error), so callers can report them all at once.
+/// Large programs are checked in parallel chunks; the result is the same.
 pub fn validate(program: &Program, arch: Option<&ArchSpec>) -> Vec<ValidationError> {
     let Some(arch) = arch else {
         return Vec::new();
     };
+    check_arch(arch, &program.code, 0, 0, available_workers())
+}
 
-    let mut errors = Vec::new();
-    let mut measure_count = 0u32;
+/// Arch checks for `code`, which starts at program counter `offset` and is
+/// preceded by `measures_before` `measure` instructions.
+fn check_arch(
+    arch: &ArchSpec,
+    code: &[Instruction],
+    offset: usize,
+    measures_before: u32,
+    workers: usize,
+) -> Vec<ValidationError> {
+    let mut errors = map_chunks(workers, code, PARALLEL_MIN_INSTRUCTIONS, |start, chunk| {
+        // A chunk does not know how many measures precede it, so it flags
+        // every one; the program's first measure is exempted below.
+        let mut measure_count = 1;
+        let mut errors = Vec::new();
+        for (i, inst) in chunk.iter().enumerate() {
+            check_instruction(
+                arch,
+                offset + start + i,
+                inst,
+                &mut measure_count,
+                &mut errors,
+            );
+        }
+        errors
+    });
+    if measures_before == 0
+        && let Some(first) = errors.iter().position(|e| {
+            matches!(
+                e,
+                ValidationError::MultipleMeasuresRequireFeedForward { .. }
+            )
+        })
+    {
+        errors.remove(first);
+    }
+    errors
+}
 
-    for (pc, inst) in program.code.iter().enumerate() {
-        match inst {
-            // ---- capability checks ----
-            Instruction::Cpu(cpu) if !arch.feed_forward => {
-                if let Some(mnemonic) = control_flow_mnemonic(cpu) {
-                    errors.push(ValidationError::ControlFlowRequiresFeedForward { pc, mnemonic });
-                }
-            }
-            Instruction::Measure(_) => {
-                measure_count += 1;
-                if !arch.feed_forward && measure_count > 1 {
-                    errors.push(ValidationError::MultipleMeasuresRequireFeedForward { pc });
-                }
+/// The arch checks for one instruction. `measure_count` counts the `measure`
+/// instructions before `pc` and is advanced past this one.
+fn check_instruction(
+    arch: &ArchSpec,
+    pc: usize,
+    inst: &Instruction,
+    measure_count: &mut u32,
+    errors: &mut Vec<ValidationError>,
+) {
+    match inst {
+        // ---- capability checks ----
+        Instruction::Cpu(cpu) if !arch.feed_forward => {
+            if let Some(mnemonic) = control_flow_mnemonic(cpu) {
+                errors.push(ValidationError::ControlFlowRequiresFeedForward { pc, mnemonic });
             }
-            Instruction::Fill(_) if !arch.atom_reloading => {
-                errors.push(ValidationError::FillRequiresAtomReloading { pc });
+        }
+        Instruction::Measure(_) => {
+            *measure_count += 1;
+            if !arch.feed_forward && *measure_count > 1 {
+                errors.push(ValidationError::MultipleMeasuresRequireFeedForward { pc });
             }
+        }
+        Instruction::Fill(_) if !arch.atom_reloading => {
+            errors.push(ValidationError::FillRequiresAtomReloading { pc });
+        }
 
-            // ---- address checks ----
-            Instruction::ConstLoc(bits) => {
-                if let Some(message) = arch.check_location(&LocationAddr::decode(*bits)) {
-                    errors.push(ValidationError::InvalidLocation { pc, message });
-                }
+        // ---- address checks ----
+        Instruction::ConstLoc(bits) => {
+            if let Some(message) = arch.check_location(&LocationAddr::decode(*bits)) {
+                errors.push(ValidationError::InvalidLocation { pc, message });
             }
-            Instruction::ConstLane(bits) => {
-                for message in arch.check_lane(&LaneAddr::decode_u64(*bits)) {
-                    errors.push(ValidationError::InvalidLane { pc, message });
-                }
+        }
+        Instruction::ConstLane(bits) => {
+            for message in arch.check_lane(&LaneAddr::decode_u64(*bits)) {
+                errors.push(ValidationError::InvalidLane { pc, message });
             }
-            Instruction::ConstZone(bits) => {
-                if let Some(message) = arch.check_zone(&ZoneAddr::decode(*bits)) {
-                    errors.push(ValidationError::InvalidZone { pc, message });
-                }
+        }
+        Instruction::ConstZone(bits) => {
+            if let Some(message) = arch.check_zone(&ZoneAddr::decode(*bits)) {
+                errors.push(ValidationError::InvalidZone { pc, message });
             }
-
-            _ => {}
         }
-    }
 
-    errors
+        _ => {}
+    }
 }
 
 /// True if `inst` terminates execution (`return` or `halt`).
@@ -257,14 +370,23 @@ fn is_constant_push(inst: &Instruction) -> bool {
     )
 }
 
-/// Validate a program's arch-independent structural rules: `new_array` operand
-/// bounds, `initial_fill` ordering, and terminator/reachability. These never
-/// consult an arch spec, so they always run.
-pub fn validate_structure(program: &Program) -> Vec<ValidationError> {
-    let mut errors = Vec::new();
-    let mut seen_non_constant = false;
+/// Running state of the structural checks.
+#[derive(Debug, Clone, Default)]
+struct StructureState {
+    seen_non_constant: bool,
+    terminated: bool,
+}
 
-    for (pc, inst) in program.code.iter().enumerate() {
+impl StructureState {
+    /// Structural checks for one instruction. Unreachable instructions are
+    /// reported separately because they suppress `MissingTerminator`.
+    fn check(
+        &mut self,
+        pc: usize,
+        inst: &Instruction,
+        errors: &mut Vec<ValidationError>,
+        unreachable: &mut Vec<ValidationError>,
+    ) {
         match inst {
             Instruction::NewArray(type_tag, dim0, _dim1) => {
                 if *dim0 == 0 {
@@ -276,33 +398,41 @@ pub fn validate_structure(program: &Program) -> Vec<ValidationError> {
                         type_tag: *type_tag,
                     });
                 }
-                seen_non_constant = true;
+                self.seen_non_constant = true;
             }
             Instruction::InitialFill(_) => {
-                if seen_non_constant {
+                if self.seen_non_constant {
                     errors.push(ValidationError::InitialFillNotFirst { pc });
                 }
-                seen_non_constant = true;
+                self.seen_non_constant = true;
             }
             inst if is_constant_push(inst) => {}
-            _ => seen_non_constant = true,
+            _ => self.seen_non_constant = true,
         }
-    }
 
-    // Any instruction after the first terminator is unreachable. If there are
-    // unreachable instructions they explain a non-terminal last instruction, so
-    // `MissingTerminator` would be a redundant second error.
-    let mut found_terminator = false;
-    let mut unreachable = Vec::new();
-    for (pc, inst) in program.code.iter().enumerate() {
-        if found_terminator {
+        // Any instruction after the first terminator is unreachable.
+        if self.terminated {
             unreachable.push(ValidationError::UnreachableInstruction { pc });
         }
         if is_terminator(inst) {
-            found_terminator = true;
+            self.terminated = true;
         }
     }
+}
+
+/// Validate a program's arch-independent structural rules: `new_array` operand
+/// bounds, `initial_fill` ordering, and terminator/reachability. These never
+/// consult an arch spec, so they always run.
+pub fn validate_structure(program: &Program) -> Vec<ValidationError> {
+    let mut state = StructureState::default();
+    let mut errors = Vec::new();
+    let mut unreachable = Vec::new();
+    for (pc, inst) in program.code.iter().enumerate() {
+        state.check(pc, inst, &mut errors, &mut unreachable);
+    }
 
+    // If there are unreachable instructions they explain a non-terminal last
+    // instruction, so `MissingTerminator` would be a redundant second error.
     if unreachable.is_empty() {
         match program.code.last() {
             None => errors.push(ValidationError::EmptyProgram),
@@ -327,27 +457,38 @@ struct SimEntry {
     value: Option<u64>,
 }
 
+/// What an operand group popped by the simulator holds.
+#[derive(Debug, Clone, Copy)]
+enum GroupKind {
+    Locations,
+    Lanes,
+}
+
+/// A location or lane group popped at `pc`, whose concrete bits are
+/// `operands[start..start + len]` of the simulator, in pop order.
+#[derive(Debug, Clone, Copy)]
+struct OperandGroup {
+    pc: usize,
+    kind: GroupKind,
+    start: usize,
+    len: usize,
+}
+
 /// Type-level stack simulator: walks the instruction stream tracking value
-/// types, reporting underflow and type mismatches, and — when given an
-/// [`ArchSpec`] — validating `move` lane groups and `fill`/`local_*` location
-/// groups (duplicates only without an arch).
-struct StackSimulator<'a> {
+/// types and reporting underflow and type mismatches. The `move` lane groups
+/// and `fill`/`local_*` location groups it pops are recorded in one flat
+/// operand buffer and validated afterwards by [`check_groups`], which needs
+/// no stack state and so can run in parallel.
+#[derive(Default)]
+struct StackSimulator {
     stack: Vec<SimEntry>,
     errors: Vec<ValidationError>,
-    arch: Option<&'a ArchSpec>,
     pc: usize,
+    groups: Vec<OperandGroup>,
+    operands: Vec<u64>,
 }
 
-impl<'a> StackSimulator<'a> {
-    fn new(arch: Option<&'a ArchSpec>) -> Self {
-        Self {
-            stack: Vec::new(),
-            errors: Vec::new(),
-            arch,
-            pc: 0,
-        }
-    }
-
+impl StackSimulator {
     fn pop_any(&mut self) {
         if self.stack.pop().is_none() {
             self.errors
@@ -421,70 +562,26 @@ impl<'a> StackSimulator<'a> {
         }
     }
 
-    /// Report each uniquely-duplicated location once (no-arch fallback).
-    fn check_duplicate_locations(&mut self, locations: &[LocationAddr]) {
-        let mut seen = HashSet::new();
-        let mut reported = HashSet::new();
-        for loc in locations {
-            let bits = loc.encode();
-            if !seen.insert(bits) && reported.insert(bits) {
-                self.errors.push(ValidationError::LocationGroupValidation {
-                    pc: self.pc,
-                    error: LocationGroupError::DuplicateAddress { address: bits },
-                });
-            }
-        }
-    }
-
-    /// Report each uniquely-duplicated lane once (no-arch fallback).
-    fn check_duplicate_lanes(&mut self, lanes: &[LaneAddr]) {
-        let mut seen = HashSet::new();
-        let mut reported = HashSet::new();
-        for lane in lanes {
-            let (d0, d1) = lane.encode();
-            let combined = (d0 as u64) | ((d1 as u64) << 32);
-            if !seen.insert(combined) && reported.insert(combined) {
-                self.errors.push(ValidationError::LaneGroupValidation {
-                    pc: self.pc,
-                    error: LaneGroupError::DuplicateAddress { address: (d0, d1) },
-                });
-            }
-        }
-    }
-
-    /// Pop `arity` locations and validate them as a group.
-    fn pop_and_validate_locations(&mut self, arity: u32) {
-        let bits: Vec<Option<u64>> = (0..arity).map(|_| self.pop_addr(tag::LOCATION)).collect();
-        let locations: Vec<LocationAddr> = bits
-            .iter()
-            .filter_map(|v| v.map(LocationAddr::decode))
-            .collect();
-        let pc = self.pc;
-        if let Some(arch) = self.arch {
-            for error in arch.check_locations(&locations) {
-                self.errors
-                    .push(ValidationError::LocationGroupValidation { pc, error });
+    /// Pop `arity` addresses and record the well-typed ones as a group.
+    fn pop_group(&mut self, kind: GroupKind, arity: u32) {
+        let expected = match kind {
+            GroupKind::Locations => tag::LOCATION,
+            GroupKind::Lanes => tag::LANE,
+        };
+        let start = self.operands.len();
+        for _ in 0..arity {
+            if let Some(bits) = self.pop_addr(expected) {
+                self.operands.push(bits);
             }
-        } else {
-            self.check_duplicate_locations(&locations);
         }
-    }
-
-    /// Pop `arity` lanes and validate them as a group.
-    fn sim_move(&mut self, arity: u32) {
-        let bits: Vec<Option<u64>> = (0..arity).map(|_| self.pop_addr(tag::LANE)).collect();
-        let lanes: Vec<LaneAddr> = bits
-            .iter()
-            .filter_map(|v| v.map(LaneAddr::decode_u64))
-            .collect();
-        let pc = self.pc;
-        if let Some(arch) = self.arch {
-            for error in arch.check_lanes(&lanes) {
-                self.errors
-                    .push(ValidationError::LaneGroupValidation { pc, error });
-            }
-        } else {
-            self.check_duplicate_lanes(&lanes);
+        let len = self.operands.len() - start;
+        if len > 0 {
+            self.groups.push(OperandGroup {
+                pc: self.pc,
+                kind,
+                start,
+                len,
+            });
         }
     }
 
@@ -504,18 +601,18 @@ impl<'a> StackSimulator<'a> {
 
             // atom arrangement
             Instruction::InitialFill(arity) | Instruction::Fill(arity) => {
-                self.pop_and_validate_locations(*arity)
+                self.pop_group(GroupKind::Locations, *arity)
             }
-            Instruction::Move(arity) => self.sim_move(*arity),
+            Instruction::Move(arity) => self.pop_group(GroupKind::Lanes, *arity),
 
             // gates
             Instruction::LocalR(arity) => {
                 self.pop_typed_n(tag::FLOAT, 2);
-                self.pop_and_validate_locations(*arity);
+                self.pop_group(GroupKind::Locations, *arity);
             }
             Instruction::LocalRz(arity) => {
                 self.pop_typed_n(tag::FLOAT, 1);
-                self.pop_and_validate_locations(*arity);
+                self.pop_group(GroupKind::Locations, *arity);
             }
             Instruction::GlobalR => self.pop_typed_n(tag::FLOAT, 2),
             Instruction::GlobalRz => self.pop_typed_n(tag::FLOAT, 1),
@@ -568,12 +665,114 @@ impl<'a> StackSimulator<'a> {
         }
     }
 
-    fn run(mut self, program: &Program) -> Vec<ValidationError> {
-        for (pc, inst) in program.code.iter().enumerate() {
-            self.pc = pc;
+    /// Simulate `code`, whose first instruction is at program counter `offset`.
+    fn run(&mut self, code: &[Instruction], offset: usize) {
+        for (i, inst) in code.iter().enumerate() {
+            self.pc = offset + i;
             self.dispatch(inst);
         }
-        self.errors
+    }
+
+    /// Validate the recorded groups and return every error in program order.
+    /// At one `pc`, group errors follow the stack errors, since each group is
+    /// the last thing its instruction pops.
+    fn finish(self, arch: Option<&ArchSpec>, workers: usize) -> Vec<ValidationError> {
+        let group_errors = check_groups(&self.groups, &self.operands, arch, workers);
+        let mut errors = Vec::with_capacity(self.errors.len() + group_errors.len());
+        let mut group_errors = group_errors.into_iter().peekable();
+        for error in self.errors {
+            while let Some(group_error) =
+                group_errors.next_if(|group_error| group_error.pc() < error.pc())
+            {
+                errors.push(group_error);
+            }
+            errors.push(error);
+        }
+        errors.extend(group_errors);
+        errors
+    }
+}
+
+/// Validate location and lane groups: against `arch` when provided, else
+/// for duplicates only. Many groups are checked in parallel chunks.
+fn check_groups(
+    groups: &[OperandGroup],
+    operands: &[u64],
+    arch: Option<&ArchSpec>,
+    workers: usize,
+) -> Vec<ValidationError> {
+    map_chunks(workers, groups, PARALLEL_MIN_GROUPS, |_, chunk| {
+        let mut errors = Vec::new();
+        let mut locations = Vec::new();
+        let mut lanes = Vec::new();
+        for group in chunk {
+            let pc = group.pc;
+            let bits = &operands[group.start..group.start + group.len];
+            match group.kind {
+                GroupKind::Locations => {
+                    locations.clear();
+                    locations.extend(bits.iter().map(|&b| LocationAddr::decode(b)));
+                    if let Some(arch) = arch {
+                        errors.extend(
+                            arch.check_locations(&locations).into_iter().map(|error| {
+                                ValidationError::LocationGroupValidation { pc, error }
+                            }),
+                        );
+                    } else {
+                        check_duplicate_locations(pc, &locations, &mut errors);
+                    }
+                }
+                GroupKind::Lanes => {
+                    lanes.clear();
+                    lanes.extend(bits.iter().map(|&b| LaneAddr::decode_u64(b)));
+                    if let Some(arch) = arch {
+                        errors.extend(
+                            arch.check_lanes(&lanes)
+                                .into_iter()
+                                .map(|error| ValidationError::LaneGroupValidation { pc, error }),
+                        );
+                    } else {
+                        check_duplicate_lanes(pc, &lanes, &mut errors);
+                    }
+                }
+            }
+        }
+        errors
+    })
+}
+
+/// Report each uniquely-duplicated location once (no-arch fallback).
+fn check_duplicate_locations(
+    pc: usize,
+    locations: &[LocationAddr],
+    errors: &mut Vec<ValidationError>,
+) {
+    let mut seen = HashSet::new();
+    let mut reported = HashSet::new();
+    for loc in locations {
+        let bits = loc.encode();
+        if !seen.insert(bits) && reported.insert(bits) {
+            errors.push(ValidationError::LocationGroupValidation {
+                pc,
+                error: LocationGroupError::DuplicateAddress { address: bits },
+            });
+        }
+    }
+}
+
+/// Report each uniquely-duplicated lane once (no-arch fallback).
+fn check_duplicate_lanes(pc: usize, lanes: &[LaneAddr], errors: &mut Vec<ValidationError>) {
+    let mut seen = HashSet::new();
+    let mut reported = HashSet::new();
+    for lane in lanes {
+        let (d0, d1) = lane.encode();
+        let combined = (d0 as u64) | ((d1 as u64) << 32);
+        if !seen.insert(combined) && reported.insert(combined) {
+            errors.push(ValidationError::LaneGroupValidation {
+                pc,
+                error: LaneGroupError::DuplicateAddress { address: (d0, d1) },
+            });
+        }
     }
 }
 
@@ -581,7 +780,111 @@ impl<'a> StackSimulator<'a> {
 /// type-mismatch errors, plus lane/location group errors (validated against
 /// `arch` when provided, else duplicate-only).
 pub fn simulate_stack(program: &Program, arch: Option<&ArchSpec>) -> Vec<ValidationError> {
-    StackSimulator::new(arch).run(program)
+    let mut sim = StackSimulator::default();
+    sim.run(&program.code, 0);
+    sim.finish(arch, available_workers())
+}
+
+// ── Incremental validation ─────────────────────────────────────────────────
+
+/// Validator state after a program prefix, for [`validate_appended`].
+///
+/// Holds the structural flags, the `measure` count and the simulated stack,
+/// so a program that only grows can be validated one appended suffix at a
+/// time. A checkpoint describes the exact prefix it was advanced over; using
+/// it with a program whose first [`len`](Self::len) instructions differ gives
+/// meaningless results.
+#[derive(Debug, Clone, Default)]
+pub struct ValidationCheckpoint {
+    len: usize,
+    structure: StructureState,
+    measure_count: u32,
+    stack: Vec<SimEntry>,
+}
+
+impl ValidationCheckpoint {
+    /// Number of instructions validated so far.
+    pub fn len(&self) -> usize {
+        self.len
+    }
+
+    /// True if no instruction has been validated yet.
+    pub fn is_empty(&self) -> bool {
+        self.len == 0
+    }
+
+    /// The terminator error for the prefix validated so far, as if it were
+    /// the whole program: `EmptyProgram`, `MissingTerminator` when no
+    /// instruction is a terminator, or `None`. (A program whose last
+    /// instruction follows an earlier terminator reports those instructions
+    /// as unreachable instead.)
+    pub fn termination_error(&self) -> Option<ValidationError> {
+        if self.len == 0 {
+            Some(ValidationError::EmptyProgram)
+        } else if !self.structure.terminated {
+            Some(ValidationError::MissingTerminator { pc: self.len - 1 })
+        } else {
+            None
+        }
+    }
+}
+
+/// Validate the instructions appended to `program` since `checkpoint` and
+/// advance the checkpoint past them.
+///
+/// Runs the structural checks, the arch checks of [`validate`] (when `arch`
+/// is given) and, with `stack`, [`simulate_stack`] over
+/// `program.code[checkpoint.len()..]` only, resuming from the saved state.
+/// Across all calls this reports the same errors as the one-shot validators
+/// on the final program, except the terminator check, which is left to
+/// [`ValidationCheckpoint::termination_error`] once the program is complete.
+/// Errors come back grouped by validator within each call. Pass the same
+/// `arch` and `stack` on every call for a checkpoint.
+pub fn validate_appended(
+    program: &Program,
+    arch: Option<&ArchSpec>,
+    stack: bool,
+    checkpoint: &mut ValidationCheckpoint,
+) -> Vec<ValidationError> {
+    let offset = checkpoint.len;
+    let suffix = program.code.get(offset..).unwrap_or_default();
+
+    let mut errors = Vec::new();
+    let mut unreachable = Vec::new();
+    for (i, inst) in suffix.iter().enumerate() {
+        checkpoint
+            .structure
+            .check(offset + i, inst, &mut errors, &mut unreachable);
+    }
+    errors.extend(unreachable);
+
+    if let Some(arch) = arch {
+        errors.extend(check_arch(
+            arch,
+            suffix,
+            offset,
+            checkpoint.measure_count,
+            available_workers(),
+        ));
+    }
+    let measures = suffix
+        .iter()
+        .filter(|inst| matches!(inst, Instruction::Measure(_)))
+        .count();
+    checkpoint.measure_count = checkpoint.measure_count.saturating_add(measures as u32);
+
+    if stack {
+        let mut sim = StackSimulator {
+            stack: std::mem::take(&mut checkpoint.stack),
+            ..StackSimulator::default()
+        };
+        sim.run(suffix, offset);
+        checkpoint.stack = std::mem::take(&mut sim.stack);
+        errors.extend(sim.finish(arch, available_workers()));
+    }
+
+    checkpoint.len = offset + suffix.len();
+    errors
 }
 
 #[cfg(test)]
@@ -1364,4 +1667,193 @@ mod tests {
             "got {errors:?}"
         );
     }
+
+    // ---- parallel and incremental validation ----
+
+    /// Every validator over `p` in one shot, minus the terminator check.
+    fn one_shot(p: &Program, arch: Option<&ArchSpec>) -> Vec<ValidationError> {
+        validate_structure(p)
+            .into_iter()
+            .chain(validate(p, arch))
+            .chain(simulate_stack(p, arch))
+            .filter(|e| {
+                !matches!(
+                    e,
+                    ValidationError::EmptyProgram | ValidationError::MissingTerminator { .. }
+                )
+            })
+            .collect()
+    }
+
+    /// Validate `p` by appending `step` instructions at a time.
+    fn appended(
+        p: &Program,
+        arch: Option<&ArchSpec>,
+        step: usize,
+    ) -> (Vec<ValidationError>, ValidationCheckpoint) {
+        let mut checkpoint = ValidationCheckpoint::default();
+        let mut errors = Vec::new();
+        let mut end = 0;
+        while end < p.code.len() {
+            end = (end + step).min(p.code.len());
+            let prefix = program(p.code[..end].to_vec());
+            errors.extend(validate_appended(&prefix, arch, true, &mut checkpoint));
+        }
+        (errors, checkpoint)
+    }
+
+    fn sorted(mut errors: Vec<ValidationError>) -> Vec<(Option<usize>, String)> {
+        let mut keyed: Vec<_> = errors.drain(..).map(|e| (e.pc(), e.to_string())).collect();
+        keyed.sort();
+        keyed
+    }
+
+    /// A body that trips capability, address, structural, stack and group
+    /// checks, repeated until both parallel thresholds are exceeded.
+    fn large_program() -> Program {
+        let body = [
+            Instruction::ConstLoc(loc(0, 0, 0)),
+            Instruction::ConstLoc(loc(0, 0, 0)),
+            Instruction::Fill(2),
+            Instruction::ConstZone(0),
+            Instruction::Measure(1),
+            Instruction::AwaitMeasure,
+            Instruction::Pop,
+            Instruction::ConstLoc(loc(0, 0, 1)),
+            Instruction::ConstLoc(loc(0, 0, 1)),
+            Instruction::LocalRz(2),
+            Instruction::ConstZone(7),
+            Instruction::Cz,
+            Instruction::NewArray(0, 0, 0),
+        ];
+        let repeats = PARALLEL_MIN_INSTRUCTIONS.div_ceil(body.len()) + PARALLEL_MIN_GROUPS;
+        let mut code: Vec<Instruction> = body
+            .iter()
+            .cycle()
+            .take(body.len() * repeats)
+            .cloned()
+            .collect();
+        code.push(Instruction::Return);
+        program(code)
+    }
+
+    #[test]
+    fn parallel_validation_matches_sequential_checks() {
+        let arch = simple_arch();
+        let p = large_program();
+        let mut expected = Vec::new();
+        let mut measure_count = 0;
+        for (pc, inst) in p.code.iter().enumerate() {
+            check_instruction(&arch, pc, inst, &mut measure_count, &mut expected);
+        }
+        for workers in [1, 3, 8] {
+            assert_eq!(check_arch(&arch, &p.code, 0, 0, workers), expected);
+        }
+        assert_eq!(validate(&p, Some(&arch)), expected);
+    }
+
+    #[test]
+    fn parallel_group_checks_match_sequential() {
+        let p = large_program();
+        for arch in [None, Some(simple_arch())] {
+            let sequential = {
+                let mut sim = StackSimulator::default();
+                sim.run(&p.code, 0);
+                sim.finish(arch.as_ref(), 1)
+            };
+            assert!(
+                sequential
+                    .iter()
+                    .any(|e| matches!(e, ValidationError::LocationGroupValidation { .. }))
+            );
+            assert!(sequential.windows(2).all(|w| w[0].pc() <= w[1].pc()));
+            for workers in [3, 8] {
+                let mut sim = StackSimulator::default();
+                sim.run(&p.code, 0);
+                assert_eq!(sim.finish(arch.as_ref(), workers), sequential);
+            }
+        }
+    }
+
+    #[test]
+    fn group_errors_follow_stack_errors_at_the_same_pc() {
+        // `local_rz 2` pops a location as its angle (type mismatch), then a
+        // one-location group, then underflows.
+        let p = program(vec![
+            Instruction::ConstLoc(loc(0, 0, 0)),
+            Instruction::ConstLoc(loc(0, 0, 0)),
+            Instruction::LocalRz(2),
+        ]);
+        let errors = simulate_stack(&p, Some(&simple_arch()));
+        assert_eq!(
+            errors,
+            vec![
+                ValidationError::TypeMismatch {
+                    pc: 2,
+                    expected: tag::FLOAT,
+                    got: tag::LOCATION
+                },
+                ValidationError::StackUnderflow { pc: 2 },
+            ]
+        );
+    }
+
+    #[test]
+    fn appended_validation_matches_one_shot() {
+        let arch = simple_arch();
+        let p = large_program();
+        let (errors, checkpoint) = appended(&p, Some(&arch), 4096);
+        assert_eq!(checkpoint.len(), p.code.len());
+        assert_eq!(checkpoint.termination_error(), None);
+        assert_eq!(sorted(errors), sorted(one_shot(&p, Some(&arch))));
+    }
+
+    #[test]
+    fn appended_validation_matches_one_shot_at_every_split() {
+        let p = program(vec![
+            Instruction::ConstZone(0),
+            Instruction::Measure(1),
+            Instruction::ConstLoc(loc(0, 0, 0)),
+            Instruction::InitialFill(1),
+            Instruction::ConstZone(0),
+            Instruction::Measure(1),
+            Instruction::Swap,
+            Instruction::Cpu(Cpu::Halt),
+            Instruction::Pop,
+        ]);
+        for arch in [None, Some(simple_arch())] {
+            for step in 1..=p.code.len() {
+                let (errors, _) = appended(&p, arch.as_ref(), step);
+                assert_eq!(
+                    sorted(errors),
+                    sorted(one_shot(&p, arch.as_ref())),
+                    "step {step}"
+                );
+            }
+        }
+    }
+
+    #[test]
+    fn checkpoint_termination_error() {
+        let mut checkpoint = ValidationCheckpoint::default();
+        assert!(checkpoint.is_empty());
+        assert_eq!(
+            checkpoint.termination_error(),
+            Some(ValidationError::EmptyProgram)
+        );
+
+        let open = program(vec![Instruction::ConstZone(0), Instruction::Cz]);
+        validate_appended(&open, None, true, &mut checkpoint);
+        assert_eq!(
+            checkpoint.termination_error(),
+            Some(ValidationError::MissingTerminator { pc: 1 })
+        );
+
+        let mut code = open.code.clone();
+        code.push(Instruction::Cpu(Cpu::Halt));
+        let closed = program(code);
+        assert!(validate_appended(&closed, None, true, &mut checkpoint).is_empty());
+        assert_eq!(checkpoint.len(), 3);
+        assert_eq!(checkpoint.termination_error(), None);
+    }
 }
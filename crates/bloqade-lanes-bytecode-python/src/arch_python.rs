@@ -1,10 +1,14 @@
+use std::sync::{Arc, OnceLock};
+
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
 
 // `PyObject` was removed from pyo3 0.29's exports; keep the historical alias
 // so `check_locations` / `check_lanes` return-type signatures stay legible.
 pub(crate) type PyObject = Py<PyAny>;
 
 use bloqade_lanes_bytecode_core::arch::addr as rs_addr;
+use bloqade_lanes_bytecode_core::arch::tables::ArchTables;
 use bloqade_lanes_bytecode_core::arch::types as rs;
 use bloqade_lanes_bytecode_core::version::Version;
 
@@ -902,6 +906,68 @@ impl PyTransportPath {
 #[derive(Clone)]
 pub struct PyArchSpec {
     pub(crate) inner: rs::ArchSpec,
+    /// Lookup tables for `inner`, built on first use (eagerly by
+    /// `from_json_validated`) and shared by clones. `inner` is never
+    /// mutated after construction, so the tables cannot go stale.
+    tables: Arc<OnceLock<ArchTables>>,
+}
+
+impl PyArchSpec {
+    fn wrap(inner: rs::ArchSpec) -> Self {
+        Self {
+            inner,
+            tables: Arc::default(),
+        }
+    }
+
+    /// The precomputed lookup tables for this spec.
+    pub(crate) fn tables(&self) -> &ArchTables {
+        self.tables.get_or_init(|| ArchTables::new(&self.inner))
+    }
+
+    /// Int64 location ordinal of `loc`, `-1` if it has none.
+    fn ordinal_or_neg(&self, loc: &rs_addr::LocationAddr) -> i64 {
+        self.tables()
+            .location_ordinal(loc)
+            .map_or(-1, |ordinal| ordinal as i64)
+    }
+}
+
+fn i64_le_bytes<'py>(py: Python<'py>, values: impl Iterator<Item = i64>) -> Bound<'py, PyBytes> {
+    let bytes: Vec<u8> = values.flat_map(i64::to_le_bytes).collect();
+    PyBytes::new(py, &bytes)
+}
+
+/// The little-endian ``uint64`` words of ``bytes``.
+fn u64_words(name: &str, bytes: &Bound<'_, PyBytes>) -> PyResult<Vec<u64>> {
+    let bytes = bytes.as_bytes();
+    if !bytes.len().is_multiple_of(8) {
+        return Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "{name} has {} bytes, not a multiple of 8",
+            bytes.len()
+        )));
+    }
+    Ok(bytes
+        .chunks_exact(8)
+        .map(|word| u64::from_le_bytes(word.try_into().expect("8-byte chunk")))
+        .collect())
+}
+
+/// Group boundaries read from ``bytes``, checked to be non-decreasing and at
+/// most ``len`` so that every group is a valid slice.
+fn group_offsets(name: &str, bytes: &Bound<'_, PyBytes>, len: usize) -> PyResult<Vec<usize>> {
+    let offsets: Vec<usize> = u64_words(name, bytes)?
+        .into_iter()
+        .map(|offset| usize::try_from(offset).unwrap_or(usize::MAX))
+        .collect();
+    if offsets.windows(2).any(|bounds| bounds[0] > bounds[1])
+        || offsets.last().is_some_and(|&last| last > len)
+    {
+        return Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "{name} must be non-decreasing and at most {len}"
+        )));
+    }
+    Ok(offsets)
 }
 
 #[pymethods]
@@ -920,26 +986,24 @@ impl PyArchSpec {
         atom_reloading: bool,
         blockade_radius: Option<f64>,
     ) -> PyResult<Self> {
-        Ok(Self {
-            inner: rs::ArchSpec {
-                version: Version::new(version.0, version.1),
-                words: words.iter().map(|w| w.inner.clone()).collect(),
-                zones: zones.iter().map(|z| z.inner.clone()).collect(),
-                zone_buses: zone_buses.iter().map(|b| b.inner.clone()).collect(),
-                modes: modes.iter().map(|m| m.inner.clone()).collect(),
-                paths: paths.map(|v| v.iter().map(|p| p.inner.clone()).collect()),
-                feed_forward,
-                atom_reloading,
-                blockade_radius,
-            },
-        })
+        Ok(Self::wrap(rs::ArchSpec {
+            version: Version::new(version.0, version.1),
+            words: words.iter().map(|w| w.inner.clone()).collect(),
+            zones: zones.iter().map(|z| z.inner.clone()).collect(),
+            zone_buses: zone_buses.iter().map(|b| b.inner.clone()).collect(),
+            modes: modes.iter().map(|m| m.inner.clone()).collect(),
+            paths: paths.map(|v| v.iter().map(|p| p.inner.clone()).collect()),
+            feed_forward,
+            atom_reloading,
+            blockade_radius,
+        }))
     }
 
     #[staticmethod]
     fn from_json(json: &str) -> PyResult<Self> {
         let inner = rs::ArchSpec::from_json(json)
             .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
-        Ok(Self { inner })
+        Ok(Self::wrap(inner))
     }
 
     fn to_json(&self) -> PyResult<String> {
@@ -951,7 +1015,9 @@ impl PyArchSpec {
     fn from_json_validated(json: &str, py: Python<'_>) -> PyResult<Self> {
         let inner = rs::ArchSpec::from_json_validated(json)
             .map_err(|e| crate::errors::arch_spec_load_error_to_py(py, &e))?;
-        Ok(Self { inner })
+        let spec = Self::wrap(inner);
+        spec.tables();
+        Ok(spec)
     }
 
     fn validate(&self, py: Python<'_>) -> PyResult<()> {
@@ -1051,7 +1117,10 @@ impl PyArchSpec {
     /// Returns None if the zone, word, or site is not found.
     #[pyo3(text_signature = "(self, loc)")]
     fn location_position(&self, loc: &PyLocationAddr) -> Option<(f64, f64)> {
-        self.inner.location_position(&loc.inner)
+        match self.tables().location_ordinal(&loc.inner) {
+            Some(ordinal) => self.tables().positions()[ordinal],
+            None => self.inner.location_position(&loc.inner),
+        }
     }
 
     /// Resolve a lane address to its source and destination location addresses.
@@ -1064,7 +1133,7 @@ impl PyArchSpec {
     /// references an invalid bus, word, or site.
     #[pyo3(text_signature = "(self, lane)")]
     fn lane_endpoints(&self, lane: &PyLaneAddr) -> Option<(PyLocationAddr, PyLocationAddr)> {
-        let (src, dst) = self.inner.lane_endpoints(&lane.inner)?;
+        let (src, dst) = self.tables().lane_endpoints(&lane.inner)?;
         Some((PyLocationAddr { inner: src }, PyLocationAddr { inner: dst }))
     }
 
@@ -1075,9 +1144,11 @@ impl PyArchSpec {
     /// Returns None if the word is not in any entangling pair.
     #[pyo3(text_signature = "(self, loc)")]
     fn get_cz_partner(&self, loc: &PyLocationAddr) -> Option<PyLocationAddr> {
-        self.inner
-            .get_cz_partner(&loc.inner)
-            .map(|l| PyLocationAddr { inner: l })
+        let partner = match self.tables().location_ordinal(&loc.inner) {
+            Some(ordinal) => self.tables().cz_partners()[ordinal],
+            None => self.inner.get_cz_partner(&loc.inner),
+        };
+        partner.map(|l| PyLocationAddr { inner: l })
     }
 
     /// Resolve a ``(zone, row, col)`` grid coordinate to a ``LocationAddress``.
@@ -1087,7 +1158,7 @@ impl PyArchSpec {
     /// ``(word_id, site_id)`` within the zone), or None if no atom occupies it.
     #[pyo3(text_signature = "(self, zone, row, col)")]
     fn location_at(&self, zone: u32, row: u32, col: u32) -> Option<PyLocationAddr> {
-        self.inner
+        self.tables()
             .location_at(zone, row, col)
             .map(|l| PyLocationAddr { inner: l })
     }
@@ -1098,14 +1169,14 @@ impl PyArchSpec {
     ///
     /// Returns a dict mapping each word_id to its CZ partner word_id.
     fn word_partner_map(&self) -> std::collections::HashMap<u32, u32> {
-        self.inner.word_partner_map()
+        self.tables().word_partner_map().clone()
     }
 
     /// Map each word_id to the zone_id that owns it.
     ///
     /// Returns a dict mapping word_id → zone_id.
     fn word_zone_map(&self) -> std::collections::HashMap<u32, u32> {
-        self.inner.word_zone_map()
+        self.tables().word_zone_map().clone()
     }
 
     /// Return sorted left-CZ word IDs (lower word of each CZ pair + unpaired).
@@ -1124,11 +1195,112 @@ impl PyArchSpec {
     /// Returns the ``LaneAddress`` if found, or None.
     #[pyo3(text_signature = "(self, src, dst)")]
     fn lane_for_endpoints(&self, src: &PyLocationAddr, dst: &PyLocationAddr) -> Option<PyLaneAddr> {
-        self.inner
+        self.tables()
             .lane_for_endpoints(&src.inner, &dst.inner)
             .map(|l| PyLaneAddr { inner: l })
     }
 
+    // -- Bulk lookup tables --
+    //
+    // Little-endian byte buffers indexed by location ordinal (zone-major,
+    // then word, then site) or lane ordinal, for `numpy.frombuffer`; see
+    // `ArchSpecGeometry` for the NumPy views.
+
+    /// Number of location ordinals: ``zones × words × sites_per_word``.
+    #[getter]
+    fn num_locations(&self) -> usize {
+        self.tables().num_locations()
+    }
+
+    /// Dense ordinal of a location, or None if it is out of range.
+    #[pyo3(text_signature = "(self, loc)")]
+    fn location_ordinal(&self, loc: &PyLocationAddr) -> Option<usize> {
+        self.tables().location_ordinal(&loc.inner)
+    }
+
+    /// ``float64`` ``(x, y)`` per location ordinal, NaN where unresolvable.
+    fn location_position_table<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        let bytes: Vec<u8> = self
+            .tables()
+            .positions()
+            .iter()
+            .flat_map(|pos| {
+                let (x, y) = pos.unwrap_or((f64::NAN, f64::NAN));
+                [x, y]
+            })
+            .flat_map(f64::to_le_bytes)
+            .collect();
+        PyBytes::new(py, &bytes)
+    }
+
+    /// ``int64`` CZ-partner ordinal per location ordinal, ``-1`` for none.
+    fn cz_partner_table<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        let tables = self.tables();
+        i64_le_bytes(
+            py,
+            tables
+                .cz_partners()
+                .iter()
+                .map(|partner| partner.map_or(-1, |loc| self.ordinal_or_neg(&loc))),
+        )
+    }
+
+    /// Every valid lane with its endpoints, as three parallel buffers:
+    /// ``uint64`` encoded lane addresses and ``int64`` source and
+    /// destination location ordinals.
+    fn lane_table<'py>(
+        &self,
+        py: Python<'py>,
+    ) -> (
+        Bound<'py, PyBytes>,
+        Bound<'py, PyBytes>,
+        Bound<'py, PyBytes>,
+    ) {
+        let tables = self.tables();
+        let lanes: Vec<u8> = tables
+            .lanes()
+            .iter()
+            .flat_map(|lane| lane.encode_u64().to_le_bytes())
+            .collect();
+        let pairs = tables.lane_endpoint_pairs();
+        (
+            PyBytes::new(py, &lanes),
+            i64_le_bytes(py, pairs.iter().map(|(src, _)| self.ordinal_or_neg(src))),
+            i64_le_bytes(py, pairs.iter().map(|(_, dst)| self.ordinal_or_neg(dst))),
+        )
+    }
+
+    /// ``int64`` lane ordinal (row of ``lane_table``) of every encoded
+    /// lane in ``lanes``, a little-endian ``uint64`` buffer; ``-1`` for
+    /// lanes that are not valid in this architecture.
+    fn lane_ordinals<'py>(
+        &self,
+        py: Python<'py>,
+        lanes: &Bound<'py, PyBytes>,
+    ) -> PyResult<Bound<'py, PyBytes>> {
+        let lanes = lanes.as_bytes();
+        if !lanes.len().is_multiple_of(8) {
+            return Err(pyo3::exceptions::PyValueError::new_err(format!(
+                "lane buffer has {} bytes, not a multiple of 8",
+                lanes.len()
+            )));
+        }
+        let tables = self.tables();
+        Ok(i64_le_bytes(
+            py,
+            lanes.chunks_exact(8).map(|word| {
+                let bits = u64::from_le_bytes(word.try_into().expect("8-byte chunk"));
+                // Move-type bits 0b11 do not decode (LaneAddr::decode panics).
+                if (bits >> 61) & 0x3 == 0x3 {
+                    return -1;
+                }
+                tables
+                    .lane_ordinal(&rs_addr::LaneAddr::decode_u64(bits))
+                    .map_or(-1, |ordinal| ordinal as i64)
+            }),
+        ))
+    }
+
     fn check_zone(&self, addr: &PyZoneAddr) -> Option<String> {
         self.inner.check_zone(&addr.inner)
     }
@@ -1157,6 +1329,67 @@ impl PyArchSpec {
         Ok(pyo3::types::PyList::new(py, &py_errors)?.into())
     }
 
+    /// Validate many location and lane groups in one call.
+    ///
+    /// ``locations`` and ``lanes`` are little-endian ``uint64`` buffers of
+    /// encoded addresses. ``location_offsets`` and ``lane_offsets`` are
+    /// ``uint64`` buffers of group boundaries with one more entry than there
+    /// are groups: group ``i`` spans ``offsets[i]:offsets[i + 1]``. Groups are
+    /// checked in parallel with the GIL released.
+    ///
+    /// Returns ``(location_errors, lane_errors)``, each a list of
+    /// ``(group index, error)`` pairs in group order, with the errors
+    /// ``check_locations``/``check_lanes`` would report for that group.
+    fn check_many(
+        &self,
+        py: Python<'_>,
+        locations: &Bound<'_, PyBytes>,
+        location_offsets: &Bound<'_, PyBytes>,
+        lanes: &Bound<'_, PyBytes>,
+        lane_offsets: &Bound<'_, PyBytes>,
+    ) -> PyResult<(PyObject, PyObject)> {
+        let locations: Vec<rs_addr::LocationAddr> = u64_words("locations", locations)?
+            .into_iter()
+            .map(rs_addr::LocationAddr::decode)
+            .collect();
+        let location_offsets =
+            group_offsets("location_offsets", location_offsets, locations.len())?;
+        let lanes: Vec<rs_addr::LaneAddr> = u64_words("lanes", lanes)?
+            .into_iter()
+            .map(|bits| {
+                // Move-type bits 0b11 do not decode (LaneAddr::decode panics).
+                if (bits >> 61) & 0x3 == 0x3 {
+                    return Err(pyo3::exceptions::PyValueError::new_err(format!(
+                        "lanes holds an invalid encoded lane {bits:#x}"
+                    )));
+                }
+                Ok(rs_addr::LaneAddr::decode_u64(bits))
+            })
+            .collect::<PyResult<_>>()?;
+        let lane_offsets = group_offsets("lane_offsets", lane_offsets, lanes.len())?;
+
+        let inner = &self.inner;
+        let (location_errors, lane_errors) = py.detach(|| {
+            (
+                inner.check_location_groups(&locations, &location_offsets),
+                inner.check_lane_groups(&lanes, &lane_offsets),
+            )
+        });
+
+        let location_errors = location_errors
+            .iter()
+            .map(|(group, e)| Ok((*group, crate::errors::location_group_error_to_py(py, e)?)))
+            .collect::<PyResult<Vec<_>>>()?;
+        let lane_errors = lane_errors
+            .iter()
+            .map(|(group, e)| Ok((*group, crate::errors::lane_group_error_to_py(py, e)?)))
+            .collect::<PyResult<Vec<_>>>()?;
+        Ok((
+            pyo3::types::PyList::new(py, location_errors)?.into(),
+            pyo3::types::PyList::new(py, lane_errors)?.into(),
+        ))
+    }
+
     fn __repr__(&self) -> String {
         format!(
             "ArchSpec(version=({}, {}))",
@@ -2,11 +2,11 @@
 
 use std::collections::HashMap;
 
-use pyo3::exceptions::PyRuntimeError;
+use pyo3::exceptions::{PyRuntimeError, PyValueError};
 use pyo3::prelude::*;
 
 use bloqade_lanes_bytecode_core::arch::addr::{LaneAddr, LocationAddr, ZoneAddr};
-use bloqade_lanes_bytecode_core::atom_state::{AtomStateData, ValidatedMoves};
+use bloqade_lanes_bytecode_core::atom_state::{AtomStateData, DenseAtomState, ValidatedMoves};
 
 use crate::arch_python::{PyArchSpec, PyLaneAddr, PyLocationAddr, PyZoneAddr};
 use crate::errors::move_validation_errors_to_py;
@@ -269,6 +269,45 @@ impl PyAtomStateData {
             .map_err(|errors| move_validation_errors_to_py(py, errors))
     }
 
+    /// Replay a sequence of lane groups and return the final state.
+    ///
+    /// Same result as chaining `validate_moves` + `apply_validated` (or, with
+    /// `validate=False`, `apply_moves`) once per group, but the replay runs
+    /// on one index-addressed state updated in place, so no intermediate
+    /// states are built. `prev_lanes` of the result reflects the last group.
+    ///
+    /// Raises `MoveValidationError` for the first group that fails
+    /// validation. With `validate=False`, returns None if any lane is invalid.
+    /// Raises `ValueError` if this state has a location outside `arch_spec`.
+    #[pyo3(signature = (lane_layers, arch_spec, validate = true))]
+    fn apply_many(
+        &self,
+        py: Python<'_>,
+        lane_layers: Vec<Vec<PyLaneAddr>>,
+        arch_spec: &PyArchSpec,
+        validate: bool,
+    ) -> PyResult<Option<Self>> {
+        let Some(mut state) = DenseAtomState::from_state(&self.inner, &arch_spec.inner) else {
+            return Err(PyValueError::new_err(
+                "atom state has a location outside the architecture",
+            ));
+        };
+        let mut lane_addrs: Vec<LaneAddr> = Vec::new();
+        for lanes in &lane_layers {
+            lane_addrs.clear();
+            lane_addrs.extend(lanes.iter().map(|l| l.inner));
+            if validate {
+                state
+                    .validate_moves(&lane_addrs, &arch_spec.inner)
+                    .and_then(|moves| state.apply_validated(&moves))
+                    .map_err(|errors| move_validation_errors_to_py(py, errors))?;
+            } else if state.apply_moves(&lane_addrs, &arch_spec.inner).is_none() {
+                return Ok(None);
+            }
+        }
+        Ok(Some(Self::from_rs(state.to_state())))
+    }
+
     /// Look up which qubit (if any) occupies the given location.
     ///
     /// Returns the qubit id, or None if the location is empty.
@@ -21,6 +21,7 @@ mod instruction_python;
 mod metrics_python;
 mod policy_runner_python;
 mod program_python;
+mod replay_python;
 mod search_python;
 mod target_generator_dsl_python;
 pub(crate) mod validation;
@@ -56,6 +57,7 @@ fn bloqade_lanes_bytecode(m: &Bound<'_, PyModule>) -> PyResult<()> {
     // Instruction and Program
     m.add_class::<instruction_python::PyInstruction>()?;
     m.add_class::<program_python::PyProgram>()?;
+    m.add_class::<replay_python::PyProgramReplay>()?;
 
     // Search / move synthesis
     m.add_class::<search_python::PySearchStrategy>()?;
@@ -77,6 +79,7 @@ fn bloqade_lanes_bytecode(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<search_python::PySearchEngine>()?;
     m.add_class::<search_python::PyMoveSearch>()?;
     m.add_class::<search_python::PyTargetSolver>()?;
+    m.add_class::<search_python::PyWarmStart>()?;
     m.add_class::<search_python::PySingleHeuristicCzPlacement>()?;
     m.add_class::<search_python::PyLooseGoalCzPlacement>()?;
     m.add_class::<search_python::PyRecedingHorizonCzPlacement>()?;
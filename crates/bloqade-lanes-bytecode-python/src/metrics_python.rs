@@ -6,9 +6,12 @@
 //! than a hand-maintained transcription.
 
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
 
 use bloqade_lanes_bytecode_core::arch::metrics as rs;
 
+use crate::arch_python::PyArchSpec;
+
 /// Constant-jerk motion/timing model for AOD move durations.
 ///
 /// Defaults to the FLAIR constants; pass explicit values to model a different
@@ -92,6 +95,26 @@ impl PyMotionModel {
         self.inner.lane_duration_us(&waypoints, amplitude_delta)
     }
 
+    /// Duration (µs) of every lane of `arch`, as a little-endian `float64`
+    /// buffer indexed by lane ordinal (the rows of `ArchSpec.lane_table`).
+    ///
+    /// Each lane is priced over its transport path, or the straight segment
+    /// between its endpoints when it has none; NaN where an endpoint has no
+    /// position.
+    #[pyo3(signature = (arch, amplitude_delta = 1.0))]
+    fn lane_duration_table<'py>(
+        &self,
+        py: Python<'py>,
+        arch: &PyArchSpec,
+        amplitude_delta: f64,
+    ) -> Bound<'py, PyBytes> {
+        let durations = arch
+            .tables()
+            .lane_durations_us(&arch.inner, &self.inner, amplitude_delta);
+        let bytes: Vec<u8> = durations.iter().flat_map(|d| d.to_le_bytes()).collect();
+        PyBytes::new(py, &bytes)
+    }
+
     fn __repr__(&self) -> String {
         format!(
             "MotionModel(max_ramp_us={}, max_jerk_um_per_us3={}, max_accel_um_per_us2={})",
@@ -1,13 +1,17 @@
 use pyo3::prelude::*;
 use pyo3::types::PyBytes;
 
+use bloqade_lanes_bytecode_core::isa::columns as rs_cols;
 use bloqade_lanes_bytecode_core::isa::program as rs_prog;
+use bloqade_lanes_bytecode_core::isa::replay as rs_replay;
 use bloqade_lanes_bytecode_core::isa::validate as rs_val;
 use bloqade_lanes_bytecode_core::isa::{parse_text, to_text};
 use bloqade_lanes_bytecode_core::version::Version;
 
 use crate::arch_python::PyArchSpec;
 use crate::instruction_python::PyInstruction;
+use crate::metrics_python::PyMotionModel;
+use crate::replay_python::PyProgramReplay;
 
 #[pyclass(name = "Program", frozen, module = "bloqade.lanes.bytecode._native")]
 #[derive(Clone)]
@@ -50,6 +54,82 @@ impl PyProgram {
         PyBytes::new(py, &bytes)
     }
 
+    /// Build a program from instruction columns (the inverse of
+    /// `to_columns`).
+    ///
+    /// `ops` holds one `uint8` op id per instruction, `operand0` the
+    /// little-endian `uint64` operands, and `operand1`/`operand2` the
+    /// little-endian `uint32` `new_array` dimensions.
+    ///
+    /// Raises `ValueError` for ragged columns, an unknown op id, or an
+    /// operand that does not fit its instruction.
+    #[staticmethod]
+    fn from_columns(
+        py: Python<'_>,
+        version: (u16, u16),
+        ops: &Bound<'_, PyBytes>,
+        operand0: &Bound<'_, PyBytes>,
+        operand1: &Bound<'_, PyBytes>,
+        operand2: &Bound<'_, PyBytes>,
+    ) -> PyResult<Self> {
+        let ops = ops.as_bytes();
+        let operand0 = le_words::<8>("operand0", operand0.as_bytes())?
+            .map(u64::from_le_bytes)
+            .collect::<Vec<_>>();
+        let operand1 = le_words::<4>("operand1", operand1.as_bytes())?
+            .map(u32::from_le_bytes)
+            .collect::<Vec<_>>();
+        let operand2 = le_words::<4>("operand2", operand2.as_bytes())?
+            .map(u32::from_le_bytes)
+            .collect::<Vec<_>>();
+        let code = py
+            .detach(|| rs_cols::from_columns(ops, &operand0, &operand1, &operand2))
+            .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
+        Ok(Self {
+            inner: rs_prog::from_code(Version::new(version.0, version.1), code),
+        })
+    }
+
+    /// The instructions as `(ops, operand0, operand1, operand2)` column
+    /// buffers; see `from_columns` for the dtypes.
+    /// `bloqade.lanes.bytecode.columns.columns` wraps them in NumPy arrays.
+    ///
+    /// Raises `ValueError` for a nested CPU op with no Python factory.
+    #[allow(clippy::type_complexity)]
+    fn to_columns<'py>(
+        &self,
+        py: Python<'py>,
+    ) -> PyResult<(
+        Bound<'py, PyBytes>,
+        Bound<'py, PyBytes>,
+        Bound<'py, PyBytes>,
+        Bound<'py, PyBytes>,
+    )> {
+        let columns = rs_cols::to_columns(&self.inner.code)
+            .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
+        let operand0: Vec<u8> = columns
+            .operand0
+            .iter()
+            .flat_map(|v| v.to_le_bytes())
+            .collect();
+        let operand1: Vec<u8> = columns
+            .operand1
+            .iter()
+            .flat_map(|v| v.to_le_bytes())
+            .collect();
+        let operand2: Vec<u8> = columns
+            .operand2
+            .iter()
+            .flat_map(|v| v.to_le_bytes())
+            .collect();
+        Ok((
+            PyBytes::new(py, &columns.ops),
+            PyBytes::new(py, &operand0),
+            PyBytes::new(py, &operand1),
+            PyBytes::new(py, &operand2),
+        ))
+    }
+
     /// Validate the program.
     ///
     /// With no arguments, runs structural validation only.
@@ -60,14 +140,18 @@ impl PyProgram {
     #[pyo3(signature = (arch=None, stack=false))]
     fn validate(&self, py: Python<'_>, arch: Option<&PyArchSpec>, stack: bool) -> PyResult<()> {
         let arch_ref = arch.map(|a| &a.inner);
-        let mut all_errors = rs_val::validate_structure(&self.inner)
-            .into_iter()
-            .chain(rs_val::validate(&self.inner, arch_ref))
-            .collect::<Vec<_>>();
-
-        if stack {
-            all_errors.extend(rs_val::simulate_stack(&self.inner, arch_ref));
-        }
+        // Large programs are checked on worker threads; release the GIL.
+        let all_errors = py.detach(|| {
+            let mut all_errors = rs_val::validate_structure(&self.inner)
+                .into_iter()
+                .chain(rs_val::validate(&self.inner, arch_ref))
+                .collect::<Vec<_>>();
+
+            if stack {
+                all_errors.extend(rs_val::simulate_stack(&self.inner, arch_ref));
+            }
+            all_errors
+        });
 
         if all_errors.is_empty() {
             Ok(())
@@ -76,6 +160,39 @@ impl PyProgram {
         }
     }
 
+    /// Replay the program's atom moves against `arch` in one pass.
+    ///
+    /// Runs `initial_fill`/`fill`/`move` on an in-place atom state, times
+    /// every lane with `motion_model` (FLAIR constants by default), and
+    /// pairs qubits at every `cz`. With `validate=True` each lane group
+    /// must pass `AtomStateData.validate_moves`; otherwise groups apply
+    /// with `apply_moves` collision semantics and collisions are recorded.
+    ///
+    /// Raises `MoveValidationError` for an inexecutable group and
+    /// `ValueError` for any other replay failure.
+    #[pyo3(signature = (arch, motion_model=None, amplitude_delta=1.0, validate=true))]
+    fn replay(
+        &self,
+        py: Python<'_>,
+        arch: &PyArchSpec,
+        motion_model: Option<&PyMotionModel>,
+        amplitude_delta: f64,
+        validate: bool,
+    ) -> PyResult<PyProgramReplay> {
+        let options = rs_replay::ReplayOptions {
+            motion_model: motion_model.map(|m| m.inner).unwrap_or_default(),
+            amplitude_delta,
+            validate,
+        };
+        match rs_replay::replay(&self.inner, &arch.inner, &options) {
+            Ok(inner) => Ok(PyProgramReplay { inner }),
+            Err(rs_replay::ReplayError::Move { errors, .. }) => {
+                Err(crate::errors::move_validation_errors_to_py(py, errors))
+            }
+            Err(e) => Err(pyo3::exceptions::PyValueError::new_err(e.to_string())),
+        }
+    }
+
     #[getter]
     fn version(&self) -> (u16, u16) {
         (
@@ -110,3 +227,19 @@ impl PyProgram {
         self.inner == other.inner
     }
 }
+
+/// Split a little-endian column buffer into `N`-byte words.
+fn le_words<'a, const N: usize>(
+    column: &str,
+    bytes: &'a [u8],
+) -> PyResult<impl Iterator<Item = [u8; N]> + 'a> {
+    if !bytes.len().is_multiple_of(N) {
+        return Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "column {column} has {} bytes, not a multiple of {N}",
+            bytes.len()
+        )));
+    }
+    Ok(bytes
+        .chunks_exact(N)
+        .map(|word| word.try_into().expect("chunks_exact yields N-byte words")))
+}
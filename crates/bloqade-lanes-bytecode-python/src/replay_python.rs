@@ -0,0 +1,180 @@
+//! PyO3 binding for the whole-program replay.
+//!
+//! Exposes [`bloqade_lanes_bytecode_core::isa::replay::ProgramReplay`] as
+//! `bloqade.lanes.bytecode.ProgramReplay`. Columns cross the boundary as
+//! little-endian byte buffers — one Python object per column instead of one
+//! per element — and `bloqade.lanes.bytecode.replay` wraps them in NumPy
+//! arrays with `numpy.frombuffer`.
+
+use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+
+use bloqade_lanes_bytecode_core::isa::replay::ProgramReplay;
+
+/// Little-endian `int64` buffer.
+fn i64_bytes<'py>(py: Python<'py>, values: impl Iterator<Item = i64>) -> Bound<'py, PyBytes> {
+    let bytes: Vec<u8> = values.flat_map(i64::to_le_bytes).collect();
+    PyBytes::new(py, &bytes)
+}
+
+/// Little-endian `float64` buffer.
+fn f64_bytes<'py>(py: Python<'py>, values: &[f64]) -> Bound<'py, PyBytes> {
+    let bytes: Vec<u8> = values.iter().flat_map(|v| v.to_le_bytes()).collect();
+    PyBytes::new(py, &bytes)
+}
+
+fn usize_bytes<'py>(py: Python<'py>, values: &[usize]) -> Bound<'py, PyBytes> {
+    i64_bytes(py, values.iter().map(|&v| v as i64))
+}
+
+/// Columnar result of `Program.replay`.
+///
+/// Every column getter returns a `bytes` buffer of little-endian values;
+/// use `bloqade.lanes.bytecode.replay.replay` for NumPy arrays with the
+/// right dtypes and shapes.
+#[pyclass(
+    name = "ProgramReplay",
+    frozen,
+    module = "bloqade.lanes.bytecode._native"
+)]
+pub struct PyProgramReplay {
+    pub(crate) inner: ProgramReplay,
+}
+
+#[pymethods]
+impl PyProgramReplay {
+    /// Number of qubits the program loads.
+    #[getter]
+    fn num_qubits(&self) -> usize {
+        self.inner.num_qubits
+    }
+
+    /// Number of executed `move` layers.
+    #[getter]
+    fn num_layers(&self) -> usize {
+        self.inner.num_layers()
+    }
+
+    /// Number of executed `cz` instructions.
+    #[getter]
+    fn num_czs(&self) -> usize {
+        self.inner.cz_pcs.len()
+    }
+
+    /// Sum of the layer durations (µs).
+    #[getter]
+    fn total_move_time_us(&self) -> f64 {
+        self.inner.total_move_time_us()
+    }
+
+    /// `int32` `(zone_id, word_id, site_id)` per qubit per row, `-1` where a
+    /// qubit is not on a site; `(num_layers + 1) × num_qubits × 3`.
+    #[getter]
+    fn locations<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        let bytes: Vec<u8> = self
+            .inner
+            .locations
+            .iter()
+            .flat_map(|loc| match loc {
+                Some(loc) => [loc.zone_id as i32, loc.word_id as i32, loc.site_id as i32],
+                None => [-1; 3],
+            })
+            .flat_map(i32::to_le_bytes)
+            .collect();
+        PyBytes::new(py, &bytes)
+    }
+
+    /// `bool` collision flag per qubit per layer; `num_layers × num_qubits`.
+    #[getter]
+    fn collided<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        let bytes: Vec<u8> = self.inner.collided.iter().map(|&c| u8::from(c)).collect();
+        PyBytes::new(py, &bytes)
+    }
+
+    /// `int64` program counter of each layer's `move`.
+    #[getter]
+    fn layer_pcs<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        usize_bytes(py, &self.inner.layer_pcs)
+    }
+
+    /// `float64` duration (µs) of each layer: its slowest lane.
+    #[getter]
+    fn layer_durations_us<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        f64_bytes(py, &self.inner.layer_durations_us)
+    }
+
+    /// `int64` offsets into the lane columns; `num_layers + 1` entries.
+    #[getter]
+    fn lane_offsets<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        usize_bytes(py, &self.inner.lane_offsets)
+    }
+
+    /// `uint64` encoded address of every lane, layer by layer.
+    #[getter]
+    fn lanes<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        let bytes: Vec<u8> = self
+            .inner
+            .lanes
+            .iter()
+            .flat_map(|lane| lane.encode_u64().to_le_bytes())
+            .collect();
+        PyBytes::new(py, &bytes)
+    }
+
+    /// `int64` qubit carried by each lane, `-1` for an empty source.
+    #[getter]
+    fn lane_qubits<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        i64_bytes(
+            py,
+            self.inner
+                .lane_qubits
+                .iter()
+                .map(|q| q.map_or(-1, i64::from)),
+        )
+    }
+
+    /// `float64` duration (µs) of each lane.
+    #[getter]
+    fn lane_durations_us<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        f64_bytes(py, &self.inner.lane_durations_us)
+    }
+
+    /// `int64` program counter of each `cz`.
+    #[getter]
+    fn cz_pcs<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        usize_bytes(py, &self.inner.cz_pcs)
+    }
+
+    /// `int64` number of layers executed before each `cz`.
+    #[getter]
+    fn cz_layers<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        usize_bytes(py, &self.inner.cz_layers)
+    }
+
+    /// `int64` offsets into the CZ pair columns; `num_czs + 1` entries.
+    #[getter]
+    fn cz_offsets<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        usize_bytes(py, &self.inner.cz_offsets)
+    }
+
+    /// `int64` control qubit of each CZ pair.
+    #[getter]
+    fn cz_controls<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        i64_bytes(py, self.inner.cz_controls.iter().map(|&q| i64::from(q)))
+    }
+
+    /// `int64` target qubit of each CZ pair.
+    #[getter]
+    fn cz_targets<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        i64_bytes(py, self.inner.cz_targets.iter().map(|&q| i64::from(q)))
+    }
+
+    fn __repr__(&self) -> String {
+        format!(
+            "ProgramReplay(num_qubits={}, num_layers={}, num_czs={})",
+            self.inner.num_qubits,
+            self.inner.num_layers(),
+            self.inner.cz_pcs.len()
+        )
+    }
+}
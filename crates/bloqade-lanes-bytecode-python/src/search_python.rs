@@ -38,6 +38,7 @@ use bloqade_lanes_search::search::options::{
 };
 use bloqade_lanes_search::search::result::{MultiSolveResult, SolveResult};
 use bloqade_lanes_search::search::target_solver::TargetSolver;
+use bloqade_lanes_search::search::warm_start::WarmStart;
 
 use crate::arch_python::{PyArchSpec, PyLaneAddr, PyLocationAddr};
 
@@ -305,6 +306,38 @@ impl PySolveResult {
         Ok(dict)
     }
 
+    /// Search telemetry as a dict: always populated, natively collected.
+    ///
+    /// Keys: `wall_time_s`, `generate_time_s`, `score_time_s`,
+    /// `insert_time_s` (phase timings in seconds), `expansions`, `candidates`,
+    /// `new_nodes`, `transpositions`, `goals`, `peak_frontier`,
+    /// `branching_factor`, and `by_depth` — a list indexed by depth of
+    /// `(expanded, candidates, new_nodes)` tuples. Pruning counts are in
+    /// `bound_stats`.
+    #[getter]
+    fn telemetry<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let t = &self.inner.telemetry;
+        let dict = PyDict::new(py);
+        dict.set_item("wall_time_s", t.wall_time.as_secs_f64())?;
+        dict.set_item("generate_time_s", t.generate_time.as_secs_f64())?;
+        dict.set_item("score_time_s", t.score_time.as_secs_f64())?;
+        dict.set_item("insert_time_s", t.insert_time.as_secs_f64())?;
+        dict.set_item("expansions", t.expansions)?;
+        dict.set_item("candidates", t.candidates)?;
+        dict.set_item("new_nodes", t.new_nodes)?;
+        dict.set_item("transpositions", t.transpositions)?;
+        dict.set_item("goals", t.goals)?;
+        dict.set_item("peak_frontier", t.peak_frontier)?;
+        dict.set_item("branching_factor", t.branching_factor())?;
+        let by_depth: Vec<(u64, u64, u64)> = t
+            .by_depth
+            .iter()
+            .map(|row| (row.expanded, row.candidates, row.new_nodes))
+            .collect();
+        dict.set_item("by_depth", by_depth)?;
+        Ok(dict)
+    }
+
     /// Optional entropy trace (present when `collect_entropy_trace=True`).
     #[getter]
     fn entropy_trace(&self) -> Option<PyEntropyTrace> {
@@ -832,7 +865,7 @@ pub struct PySolveOptions {
 #[pymethods]
 impl PySolveOptions {
     #[new]
-    #[pyo3(signature = (strategy=PySearchStrategy::AStar, weight=1.0, restarts=1, deadlock_policy=PyDeadlockPolicy::Skip, lookahead=false, top_c=None, fallback_push_rotate=false, backwards_search=false))]
+    #[pyo3(signature = (strategy=PySearchStrategy::AStar, weight=1.0, restarts=1, deadlock_policy=PyDeadlockPolicy::Skip, lookahead=false, top_c=None, fallback_push_rotate=false, backwards_search=false, time_budget_s=None))]
     #[allow(clippy::too_many_arguments)]
     fn new(
         strategy: PySearchStrategy,
@@ -843,6 +876,7 @@ impl PySolveOptions {
         top_c: Option<usize>,
         fallback_push_rotate: bool,
         backwards_search: bool,
+        time_budget_s: Option<f64>,
     ) -> PyResult<Self> {
         if !weight.is_finite() || weight <= 0.0 {
             return Err(PyValueError::new_err(
@@ -854,6 +888,7 @@ impl PySolveOptions {
                 "top_c must be None or an integer >= 1",
             ));
         }
+        let time_budget = time_budget_s.map(time_budget_from_secs).transpose()?;
         Ok(Self {
             inner: SolveOptions {
                 strategy: strategy.to_rs(),
@@ -864,6 +899,7 @@ impl PySolveOptions {
                 top_c,
                 fallback_push_rotate,
                 backwards_search,
+                time_budget,
             },
         })
     }
@@ -908,6 +944,12 @@ impl PySolveOptions {
         self.inner.backwards_search
     }
 
+    /// Wall-clock budget per solve in seconds, or ``None`` for no deadline.
+    #[getter]
+    fn time_budget_s(&self) -> Option<f64> {
+        self.inner.time_budget.map(|d| d.as_secs_f64())
+    }
+
     /// Every constructor field, in constructor order.
     ///
     /// Keep this exhaustive: a `SolveOptions` that prints fewer options than
@@ -915,7 +957,7 @@ impl PySolveOptions {
     /// someone is printing the options to find one.
     fn __repr__(&self) -> String {
         format!(
-            "SolveOptions(strategy={}, weight={}, restarts={}, deadlock_policy={}, lookahead={}, top_c={:?}, fallback_push_rotate={}, backwards_search={})",
+            "SolveOptions(strategy={}, weight={}, restarts={}, deadlock_policy={}, lookahead={}, top_c={:?}, fallback_push_rotate={}, backwards_search={}, time_budget_s={:?})",
             self.strategy().name(),
             self.inner.weight,
             self.inner.restarts,
@@ -924,10 +966,24 @@ impl PySolveOptions {
             self.inner.top_c,
             self.inner.fallback_push_rotate,
             self.inner.backwards_search,
+            self.time_budget_s(),
         )
     }
 }
 
+/// Validate a Python wall-clock budget in seconds.
+///
+/// Rejects NaN, infinite, negative and too-large values (beyond
+/// `Duration::MAX`). A representable budget that ends past the range of the
+/// monotonic clock is accepted and never expires.
+fn time_budget_from_secs(secs: f64) -> PyResult<std::time::Duration> {
+    std::time::Duration::try_from_secs_f64(secs).map_err(|_| {
+        PyValueError::new_err(
+            "time_budget_s must be None or a finite float >= 0.0 that fits in a Duration",
+        )
+    })
+}
+
 // ── Entropy options ──
 
 /// Entropy-strategy-specific parameters.
@@ -1639,10 +1695,17 @@ impl PyTargetSolver {
     ///     target: Mapping of qubit_id to LocationAddress for desired positions.
     ///     blocked: List of immovable obstacle locations.
     ///     max_expansions: Optional node expansion budget.
+    ///     time_budget_s: Optional wall-clock budget in seconds. Overrides
+    ///         ``SolveOptions.time_budget_s`` for this call; a search cut
+    ///         short with a plan in hand returns it as ``"solved"``.
+    ///     warm_start: Optional ``WarmStart`` carried from the previous
+    ///         stage's solve. Its plan seeds this one and is replaced by this
+    ///         solve's plan when it succeeds.
     ///
     /// Returns:
     ///     ``SolveResult`` with status, move layers, and search statistics.
-    #[pyo3(signature = (initial, target, blocked, max_expansions=None))]
+    #[pyo3(signature = (initial, target, blocked, max_expansions=None, time_budget_s=None, warm_start=None))]
+    #[allow(clippy::too_many_arguments)]
     fn solve(
         &self,
         py: Python<'_>,
@@ -1650,17 +1713,47 @@ impl PyTargetSolver {
         target: std::collections::BTreeMap<u32, PyRef<'_, PyLocationAddr>>,
         blocked: Vec<PyRef<'_, PyLocationAddr>>,
         max_expansions: Option<u32>,
+        time_budget_s: Option<f64>,
+        warm_start: Option<PyRefMut<'_, PyWarmStart>>,
     ) -> PyResult<PySolveResult> {
+        let time_budget = time_budget_s.map(time_budget_from_secs).transpose()?;
         let initial_pairs: Vec<(u32, LocationAddr)> =
             initial.iter().map(|(&qid, loc)| (qid, loc.inner)).collect();
         let target_pairs: Vec<(u32, LocationAddr)> =
             target.iter().map(|(&qid, loc)| (qid, loc.inner)).collect();
         let blocked_locs: Vec<LocationAddr> = blocked.iter().map(|loc| loc.inner).collect();
 
+        if let Some(mut warm_start) = warm_start {
+            // Move the seed out for the duration of the detached solve: the
+            // `PyRefMut` borrow itself cannot cross into it.
+            let mut warm = std::mem::take(&mut warm_start.inner);
+            let result = py.detach(|| {
+                self.inner.solve_warm(
+                    initial_pairs,
+                    target_pairs,
+                    blocked_locs,
+                    max_expansions,
+                    time_budget,
+                    &mut warm,
+                )
+            });
+            warm_start.inner = warm;
+            let result = result.map_err(|e| PyValueError::new_err(e.to_string()))?;
+            return Ok(PySolveResult { inner: result });
+        }
+
         let result = py
-            .detach(|| {
-                self.inner
-                    .solve(initial_pairs, target_pairs, blocked_locs, max_expansions)
+            .detach(|| match time_budget {
+                Some(budget) => self.inner.solve_within(
+                    initial_pairs,
+                    target_pairs,
+                    blocked_locs,
+                    max_expansions,
+                    budget,
+                ),
+                None => self
+                    .inner
+                    .solve(initial_pairs, target_pairs, blocked_locs, max_expansions),
             })
             .map_err(|e| PyValueError::new_err(e.to_string()))?;
 
@@ -1672,6 +1765,56 @@ impl PyTargetSolver {
     }
 }
 
+/// Seed handle carried between consecutive ``TargetSolver.solve`` calls.
+///
+/// Pass the same instance as ``warm_start`` to each stage's solve. Before
+/// searching, the previous stage's plan is replayed forward and then inverted.
+/// If either replay reaches the new target, it is an incumbent the search
+/// must beat, and it is returned without searching when it already meets the
+/// root lower bound.
+#[pyclass(name = "WarmStart", module = "bloqade.lanes.bytecode._native")]
+#[derive(Default)]
+pub struct PyWarmStart {
+    inner: WarmStart,
+}
+
+#[pymethods]
+impl PyWarmStart {
+    #[new]
+    fn new() -> Self {
+        Self::default()
+    }
+
+    /// The seed plan the next solve will try, in ``SolveResult.move_layers``
+    /// form.
+    #[getter]
+    fn move_layers(&self) -> Vec<Vec<PyLaneAddr>> {
+        self.inner
+            .move_layers()
+            .iter()
+            .map(|ms| {
+                ms.decode()
+                    .into_iter()
+                    .map(|lane| PyLaneAddr { inner: lane })
+                    .collect()
+            })
+            .collect()
+    }
+
+    /// Drop the seed so the next solve runs cold.
+    fn clear(&mut self) {
+        self.inner.clear();
+    }
+
+    fn __len__(&self) -> usize {
+        self.inner.move_layers().len()
+    }
+
+    fn __repr__(&self) -> String {
+        format!("WarmStart(layers={})", self.inner.move_layers().len())
+    }
+}
+
 /// CZ placement via a target generator + single-heuristic routing.
 ///
 /// Generates candidate target configurations with ``DefaultTargetGenerator``,
@@ -5,6 +5,11 @@
 //! per-scenario `nodes_expanded`/goal-depth fingerprint MUST stay identical
 //! across optimizations — it is the behavior guard, printed alongside timing.
 //!
+//! A second table times [`HeuristicGenerator::generate`] alone over the
+//! configurations on each scenario's solution path, isolating the move
+//! generator's per-expansion cost (allocation and hashing included) from the
+//! driver's bookkeeping. Its `candidates` column is the behavior guard there.
+//!
 //! Run: `cargo bench -p bloqade-lanes-search --bench entropy`
 
 use std::collections::HashSet;
@@ -16,10 +21,12 @@ use bloqade_lanes_bytecode_core::arch::types::ArchSpec;
 use bloqade_lanes_search::drivers::entropy::{EntropyParams, entropy_search};
 use bloqade_lanes_search::goals::AllAtTarget;
 use bloqade_lanes_search::observer::NoOpObserver;
-use bloqade_lanes_search::primitives::context::SearchContext;
+use bloqade_lanes_search::primitives::context::{MoveCandidate, SearchContext, SearchState};
 use bloqade_lanes_search::primitives::distance::DistanceTable;
+use bloqade_lanes_search::primitives::graph::NodeId;
 use bloqade_lanes_search::primitives::lane_index::LaneIndex;
-use bloqade_lanes_search::{Config, SearchResult};
+use bloqade_lanes_search::traits::MoveGenerator;
+use bloqade_lanes_search::{Config, HeuristicGenerator, SearchResult};
 
 /// Three-word, two-zone architecture (9 site buses + 1 word bus in zone 0).
 const FULL_ARCH_JSON: &str = include_str!("../../../examples/arch/full.json");
@@ -180,6 +187,101 @@ fn run_driver(index: &LaneIndex, p: &Prepared) -> SearchResult {
     )
 }
 
+/// Configurations on the search's solution path, root first (just the root
+/// when the search found no goal). These are the states the generator is
+/// benchmarked on: realistic occupancy, and deterministic.
+fn path_configs(r: &SearchResult) -> Vec<Config> {
+    let mut configs = Vec::new();
+    let mut node = r.goal;
+    while let Some(id) = node {
+        configs.push(r.graph.config(id).clone());
+        node = r.graph.parent(id);
+    }
+    if configs.is_empty() {
+        configs.push(r.graph.config(r.graph.root()).clone());
+    }
+    configs.reverse();
+    configs
+}
+
+/// Run the generator once over every configuration; returns the number of
+/// candidates emitted, the generator-only fingerprint.
+fn run_generator(
+    generator: &HeuristicGenerator,
+    index: &LaneIndex,
+    p: &Prepared,
+    configs: &[Config],
+    root: NodeId,
+    out: &mut Vec<MoveCandidate>,
+) -> usize {
+    let ctx = SearchContext {
+        index,
+        dist_table: &p.dist_table,
+        blocked: &p.blocked,
+        targets: &p.target_encoded,
+        cz_pairs: None,
+    };
+    let mut state = SearchState::default();
+    let mut emitted = 0;
+    for config in configs {
+        out.clear();
+        generator.generate(config, root, &ctx, &mut state, out);
+        emitted += out.len();
+    }
+    emitted
+}
+
+fn bench_generator(index: &LaneIndex) {
+    const WARMUP: usize = 10;
+    const SAMPLES: usize = 200;
+
+    println!();
+    println!(
+        "{:<20} {:>10} {:>10} {:>12} {:>14}",
+        "generator", "configs", "candidates", "median_us", "expansions/s"
+    );
+
+    for s in scenarios() {
+        let p = prepare(index, &s);
+        let r0 = run_driver(index, &p);
+        let configs = path_configs(&r0);
+        let root = r0.graph.root();
+
+        // One generator for the whole run, as in a single restart, so the
+        // timing includes its reuse of scratch buffers across expansions.
+        let generator = HeuristicGenerator::new();
+        let mut out: Vec<MoveCandidate> = Vec::new();
+        let candidates = run_generator(&generator, index, &p, &configs, root, &mut out);
+
+        for _ in 0..WARMUP {
+            black_box(run_generator(
+                &generator, index, &p, &configs, root, &mut out,
+            ));
+        }
+
+        let mut times_us: Vec<f64> = Vec::with_capacity(SAMPLES);
+        for _ in 0..SAMPLES {
+            let t = Instant::now();
+            black_box(run_generator(
+                &generator, index, &p, &configs, root, &mut out,
+            ));
+            times_us.push(t.elapsed().as_nanos() as f64 / 1000.0);
+        }
+        times_us.sort_by(|a, b| a.total_cmp(b));
+        let median = times_us[times_us.len() / 2];
+        let per_second = configs.len() as f64 / (median / 1e6);
+
+        println!(
+            "{:<20} {:>10} {:>10} {:>12.2} {:>14.0}",
+            s.name,
+            configs.len(),
+            candidates,
+            median,
+            per_second
+        );
+    }
+}
+
 fn main() {
     let spec: ArchSpec = serde_json::from_str(FULL_ARCH_JSON).expect("parse full arch");
     let index = LaneIndex::new(spec);
@@ -221,4 +323,6 @@ fn main() {
             s.name, expanded, depth, min, median, mean
         );
     }
+
+    bench_generator(&index);
 }
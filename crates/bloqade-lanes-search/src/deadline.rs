@@ -0,0 +1,108 @@
+//! Wall-clock budgets for anytime search.
+//!
+//! A [`Deadline`] is an absolute point on the monotonic clock
+//! ([`std::time::Instant`]), fixed once per solve and shared by reference
+//! across every driver and restart that solve fans out to. Drivers poll it
+//! through [`Deadline::poll`], which reads the clock only once every
+//! [`DEADLINE_POLL_STRIDE`] ticks, so leaving a deadline on costs a counter
+//! test per expansion rather than a clock read.
+//!
+//! A deadline is a *budget*, like `max_expansions`: a search cut short by one
+//! reports [`SolveStatus::BudgetExceeded`](crate::search::result::SolveStatus::BudgetExceeded)
+//! unless it already holds an incumbent, in which case the incumbent is
+//! returned as the answer.
+
+use std::time::{Duration, Instant};
+
+/// Number of driver ticks between clock reads in [`Deadline::poll`].
+///
+/// One tick is one node expansion, which costs microseconds on Gemini-sized
+/// instances, so a deadline overshoots by at most a few dozen microseconds
+/// while the clock is read for well under 1% of expansions.
+pub const DEADLINE_POLL_STRIDE: u32 = 16;
+
+/// An absolute wall-clock cutoff on the monotonic clock.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub struct Deadline {
+    at: Instant,
+}
+
+impl Deadline {
+    /// A deadline `budget` from now.
+    ///
+    /// Returns `None` when that instant is past what the monotonic clock can
+    /// represent: such a budget can never run out, so it is no deadline.
+    pub fn after(budget: Duration) -> Option<Self> {
+        Instant::now().checked_add(budget).map(Self::at)
+    }
+
+    /// A deadline at a fixed instant.
+    pub fn at(at: Instant) -> Self {
+        Self { at }
+    }
+
+    /// The instant at which this deadline expires.
+    pub fn instant(&self) -> Instant {
+        self.at
+    }
+
+    /// Time left before expiry; zero once expired.
+    pub fn remaining(&self) -> Duration {
+        self.at.saturating_duration_since(Instant::now())
+    }
+
+    /// Whether the deadline has passed. Reads the clock on every call.
+    pub fn expired(&self) -> bool {
+        Instant::now() >= self.at
+    }
+
+    /// Amortised [`expired`](Self::expired): reads the clock only when `tick`
+    /// is a multiple of [`DEADLINE_POLL_STRIDE`].
+    ///
+    /// Tick `0` always reads the clock, so a deadline that is already past when
+    /// the search starts stops it before the first expansion.
+    #[inline]
+    pub fn poll(&self, tick: u32) -> bool {
+        tick.is_multiple_of(DEADLINE_POLL_STRIDE) && self.expired()
+    }
+}
+
+/// [`Deadline::poll`] over an optional deadline; `None` never expires.
+#[inline]
+pub(crate) fn poll(deadline: Option<&Deadline>, tick: u32) -> bool {
+    deadline.is_some_and(|d| d.poll(tick))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn a_past_deadline_is_expired_and_polls_at_tick_zero() {
+        let deadline = Deadline::after(Duration::ZERO).unwrap();
+        assert!(deadline.expired());
+        assert!(deadline.poll(0));
+        assert_eq!(deadline.remaining(), Duration::ZERO);
+    }
+
+    #[test]
+    fn poll_only_reads_the_clock_on_stride_boundaries() {
+        let deadline = Deadline::after(Duration::ZERO).unwrap();
+        assert!(!deadline.poll(1));
+        assert!(!deadline.poll(DEADLINE_POLL_STRIDE - 1));
+        assert!(deadline.poll(DEADLINE_POLL_STRIDE));
+    }
+
+    #[test]
+    fn a_distant_deadline_never_polls_expired() {
+        let deadline = Deadline::after(Duration::from_secs(3600)).unwrap();
+        assert!(!deadline.expired());
+        assert!(!deadline.poll(0));
+        assert!(!poll(None, 0));
+    }
+
+    #[test]
+    fn an_unrepresentable_deadline_is_no_deadline() {
+        assert_eq!(Deadline::after(Duration::MAX), None);
+    }
+}
@@ -15,11 +15,13 @@
 
 use std::cmp::Ordering;
 use std::collections::{BTreeMap, HashMap, HashSet};
-use std::hash::{Hash, Hasher};
+use std::hash::{BuildHasher, Hash, Hasher};
 use std::sync::Arc;
+use std::time::Instant;
 
 use crate::bounds::{BoundStats, CompletionBound, NoBound};
 use crate::cost::UniformCost;
+use crate::deadline::{self, Deadline};
 use crate::drivers::result::SearchResult;
 use crate::feasibility::graph::LaneGraph;
 use crate::observer::{SearchEvent, SearchObserver};
@@ -35,10 +37,13 @@ use crate::primitives::ordering::{
 };
 use crate::primitives::path::find_path_occupied;
 use crate::push_rotate::{DEFAULT_MOVE_BUDGET, plan as push_rotate_plan};
+use crate::telemetry::{self, SearchTelemetry};
 use crate::traits::{Goal, Objective};
 use bloqade_lanes_bytecode_core::arch::addr::{LaneAddr, LocationAddr};
 use rand::rngs::SmallRng;
 use rand::{Rng, SeedableRng};
+use rustc_hash::{FxHashMap, FxHashSet};
+use smallvec::SmallVec;
 
 #[cfg(test)]
 static COMPUTE_MOVESET_METRICS_CALLS: std::sync::atomic::AtomicUsize =
@@ -415,11 +420,11 @@ fn chain_scored_entries(links: &[ChainLink]) -> impl Iterator<Item = ScoredEntry
 
 fn build_deadlock_breaker_candidate(
     config: &Config,
-    occupied: &HashSet<u64>,
+    occupied: &FxHashSet<u64>,
     all_scores: &[(TripletKey, ScoredEntry)],
     ctx: &SearchContext,
 ) -> Option<(f64, MoveSet, Config)> {
-    let unresolved: HashSet<u32> = ctx
+    let unresolved: FxHashSet<u32> = ctx
         .targets
         .iter()
         .filter_map(|(qid, target)| {
@@ -438,6 +443,11 @@ fn build_deadlock_breaker_candidate(
     }
 
     let mut best: Option<(usize, f64, MoveSet, Config)> = None;
+    // Per-group buffers, cleared and refilled for each bus group.
+    let mut entries: FxHashMap<u64, u64> = FxHashMap::default();
+    let mut entry_by_lane: FxHashMap<u64, ScoredEntry> = FxHashMap::default();
+    let mut seed_lanes: Vec<u64> = Vec::new();
+    let mut seen_qubits: FxHashSet<u32> = FxHashSet::default();
     for (
         TripletKey {
             move_type: mt,
@@ -450,10 +460,10 @@ fn build_deadlock_breaker_candidate(
         qubits.sort_by(cmp_group_entries);
         let grid_ctx = BusGridContext::new(ctx.index, mt, bus_id, None, dir, occupied);
 
-        let mut entries: HashMap<u64, u64> = HashMap::new();
-        let mut entry_by_lane: HashMap<u64, ScoredEntry> = HashMap::new();
-        let mut seed_lanes: Vec<u64> = Vec::new();
-        let mut seen_qubits: HashSet<u32> = HashSet::new();
+        entries.clear();
+        entry_by_lane.clear();
+        seed_lanes.clear();
+        seen_qubits.clear();
         let mut selected_unresolved = 0usize;
         for t in &qubits {
             if !seen_qubits.insert(t.qubit_id) {
@@ -497,7 +507,7 @@ fn build_deadlock_breaker_candidate(
 
         for grid_lanes in grid_ctx.build_aod_grids(&entries) {
             let mut total_score = 0.0;
-            let mut moves: Vec<(u32, LocationAddr)> = Vec::new();
+            let mut moves: SmallVec<[(u32, LocationAddr); 8]> = SmallVec::new();
             let mut moved_unresolved = 0usize;
 
             for lane_enc in &grid_lanes {
@@ -1466,7 +1476,8 @@ fn moveset_to_trace_tuple(ms: &MoveSet) -> Vec<(u8, u8, u32, u32, u32, u32)> {
 }
 
 fn first_unresolved_qubit_without_valid_move(config: &Config, ctx: &SearchContext) -> Option<u32> {
-    let mut occupied = HashSet::with_capacity(ctx.blocked.len() + config.len());
+    let mut occupied =
+        FxHashSet::with_capacity_and_hasher(ctx.blocked.len() + config.len(), Default::default());
     occupied.extend(ctx.blocked);
     for (_, loc) in config.iter() {
         occupied.insert(loc.encode());
@@ -1529,7 +1540,8 @@ pub(crate) fn generate_candidates(
     let e_eff = entropy.min(params.e_max) as f64;
 
     // Build occupied set.
-    let mut occupied = HashSet::with_capacity(blocked.len() + config.len());
+    let mut occupied =
+        FxHashSet::with_capacity_and_hasher(blocked.len() + config.len(), Default::default());
     occupied.extend(blocked);
     for (_, loc) in config.iter() {
         occupied.insert(loc.encode());
@@ -1687,6 +1699,10 @@ pub(crate) fn generate_candidates(
 
     // Step 5: per group, build AOD-compatible rectangular grids.
     let mut candidates: Vec<(f64, MoveSet, Config)> = Vec::new();
+    // Per-group buffers, cleared and refilled for each bus group.
+    let mut entries: FxHashMap<u64, u64> = FxHashMap::default();
+    let mut entry_by_lane: FxHashMap<u64, ScoredEntry> = FxHashMap::default();
+    let mut seed_lanes: Vec<u64> = Vec::new();
 
     for (
         TripletKey {
@@ -1701,9 +1717,9 @@ pub(crate) fn generate_candidates(
 
         let grid_ctx = BusGridContext::new(ctx.index, mt, bus_id, None, dir, &occupied);
 
-        let mut entries: HashMap<u64, u64> = HashMap::new();
-        let mut entry_by_lane: HashMap<u64, ScoredEntry> = HashMap::new();
-        let mut seed_lanes: Vec<u64> = Vec::with_capacity(qubits.len());
+        entries.clear();
+        entry_by_lane.clear();
+        seed_lanes.clear();
         for t in &qubits {
             let lane = LaneAddr::decode_u64(t.lane_encoded);
             if let Some((src, _)) = ctx.index.endpoints(&lane) {
@@ -1733,7 +1749,7 @@ pub(crate) fn generate_candidates(
         let mut group_candidates: Vec<(f64, MoveSet, Config)> = Vec::new();
         for grid_lanes in grids {
             let mut total_score = 0.0;
-            let mut moves: Vec<(u32, LocationAddr)> = Vec::new();
+            let mut moves: SmallVec<[(u32, LocationAddr); 8]> = SmallVec::new();
 
             for &lane_enc in &grid_lanes {
                 if let Some(t) = entry_by_lane.get(&lane_enc) {
@@ -1946,10 +1962,14 @@ pub fn compute_moveset_metrics(
 /// Unlike the level-1 generator mobility, the mobility terms here filter on
 /// full occupancy (atoms included), so only the distance evaluations are
 /// table-backed; the occupancy checks stay at call time.
-pub(crate) fn score_moveset(
+///
+/// `occupied` must be `old_config`'s locations plus `ctx.blocked`; the
+/// post-move occupancy is derived from it (see [`NextOccupancy`]) rather than
+/// rebuilt per candidate.
+pub(crate) fn score_moveset<S: BuildHasher>(
     old_config: &Config,
     new_config: &Config,
-    occupied: &HashSet<u64>,
+    occupied: &HashSet<u64, S>,
     ctx: &SearchContext,
     params: &EntropyParams,
     tables: Option<&HeuristicTables>,
@@ -1957,10 +1977,8 @@ pub(crate) fn score_moveset(
     debug_assert_tables_match(tables, params);
     let targets = ctx.targets;
     let dist_table = ctx.dist_table;
-    let blocked = ctx.blocked;
     let index = ctx.index;
-    let mut new_occupied: HashSet<u64> = new_config.iter().map(|(_, loc)| loc.encode()).collect();
-    new_occupied.extend(blocked);
+    let new_occupied = NextOccupancy::new(old_config, new_config, occupied, ctx.blocked);
 
     let mut distance_progress = 0.0;
     let mut arrived = 0_u32;
@@ -1968,15 +1986,16 @@ pub(crate) fn score_moveset(
     let mut mobility_after = 0.0;
 
     for &(qid, target_enc) in targets {
+        // Unmoved qubits contribute nothing; skip them before any lookup.
+        if new_occupied.moved.binary_search(&qid).is_err() {
+            continue;
+        }
         let Some(old_loc) = old_config.location_of(qid) else {
             continue;
         };
         let Some(new_loc) = new_config.location_of(qid) else {
             continue;
         };
-        if old_loc == new_loc {
-            continue; // didn't move
-        }
 
         // Resolve the target column once per qubit — `d_of` runs per
         // successor in the mobility loops, and re-resolving the column
@@ -2022,7 +2041,7 @@ pub(crate) fn score_moveset(
                 continue;
             };
             let dst_enc = dst.encode();
-            if new_occupied.contains(&dst_enc) {
+            if new_occupied.contains(dst_enc) {
                 continue;
             }
             if let Some(d) = d_of(dst_enc) {
@@ -2036,6 +2055,63 @@ pub(crate) fn score_moveset(
         + params.gamma * (mobility_after - mobility_before)
 }
 
+/// Occupancy after a move set, answered as a delta over the occupancy before
+/// it.
+///
+/// [`score_moveset`] runs once per candidate, and materializing the child's
+/// occupied set there cost a hash-set allocation and `n_qubits` inserts per
+/// candidate. A move set relocates only a handful of atoms, so the child's
+/// occupancy is the parent's set corrected by the sorted sites those atoms
+/// vacated and filled.
+struct NextOccupancy<'a, S> {
+    /// `old_config`'s locations plus `blocked`.
+    before: &'a HashSet<u64, S>,
+    blocked: &'a HashSet<u64>,
+    vacated: SmallVec<[u64; 16]>,
+    filled: SmallVec<[u64; 16]>,
+    /// Qubits whose location changed, ascending.
+    moved: SmallVec<[u32; 16]>,
+}
+
+impl<'a, S: BuildHasher> NextOccupancy<'a, S> {
+    fn new(
+        old_config: &Config,
+        new_config: &Config,
+        before: &'a HashSet<u64, S>,
+        blocked: &'a HashSet<u64>,
+    ) -> Self {
+        let mut vacated: SmallVec<[u64; 16]> = SmallVec::new();
+        let mut filled: SmallVec<[u64; 16]> = SmallVec::new();
+        let mut moved: SmallVec<[u32; 16]> = SmallVec::new();
+        for (qid, before_loc, after_loc) in old_config.diff(new_config) {
+            vacated.extend(before_loc);
+            filled.extend(after_loc);
+            moved.push(qid);
+        }
+        vacated.sort_unstable();
+        filled.sort_unstable();
+        Self {
+            before,
+            blocked,
+            vacated,
+            filled,
+            moved,
+        }
+    }
+
+    fn contains(&self, loc_enc: u64) -> bool {
+        if self.filled.binary_search(&loc_enc).is_ok() {
+            return true;
+        }
+        // A vacated site held a moving atom, so no other atom was there; only
+        // a blocked site stays occupied.
+        if self.vacated.binary_search(&loc_enc).is_ok() {
+            return self.blocked.contains(&loc_enc);
+        }
+        self.before.contains(&loc_enc)
+    }
+}
+
 // ── Sequential fallback ────────────────────────────────────────────
 
 fn fire_fallback_start_event(
@@ -2333,6 +2409,7 @@ where
         None,
         objective,
         bound,
+        None,
     )
 }
 
@@ -2342,6 +2419,11 @@ where
 /// engine's [`BlendedColumnCache`]) and shares them across restarts;
 /// `None` builds them internally, preserving the public entry point's
 /// behavior for tests, benches, and direct callers.
+///
+/// `deadline` is polled once per loop iteration. Passing it is treated
+/// exactly like running out of expansions: the goals collected so far are
+/// the incumbents the best one is picked from, and with none collected the
+/// budget-exhaustion fallback runs as usual.
 #[allow(clippy::too_many_arguments)]
 pub(crate) fn entropy_search_with_tables<O, B>(
     root: Config,
@@ -2355,6 +2437,7 @@ pub(crate) fn entropy_search_with_tables<O, B>(
     tables: Option<&HeuristicTables>,
     objective: &O,
     bound: &B,
+    deadline: Option<&Deadline>,
 ) -> SearchResult
 where
     O: Objective,
@@ -2373,6 +2456,8 @@ where
          than the one accumulating g"
     );
 
+    let started = Instant::now();
+
     // Early check.
     if goal.is_goal(&root) {
         // Evaluate the bound at the root rather than leaving `root_lower_bound`
@@ -2403,6 +2488,12 @@ where
                 bound_enabled: !B::TRIVIAL,
                 ..BoundStats::default()
             },
+            telemetry: SearchTelemetry {
+                goals: 1,
+                ..SearchTelemetry::default()
+            }
+            .finished(started),
+            deadline_hit: false,
         };
     }
 
@@ -2434,6 +2525,7 @@ where
     // replaces.
     let mut best_cost: Option<f64> = None;
     let mut budget_exhausted = false;
+    let mut deadline_hit = false;
 
     // Nodes whose cut has already been folded into `bound_stats`, so a node
     // tested at both gates or re-tested on resume is counted once. Left empty
@@ -2455,8 +2547,14 @@ where
     // max_expansions is None and the search gets stuck in reversion cycles.
     let hard_limit = max_expansions.unwrap_or(ctx.index.num_locations() as u32 * 10);
     let mut iterations: u32 = 0;
+    let mut telemetry = SearchTelemetry::default();
 
     loop {
+        if deadline::poll(deadline, iterations) {
+            budget_exhausted = true;
+            deadline_hit = true;
+            break;
+        }
         iterations += 1;
         if nodes_expanded >= hard_limit || iterations >= hard_limit * 2 {
             budget_exhausted = true;
@@ -2559,6 +2657,7 @@ where
         }
 
         // CANDIDATE SELECTION.
+        let mut mark = Instant::now();
         let candidate = get_next_candidate(
             &mut entropy_map,
             current,
@@ -2568,6 +2667,7 @@ where
             seed,
             Some(tables),
         );
+        telemetry::lap(&mut mark, &mut telemetry.generate_time);
 
         let Some((candidate_idx, move_set, new_config, candidate_origin)) = candidate else {
             // No candidates available — bump entropy.
@@ -2615,6 +2715,7 @@ where
         // Record as tried.
         let es = entropy_map.entry(current).or_default();
         let move_key = move_set.encoded_lanes().to_vec();
+        let first_attempt = es.tried_moves.is_empty();
         es.tried_moves.insert(move_key.clone());
         es.candidates_tried += 1;
 
@@ -2624,6 +2725,8 @@ where
         let new_g = graph.g_score(current)
             + objective.edge_cost(&move_set, graph.config(current), &new_config);
         let (child_id, is_new) = graph.insert(current, move_set, new_config, new_g);
+        telemetry::lap(&mut mark, &mut telemetry.insert_time);
+        telemetry.record_attempt(graph.depth(current), first_attempt, is_new);
 
         if !is_new {
             if goal.is_goal(graph.config(child_id)) {
@@ -2749,7 +2852,10 @@ where
         }
 
         if observer.wants_events() {
-            let mut occupied = HashSet::with_capacity(ctx.blocked.len() + current_cfg.len());
+            let mut occupied = FxHashSet::with_capacity_and_hasher(
+                ctx.blocked.len() + current_cfg.len(),
+                Default::default(),
+            );
             occupied.extend(ctx.blocked);
             for (_, loc) in current_cfg.iter() {
                 occupied.insert(loc.encode());
@@ -2868,12 +2974,15 @@ where
     // 3) lexicographic path key (deterministic), 4) node id (deterministic).
     let best = select_best_goal_with_tiebreak(&found_goals, &graph, ctx.index);
     bound_stats.incumbent_cost = best.map(|id| graph.g_score(id));
+    telemetry.goals = found_goals.len() as u64;
     SearchResult {
         goal: best,
         nodes_expanded,
         max_depth_reached: max_depth_seen,
         graph,
         bound_stats,
+        telemetry: telemetry.finished(started),
+        deadline_hit,
     }
 }
 
@@ -3847,7 +3956,7 @@ mod tests {
         let out = generate_candidates(&config, 1, &params, &ctx, 0, None);
         assert!(!out.is_empty());
 
-        let mut occupied = HashSet::new();
+        let mut occupied = FxHashSet::default();
         for (_, loc) in config.iter() {
             occupied.insert(loc.encode());
         }
@@ -3867,7 +3976,7 @@ mod tests {
                 &occupied,
             );
 
-            let mut entries: HashMap<u64, u64> = HashMap::new();
+            let mut entries: FxHashMap<u64, u64> = FxHashMap::default();
             for lane in &lanes {
                 assert_eq!(lane.move_type, first.move_type);
                 assert_eq!(lane.bus_id, first.bus_id);
@@ -9,13 +9,17 @@
 
 use std::cmp::Ordering;
 use std::collections::{BinaryHeap, HashMap, HashSet, VecDeque};
+use std::time::Instant;
 
+use crate::deadline::{self, Deadline};
 use crate::drivers::result::SearchResult;
 use crate::observer::{SearchEvent, SearchObserver};
 use crate::primitives::config::Config;
 use crate::primitives::context::{MoveCandidate, SearchContext, SearchState};
+use crate::primitives::distance::CostProfile;
 use crate::primitives::graph::{NodeId, SearchGraph};
-use crate::traits::{CandidateScorer, CostFn, Goal, MoveGenerator};
+use crate::telemetry::{self, SearchTelemetry};
+use crate::traits::{CandidateScorer, CostFn, Goal, Heuristic, MoveGenerator};
 
 /// Number of parent-chain steps to inspect when computing the
 /// per-atom recent-source map for the IDS frontier's reversal
@@ -49,6 +53,15 @@ pub trait Frontier {
     /// Use `graph` to look up configs and g-scores for ordering.
     fn receive_children(&mut self, children: &[NodeId], graph: &SearchGraph);
 
+    /// Number of nodes currently queued. Reported as
+    /// [`SearchTelemetry::peak_frontier`].
+    fn len(&self) -> usize;
+
+    /// Whether no nodes are queued.
+    fn is_empty(&self) -> bool {
+        self.len() == 0
+    }
+
     /// Check goal when a node is popped (before expansion)?
     /// `true` for A* (guarantees optimality). Default: `false`.
     fn check_goal_on_pop(&self) -> bool {
@@ -62,6 +75,51 @@ pub trait Frontier {
     }
 }
 
+// ── Incremental heuristic profiles ──────────────────────────────────
+
+/// Per-node [`CostProfile`]s for heuristics that estimate incrementally
+/// (see [`Heuristic::estimate_incremental`]).
+///
+/// A node's profile is kept from when the node is received until its own
+/// children have been received, since they are derived from it. Heuristics
+/// without a profile leave every slot empty and pay only the lookup.
+#[derive(Default)]
+struct ProfileCache {
+    slots: Vec<Option<CostProfile>>,
+}
+
+impl ProfileCache {
+    /// Estimate `child`, from `parent`'s profile when one is cached.
+    fn estimate<H: Heuristic>(
+        &mut self,
+        heuristic: &H,
+        graph: &SearchGraph,
+        parent: Option<NodeId>,
+        child: NodeId,
+    ) -> f64 {
+        let parent_profile = parent.and_then(|pid| {
+            let profile = self.slots.get(pid.0 as usize)?.as_ref()?;
+            Some((graph.config(pid), profile))
+        });
+        let (h, profile) = heuristic.estimate_incremental(parent_profile, graph.config(child));
+        if let Some(profile) = profile {
+            let idx = child.0 as usize;
+            if idx >= self.slots.len() {
+                self.slots.resize(idx + 1, None);
+            }
+            self.slots[idx] = Some(profile);
+        }
+        h
+    }
+
+    /// Drop `node`'s profile once all of its children have theirs.
+    fn release(&mut self, node: Option<NodeId>) {
+        if let Some(slot) = node.and_then(|id| self.slots.get_mut(id.0 as usize)) {
+            *slot = None;
+        }
+    }
+}
+
 // ── PriorityFrontier (A* / Greedy) ─────────────────────────────────
 
 /// Priority queue entry, ordered by f-score (lower = higher priority).
@@ -113,6 +171,7 @@ pub struct PriorityFrontier<H> {
     /// With `weight > 1.0`, the guarantee weakens to bounded suboptimal
     /// (cost ≤ weight × optimal).
     goal_on_pop: bool,
+    profiles: ProfileCache,
 }
 
 impl<H> PriorityFrontier<H> {
@@ -127,6 +186,7 @@ impl<H> PriorityFrontier<H> {
             weight,
             use_cost: true,
             goal_on_pop: true,
+            profiles: ProfileCache::default(),
         }
     }
 
@@ -138,19 +198,31 @@ impl<H> PriorityFrontier<H> {
             weight: 0.0, // unused — greedy ignores cost
             use_cost: false,
             goal_on_pop: false,
+            profiles: ProfileCache::default(),
         }
     }
 }
 
-impl<H: crate::traits::Heuristic> Frontier for PriorityFrontier<H> {
+impl<H: Heuristic> Frontier for PriorityFrontier<H> {
     fn select_next(&mut self) -> Option<NodeId> {
         self.heap.pop().map(|e| e.node_id)
     }
 
+    fn len(&self) -> usize {
+        self.heap.len()
+    }
+
     fn receive_children(&mut self, children: &[NodeId], graph: &SearchGraph) {
+        let Some(&first) = children.first() else {
+            return;
+        };
+        // All children of one call share the just-expanded parent.
+        let parent = graph.parent(first);
         for &child_id in children {
             let g = graph.g_score(child_id);
-            let h = self.heuristic.estimate(graph.config(child_id));
+            let h = self
+                .profiles
+                .estimate(&self.heuristic, graph, parent, child_id);
             let f = if self.use_cost {
                 g + self.weight * h
             } else {
@@ -162,6 +234,7 @@ impl<H: crate::traits::Heuristic> Frontier for PriorityFrontier<H> {
                 node_id: child_id,
             });
         }
+        self.profiles.release(parent);
     }
 
     fn check_goal_on_pop(&self) -> bool {
@@ -202,6 +275,10 @@ impl Frontier for BfsFrontier {
     fn receive_children(&mut self, children: &[NodeId], _graph: &SearchGraph) {
         self.queue.extend(children);
     }
+
+    fn len(&self) -> usize {
+        self.queue.len()
+    }
 }
 
 // ── DfsFrontier ─────────────────────────────────────────────────────
@@ -214,6 +291,7 @@ impl Frontier for BfsFrontier {
 pub struct DfsFrontier<H> {
     stack: Vec<NodeId>,
     heuristic: H,
+    profiles: ProfileCache,
 }
 
 impl<H> DfsFrontier<H> {
@@ -221,25 +299,35 @@ impl<H> DfsFrontier<H> {
         Self {
             stack: Vec::new(),
             heuristic,
+            profiles: ProfileCache::default(),
         }
     }
 }
 
-impl<H: crate::traits::Heuristic> Frontier for DfsFrontier<H> {
+impl<H: Heuristic> Frontier for DfsFrontier<H> {
     fn select_next(&mut self) -> Option<NodeId> {
         self.stack.pop()
     }
 
+    fn len(&self) -> usize {
+        self.stack.len()
+    }
+
     fn receive_children(&mut self, children: &[NodeId], graph: &SearchGraph) {
         if children.is_empty() {
             return;
         }
         // Sort by heuristic descending (worst first on stack).
         // Best child is pushed last → popped first (LIFO).
+        let parent = graph.parent(children[0]);
         let mut scored: Vec<(f64, NodeId)> = children
             .iter()
-            .map(|&id| (self.heuristic.estimate(graph.config(id)), id))
+            .map(|&id| {
+                let h = self.profiles.estimate(&self.heuristic, graph, parent, id);
+                (h, id)
+            })
             .collect();
+        self.profiles.release(parent);
         scored.sort_by(|a, b| b.0.total_cmp(&a.0));
         for (_, id) in scored {
             self.stack.push(id);
@@ -326,6 +414,7 @@ pub struct IdsFrontier<H> {
     heap: BinaryHeap<IdsEntry>,
     heuristic: H,
     insertion_counter: u64,
+    profiles: ProfileCache,
 }
 
 impl<H> IdsFrontier<H> {
@@ -334,15 +423,20 @@ impl<H> IdsFrontier<H> {
             heap: BinaryHeap::new(),
             heuristic,
             insertion_counter: 0,
+            profiles: ProfileCache::default(),
         }
     }
 }
 
-impl<H: crate::traits::Heuristic> Frontier for IdsFrontier<H> {
+impl<H: Heuristic> Frontier for IdsFrontier<H> {
     fn select_next(&mut self) -> Option<NodeId> {
         self.heap.pop().map(|e| e.node_id)
     }
 
+    fn len(&self) -> usize {
+        self.heap.len()
+    }
+
     fn receive_children(&mut self, children: &[NodeId], graph: &SearchGraph) {
         if children.is_empty() {
             return;
@@ -364,7 +458,9 @@ impl<H: crate::traits::Heuristic> Frontier for IdsFrontier<H> {
         let recent_sources: Option<HashMap<u32, HashSet<u64>>> =
             parent_id_opt.map(|pid| compute_recent_sources(graph, pid, IDS_REVERSAL_LOOKBACK));
         for &child_id in children {
-            let h = self.heuristic.estimate(graph.config(child_id));
+            let h = self
+                .profiles
+                .estimate(&self.heuristic, graph, parent_id_opt, child_id);
             let depth = graph.depth(child_id);
             let penalty = match (parent_id_opt, &recent_sources) {
                 (Some(pid), Some(rs)) => count_reversals(graph, pid, child_id, rs),
@@ -379,6 +475,7 @@ impl<H: crate::traits::Heuristic> Frontier for IdsFrontier<H> {
             });
             self.insertion_counter += 1;
         }
+        self.profiles.release(parent_id_opt);
     }
 }
 
@@ -540,6 +637,64 @@ where
     F: Frontier,
     O: SearchObserver,
 {
+    run_search_until(
+        root,
+        generator,
+        scorer,
+        cost_fn,
+        goal,
+        frontier,
+        ctx,
+        state,
+        observer,
+        max_expansions,
+        max_depth,
+        max_cost,
+        None,
+    )
+}
+
+/// [`run_search`] with an optional wall-clock [`Deadline`].
+///
+/// The deadline is polled once per loop iteration through
+/// [`Deadline::poll`], so it costs a counter test per expansion and a clock
+/// read every [`DEADLINE_POLL_STRIDE`](crate::deadline::DEADLINE_POLL_STRIDE)
+/// of them.
+///
+/// With a deadline set the loop also keeps an **incumbent**: the cheapest
+/// goal-satisfying child generated so far that the frontier has not yet
+/// popped. That only matters for goal-on-pop frontiers (A*, weighted A*) —
+/// goal-on-generate frontiers return their first goal child immediately — and
+/// it is what a deadline exit returns instead of nothing. Reaching
+/// `max_expansions` or draining the frontier keeps its historical verdict and
+/// never returns the incumbent, so a solve that finishes within its deadline
+/// behaves exactly as it would with none.
+#[allow(clippy::too_many_arguments)]
+pub fn run_search_until<G, S, C, Go, F, O>(
+    root: Config,
+    generator: &G,
+    scorer: &S,
+    cost_fn: &C,
+    goal: &Go,
+    frontier: &mut F,
+    ctx: &SearchContext,
+    state: &mut SearchState,
+    observer: &mut O,
+    max_expansions: Option<u32>,
+    max_depth: Option<u32>,
+    max_cost: Option<f64>,
+    deadline: Option<&Deadline>,
+) -> SearchResult
+where
+    G: MoveGenerator,
+    S: CandidateScorer,
+    C: CostFn,
+    Go: Goal,
+    F: Frontier,
+    O: SearchObserver,
+{
+    let started = Instant::now();
+
     // Early check: root is already a goal.
     if goal.is_goal(&root) {
         return SearchResult {
@@ -549,6 +704,12 @@ where
             graph: SearchGraph::new(root),
             // The frontier drivers do not prune against an incumbent.
             bound_stats: crate::bounds::BoundStats::default(),
+            telemetry: SearchTelemetry {
+                goals: 1,
+                ..SearchTelemetry::default()
+            }
+            .finished(started),
+            deadline_hit: false,
         };
     }
 
@@ -563,6 +724,12 @@ where
     let mut closed: Vec<bool> = vec![false; 64];
     let mut candidates: Vec<MoveCandidate> = Vec::new();
     let mut new_children: Vec<NodeId> = Vec::new();
+    // Cheapest goal child generated but not yet popped. Only tracked under a
+    // deadline, and only returned by a deadline exit.
+    let track_incumbent = deadline.is_some() && frontier.check_goal_on_pop();
+    let mut incumbent: Option<NodeId> = None;
+    let mut iterations: u32 = 0;
+    let mut telemetry = SearchTelemetry::default();
 
     while let Some(node_id) = frontier.select_next() {
         if let Some(max) = max_expansions
@@ -570,6 +737,21 @@ where
         {
             break;
         }
+        if deadline::poll(deadline, iterations) {
+            return SearchResult {
+                goal: incumbent,
+                nodes_expanded,
+                max_depth_reached: max_depth_seen,
+                bound_stats: crate::bounds::BoundStats {
+                    incumbent_cost: incumbent.map(|id| graph.g_score(id)),
+                    ..crate::bounds::BoundStats::default()
+                },
+                graph,
+                telemetry: telemetry.finished(started),
+                deadline_hit: true,
+            };
+        }
+        iterations = iterations.wrapping_add(1);
 
         let idx = node_id.0 as usize;
 
@@ -594,12 +776,15 @@ where
                 node_id,
                 config: graph.config(node_id),
             });
+            telemetry.goals += 1;
             return SearchResult {
                 goal: Some(node_id),
                 nodes_expanded,
                 max_depth_reached: max_depth_seen,
                 graph,
                 bound_stats: crate::bounds::BoundStats::default(),
+                telemetry: telemetry.finished(started),
+                deadline_hit: false,
             };
         }
 
@@ -621,9 +806,12 @@ where
         nodes_expanded += 1;
         let current_g = graph.g_score(node_id);
 
+        let mut mark = Instant::now();
         candidates.clear();
         generator.generate(graph.config(node_id), node_id, ctx, state, &mut candidates);
+        telemetry::lap(&mut mark, &mut telemetry.generate_time);
         debug_assert_candidates_valid(&candidates, ctx);
+        let num_candidates = candidates.len();
 
         observer.on_event(SearchEvent::NodeExpanded {
             depth,
@@ -639,6 +827,7 @@ where
                 .partial_cmp(&scorer.score(a, graph.config(node_id), ctx))
                 .unwrap_or(std::cmp::Ordering::Equal)
         });
+        telemetry::lap(&mut mark, &mut telemetry.score_time);
 
         new_children.clear();
 
@@ -670,14 +859,26 @@ where
                         node_id: child_id,
                         config: graph.config(child_id),
                     });
+                    telemetry::lap(&mut mark, &mut telemetry.insert_time);
+                    telemetry.record_expansion(depth, num_candidates, new_children.len() + 1);
+                    telemetry.goals += 1;
                     return SearchResult {
                         goal: Some(child_id),
                         nodes_expanded,
                         max_depth_reached: max_depth_seen.max(graph.depth(child_id)),
                         graph,
                         bound_stats: crate::bounds::BoundStats::default(),
+                        telemetry: telemetry.finished(started),
+                        deadline_hit: false,
                     };
                 }
+                if track_incumbent
+                    && !reaches_cost_cap(new_g, max_cost)
+                    && incumbent.is_none_or(|id| new_g < graph.g_score(id))
+                    && goal.is_goal(graph.config(child_id))
+                {
+                    incumbent = Some(child_id);
+                }
                 new_children.push(child_id);
             }
         }
@@ -685,6 +886,9 @@ where
         if !new_children.is_empty() {
             frontier.receive_children(&new_children, &graph);
         }
+        telemetry::lap(&mut mark, &mut telemetry.insert_time);
+        telemetry.record_expansion(depth, num_candidates, new_children.len());
+        telemetry.peak_frontier = telemetry.peak_frontier.max(frontier.len() as u64);
     }
 
     SearchResult {
@@ -693,6 +897,8 @@ where
         max_depth_reached: max_depth_seen,
         graph,
         bound_stats: crate::bounds::BoundStats::default(),
+        telemetry: telemetry.finished(started),
+        deadline_hit: false,
     }
 }
 
@@ -1060,6 +1266,16 @@ mod tests {
         // With an exact manhattan heuristic, A* expands exactly 3 nodes
         // on the line (no off-path expansions).
         assert_eq!(result.nodes_expanded, 3);
+
+        // One expansion per depth along the path, and every candidate is
+        // either a new node or a transposition.
+        let t = &result.telemetry;
+        assert_eq!(t.expansions, 3);
+        assert_eq!(t.goals, 1);
+        assert_eq!(t.by_depth.len(), 3);
+        assert!(t.by_depth.iter().all(|row| row.expanded == 1));
+        assert_eq!(t.candidates, t.new_nodes + t.transpositions);
+        assert!(t.peak_frontier >= 1);
     }
 
     #[test]
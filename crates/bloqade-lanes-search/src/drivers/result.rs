@@ -3,10 +3,12 @@
 //! [`SearchResult`] is produced by every search driver
 //! ([`crate::drivers::frontier::run_search`] and
 //! [`crate::drivers::entropy::entropy_search`]) and carries the goal node,
-//! expansion statistics, and the [`SearchGraph`] for path reconstruction.
+//! expansion statistics, telemetry, and the [`SearchGraph`] for path
+//! reconstruction.
 
 use crate::bounds::BoundStats;
 use crate::primitives::graph::{MoveSet, NodeId, SearchGraph};
+use crate::telemetry::SearchTelemetry;
 
 /// Result of a search.
 #[derive(Debug)]
@@ -26,6 +28,13 @@ pub struct SearchResult {
     /// run from an unmeasured one rather than testing the counters against zero;
     /// `incumbent_cost` is `Some` on any solve that found a goal, bounded or not.
     pub bound_stats: BoundStats,
+    /// Counters, per-depth histograms and phase timings for this search.
+    pub telemetry: SearchTelemetry,
+    /// Whether the wall-clock deadline stopped the search before it finished.
+    ///
+    /// A search that drained its frontier or hit another limit leaves this
+    /// `false` even if the deadline has passed by the time it returns.
+    pub deadline_hit: bool,
 }
 
 impl SearchResult {
@@ -21,9 +21,10 @@
 //!   entries, mirroring `cmp_moveset_config_tiebreak`).
 
 use std::cmp::Ordering;
-use std::collections::{BTreeMap, HashMap, HashSet};
+use std::collections::{BTreeMap, HashSet};
 
 use bloqade_lanes_bytecode_core::arch::addr::{LaneAddr, LocationAddr};
+use rustc_hash::{FxHashMap, FxHashSet};
 
 use crate::ops::aod_grid::BusGridContext;
 use crate::primitives::config::Config;
@@ -84,7 +85,8 @@ pub(crate) fn pack_aod_rectangles(
     blocked: &HashSet<u64>,
 ) -> Vec<PackedCandidate> {
     // Build occupied set: blocked locations + qubits already in this config.
-    let mut occupied: HashSet<u64> = HashSet::with_capacity(blocked.len() + config.len());
+    let mut occupied: FxHashSet<u64> =
+        FxHashSet::with_capacity_and_hasher(blocked.len() + config.len(), Default::default());
     occupied.extend(blocked);
     for (_, loc) in config.iter() {
         occupied.insert(loc.encode());
@@ -108,8 +110,10 @@ pub(crate) fn pack_aod_rectangles(
 
         // Build src→lane entries and lane→entry lookup for score lifting
         // and destination derivation.
-        let mut grid_entries: HashMap<u64, u64> = HashMap::with_capacity(entries.len());
-        let mut entry_by_lane: HashMap<u64, &ScoredLane> = HashMap::with_capacity(entries.len());
+        let mut grid_entries: FxHashMap<u64, u64> =
+            FxHashMap::with_capacity_and_hasher(entries.len(), Default::default());
+        let mut entry_by_lane: FxHashMap<u64, &ScoredLane> =
+            FxHashMap::with_capacity_and_hasher(entries.len(), Default::default());
         for e in &entries {
             if let Some((src, _)) = index.endpoints(&e.lane) {
                 let src_enc = src.encode();
@@ -7,6 +7,7 @@
 use std::collections::{BTreeSet, HashMap, HashSet};
 
 use bloqade_lanes_bytecode_core::arch::addr::{LaneAddr, LocationAddr};
+use rustc_hash::FxHashSet;
 
 use crate::primitives::config::Config;
 use crate::primitives::context::{MoveCandidate, SearchContext, SearchState};
@@ -37,8 +38,8 @@ impl ExhaustiveGenerator {
     }
 
     /// Build the set of all occupied encoded locations (config qubits + blocked).
-    fn occupied_set(config: &Config, blocked: &HashSet<u64>) -> HashSet<u64> {
-        let mut occupied = blocked.clone();
+    fn occupied_set(config: &Config, blocked: &HashSet<u64>) -> FxHashSet<u64> {
+        let mut occupied: FxHashSet<u64> = blocked.iter().copied().collect();
         for (_, loc) in config.iter() {
             occupied.insert(loc.encode());
         }
@@ -81,7 +82,7 @@ impl MoveGenerator for ExhaustiveGenerator {
 
 /// Shared context for rectangle enumeration, built once per `generate()` call.
 struct ExpandContext<'a> {
-    occupied: HashSet<u64>,
+    occupied: FxHashSet<u64>,
     loc_to_qubit: HashMap<u64, u32>,
     config: &'a Config,
     index: &'a LaneIndex,
@@ -172,7 +173,7 @@ fn try_rectangle(
     // Every cell's (src, dst) plus the sources this rectangle actually moves
     // an atom out of — the group's mover set, needed to judge destinations.
     let mut cells: Vec<(u64, u64)> = Vec::with_capacity(x_subset.len() * y_subset.len());
-    let mut mover_srcs: HashSet<u64> = HashSet::new();
+    let mut mover_srcs: FxHashSet<u64> = FxHashSet::default();
 
     for &xb in x_subset {
         for &yb in y_subset {
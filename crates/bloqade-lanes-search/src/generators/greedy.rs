@@ -7,9 +7,9 @@
 //! AOD-compatible rectangular grids via [`BusGridContext`].
 
 use std::collections::HashMap;
-use std::collections::HashSet;
 
 use bloqade_lanes_bytecode_core::arch::addr::{Direction, LaneAddr, LocationAddr, MoveType};
+use rustc_hash::{FxHashMap, FxHashSet};
 
 use crate::ops::aod_grid::BusGridContext;
 use crate::primitives::config::Config;
@@ -37,7 +37,7 @@ impl MoveGenerator for GreedyGenerator {
         let index = ctx.index;
 
         // 1. Build occupied set: blocked ∪ {all current qubit locations}.
-        let mut occupied: HashSet<u64> = ctx.blocked.clone();
+        let mut occupied: FxHashSet<u64> = ctx.blocked.iter().copied().collect();
         for (_qid, loc) in config.iter() {
             occupied.insert(loc.encode());
         }
@@ -73,7 +73,7 @@ impl MoveGenerator for GreedyGenerator {
         }
 
         // 3. Group first lanes by (move_type, bus_id, direction) — zone-independent.
-        let mut groups: HashMap<(MoveType, u32, Direction), HashMap<u64, u64>> = HashMap::new();
+        let mut groups: HashMap<(MoveType, u32, Direction), FxHashMap<u64, u64>> = HashMap::new();
 
         // Build reverse lookup for resolving qubit → source location.
         let loc_to_qubit = config.location_to_qubit_map();
@@ -127,6 +127,8 @@ impl MoveGenerator for GreedyGenerator {
 
 #[cfg(test)]
 mod tests {
+    use std::collections::HashSet;
+
     use super::*;
     use crate::primitives::context::SearchState;
     use crate::primitives::distance::DistanceTable;
@@ -7,13 +7,14 @@
 //! Supports configurable deadlock escape, 2-step lookahead scoring,
 //! and seeded score perturbation for restart diversity.
 
-use std::cell::Cell;
+use std::cell::{Cell, RefCell};
 use std::cmp::Ordering;
-use std::collections::{BTreeMap, HashMap, HashSet};
 
 use bloqade_lanes_bytecode_core::arch::addr::{LaneAddr, LocationAddr};
 use rand::rngs::SmallRng;
 use rand::{Rng, SeedableRng};
+use rustc_hash::{FxHashMap, FxHashSet};
+use smallvec::SmallVec;
 
 use crate::generators::cz_coordination::{
     CzCoordination, EntanglingCoordination, FixedTargetCoordination,
@@ -44,7 +45,7 @@ pub enum DeadlockPolicy {
 ///
 /// `pub(crate)` so the [`CzCoordination`](crate::generators::cz_coordination)
 /// policy module can operate on the selected-entry buffer.
-#[derive(Clone)]
+#[derive(Debug, Clone)]
 pub(crate) struct ScoredTriple {
     pub(crate) qubit_id: u32,
     pub(crate) score: i32, // d_now - d_after (can be negative)
@@ -72,6 +73,47 @@ fn cmp_candidates(a: &(i32, MoveSet, Config), b: &(i32, MoveSet, Config)) -> Ord
         .then_with(|| cmp_moveset_config_tiebreak(&a.1, &a.2, &b.1, &b.2))
 }
 
+/// Buffers [`HeuristicGenerator::generate`] reuses from one expansion to the
+/// next, so a warmed-up generator expands a node without touching the
+/// allocator except for the candidates it emits.
+///
+/// Every buffer is cleared at the top of each call; only capacity carries
+/// over, never contents. The location sets use the Fx hasher: their keys are
+/// encoded addresses, not attacker-controlled input, and SipHash was a
+/// visible share of expansion time.
+#[derive(Debug, Default)]
+struct GeneratorScratch {
+    occupied: FxHashSet<u64>,
+    unresolved: Vec<(u32, u64, u64)>,
+    target_qubits: FxHashSet<u32>,
+    accidental_cz_qubits: Vec<(u32, u64)>,
+    accidental_seen: FxHashSet<u64>,
+    contested: FxHashSet<u64>,
+    all_scores: Vec<(TripletKey, ScoredTriple)>,
+    spectator_escapes: Vec<(TripletKey, ScoredTriple)>,
+    selected: Vec<(TripletKey, ScoredTriple)>,
+    entries: FxHashMap<u64, u64>,
+    seed_lanes: Vec<u64>,
+    seen_movesets: FxHashSet<MoveSet>,
+}
+
+impl GeneratorScratch {
+    fn clear(&mut self) {
+        self.occupied.clear();
+        self.unresolved.clear();
+        self.target_qubits.clear();
+        self.accidental_cz_qubits.clear();
+        self.accidental_seen.clear();
+        self.contested.clear();
+        self.all_scores.clear();
+        self.spectator_escapes.clear();
+        self.selected.clear();
+        self.entries.clear();
+        self.seed_lanes.clear();
+        self.seen_movesets.clear();
+    }
+}
+
 /// Heuristic move generator that produces a small number of high-quality
 /// movesets per expansion.
 ///
@@ -102,6 +144,9 @@ pub struct HeuristicGenerator {
     top_c: Option<usize>,
     /// Counter for deadlock occurrences (single-threaded; each restart gets its own generator).
     deadlock_count: Cell<u32>,
+    /// Per-generator scratch arena, reused across `generate` calls (same
+    /// single-threaded ownership as `deadlock_count`).
+    scratch: RefCell<GeneratorScratch>,
 }
 
 impl Default for HeuristicGenerator {
@@ -119,6 +164,7 @@ impl HeuristicGenerator {
             seed: 0,
             top_c: None,
             deadlock_count: Cell::new(0),
+            scratch: RefCell::new(GeneratorScratch::default()),
         }
     }
 
@@ -181,7 +227,7 @@ impl HeuristicGenerator {
         score_step1: i32,
         dst_enc: u64,
         target_enc: u64,
-        occupied: &HashSet<u64>,
+        occupied: &FxHashSet<u64>,
         index: &LaneIndex,
         dist_table: &DistanceTable,
     ) -> i32 {
@@ -216,12 +262,12 @@ impl HeuristicGenerator {
     fn generate_blocker_escape(
         &self,
         config: &Config,
-        occupied: &HashSet<u64>,
+        occupied: &FxHashSet<u64>,
         unresolved: &[(u32, u64, u64)],
         index: &LaneIndex,
         out: &mut Vec<MoveCandidate>,
     ) {
-        let target_locs: HashSet<u64> = unresolved.iter().map(|&(_, _, t)| t).collect();
+        let target_locs: FxHashSet<u64> = unresolved.iter().map(|&(_, _, t)| t).collect();
         for (qid, loc) in config.iter() {
             if !target_locs.contains(&loc.encode()) {
                 continue;
@@ -241,7 +287,7 @@ impl HeuristicGenerator {
     fn generate_all_escape(
         &self,
         config: &Config,
-        occupied: &HashSet<u64>,
+        occupied: &FxHashSet<u64>,
         index: &LaneIndex,
         out: &mut Vec<MoveCandidate>,
     ) {
@@ -294,7 +340,7 @@ fn occupant_can_vacate(dst: LocationAddr, lane: &LaneAddr, index: &LaneIndex) ->
 ///   it is penalized: `STRANDS_FOLLOWER`.
 fn chain_link_score(
     link: &ChainLink,
-    targets: &HashMap<u32, u64>,
+    targets: &FxHashMap<u32, u64>,
     dist_table: &DistanceTable,
 ) -> i32 {
     /// Penalty for a hop that leaves a follower unable to reach its target at
@@ -324,7 +370,7 @@ fn chain_link_score(
 /// could vacate its destination, so the chain exemption cannot apply here.
 fn escape_targets<'a>(
     loc: LocationAddr,
-    occupied: &'a HashSet<u64>,
+    occupied: &'a FxHashSet<u64>,
     index: &'a LaneIndex,
 ) -> impl Iterator<Item = (LaneAddr, LocationAddr)> + 'a {
     index.outgoing_lanes(loc).iter().filter_map(move |&lane| {
@@ -360,37 +406,48 @@ impl MoveGenerator for HeuristicGenerator {
             None => Box::new(FixedTargetCoordination),
         };
 
+        let mut scratch = self.scratch.borrow_mut();
+        scratch.clear();
+        let GeneratorScratch {
+            occupied,
+            unresolved,
+            target_qubits,
+            accidental_cz_qubits,
+            accidental_seen,
+            contested,
+            all_scores,
+            spectator_escapes,
+            selected,
+            entries,
+            seed_lanes,
+            seen_movesets,
+        } = &mut *scratch;
+
         // Build occupied set: config qubit locations + blocked.
         // Pre-allocate to avoid rehashing.
-        let mut occupied = HashSet::with_capacity(ctx.blocked.len() + config.len());
+        occupied.reserve(ctx.blocked.len() + config.len());
         occupied.extend(ctx.blocked);
         for (_, loc) in config.iter() {
             occupied.insert(loc.encode());
         }
 
         // Step 1: identify unresolved qubits.
-        let unresolved: Vec<(u32, u64, u64)> = ctx
-            .targets
-            .iter()
-            .filter_map(|&(qid, target_enc)| {
-                let loc = config.location_of(qid)?;
-                let loc_enc = loc.encode();
-                if loc_enc == target_enc {
-                    None
-                } else {
-                    Some((qid, loc_enc, target_enc))
-                }
-            })
-            .collect();
+        unresolved.extend(ctx.targets.iter().filter_map(|&(qid, target_enc)| {
+            let loc = config.location_of(qid)?;
+            let loc_enc = loc.encode();
+            if loc_enc == target_enc {
+                None
+            } else {
+                Some((qid, loc_enc, target_enc))
+            }
+        }));
 
         // Step 1b: identify spectator qubits in accidental CZ positions.
         // A spectator is at an accidental CZ if it's NOT a target qubit,
         // occupies an entangling position, and the partner site is occupied
         // by another non-target qubit.
-        let target_qubits: HashSet<u32> = ctx.targets.iter().map(|&(qid, _)| qid).collect();
+        target_qubits.extend(ctx.targets.iter().map(|&(qid, _)| qid));
         let arch_spec = ctx.index.arch_spec();
-        let mut accidental_cz_qubits: Vec<(u32, u64)> = Vec::new();
-        let mut accidental_seen: HashSet<u64> = HashSet::new();
 
         for (qid, loc) in config.iter() {
             if target_qubits.contains(&qid) {
@@ -427,12 +484,10 @@ impl MoveGenerator for HeuristicGenerator {
         // Build set of contested destinations: target locations that other
         // qubits still need to reach. Moving through these creates future
         // deadlocks, so we apply a soft penalty.
-        let contested: HashSet<u64> = unresolved.iter().map(|&(_, _, t)| t).collect();
+        contested.extend(unresolved.iter().map(|&(_, _, t)| t));
 
         // Step 2: score (qubit, bus triplet) pairs.
-        let mut all_scores: Vec<(TripletKey, ScoredTriple)> = Vec::new();
-
-        for &(qid, loc_enc, target_enc) in &unresolved {
+        for &(qid, loc_enc, target_enc) in unresolved.iter() {
             let d_now = ctx.dist_table.distance(loc_enc, target_enc);
             let d_now = match d_now {
                 Some(d) => d as i32,
@@ -481,7 +536,7 @@ impl MoveGenerator for HeuristicGenerator {
                         score,
                         dst_enc,
                         target_enc,
-                        &occupied,
+                        occupied,
                         ctx.index,
                         ctx.dist_table,
                     );
@@ -504,10 +559,9 @@ impl MoveGenerator for HeuristicGenerator {
         // These are kept out of the main filtering so they don't
         // steal candidate slots from CZ routing moves. They'll be merged
         // back after filtering, piggybacking on existing bus triplet groups.
-        let mut spectator_escapes: Vec<(TripletKey, ScoredTriple)> = Vec::new();
-        for &(qid, loc_enc) in &accidental_cz_qubits {
+        for &(qid, loc_enc) in accidental_cz_qubits.iter() {
             let loc = LocationAddr::decode(loc_enc);
-            for (lane, dst) in escape_targets(loc, &occupied, ctx.index) {
+            for (lane, dst) in escape_targets(loc, occupied, ctx.index) {
                 let triplet_key = TripletKey::new(lane.move_type, lane.bus_id, lane.direction);
                 spectator_escapes.push((
                     triplet_key,
@@ -521,21 +575,19 @@ impl MoveGenerator for HeuristicGenerator {
             }
         }
 
-        // Step 3: retain all scored triples.
-        let mut per_qubit: BTreeMap<u32, Vec<(TripletKey, ScoredTriple)>> = BTreeMap::new();
-        for entry in all_scores {
-            per_qubit.entry(entry.1.qubit_id).or_default().push(entry);
-        }
-
-        let mut selected: Vec<(TripletKey, ScoredTriple)> = Vec::new();
+        // Step 3: retain all scored triples, ranked per qubit in ascending
+        // qubit order. One stable sort on (qubit, rank) replaces a per-qubit
+        // map of vectors and yields the same sequence.
+        all_scores.sort_by(|a, b| {
+            a.1.qubit_id
+                .cmp(&b.1.qubit_id)
+                .then_with(|| cmp_scored_triples(a, b))
+        });
         let mut has_positive = false;
 
-        for entries in per_qubit.values_mut() {
-            entries.sort_by(cmp_scored_triples);
-            if let Some(c) = self.top_c {
-                entries.truncate(c);
-            }
-            for e in entries.iter() {
+        for ranked in all_scores.chunk_by(|a, b| a.1.qubit_id == b.1.qubit_id) {
+            let keep = self.top_c.map_or(ranked.len(), |c| c.min(ranked.len()));
+            for e in &ranked[..keep] {
                 if e.1.score > 0 {
                     has_positive = true;
                 }
@@ -562,9 +614,9 @@ impl MoveGenerator for HeuristicGenerator {
         // selected CZ routing moves, so they can share an AOD grid without
         // stealing candidate slots.
         if !spectator_escapes.is_empty() {
-            let selected_keys: HashSet<TripletKey> = selected.iter().map(|e| e.0).collect();
+            let selected_keys: FxHashSet<TripletKey> = selected.iter().map(|e| e.0).collect();
             let mut added_any = false;
-            for entry in spectator_escapes {
+            for entry in spectator_escapes.drain(..) {
                 if selected_keys.contains(&entry.0) {
                     selected.push(entry);
                     added_any = true;
@@ -578,7 +630,7 @@ impl MoveGenerator for HeuristicGenerator {
                 // for the first accidental qubit.
                 let (qid, loc_enc) = accidental_cz_qubits[0];
                 let loc = LocationAddr::decode(loc_enc);
-                if let Some((lane, dst)) = escape_targets(loc, &occupied, ctx.index).next() {
+                if let Some((lane, dst)) = escape_targets(loc, occupied, ctx.index).next() {
                     let triplet_key = TripletKey::new(lane.move_type, lane.bus_id, lane.direction);
                     selected.push((
                         triplet_key,
@@ -598,45 +650,41 @@ impl MoveGenerator for HeuristicGenerator {
         // same bus triplet, boost those entries so they're more likely to
         // end up in the same AOD grid (coordinated pair movement). No-op for
         // fixed-target; applied for entangling.
-        coordination.boost_coordinated_pairs(&mut selected);
+        coordination.boost_coordinated_pairs(selected);
 
-        // Step 4: group by bus triplet.
-        let mut groups: BTreeMap<TripletKey, Vec<ScoredTriple>> = BTreeMap::new();
-        for (key, triple) in selected {
-            groups.entry(key).or_default().push(triple);
-        }
+        // Step 4: group by bus triplet. A stable sort on the key keeps each
+        // group's entries in selection order, as the former per-key map did.
+        selected.sort_by_key(|e| e.0);
 
         // Step 5: per group, build AOD-compatible rectangular grids.
         let mut candidates: Vec<(i32, MoveSet, Config)> = Vec::new();
-        // Side-index of movesets already emitted, for O(1) dedup. Order of
-        // `candidates` is irrelevant — Step 6 re-sorts by score.
-        let mut seen_movesets: HashSet<MoveSet> = HashSet::new();
+        // `seen_movesets` is a side-index of movesets already emitted, for
+        // O(1) dedup. Order of `candidates` is irrelevant — Step 6 re-sorts
+        // by score.
         // Target lookup for scoring co-selected conveyor followers. Built on
         // first use so the endpoint-disjoint specs — where no chain can ever
         // form — pay nothing for it.
-        let mut target_by_qubit: Option<HashMap<u32, u64>> = None;
+        let mut target_by_qubit: Option<FxHashMap<u32, u64>> = None;
 
-        for (
-            TripletKey {
+        for qubits in selected.chunk_by(|a, b| a.0 == b.0) {
+            let TripletKey {
                 move_type: mt,
                 bus_id,
                 direction: dir,
-            },
-            qubits,
-        ) in groups
-        {
+            } = qubits[0].0;
+
             // Build grid context from ALL lanes on this bus group (cross-zone).
             let grid_ctx = crate::ops::aod_grid::BusGridContext::new(
-                ctx.index, mt, bus_id, None, dir, &occupied,
+                ctx.index, mt, bus_id, None, dir, occupied,
             );
 
             // Build entries (src_encoded -> lane_encoded) and the seed order for
             // the chain closure. Each source location has at most one atom, so
             // no overwrites occur.
-            let mut entries: HashMap<u64, u64> = HashMap::new();
-            let mut seed_lanes: Vec<u64> = Vec::with_capacity(qubits.len());
+            entries.clear();
+            seed_lanes.clear();
 
-            for t in &qubits {
+            for (_, t) in qubits {
                 let lane = LaneAddr::decode_u64(t.lane_encoded);
                 if let Some((src, _)) = ctx.index.endpoints(&lane) {
                     let src_enc = src.encode();
@@ -651,13 +699,13 @@ impl MoveGenerator for HeuristicGenerator {
             // scored `<= 0` and was pruned — leaves the rectangle unexecutable
             // and the group emits nothing. Co-select those followers, to the end
             // of the chain, so the whole shift rides in one AOD shot.
-            let chain_links =
-                close_chain_entries(&mut entries, &seed_lanes, &occupied, config, ctx.index);
+            let chain_links = close_chain_entries(entries, seed_lanes, occupied, config, ctx.index);
             let chain_triples: Vec<ScoredTriple> = if chain_links.is_empty() {
                 Vec::new()
             } else {
-                let targets = target_by_qubit
-                    .get_or_insert_with(|| ctx.targets.iter().copied().collect::<HashMap<_, _>>());
+                let targets = target_by_qubit.get_or_insert_with(|| {
+                    ctx.targets.iter().copied().collect::<FxHashMap<_, _>>()
+                });
                 chain_links
                     .iter()
                     .map(|link| ScoredTriple {
@@ -671,8 +719,9 @@ impl MoveGenerator for HeuristicGenerator {
 
             // Lane -> triple lookup over both the selected movers and the
             // followers pulled in behind them.
-            let triple_by_lane: HashMap<u64, &ScoredTriple> = qubits
+            let triple_by_lane: FxHashMap<u64, &ScoredTriple> = qubits
                 .iter()
+                .map(|(_, t)| t)
                 .chain(chain_triples.iter())
                 .map(|t| (t.lane_encoded, t))
                 .collect();
@@ -680,11 +729,11 @@ impl MoveGenerator for HeuristicGenerator {
             // Build rectangular grids via two-phase algorithm. Grids may include
             // empty filler lanes to keep complete AOD geometry; only lanes that
             // map back to a scored triple contribute qubit moves and score.
-            let grids = grid_ctx.build_aod_grids(&entries);
+            let grids = grid_ctx.build_aod_grids(entries);
 
             for grid_lanes in grids {
                 let mut total_score: i32 = 0;
-                let mut moves: Vec<(u32, LocationAddr)> = Vec::new();
+                let mut moves: SmallVec<[(u32, LocationAddr); 8]> = SmallVec::new();
 
                 for &lane_enc in &grid_lanes {
                     if let Some(t) = triple_by_lane.get(&lane_enc) {
@@ -753,10 +802,10 @@ impl MoveGenerator for HeuristicGenerator {
             match self.deadlock_policy {
                 DeadlockPolicy::Skip => {}
                 DeadlockPolicy::MoveBlockers => {
-                    self.generate_blocker_escape(config, &occupied, &unresolved, ctx.index, out);
+                    self.generate_blocker_escape(config, occupied, unresolved, ctx.index, out);
                 }
                 DeadlockPolicy::AllMoves => {
-                    self.generate_all_escape(config, &occupied, ctx.index, out);
+                    self.generate_all_escape(config, occupied, ctx.index, out);
                 }
             }
         }
@@ -18,11 +18,13 @@
 //!   `nohome`, `receding_horizon` (and forthcoming `single_heuristic` /
 //!   `loose_goal` peers).
 //! - [`dsl`] — Starlark policy DSL sidecar (Move / Target).
-//! - Top-level small modules (`cost`, `goals`, `heuristics`, `scorers`,
-//!   `generators`, `observer`, `traits`) — too small to warrant subdirs.
+//! - Top-level small modules (`cost`, `deadline`, `goals`, `heuristics`,
+//!   `scorers`, `generators`, `observer`, `traits`) — too small to warrant
+//!   subdirs.
 
 pub mod bounds;
 pub mod cost;
+pub mod deadline;
 pub mod drivers;
 pub mod dsl;
 pub mod feasibility;
@@ -36,6 +38,7 @@ pub mod primitives;
 pub mod push_rotate;
 pub mod scorers;
 pub mod search;
+pub mod telemetry;
 #[cfg(test)]
 pub(crate) mod test_utils;
 pub mod traits;
@@ -45,6 +48,7 @@ pub use bounds::{CompletionBound, MaxBound, NoBound, WeightedDistanceBound};
 // test-only assertion helper, reachable as `bounds::assert_objective_contract`
 // under `cfg(test)` or the `test-util` feature.
 pub use cost::{UniformCost, WeightedDuration};
+pub use deadline::Deadline;
 pub use drivers::result::SearchResult;
 pub use feasibility::{Feasibility, Obstruction, check as check_feasibility};
 pub use generators::{
@@ -63,7 +67,7 @@ pub use placement::single_heuristic::SingleHeuristicCzPlacement;
 pub use placement::target_generator::{
     CandidateError, DefaultTargetGenerator, TargetContext, TargetGenerator,
 };
-pub use primitives::config::{Config, ConfigError};
+pub use primitives::config::{Config, ConfigDiff, ConfigError};
 pub use primitives::context::{MoveCandidate, SearchContext, SearchState};
 pub use primitives::distance::PairDistanceHeuristic;
 pub use primitives::graph::{MoveSet, NodeId, SearchGraph};
@@ -75,4 +79,6 @@ pub use search::move_search::MoveSearch;
 pub use search::options::{InnerStrategy, SolveOptions, Strategy};
 pub use search::result::{CandidateAttempt, MultiSolveResult};
 pub use search::target_solver::TargetSolver;
+pub use search::warm_start::WarmStart;
+pub use telemetry::{EventSampler, SearchTelemetry};
 pub use traits::{CandidateScorer, CostFn, Goal, Heuristic, MoveGenerator, Objective, ObjectiveId};
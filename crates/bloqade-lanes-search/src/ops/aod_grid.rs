@@ -11,9 +11,10 @@
 
 use std::borrow::Cow;
 use std::cell::RefCell;
-use std::collections::{BTreeSet, HashMap, HashSet};
+use std::collections::BTreeSet;
 
 use bloqade_lanes_bytecode_core::arch::addr::{Direction, LaneAddr, LocationAddr, MoveType};
+use rustc_hash::{FxHashMap, FxHashSet};
 
 use crate::primitives::bus_grid_maps::BusGridMaps;
 use crate::primitives::config::Config;
@@ -58,8 +59,8 @@ enum RectOutcome {
 /// drift apart.
 pub(crate) fn destination_is_available(
     dst_enc: u64,
-    occupied: &HashSet<u64>,
-    group_mover_srcs: &HashSet<u64>,
+    occupied: &FxHashSet<u64>,
+    group_mover_srcs: &FxHashSet<u64>,
 ) -> bool {
     !occupied.contains(&dst_enc) || group_mover_srcs.contains(&dst_enc)
 }
@@ -187,9 +188,9 @@ pub(crate) struct ChainLink {
 /// A no-op on endpoint-disjoint buses (see [`vacating_lane`]), so the shipped
 /// Gemini specs get byte-identical entry sets.
 pub(crate) fn close_chain_entries(
-    entries: &mut HashMap<u64, u64>,
+    entries: &mut FxHashMap<u64, u64>,
     seed_lanes: &[u64],
-    occupied: &HashSet<u64>,
+    occupied: &FxHashSet<u64>,
     config: &Config,
     index: &LaneIndex,
 ) -> Vec<ChainLink> {
@@ -267,7 +268,7 @@ pub(crate) struct BusGridContext<'a> {
     /// Locations occupied by atoms or blocked locations in the current config.
     /// Borrowed in production (one context per bus group per node — cloning
     /// here was pure overhead); owned only by tests that fabricate contexts.
-    occupied_locs: Cow<'a, HashSet<u64>>,
+    occupied_locs: Cow<'a, FxHashSet<u64>>,
     /// Scratch buffers reused across `is_valid_rect` calls (the hottest loop
     /// in candidate generation) to avoid a fresh allocation per rectangle:
     /// the rectangle's `(src, dst)` cells and its sorted source encodings.
@@ -288,7 +289,7 @@ impl<'a> BusGridContext<'a> {
         bus_id: u32,
         zone_id: Option<u32>,
         dir: Direction,
-        occupied: &'a HashSet<u64>,
+        occupied: &'a FxHashSet<u64>,
     ) -> Self {
         let maps = match zone_id {
             None => match index.bus_grid_maps(mt, bus_id, dir) {
@@ -318,7 +319,12 @@ impl<'a> BusGridContext<'a> {
     ///
     /// The destination half of that is [`destination_is_available`]'s rule,
     /// specialized here to a lazily-built sorted source index for speed.
-    fn is_valid_rect(&self, xs: &BTreeSet<u64>, ys: &BTreeSet<u64>, movers: &HashSet<u64>) -> bool {
+    fn is_valid_rect(
+        &self,
+        xs: &BTreeSet<u64>,
+        ys: &BTreeSet<u64>,
+        movers: &FxHashSet<u64>,
+    ) -> bool {
         matches!(self.rect_outcome(xs, ys, movers, None), RectOutcome::Valid)
     }
 
@@ -343,7 +349,7 @@ impl<'a> BusGridContext<'a> {
         &self,
         xs: &BTreeSet<u64>,
         ys: &BTreeSet<u64>,
-        movers: &HashSet<u64>,
+        movers: &FxHashSet<u64>,
         mut repairs: Option<&mut Vec<u64>>,
     ) -> RectOutcome {
         // Resolve every cell's (src, dst) once into a reused scratch buffer.
@@ -492,13 +498,13 @@ impl<'a> BusGridContext<'a> {
     /// chain's follower invalidates its leader). Such a caller must therefore
     /// *regenerate* with the reserved atoms treated as immovable from the
     /// start, rather than subtracting them afterwards.
-    pub(crate) fn build_aod_grids(&self, entries: &HashMap<u64, u64>) -> Vec<Vec<u64>> {
+    pub(crate) fn build_aod_grids(&self, entries: &FxHashMap<u64, u64>) -> Vec<Vec<u64>> {
         if entries.is_empty() {
             return Vec::new();
         }
 
         // Movers = all source locations from the entries.
-        let movers: HashSet<u64> = entries.keys().copied().collect();
+        let movers: FxHashSet<u64> = entries.keys().copied().collect();
 
         let clusters = self.greedy_init(entries, &movers);
         let solved = self.merge_clusters(clusters, &movers);
@@ -526,7 +532,7 @@ impl<'a> BusGridContext<'a> {
         &self,
         xs: &mut BTreeSet<u64>,
         ys: &mut BTreeSet<u64>,
-        movers: &HashSet<u64>,
+        movers: &FxHashSet<u64>,
         x: u64,
         y: u64,
     ) -> bool {
@@ -598,7 +604,7 @@ impl<'a> BusGridContext<'a> {
     /// Processes entries in order and greedily expands a rectangle. Entries
     /// that don't fit are put aside for the next round. Repeats until all
     /// entries are assigned or no progress is made.
-    fn greedy_init(&self, entries: &HashMap<u64, u64>, movers: &HashSet<u64>) -> Vec<Cluster> {
+    fn greedy_init(&self, entries: &FxHashMap<u64, u64>, movers: &FxHashSet<u64>) -> Vec<Cluster> {
         let mut clusters: Vec<Cluster> = Vec::new();
         // Sort by src_encoded for deterministic iteration order.
         let mut remaining: Vec<(u64, u64)> = entries.iter().map(|(&s, &l)| (s, l)).collect();
@@ -642,12 +648,12 @@ impl<'a> BusGridContext<'a> {
     /// cluster i absorbs j. Clusters that don't participate in any merge
     /// are promoted to "solved" and removed — merged clusters only grow,
     /// so a non-merging cluster will never merge later.
-    fn merge_clusters(&self, mut clusters: Vec<Cluster>, movers: &HashSet<u64>) -> Vec<Cluster> {
+    fn merge_clusters(&self, mut clusters: Vec<Cluster>, movers: &FxHashSet<u64>) -> Vec<Cluster> {
         let mut solved: Vec<Cluster> = Vec::new();
 
         while clusters.len() > 1 {
             let n = clusters.len();
-            let mut consumed: HashSet<usize> = HashSet::new();
+            let mut consumed: FxHashSet<usize> = FxHashSet::default();
             let mut merged_flags = vec![false; n];
 
             for i in 0..n {
@@ -724,7 +730,7 @@ mod tests {
     #[test]
     fn is_valid_rect_accepts_a_complete_chain_rectangle() {
         let ctx = chain_context();
-        let movers: HashSet<u64> = [10u64, 20].into_iter().collect();
+        let movers: FxHashSet<u64> = [10u64, 20].into_iter().collect();
         let xs: BTreeSet<u64> = [0u64, 1].into_iter().collect();
         let ys: BTreeSet<u64> = [0u64].into_iter().collect();
         assert!(
@@ -751,7 +757,7 @@ mod tests {
     #[test]
     fn greedy_init_assembles_a_chain_rectangle() {
         let ctx = chain_context();
-        let entries: HashMap<u64, u64> = [(10u64, 101u64), (20, 102)].into_iter().collect();
+        let entries: FxHashMap<u64, u64> = [(10u64, 101u64), (20, 102)].into_iter().collect();
         let grids = ctx.build_aod_grids(&entries);
         assert_eq!(grids.len(), 1, "expected one rectangle: {grids:?}");
         let mut lanes = grids[0].clone();
@@ -780,7 +786,7 @@ mod tests {
             &[A, B],
         );
         // Only A is a mover; B stays put.
-        let entries: HashMap<u64, u64> = [(A, 101u64)].into_iter().collect();
+        let entries: FxHashMap<u64, u64> = [(A, 101u64)].into_iter().collect();
         let grids = ctx.build_aod_grids(&entries);
         assert!(
             grids.is_empty(),
@@ -817,7 +823,7 @@ mod tests {
             &[(A, 101, B), (B, 102, E), (C, 103, D)],
             &[A, B, C],
         );
-        let entries: HashMap<u64, u64> = [(A, 101u64), (B, 102), (C, 103)].into_iter().collect();
+        let entries: FxHashMap<u64, u64> = [(A, 101u64), (B, 102), (C, 103)].into_iter().collect();
         let grids = ctx.build_aod_grids(&entries);
 
         assert!(
@@ -853,7 +859,7 @@ mod tests {
             &[(A, 101, B), (B, 102, E), (C, 103, D)],
             &[A, B, C],
         );
-        let movers: HashSet<u64> = [A, B, C].into_iter().collect();
+        let movers: FxHashSet<u64> = [A, B, C].into_iter().collect();
 
         // The seed cell is repairable, not already valid — otherwise this
         // would never reach the repair loop and would prove nothing.
@@ -895,7 +901,7 @@ mod tests {
             &[A, B, C],
         );
         // C is occupied but never offered as a mover.
-        let entries: HashMap<u64, u64> = [(A, 101u64), (B, 102)].into_iter().collect();
+        let entries: FxHashMap<u64, u64> = [(A, 101u64), (B, 102)].into_iter().collect();
         assert!(
             ctx.build_aod_grids(&entries).is_empty(),
             "every cell on this bus resolves onto a stationary atom"
@@ -929,7 +935,7 @@ mod tests {
             &[(A, 101, B), (B, 102, C), (C, 103, D)],
             &[A, B, C],
         );
-        let entries: HashMap<u64, u64> = [(A, 101u64), (B, 102), (C, 103)].into_iter().collect();
+        let entries: FxHashMap<u64, u64> = [(A, 101u64), (B, 102), (C, 103)].into_iter().collect();
         assert_eq!(
             sorted_grids(&ctx.build_aod_grids(&entries)),
             vec![vec![101, 102, 103]],
@@ -949,9 +955,9 @@ mod tests {
             &[(A, 101, B), (B, 102, C)],
             &[A, B],
         );
-        // `entries` is a HashMap, so build both insertion orders explicitly.
-        let leader_first: HashMap<u64, u64> = [(A, 101u64), (B, 102)].into_iter().collect();
-        let follower_first: HashMap<u64, u64> = [(B, 102u64), (A, 101)].into_iter().collect();
+        // `entries` is a hash map, so build both insertion orders explicitly.
+        let leader_first: FxHashMap<u64, u64> = [(A, 101u64), (B, 102)].into_iter().collect();
+        let follower_first: FxHashMap<u64, u64> = [(B, 102u64), (A, 101)].into_iter().collect();
         assert_eq!(
             sorted_grids(&ctx.build_aod_grids(&leader_first)),
             sorted_grids(&ctx.build_aod_grids(&follower_first))
@@ -978,7 +984,7 @@ mod tests {
             // D is occupied by an atom that is never offered as a mover.
             &[A, B, C, D],
         );
-        let entries: HashMap<u64, u64> = [(A, 101u64), (B, 102), (C, 103)].into_iter().collect();
+        let entries: FxHashMap<u64, u64> = [(A, 101u64), (B, 102), (C, 103)].into_iter().collect();
         assert!(
             ctx.build_aod_grids(&entries).is_empty(),
             "a chain with nowhere to go must emit nothing"
@@ -999,7 +1005,7 @@ mod tests {
             &[(A, 101, B), (B, 102, C), (E, 104, F)],
             &[A, B, E],
         );
-        let entries: HashMap<u64, u64> = [(A, 101u64), (B, 102), (E, 104)].into_iter().collect();
+        let entries: FxHashMap<u64, u64> = [(A, 101u64), (B, 102), (E, 104)].into_iter().collect();
         assert_eq!(
             sorted_grids(&ctx.build_aod_grids(&entries)),
             vec![vec![101, 102, 104]],
@@ -1032,7 +1038,7 @@ mod tests {
 
         // Offer only the two leaders first in iteration order; the followers
         // must be pulled in by the repair loop, in both rows.
-        let entries: HashMap<u64, u64> = [(A0, 101u64), (B0, 102), (A1, 111), (B1, 112)]
+        let entries: FxHashMap<u64, u64> = [(A0, 101u64), (B0, 102), (A1, 111), (B1, 112)]
             .into_iter()
             .collect();
         let grids = ctx.build_aod_grids(&entries);
@@ -1073,7 +1079,7 @@ mod tests {
             ],
             &[a0, b0, c0, a1, b1, c1],
         );
-        let entries: HashMap<u64, u64> = [
+        let entries: FxHashMap<u64, u64> = [
             (a0, 101u64),
             (b0, 102),
             (c0, 103),
@@ -1119,9 +1125,10 @@ mod tests {
             ],
             &[a0, b0, a1, b1, e],
         );
-        let entries: HashMap<u64, u64> = [(a0, 101u64), (b0, 102), (a1, 111), (b1, 112), (e, 104)]
-            .into_iter()
-            .collect();
+        let entries: FxHashMap<u64, u64> =
+            [(a0, 101u64), (b0, 102), (a1, 111), (b1, 112), (e, 104)]
+                .into_iter()
+                .collect();
 
         let grids = sorted_grids(&ctx.build_aod_grids(&entries));
         assert!(
@@ -1155,7 +1162,7 @@ mod tests {
             ],
             &[a0, b0, a1, b1],
         );
-        let entries: HashMap<u64, u64> = [(a0, 101u64), (b0, 102), (a1, 111), (b1, 112)]
+        let entries: FxHashMap<u64, u64> = [(a0, 101u64), (b0, 102), (a1, 111), (b1, 112)]
             .into_iter()
             .collect();
         assert_eq!(
@@ -1185,7 +1192,7 @@ mod tests {
             &[(p, 105, p_dst), (a, 101, b), (b, 102, c)],
             &[p, a, b],
         );
-        let entries: HashMap<u64, u64> = [(p, 105u64), (a, 101), (b, 102)].into_iter().collect();
+        let entries: FxHashMap<u64, u64> = [(p, 105u64), (a, 101), (b, 102)].into_iter().collect();
 
         let grids = sorted_grids(&ctx.build_aod_grids(&entries));
         assert!(
@@ -1215,7 +1222,7 @@ mod tests {
             // is stuck no matter how the rectangle grows.
             &[a, e, f],
         );
-        let entries: HashMap<u64, u64> = [(a, 101u64), (e, 104)].into_iter().collect();
+        let entries: FxHashMap<u64, u64> = [(a, 101u64), (e, 104)].into_iter().collect();
 
         let grids = sorted_grids(&ctx.build_aod_grids(&entries));
         assert_eq!(
@@ -1245,7 +1252,7 @@ mod tests {
             &[(A, 101, B), (B, 102, A)],
             &[A, B],
         );
-        let entries: HashMap<u64, u64> = [(A, 101u64), (B, 102)].into_iter().collect();
+        let entries: FxHashMap<u64, u64> = [(A, 101u64), (B, 102)].into_iter().collect();
         assert_eq!(
             sorted_grids(&ctx.build_aod_grids(&entries)),
             vec![vec![101, 102]],
@@ -1267,7 +1274,7 @@ mod tests {
             // `f` holds a stationary atom, so `e` has nowhere to go.
             &[a, b, e, f],
         );
-        let entries: HashMap<u64, u64> = [(a, 101u64), (b, 102), (e, 104)].into_iter().collect();
+        let entries: FxHashMap<u64, u64> = [(a, 101u64), (b, 102), (e, 104)].into_iter().collect();
 
         let grids = sorted_grids(&ctx.build_aod_grids(&entries));
         assert_eq!(
@@ -1308,21 +1315,21 @@ mod tests {
         lanes: &[(u64, u64, u64)],       // (src_encoded, lane_encoded, dst_encoded)
         occupied_locs_input: &[u64],     // all encoded occupied locations
     ) -> BusGridContext<'static> {
-        let mut pos_to_src = HashMap::new();
-        let mut src_to_pos = HashMap::new();
+        let mut pos_to_src = FxHashMap::default();
+        let mut src_to_pos = FxHashMap::default();
         for &(pos, src_enc) in positions {
             pos_to_src.insert(pos, src_enc);
             src_to_pos.insert(src_enc, pos);
         }
 
-        let mut src_to_lane = HashMap::new();
-        let mut src_to_dst = HashMap::new();
+        let mut src_to_lane = FxHashMap::default();
+        let mut src_to_dst = FxHashMap::default();
         for &(src_enc, lane_enc, dst_enc) in lanes {
             src_to_lane.insert(src_enc, lane_enc);
             src_to_dst.insert(src_enc, dst_enc);
         }
 
-        let occupied_locs: HashSet<u64> = occupied_locs_input.iter().copied().collect();
+        let occupied_locs: FxHashSet<u64> = occupied_locs_input.iter().copied().collect();
 
         BusGridContext {
             maps: Cow::Owned(BusGridMaps {
@@ -1345,7 +1352,7 @@ mod tests {
             &[(10, 100), (11, 101), (12, 102), (13, 103)],
             &[],
         );
-        let movers: HashSet<u64> = [10, 11, 12, 13].into_iter().collect();
+        let movers: FxHashSet<u64> = [10, 11, 12, 13].into_iter().collect();
         let xs: BTreeSet<u64> = [0, 1].into_iter().collect();
         let ys: BTreeSet<u64> = [0, 1].into_iter().collect();
 
@@ -1360,7 +1367,7 @@ mod tests {
             &[(10, 100), (11, 101), (12, 102), (13, 103)],
             &[],
         );
-        let movers: HashSet<u64> = [10, 11, 12].into_iter().collect(); // 13 missing
+        let movers: FxHashSet<u64> = [10, 11, 12].into_iter().collect(); // 13 missing
         let xs: BTreeSet<u64> = [0, 1].into_iter().collect();
         let ys: BTreeSet<u64> = [0, 1].into_iter().collect();
 
@@ -1376,7 +1383,7 @@ mod tests {
             &[(10, 100), (11, 101), (12, 102), (13, 103)],
             &[],
         );
-        let entries: HashMap<u64, u64> = [(10, 100), (11, 101), (12, 102)].into_iter().collect();
+        let entries: FxHashMap<u64, u64> = [(10, 100), (11, 101), (12, 102)].into_iter().collect();
 
         let grids = ctx.build_aod_grids(&entries);
         assert_eq!(grids.len(), 1);
@@ -1395,7 +1402,7 @@ mod tests {
             &[(10, 100), (11, 101), (12, 102), (13, 103)],
             &[13],
         );
-        let entries: HashMap<u64, u64> = [(10, 100), (11, 101), (12, 102)].into_iter().collect();
+        let entries: FxHashMap<u64, u64> = [(10, 100), (11, 101), (12, 102)].into_iter().collect();
 
         let grids = ctx.build_aod_grids(&entries);
         assert!(!grids.iter().any(|grid| grid.len() == 4));
@@ -1412,7 +1419,7 @@ mod tests {
             &[(10, 100, 20), (11, 101, 21), (12, 102, 22), (13, 103, 12)],
             &[10, 11, 12],
         );
-        let entries: HashMap<u64, u64> = [(10, 100), (11, 101), (12, 102)].into_iter().collect();
+        let entries: FxHashMap<u64, u64> = [(10, 100), (11, 101), (12, 102)].into_iter().collect();
 
         let grids = ctx.build_aod_grids(&entries);
 
@@ -1431,7 +1438,7 @@ mod tests {
             &[],
             &[13],
         );
-        let entries: HashMap<u64, u64> = [(10, 100), (11, 101), (12, 102)].into_iter().collect();
+        let entries: FxHashMap<u64, u64> = [(10, 100), (11, 101), (12, 102)].into_iter().collect();
 
         let grids = ctx.build_aod_grids(&entries);
         assert!(!grids.iter().any(|grid| grid.len() == 4));
@@ -1441,7 +1448,7 @@ mod tests {
     fn build_aod_grids_color_code_sparse_rectangle() {
         let mut positions = Vec::new();
         let mut lanes = Vec::new();
-        let mut entries = HashMap::new();
+        let mut entries = FxHashMap::default();
         let mut src = 100u64;
         let mut lane = 1000u64;
 
@@ -1472,7 +1479,7 @@ mod tests {
             &[(10, 100), (11, 101), (12, 102), (13, 103)],
             &[11], // collision at src 11
         );
-        let movers: HashSet<u64> = [10, 11, 12, 13].into_iter().collect();
+        let movers: FxHashSet<u64> = [10, 11, 12, 13].into_iter().collect();
         let xs: BTreeSet<u64> = [0, 1].into_iter().collect();
         let ys: BTreeSet<u64> = [0, 1].into_iter().collect();
 
@@ -1487,10 +1494,10 @@ mod tests {
             &[(10, 100), (11, 101), (12, 102), (13, 103)],
             &[],
         );
-        let entries: HashMap<u64, u64> = [(10, 100), (11, 101), (12, 102), (13, 103)]
+        let entries: FxHashMap<u64, u64> = [(10, 100), (11, 101), (12, 102), (13, 103)]
             .into_iter()
             .collect();
-        let movers: HashSet<u64> = entries.keys().copied().collect();
+        let movers: FxHashSet<u64> = entries.keys().copied().collect();
 
         let clusters = ctx.greedy_init(&entries, &movers);
         assert_eq!(clusters.len(), 1);
@@ -1513,8 +1520,8 @@ mod tests {
             &[],
             &[13],
         );
-        let entries: HashMap<u64, u64> = [(10, 100), (11, 101), (12, 102)].into_iter().collect();
-        let movers: HashSet<u64> = entries.keys().copied().collect();
+        let entries: FxHashMap<u64, u64> = [(10, 100), (11, 101), (12, 102)].into_iter().collect();
+        let movers: FxHashSet<u64> = entries.keys().copied().collect();
 
         let clusters = ctx.greedy_init(&entries, &movers);
         // Cannot form a 2×2, so should have multiple smaller clusters.
@@ -1528,7 +1535,7 @@ mod tests {
     fn merge_clusters_combines_compatible() {
         // Two 1×1 clusters at (0,0) and (1,0). Both are movers.
         let ctx = make_context(&[((0, 0), 10), ((1, 0), 11)], &[(10, 100), (11, 101)], &[]);
-        let movers: HashSet<u64> = [10, 11].into_iter().collect();
+        let movers: FxHashSet<u64> = [10, 11].into_iter().collect();
 
         let clusters = vec![
             ([0u64].into_iter().collect(), [0u64].into_iter().collect()),
@@ -1545,7 +1552,7 @@ mod tests {
     #[test]
     fn build_aod_grids_empty_entries() {
         let ctx = make_context(&[], &[], &[]);
-        let entries = HashMap::new();
+        let entries = FxHashMap::default();
         let grids = ctx.build_aod_grids(&entries);
         assert!(grids.is_empty());
     }
@@ -1558,7 +1565,7 @@ mod tests {
             &[(10, 100), (11, 101), (12, 102), (13, 103)],
             &[],
         );
-        let entries: HashMap<u64, u64> = [(10, 100), (11, 101), (12, 102), (13, 103)]
+        let entries: FxHashMap<u64, u64> = [(10, 100), (11, 101), (12, 102), (13, 103)]
             .into_iter()
             .collect();
 
@@ -1599,7 +1606,7 @@ mod tests {
         }
 
         /// The occupancy set every caller passes: atom locations plus `blocked`.
-        fn occupied_of(config: &Config, blocked: &[u32]) -> HashSet<u64> {
+        fn occupied_of(config: &Config, blocked: &[u32]) -> FxHashSet<u64> {
             config
                 .iter()
                 .map(|(_, l)| l.encode())
@@ -1618,9 +1625,10 @@ mod tests {
         fn walks_to_the_end_of_the_chain() {
             let index = chain_index();
             let config = packed(&[0, 1, 2, 3]);
-            let mut entries: HashMap<u64, u64> = [(loc(0, 0).encode(), lane(0, 0, 0).encode_u64())]
-                .into_iter()
-                .collect();
+            let mut entries: FxHashMap<u64, u64> =
+                [(loc(0, 0).encode(), lane(0, 0, 0).encode_u64())]
+                    .into_iter()
+                    .collect();
 
             let links = close_chain_entries(
                 &mut entries,
@@ -1653,9 +1661,10 @@ mod tests {
         fn stops_at_a_free_destination() {
             let index = chain_index();
             let config = packed(&[0, 1]);
-            let mut entries: HashMap<u64, u64> = [(loc(0, 0).encode(), lane(0, 0, 0).encode_u64())]
-                .into_iter()
-                .collect();
+            let mut entries: FxHashMap<u64, u64> =
+                [(loc(0, 0).encode(), lane(0, 0, 0).encode_u64())]
+                    .into_iter()
+                    .collect();
 
             let links = close_chain_entries(
                 &mut entries,
@@ -1678,7 +1687,7 @@ mod tests {
             let index = chain_index();
             let config = packed(&[3, 4]);
             let seed_lane = lane(0, 3, 0).encode_u64();
-            let mut entries: HashMap<u64, u64> =
+            let mut entries: FxHashMap<u64, u64> =
                 [(loc(0, 3).encode(), seed_lane)].into_iter().collect();
 
             let links = close_chain_entries(
@@ -1701,9 +1710,10 @@ mod tests {
             let index = chain_index();
             // Site 1 is blocked (an external atom), so it is not in the config.
             let config = packed(&[0]);
-            let mut entries: HashMap<u64, u64> = [(loc(0, 0).encode(), lane(0, 0, 0).encode_u64())]
-                .into_iter()
-                .collect();
+            let mut entries: FxHashMap<u64, u64> =
+                [(loc(0, 0).encode(), lane(0, 0, 0).encode_u64())]
+                    .into_iter()
+                    .collect();
 
             let links = close_chain_entries(
                 &mut entries,
@@ -1725,7 +1735,7 @@ mod tests {
             let config = packed(&[0, 1]);
             let lane_0 = lane(0, 0, 0).encode_u64();
             let lane_1 = lane(0, 1, 0).encode_u64();
-            let mut entries: HashMap<u64, u64> =
+            let mut entries: FxHashMap<u64, u64> =
                 [(loc(0, 0).encode(), lane_0), (loc(0, 1).encode(), lane_1)]
                     .into_iter()
                     .collect();
@@ -1751,7 +1761,7 @@ mod tests {
             // Site bus 0 maps 0-4 → 5-9; park atoms on both ends of one lane.
             let config = Config::new([(0, loc(0, 0)), (1, loc(0, 5))]).unwrap();
             let lane_0 = lane(0, 0, 0).encode_u64();
-            let mut entries: HashMap<u64, u64> =
+            let mut entries: FxHashMap<u64, u64> =
                 [(loc(0, 0).encode(), lane_0)].into_iter().collect();
 
             let links = close_chain_entries(
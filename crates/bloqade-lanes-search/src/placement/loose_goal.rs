@@ -31,7 +31,7 @@ use crate::ops::entangling::{self, LOOKAHEAD_BETA, MOVE_PENALTY};
 use crate::placement::cz_placement::CzPlacement;
 use crate::primitives::config::{Config, ConfigError};
 use crate::primitives::context::SearchContext;
-use crate::primitives::distance::PairDistanceHeuristic;
+use crate::primitives::distance::{IncrementalMax, IncrementalSum, PairDistanceHeuristic};
 use crate::primitives::lane_index::LaneIndex;
 use crate::search::engine::SearchEngine;
 use crate::search::move_search::MoveSearch;
@@ -177,8 +177,8 @@ pub(crate) fn solve_loose_goal(
 
     // Per-call: heuristic, goal, greedy assignment.
     let heuristic = PairDistanceHeuristic::new(cz_pairs, &cache.wpd);
-    let h_max = |config: &Config| -> f64 { heuristic.estimate_max(config) };
-    let h_sum = |config: &Config| -> f64 { heuristic.estimate_sum(config) };
+    let h_max = IncrementalMax(&heuristic);
+    let h_sum = IncrementalSum(&heuristic);
 
     let goal = EntanglingConstraintGoal::new(cz_pairs, cache.ent_set.clone());
 
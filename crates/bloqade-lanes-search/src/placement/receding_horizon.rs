@@ -33,7 +33,7 @@ use crate::observer::NoOpObserver;
 use crate::ops::entangling;
 use crate::primitives::config::Config;
 use crate::primitives::context::{SearchContext, SearchState};
-use crate::primitives::distance::{DistanceTable, PairDistanceHeuristic};
+use crate::primitives::distance::{DistanceTable, IncrementalSum, PairDistanceHeuristic};
 use crate::primitives::graph::{MoveSet, NodeId, SearchGraph};
 use crate::primitives::lane_index::LaneIndex;
 use crate::scorers::DistanceScorer;
@@ -846,7 +846,7 @@ pub fn solve_entangling_rh_single(
 
     // Reusable handle to the sum-heuristic for IDS frontier ordering and
     // leaf ranking.
-    let h_sum_closure = |cfg: &Config| -> f64 { heuristic.estimate_sum(cfg) };
+    let h_sum_closure = IncrementalSum(heuristic);
 
     let top_c = opts.top_c.unwrap_or(3);
     let inner_lookahead = opts.lookahead;
@@ -868,6 +868,7 @@ pub fn solve_entangling_rh_single(
                 deadlocks: 0,
                 entropy_trace: None,
                 bound_stats: crate::bounds::BoundStats::default(),
+                telemetry: crate::telemetry::SearchTelemetry::default(),
             };
         }
         stage_iter = stage_iter.saturating_add(1);
@@ -1012,6 +1013,7 @@ pub fn solve_entangling_rh_single(
         deadlocks: 0,
         entropy_trace: None,
         bound_stats: crate::bounds::BoundStats::default(),
+        telemetry: crate::telemetry::SearchTelemetry::default(),
     }
 }
 
@@ -1094,6 +1096,7 @@ fn merge_fallback(
             deadlocks: fallback.deadlocks,
             entropy_trace: None,
             bound_stats: crate::bounds::BoundStats::default(),
+            telemetry: fallback.telemetry,
         };
     }
     let mut merged = committed_layers;
@@ -1108,6 +1111,7 @@ fn merge_fallback(
         deadlocks: fallback.deadlocks,
         entropy_trace: None,
         bound_stats: crate::bounds::BoundStats::default(),
+        telemetry: fallback.telemetry,
     }
 }
 
@@ -5,15 +5,18 @@
 //! rectangular AOD grids without rebuilding the maps on every call. Keeping the
 //! type here (rather than in `ops`) means `primitives` never depends on `ops`.
 
-use std::collections::HashMap;
 use std::hash::Hash;
 
 use bloqade_lanes_bytecode_core::arch::addr::LaneAddr;
+use rustc_hash::FxHashMap;
 
 use crate::primitives::lane_index::LaneIndex;
 
 /// Occupancy-independent lookup maps for one bus group.
 ///
+/// Keyed by `u64` location encodings and probed in the grid builder's inner
+/// loop, so they use the Fx hasher rather than SipHash.
+///
 /// These are a pure function of the architecture ([`LaneIndex`]) and the bus
 /// group `(move_type, bus_id, direction)` — they do **not** depend on which
 /// locations are currently occupied. [`LaneIndex`] precomputes and caches one
@@ -30,13 +33,13 @@ use crate::primitives::lane_index::LaneIndex;
 #[derive(Debug, Clone, Default)]
 pub(crate) struct BusGridMaps {
     /// `(x_bits, y_bits) → encoded source location` for ALL bus positions.
-    pub(crate) pos_to_src: HashMap<(u64, u64), u64>,
+    pub(crate) pos_to_src: FxHashMap<(u64, u64), u64>,
     /// `encoded source → encoded lane address` for ALL bus lanes.
-    pub(crate) src_to_lane: HashMap<u64, u64>,
+    pub(crate) src_to_lane: FxHashMap<u64, u64>,
     /// `encoded source → encoded destination location` for ALL bus lanes.
-    pub(crate) src_to_dst: HashMap<u64, u64>,
+    pub(crate) src_to_dst: FxHashMap<u64, u64>,
     /// `encoded source → (x_bits, y_bits)` reverse lookup.
-    pub(crate) src_to_pos: HashMap<u64, (u64, u64)>,
+    pub(crate) src_to_pos: FxHashMap<u64, (u64, u64)>,
 }
 
 impl BusGridMaps {
@@ -103,7 +106,7 @@ impl BusGridMaps {
 /// collapsed two semantically distinct lanes onto one source — see
 /// [`BusGridMaps::from_lanes`] for why that cannot happen for SiteBus/WordBus
 /// and would indicate a non-injective (many-to-one) zone bus.
-fn insert_unique<K: Eq + Hash, V: PartialEq>(map: &mut HashMap<K, V>, key: K, value: V) {
+fn insert_unique<K: Eq + Hash, V: PartialEq>(map: &mut FxHashMap<K, V>, key: K, value: V) {
     if let Some(existing) = map.get(&key) {
         debug_assert!(
             *existing == value,
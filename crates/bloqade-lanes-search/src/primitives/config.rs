@@ -246,6 +246,20 @@ impl Config {
         &self.entries
     }
 
+    /// Iterate over the qubits whose location differs between `self` and
+    /// `other`, as `(qubit_id, encoded_before, encoded_after)`.
+    ///
+    /// A qubit present on only one side is reported with `None` on the other.
+    /// A linear merge over both sorted entry lists — no allocation and no
+    /// lookups — so a search node can find what one move set changed without
+    /// re-examining every qubit downstream.
+    pub fn diff<'a>(&'a self, other: &'a Config) -> ConfigDiff<'a> {
+        ConfigDiff {
+            before: &self.entries,
+            after: &other.entries,
+        }
+    }
+
     /// Return the cached FNV-1a hash for this configuration.
     ///
     /// Stable and deterministic across runs and platforms (FNV-1a uses no
@@ -256,6 +270,44 @@ impl Config {
     }
 }
 
+/// Iterator returned by [`Config::diff`].
+#[derive(Debug, Clone)]
+pub struct ConfigDiff<'a> {
+    before: &'a [(u32, u64)],
+    after: &'a [(u32, u64)],
+}
+
+impl Iterator for ConfigDiff<'_> {
+    type Item = (u32, Option<u64>, Option<u64>);
+
+    fn next(&mut self) -> Option<Self::Item> {
+        loop {
+            match (self.before.first(), self.after.first()) {
+                (Some(&(qa, la)), Some(&(qb, lb))) if qa == qb => {
+                    self.before = &self.before[1..];
+                    self.after = &self.after[1..];
+                    if la != lb {
+                        return Some((qa, Some(la), Some(lb)));
+                    }
+                }
+                (Some(&(qa, la)), Some(&(qb, _))) if qa < qb => {
+                    self.before = &self.before[1..];
+                    return Some((qa, Some(la), None));
+                }
+                (Some(&(qa, la)), None) => {
+                    self.before = &self.before[1..];
+                    return Some((qa, Some(la), None));
+                }
+                (_, Some(&(qb, lb))) => {
+                    self.after = &self.after[1..];
+                    return Some((qb, None, Some(lb)));
+                }
+                (None, None) => return None,
+            }
+        }
+    }
+}
+
 impl PartialEq for Config {
     fn eq(&self, other: &Self) -> bool {
         self.entries == other.entries
@@ -273,6 +325,22 @@ mod tests {
     use super::*;
     use crate::test_utils::loc;
 
+    #[test]
+    fn diff_reports_moved_added_and_removed_qubits() {
+        let a = Config::new([(0, loc(0, 1)), (1, loc(0, 2)), (3, loc(1, 0))]).unwrap();
+        let b = Config::new([(0, loc(0, 1)), (1, loc(0, 3)), (2, loc(1, 1))]).unwrap();
+        let diff: Vec<_> = a.diff(&b).collect();
+        assert_eq!(
+            diff,
+            vec![
+                (1, Some(loc(0, 2).encode()), Some(loc(0, 3).encode())),
+                (2, None, Some(loc(1, 1).encode())),
+                (3, Some(loc(1, 0).encode()), None),
+            ]
+        );
+        assert_eq!(a.diff(&a).count(), 0);
+    }
+
     #[test]
     fn canonical_ordering() {
         let a = Config::new([(0, loc(0, 1)), (1, loc(0, 2)), (2, loc(1, 0))]).unwrap();
@@ -5,14 +5,22 @@
 //!
 //! [`MisplacedHeuristic`] is a simple count-based heuristic.
 //! [`HopDistanceHeuristic`] uses the distance table for a tighter bound.
+//!
+//! The hop and pair heuristics also implement [`ProfiledHeuristic`]: their
+//! per-term costs are kept in a [`CostProfile`], so the frontiers can derive
+//! a child's estimate from its parent's by re-costing only the qubits the
+//! move set relocated. [`IncrementalMax`] and [`IncrementalSum`] adapt them
+//! to the search [`Heuristic`] trait.
 
 use std::collections::{HashMap, HashSet};
 
 use bloqade_lanes_bytecode_core::arch::addr::LocationAddr;
+use smallvec::SmallVec;
 
 use crate::primitives::config::Config;
 use crate::primitives::lane_index::LaneIndex;
 use crate::primitives::reverse_lane_graph::ReverseLaneGraph;
+use crate::traits::Heuristic;
 
 // ── DistanceTable ───────────────────────────────────────────────────
 
@@ -224,6 +232,8 @@ impl MisplacedHeuristic {
 /// Returns the max hop distance over all qubits — admissible because
 /// the worst-case qubit needs at least that many steps.
 pub struct HopDistanceHeuristic<'a> {
+    /// Sorted by qubit id, so a moved qubit's targets are found by binary
+    /// search in [`ProfiledHeuristic::child_profile`].
     targets: Vec<(u32, u64)>,
     table: &'a DistanceTable,
 }
@@ -234,10 +244,20 @@ impl<'a> HopDistanceHeuristic<'a> {
         target: impl IntoIterator<Item = (u32, LocationAddr)>,
         table: &'a DistanceTable,
     ) -> Self {
-        Self {
-            targets: target.into_iter().map(|(q, l)| (q, l.encode())).collect(),
-            table,
+        let mut targets: Vec<(u32, u64)> =
+            target.into_iter().map(|(q, l)| (q, l.encode())).collect();
+        targets.sort_by_key(|&(q, _)| q);
+        Self { targets, table }
+    }
+
+    /// Hop cost of one target term; `None` if the qubit is missing or
+    /// cannot reach its target.
+    fn term_cost(&self, loc_enc: Option<u64>, target_enc: u64) -> Option<u32> {
+        let loc_enc = loc_enc?;
+        if loc_enc == target_enc {
+            return Some(0);
         }
+        self.table.distance(loc_enc, target_enc)
     }
 
     /// Estimate cost-to-go: max hop distance over all qubits.
@@ -292,6 +312,34 @@ impl<'a> HopDistanceHeuristic<'a> {
     }
 }
 
+impl ProfiledHeuristic for HopDistanceHeuristic<'_> {
+    fn profile(&self, config: &Config) -> CostProfile {
+        let mut profile = CostProfile::default();
+        for &(qid, target_enc) in &self.targets {
+            let loc_enc = config.location_of(qid).map(|l| l.encode());
+            profile.add(self.term_cost(loc_enc, target_enc));
+        }
+        profile
+    }
+
+    fn child_profile(
+        &self,
+        parent: &Config,
+        parent_profile: &CostProfile,
+        child: &Config,
+    ) -> CostProfile {
+        let mut profile = parent_profile.clone();
+        for (qid, before, after) in parent.diff(child) {
+            let start = self.targets.partition_point(|&(q, _)| q < qid);
+            for &(_, target_enc) in self.targets[start..].iter().take_while(|&&(q, _)| q == qid) {
+                profile.remove(self.term_cost(before, target_enc));
+                profile.add(self.term_cost(after, target_enc));
+            }
+        }
+        profile
+    }
+}
+
 // ── PairDistanceHeuristic ──────────────────────────────────────────
 
 /// Heuristic for loose-goal search based on per-word-pair minimum distances.
@@ -304,6 +352,9 @@ impl<'a> HopDistanceHeuristic<'a> {
 /// Per-node cost is O(pairs × word_pairs), with word_pairs typically 1-4.
 pub struct PairDistanceHeuristic<'a> {
     pairs: Vec<(u32, u32)>,
+    /// `(qubit_id, pair_index)` for both members of every pair, sorted, so
+    /// the pairs a moved qubit belongs to are found by binary search.
+    pairs_of: Vec<(u32, u32)>,
     word_pair_dists: &'a crate::ops::entangling::WordPairDistances,
 }
 
@@ -313,12 +364,28 @@ impl<'a> PairDistanceHeuristic<'a> {
         pairs: &[(u32, u32)],
         word_pair_dists: &'a crate::ops::entangling::WordPairDistances,
     ) -> Self {
+        let mut pairs_of: Vec<(u32, u32)> = pairs
+            .iter()
+            .zip(0u32..)
+            .flat_map(|(&(qa, qb), i)| [(qa, i), (qb, i)])
+            .collect();
+        pairs_of.sort_unstable();
+        pairs_of.dedup();
         Self {
             pairs: pairs.to_vec(),
+            pairs_of,
             word_pair_dists,
         }
     }
 
+    /// [`min_pair_cost`](Self::min_pair_cost) of pair `i`, with `u32::MAX`
+    /// mapped to `None`.
+    fn term_cost(&self, i: usize, config: &Config) -> Option<u32> {
+        let (qa, qb) = self.pairs[i];
+        let cost = self.min_pair_cost(qa, qb, config);
+        (cost != u32::MAX).then_some(cost)
+    }
+
     /// Admissible heuristic: max over all pairs of min achievable cost.
     ///
     /// For each CZ pair, tries both qubit-to-word assignments on each word
@@ -380,6 +447,199 @@ impl<'a> PairDistanceHeuristic<'a> {
     }
 }
 
+impl ProfiledHeuristic for PairDistanceHeuristic<'_> {
+    fn profile(&self, config: &Config) -> CostProfile {
+        let mut profile = CostProfile::default();
+        for i in 0..self.pairs.len() {
+            profile.add(self.term_cost(i, config));
+        }
+        profile
+    }
+
+    fn child_profile(
+        &self,
+        parent: &Config,
+        parent_profile: &CostProfile,
+        child: &Config,
+    ) -> CostProfile {
+        let mut touched: SmallVec<[u32; 16]> = SmallVec::new();
+        for (qid, _, _) in parent.diff(child) {
+            let start = self.pairs_of.partition_point(|&(q, _)| q < qid);
+            touched.extend(
+                self.pairs_of[start..]
+                    .iter()
+                    .take_while(|&&(q, _)| q == qid)
+                    .map(|&(_, i)| i),
+            );
+        }
+        touched.sort_unstable();
+        touched.dedup();
+
+        let mut profile = parent_profile.clone();
+        for i in touched {
+            profile.remove(self.term_cost(i as usize, parent));
+            profile.add(self.term_cost(i as usize, child));
+        }
+        profile
+    }
+}
+
+// ── Incremental estimation ─────────────────────────────────────────
+
+/// Multiset of the per-term costs behind a max- or sum-style heuristic.
+///
+/// The hop and pair heuristics each reduce one integer cost per term (a
+/// target qubit, a CZ pair) to a max or a sum. A profile keeps those costs
+/// as a histogram plus a running total, so swapping the few terms a move set
+/// touched updates both reductions without revisiting the others. Terms with
+/// no finite cost are counted separately and make both reductions infinite.
+#[derive(Debug, Clone, Default)]
+pub struct CostProfile {
+    /// `counts[d]` is the number of terms whose cost is `d`.
+    counts: SmallVec<[u32; 16]>,
+    sum: u64,
+    unreachable: u32,
+}
+
+impl CostProfile {
+    /// Add a term; `None` is an unreachable term.
+    pub fn add(&mut self, cost: Option<u32>) {
+        let Some(d) = cost else {
+            self.unreachable += 1;
+            return;
+        };
+        let i = d as usize;
+        if i >= self.counts.len() {
+            self.counts.resize(i + 1, 0);
+        }
+        self.counts[i] += 1;
+        self.sum += u64::from(d);
+    }
+
+    /// Remove a term previously added with the same cost.
+    pub fn remove(&mut self, cost: Option<u32>) {
+        let Some(d) = cost else {
+            debug_assert!(self.unreachable > 0, "removing an absent term");
+            self.unreachable -= 1;
+            return;
+        };
+        let i = d as usize;
+        debug_assert!(
+            self.counts.get(i).is_some_and(|&c| c > 0),
+            "removing an absent term"
+        );
+        self.counts[i] -= 1;
+        self.sum -= u64::from(d);
+    }
+
+    /// Largest term cost: `0.0` with no terms, infinite if any is unreachable.
+    pub fn max(&self) -> f64 {
+        if self.unreachable > 0 {
+            return f64::INFINITY;
+        }
+        self.counts
+            .iter()
+            .rposition(|&c| c > 0)
+            .map_or(0.0, |d| d as f64)
+    }
+
+    /// Total term cost, saturating at `u32::MAX`; infinite if any term is
+    /// unreachable.
+    pub fn sum(&self) -> f64 {
+        if self.unreachable > 0 {
+            return f64::INFINITY;
+        }
+        self.sum.min(u64::from(u32::MAX)) as f64
+    }
+}
+
+/// A heuristic whose per-term costs can be carried from a parent node to
+/// its children as a [`CostProfile`].
+pub trait ProfiledHeuristic {
+    /// Profile of `config`, computed from scratch.
+    fn profile(&self, config: &Config) -> CostProfile;
+
+    /// Profile of `child`, derived from its parent's by re-costing only the
+    /// terms whose qubits moved between `parent` and `child`.
+    fn child_profile(
+        &self,
+        parent: &Config,
+        parent_profile: &CostProfile,
+        child: &Config,
+    ) -> CostProfile;
+}
+
+/// [`Heuristic`] that takes the max of a [`ProfiledHeuristic`]'s terms,
+/// updated incrementally by the frontiers. Equal to the wrapped heuristic's
+/// `estimate_max`.
+pub struct IncrementalMax<'h, P>(pub &'h P);
+
+/// [`Heuristic`] that takes the sum of a [`ProfiledHeuristic`]'s terms,
+/// updated incrementally by the frontiers. Equal to the wrapped heuristic's
+/// `estimate_sum`.
+pub struct IncrementalSum<'h, P>(pub &'h P);
+
+// Manual impls: deriving would require `P: Copy`.
+impl<P> Clone for IncrementalMax<'_, P> {
+    fn clone(&self) -> Self {
+        *self
+    }
+}
+
+impl<P> Copy for IncrementalMax<'_, P> {}
+
+impl<P> Clone for IncrementalSum<'_, P> {
+    fn clone(&self) -> Self {
+        *self
+    }
+}
+
+impl<P> Copy for IncrementalSum<'_, P> {}
+
+/// Profile of `config`, from its parent's when one is given.
+fn profile_from<P: ProfiledHeuristic>(
+    heuristic: &P,
+    parent: Option<(&Config, &CostProfile)>,
+    config: &Config,
+) -> CostProfile {
+    match parent {
+        Some((parent_config, parent_profile)) => {
+            heuristic.child_profile(parent_config, parent_profile, config)
+        }
+        None => heuristic.profile(config),
+    }
+}
+
+impl<P: ProfiledHeuristic> Heuristic for IncrementalMax<'_, P> {
+    fn estimate(&self, config: &Config) -> f64 {
+        self.0.profile(config).max()
+    }
+
+    fn estimate_incremental(
+        &self,
+        parent: Option<(&Config, &CostProfile)>,
+        config: &Config,
+    ) -> (f64, Option<CostProfile>) {
+        let profile = profile_from(self.0, parent, config);
+        (profile.max(), Some(profile))
+    }
+}
+
+impl<P: ProfiledHeuristic> Heuristic for IncrementalSum<'_, P> {
+    fn estimate(&self, config: &Config) -> f64 {
+        self.0.profile(config).sum()
+    }
+
+    fn estimate_incremental(
+        &self,
+        parent: Option<(&Config, &CostProfile)>,
+        config: &Config,
+    ) -> (f64, Option<CostProfile>) {
+        let profile = profile_from(self.0, parent, config);
+        (profile.sum(), Some(profile))
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -722,4 +982,102 @@ mod tests {
             "pair heuristic {estimate} should not exceed actual cost {actual_cost}"
         );
     }
+
+    // ── Incremental profiles ──
+
+    /// A walk of configs where each step moves one or two qubits, including
+    /// onto an unreachable site and back.
+    fn profile_walk() -> Vec<Config> {
+        vec![
+            Config::new([
+                (0, loc(0, 0)),
+                (1, loc(1, 0)),
+                (2, loc(0, 1)),
+                (3, loc(1, 1)),
+            ])
+            .unwrap(),
+            Config::new([
+                (0, loc(0, 5)),
+                (1, loc(1, 0)),
+                (2, loc(0, 1)),
+                (3, loc(1, 1)),
+            ])
+            .unwrap(),
+            Config::new([
+                (0, loc(0, 5)),
+                (1, loc(1, 5)),
+                (2, loc(0, 6)),
+                (3, loc(1, 1)),
+            ])
+            .unwrap(),
+            Config::new([
+                (0, loc(99, 99)),
+                (1, loc(1, 5)),
+                (2, loc(0, 6)),
+                (3, loc(1, 1)),
+            ])
+            .unwrap(),
+            Config::new([
+                (0, loc(0, 5)),
+                (1, loc(1, 5)),
+                (2, loc(0, 6)),
+                (3, loc(1, 6)),
+            ])
+            .unwrap(),
+        ]
+    }
+
+    fn assert_incremental_matches<P: ProfiledHeuristic>(h: &P) {
+        let walk = profile_walk();
+        let mut profile = h.profile(&walk[0]);
+        for step in walk.windows(2) {
+            profile = h.child_profile(&step[0], &profile, &step[1]);
+            let full = h.profile(&step[1]);
+            assert_eq!(profile.max(), full.max());
+            assert_eq!(profile.sum(), full.sum());
+            assert_eq!(profile.unreachable, full.unreachable);
+        }
+    }
+
+    #[test]
+    fn hop_incremental_profile_matches_full_recompute() {
+        let index = make_index();
+        let targets = [
+            (0, loc(0, 5)),
+            (1, loc(1, 5)),
+            (2, loc(1, 0)),
+            (3, loc(0, 6)),
+        ];
+        let table = make_table(&targets, &index);
+        let h = HopDistanceHeuristic::new(targets, &table);
+        assert_incremental_matches(&h);
+        for config in profile_walk() {
+            assert_eq!(
+                IncrementalMax(&h).estimate(&config),
+                h.estimate_max(&config)
+            );
+            assert_eq!(
+                IncrementalSum(&h).estimate(&config),
+                h.estimate_sum(&config)
+            );
+        }
+    }
+
+    #[test]
+    fn pair_incremental_profile_matches_full_recompute() {
+        let index = make_index();
+        let (_dt, wpd) = make_pair_heuristic(&index);
+        let h = PairDistanceHeuristic::new(&[(0, 1), (2, 3), (1, 2)], &wpd);
+        assert_incremental_matches(&h);
+        for config in profile_walk() {
+            assert_eq!(
+                IncrementalMax(&h).estimate(&config),
+                h.estimate_max(&config)
+            );
+            assert_eq!(
+                IncrementalSum(&h).estimate(&config),
+                h.estimate_sum(&config)
+            );
+        }
+    }
 }
@@ -6,6 +6,8 @@
 
 use std::collections::HashMap;
 
+use rustc_hash::FxHashMap;
+
 use bloqade_lanes_bytecode_core::arch::addr::{Direction, LaneAddr, LocationAddr, MoveType};
 use bloqade_lanes_bytecode_core::arch::metrics::MotionModel;
 use bloqade_lanes_bytecode_core::arch::types::ArchSpec;
@@ -27,15 +29,18 @@ pub struct LaneIndex {
     /// (MoveType, bus_id, zone_id, Direction) → lanes for that triplet.
     lanes_by_triplet: HashMap<(MoveType, u32, u32, Direction), Vec<LaneAddr>>,
     /// (MoveType, bus_id, zone_id, Direction) → { encoded_src → LaneAddr }.
-    lane_by_src: HashMap<(MoveType, u32, u32, Direction), HashMap<u64, LaneAddr>>,
+    lane_by_src: HashMap<(MoveType, u32, u32, Direction), FxHashMap<u64, LaneAddr>>,
     /// encoded_src → all outgoing lanes from that location.
-    outgoing_by_src: HashMap<u64, Vec<LaneAddr>>,
+    ///
+    /// The `u64`-keyed maps below are probed on every node expansion, so they
+    /// use the Fx hasher; none of them is iterated in an order-sensitive way.
+    outgoing_by_src: FxHashMap<u64, Vec<LaneAddr>>,
     /// encoded LaneAddr (u64) → (src, dst) endpoints.
-    endpoints: HashMap<u64, (LocationAddr, LocationAddr)>,
+    endpoints: FxHashMap<u64, (LocationAddr, LocationAddr)>,
     /// encoded LocationAddr (u64) → (x, y) physical position.
-    positions: HashMap<u64, (f64, f64)>,
+    positions: FxHashMap<u64, (f64, f64)>,
     /// encoded LaneAddr (u64) → duration in microseconds (from transport paths).
-    lane_durations: HashMap<u64, f64>,
+    lane_durations: FxHashMap<u64, f64>,
     /// Fastest lane duration across all lanes with paths. `None` if no paths.
     fastest_lane_duration: Option<f64>,
     /// Precomputed AOD-grid lookup maps per [`TripletKey`]
@@ -73,11 +78,11 @@ impl LaneIndex {
     pub fn with_motion_model(arch_spec: ArchSpec, motion_model: MotionModel) -> Self {
         let mut lanes_by_triplet: HashMap<(MoveType, u32, u32, Direction), Vec<LaneAddr>> =
             HashMap::new();
-        let mut lane_by_src: HashMap<(MoveType, u32, u32, Direction), HashMap<u64, LaneAddr>> =
+        let mut lane_by_src: HashMap<(MoveType, u32, u32, Direction), FxHashMap<u64, LaneAddr>> =
             HashMap::new();
-        let mut outgoing_by_src: HashMap<u64, Vec<LaneAddr>> = HashMap::new();
-        let mut endpoints: HashMap<u64, (LocationAddr, LocationAddr)> = HashMap::new();
-        let mut positions: HashMap<u64, (f64, f64)> = HashMap::new();
+        let mut outgoing_by_src: FxHashMap<u64, Vec<LaneAddr>> = FxHashMap::default();
+        let mut endpoints: FxHashMap<u64, (LocationAddr, LocationAddr)> = FxHashMap::default();
+        let mut positions: FxHashMap<u64, (f64, f64)> = FxHashMap::default();
 
         // Helper: register a lane in all indexes and cache endpoint positions.
         let mut register_lane = |lane: LaneAddr,
@@ -85,7 +90,7 @@ impl LaneIndex {
                                  zone_id: u32,
                                  direction: Direction,
                                  mt: MoveType,
-                                 positions: &mut HashMap<u64, (f64, f64)>,
+                                 positions: &mut FxHashMap<u64, (f64, f64)>,
                                  arch_spec: &ArchSpec| {
             if let Some((src, dst)) = arch_spec.lane_endpoints(&lane) {
                 let encoded_lane = lane.encode_u64();
@@ -220,7 +225,7 @@ impl LaneIndex {
         }
 
         // Build lane duration cache from transport paths.
-        let mut lane_durations: HashMap<u64, f64> = HashMap::new();
+        let mut lane_durations: FxHashMap<u64, f64> = FxHashMap::default();
         let mut fastest: Option<f64> = None;
         if let Some(paths) = &arch_spec.paths {
             for tp in paths {
@@ -14,9 +14,11 @@
 //! the entropy driver (one of the §4 findings in the
 //! `bloqade-lanes-search` review).
 
-use std::collections::{HashMap, HashSet, VecDeque};
+use std::collections::{HashSet, VecDeque};
+use std::hash::BuildHasher;
 
 use bloqade_lanes_bytecode_core::arch::addr::{LaneAddr, LocationAddr};
+use rustc_hash::{FxHashMap, FxHashSet};
 
 use crate::primitives::lane_index::LaneIndex;
 
@@ -28,11 +30,12 @@ use crate::primitives::lane_index::LaneIndex;
 /// [`LaneAddr`]s in execution order (first lane first).
 ///
 /// BFS over [`LaneIndex::outgoing_lanes`] with a parent-pointer map for
-/// O(V) memory rather than O(V × path-length).
-pub fn find_path_occupied(
+/// O(V) memory rather than O(V × path-length). `occupied` may use any
+/// hasher, so callers holding an Fx-hashed occupancy set pass it as is.
+pub fn find_path_occupied<S: BuildHasher>(
     from: LocationAddr,
     to: LocationAddr,
-    occupied: &HashSet<u64>,
+    occupied: &HashSet<u64, S>,
     index: &LaneIndex,
 ) -> Option<Vec<LaneAddr>> {
     let from_enc = from.encode();
@@ -41,10 +44,10 @@ pub fn find_path_occupied(
         return Some(Vec::new());
     }
 
-    let mut visited: HashSet<u64> = HashSet::new();
+    let mut visited: FxHashSet<u64> = FxHashSet::default();
     visited.insert(from_enc);
 
-    let mut parent: HashMap<u64, (u64, LaneAddr)> = HashMap::new();
+    let mut parent: FxHashMap<u64, (u64, LaneAddr)> = FxHashMap::default();
     let mut queue: VecDeque<u64> = VecDeque::new();
     queue.push_back(from_enc);
 
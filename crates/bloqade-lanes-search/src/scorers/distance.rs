@@ -3,6 +3,8 @@
 //! Scores a [`MoveCandidate`] by how much closer it moves qubits to their targets,
 //! measured in lane-hop distance.
 
+use smallvec::SmallVec;
+
 use crate::primitives::config::Config;
 use crate::primitives::context::{MoveCandidate, SearchContext};
 use crate::traits::CandidateScorer;
@@ -13,12 +15,23 @@ use crate::traits::CandidateScorer;
 /// `d_before` is the distance from the qubit's current location and `d_after`
 /// is the distance from the qubit's location in the candidate configuration.
 /// Returns the sum — positive means the candidate moves qubits closer overall.
+///
+/// Only qubits the move set relocated can contribute, so the candidate is
+/// diffed against `config` first and the distance table is consulted for
+/// those qubits alone.
 pub struct DistanceScorer;
 
 impl CandidateScorer for DistanceScorer {
     fn score(&self, candidate: &MoveCandidate, config: &Config, ctx: &SearchContext) -> f64 {
+        let moved: SmallVec<[u32; 16]> = config
+            .diff(&candidate.new_config)
+            .map(|(qid, _, _)| qid)
+            .collect();
         let mut total: f64 = 0.0;
         for &(qid, target_enc) in ctx.targets {
+            if moved.binary_search(&qid).is_err() {
+                continue;
+            }
             let before_enc = match config.location_of(qid) {
                 Some(loc) => loc.encode(),
                 None => continue,
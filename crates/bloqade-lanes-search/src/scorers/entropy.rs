@@ -3,7 +3,7 @@
 //! Scores movesets using `alpha * distance_progress + beta * arrived + gamma * mobility_gain`,
 //! matching the Python `CandidateScorer.score_moveset()` formula.
 
-use std::collections::HashSet;
+use rustc_hash::FxHashSet;
 
 use crate::drivers::entropy::EntropyParams;
 use crate::primitives::config::Config;
@@ -29,7 +29,10 @@ impl EntropyScorer {
 impl CandidateScorer for EntropyScorer {
     fn score(&self, candidate: &MoveCandidate, config: &Config, ctx: &SearchContext) -> f64 {
         // Build occupied set from current config + blocked.
-        let mut occupied: HashSet<u64> = HashSet::with_capacity(ctx.blocked.len() + config.len());
+        let mut occupied: FxHashSet<u64> = FxHashSet::with_capacity_and_hasher(
+            ctx.blocked.len() + config.len(),
+            Default::default(),
+        );
         occupied.extend(ctx.blocked);
         for (_, loc) in config.iter() {
             occupied.insert(loc.encode());
@@ -50,6 +53,8 @@ impl CandidateScorer for EntropyScorer {
 
 #[cfg(test)]
 mod tests {
+    use std::collections::HashSet;
+
     use super::*;
     use crate::primitives::distance::DistanceTable;
     use crate::primitives::lane_index::LaneIndex;
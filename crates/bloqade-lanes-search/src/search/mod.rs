@@ -10,6 +10,8 @@
 //! - [`move_search`] — `MoveSearch` composition layer.
 //! - [`target_solver`] — `TargetSolver` (single-candidate solver wrapping
 //!   `SearchEngine` + `MoveSearch`).
+//! - [`warm_start`] — `WarmStart`, the seed handle
+//!   `TargetSolver::solve_warm` carries from one CZ stage's solve to the next.
 //! - [`verify`] — canonical execution-model replay applied to every packaged
 //!   plan, so an inexecutable move set fails at its source (issue #866).
 
@@ -20,3 +22,4 @@ pub mod restarts;
 pub mod result;
 pub mod target_solver;
 pub(crate) mod verify;
+pub mod warm_start;
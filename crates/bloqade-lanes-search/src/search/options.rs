@@ -5,6 +5,8 @@
 //! - [`EntropyOptions`] — entropy-strategy-specific knobs.
 //! - [`EntanglingOptions`] — loose-goal Hungarian-assignment knobs.
 
+use std::time::Duration;
+
 use crate::generators::heuristic::DeadlockPolicy;
 use crate::ops::entangling::OCCUPANCY_PENALTY_DEFAULT;
 
@@ -163,6 +165,28 @@ pub struct SolveOptions {
     /// found. That is deliberate: a request to solve backwards returns the
     /// backwards solve's answer rather than silently searching twice.
     pub backwards_search: bool,
+    /// Wall-clock budget for the whole solve, measured on the monotonic clock.
+    ///
+    /// `None` (default) leaves the solve bounded by `max_expansions` alone.
+    /// `Some(budget)` fixes a [`Deadline`](crate::deadline::Deadline) when the
+    /// solve starts; every restart and both cascade phases share it, so the
+    /// budget caps the solve, not each leg of it.
+    ///
+    /// This makes the search *anytime*: when the deadline passes, the best
+    /// goal-satisfying incumbent found so far is returned as
+    /// [`SolveStatus::Solved`](crate::search::result::SolveStatus::Solved) —
+    /// for A* that is the cheapest goal child generated but not yet popped,
+    /// for entropy the cheapest goal candidate collected — and
+    /// [`BoundStats::optimality_gap`](crate::bounds::BoundStats::optimality_gap)
+    /// reports how far that plan may be from optimal when the goal has exact
+    /// targets. Without an incumbent the result is
+    /// [`SolveStatus::BudgetExceeded`](crate::search::result::SolveStatus::BudgetExceeded),
+    /// as for an exhausted expansion budget.
+    ///
+    /// The expansion budget keeps its historical verdicts: only a *deadline*
+    /// exit promotes an unpopped incumbent, so setting this never changes a
+    /// solve that finishes in time.
+    pub time_budget: Option<Duration>,
 }
 
 impl Default for SolveOptions {
@@ -176,6 +200,7 @@ impl Default for SolveOptions {
             top_c: None,
             fallback_push_rotate: false,
             backwards_search: false,
+            time_budget: None,
         }
     }
 }
@@ -336,6 +361,14 @@ impl EntanglingOptions {
 mod tests {
     use super::*;
 
+    #[test]
+    fn time_budget_is_off_by_default() {
+        assert!(
+            SolveOptions::default().time_budget.is_none(),
+            "deadlines must be opt-in so no existing caller changes behaviour"
+        );
+    }
+
     #[test]
     fn backwards_search_is_off_by_default() {
         assert!(
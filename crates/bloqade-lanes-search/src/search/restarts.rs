@@ -12,8 +12,9 @@
 
 use rayon::prelude::*;
 
-use crate::bounds::{NoBound, WeightedDistanceBound};
+use crate::bounds::{CompletionBound, NoBound, WeightedDistanceBound};
 use crate::cost::UniformCost;
+use crate::deadline::Deadline;
 use crate::drivers::entropy::EntropyTrace;
 use crate::drivers::frontier::{BfsFrontier, DfsFrontier, Frontier, IdsFrontier, PriorityFrontier};
 use crate::drivers::result::SearchResult;
@@ -34,13 +35,19 @@ use crate::traits::{Goal, Heuristic, MoveGenerator};
 /// it leaves the solver (see [`crate::search::verify`]): `Config::with_moves`
 /// performs no occupancy validation, so this is where a generator that emits
 /// an inexecutable move set gets caught, rather than downstream in the IR.
+///
+/// An unsolved search cut short by either budget — `max_exp` expansions or
+/// the solve's deadline ([`SearchResult::deadline_hit`]) — is
+/// [`SolveStatus::BudgetExceeded`]. One that exhausted its frontier is
+/// [`SolveStatus::Unsolvable`], even if the deadline passed meanwhile.
 pub(crate) fn extract(
-    result: SearchResult,
+    mut result: SearchResult,
     deadlocks: u32,
     max_exp: Option<u32>,
     ctx: &SearchContext,
 ) -> SolveResult {
     let bound_stats = result.bound_stats;
+    let telemetry = std::mem::take(&mut result.telemetry);
     match result.goal {
         Some(goal_id) => {
             let move_layers = result.solution_path().unwrap_or_default();
@@ -60,18 +67,21 @@ pub(crate) fn extract(
                 deadlocks,
             );
             solved.bound_stats = bound_stats;
+            solved.telemetry = telemetry;
             solved
         }
         None => {
             let root_config = result.graph.config(result.graph.root()).clone();
-            let status = if max_exp.is_some_and(|max| result.nodes_expanded >= max) {
-                SolveStatus::BudgetExceeded
-            } else {
-                SolveStatus::Unsolvable
-            };
+            let status =
+                if max_exp.is_some_and(|max| result.nodes_expanded >= max) || result.deadline_hit {
+                    SolveStatus::BudgetExceeded
+                } else {
+                    SolveStatus::Unsolvable
+                };
             let mut unsolved =
                 SolveResult::unsolved(status, root_config, result.nodes_expanded, deadlocks);
             unsolved.bound_stats = bound_stats;
+            unsolved.telemetry = telemetry;
             unsolved
         }
     }
@@ -116,7 +126,7 @@ fn frontier_deadlock_policy(requested: DeadlockPolicy) -> DeadlockPolicy {
 ///
 /// Still passes both of `run_search`'s limits through: `max_depth` is a layer
 /// horizon, `max_cost` an incumbent bound, and they are not interchangeable
-/// under a non-uniform objective.
+/// under a non-uniform objective. The solve-wide `deadline` rides along too.
 #[allow(clippy::too_many_arguments)]
 fn run_frontier<Gen, Go, F>(
     root: &Config,
@@ -127,13 +137,14 @@ fn run_frontier<Gen, Go, F>(
     max_expansions: Option<u32>,
     max_depth: Option<u32>,
     max_cost: Option<f64>,
+    deadline: Option<&Deadline>,
 ) -> SearchResult
 where
     Gen: MoveGenerator,
     Go: Goal,
     F: Frontier,
 {
-    crate::drivers::frontier::run_search(
+    crate::drivers::frontier::run_search_until(
         root.clone(),
         generator,
         &DistanceScorer,
@@ -146,6 +157,7 @@ where
         max_expansions,
         max_depth,
         max_cost,
+        deadline,
     )
 }
 
@@ -233,19 +245,37 @@ where
     let completion_bound = completion_bound.as_ref();
     let no_bound = NoBound::for_objective(&objective);
 
+    // One wall-clock deadline for the whole solve, fixed before any driver
+    // runs: restarts and both cascade phases share it rather than each getting
+    // a fresh budget.
+    let deadline = opts.time_budget.and_then(Deadline::after);
+    let deadline = deadline.as_ref();
+    // Every exit below goes through `finish`, so a deadline-limited plan is
+    // reported with its optimality gap whichever driver produced it.
+    let finish = |mut result: SolveResult| -> SolveResult {
+        if deadline.is_some() {
+            attach_anytime_gap(&mut result, goal, &root, ctx, &objective);
+        }
+        result
+    };
+
     // Helper: run a single inner strategy with the given seed and budget.
     let run_inner = |inner: InnerStrategy, seed: u64, budget: Option<u32>| -> SolveResult {
         match inner {
             InnerStrategy::Ids => {
                 let move_gen = make_generator(seed, deadlock_policy);
                 let mut f = IdsFrontier::new(h_sum);
-                let result = run_frontier(&root, &move_gen, goal, ctx, &mut f, budget, None, None);
+                let result = run_frontier(
+                    &root, &move_gen, goal, ctx, &mut f, budget, None, None, deadline,
+                );
                 extract(result, move_gen.deadlock_count(), budget, ctx)
             }
             InnerStrategy::Dfs => {
                 let move_gen = make_generator(seed, deadlock_policy);
                 let mut f = DfsFrontier::new(h_sum);
-                let result = run_frontier(&root, &move_gen, goal, ctx, &mut f, budget, None, None);
+                let result = run_frontier(
+                    &root, &move_gen, goal, ctx, &mut f, budget, None, None, deadline,
+                );
                 extract(result, move_gen.deadlock_count(), budget, ctx)
             }
             InnerStrategy::Entropy => {
@@ -284,6 +314,7 @@ where
                             entropy_tables,
                             &objective,
                             bound,
+                            deadline,
                         ),
                         None => crate::drivers::entropy::entropy_search_with_tables(
                             root.clone(),
@@ -297,6 +328,7 @@ where
                             entropy_tables,
                             &objective,
                             &no_bound,
+                            deadline,
                         ),
                     }
                 };
@@ -332,7 +364,7 @@ where
         let inner_result = run_inner_with_restarts(inner);
 
         if inner_result.status != SolveStatus::Solved {
-            return inner_result;
+            return finish(inner_result);
         }
 
         // The refinement is looking for something strictly cheaper than what
@@ -354,6 +386,7 @@ where
             max_expansions,
             None,
             max_cost,
+            deadline,
         );
         let astar_solve = extract(
             astar_result,
@@ -374,9 +407,9 @@ where
             if !best.bound_stats.bound_enabled {
                 best.bound_stats = inner_stats;
             }
-            return best;
+            return finish(best);
         }
-        return inner_result;
+        return finish(inner_result);
     }
 
     // ── Non-cascade strategies ─────────────────────────────────
@@ -397,13 +430,14 @@ where
                     h_max,
                     budget,
                     weight,
+                    deadline,
                 );
                 extract(result, move_gen.deadlock_count(), budget, ctx)
             }
         }
     };
 
-    if restarts <= 1 {
+    let result = if restarts <= 1 {
         run_once(base_seed, max_expansions)
     } else {
         let start = base_seed.max(1);
@@ -412,7 +446,40 @@ where
             .map(|i| run_once(start.saturating_add(i as u64), max_expansions))
             .collect();
         pick_best(results).expect("restarts > 1 yields a non-empty result set")
+    };
+    finish(result)
+}
+
+/// Report the certified optimality gap of a deadline-limited plan.
+///
+/// A solve cut short by its deadline hands back an incumbent rather than a
+/// proven optimum, and the caller needs to know how much that costs. When the
+/// goal is point-valued, `h0` at the root — the same
+/// [`WeightedDistanceBound`] the entropy driver prunes with — is a certified
+/// lower bound on the instance's optimum, so together with the plan's cost it
+/// yields [`BoundStats::optimality_gap`](crate::bounds::BoundStats::optimality_gap).
+///
+/// Leaves the stats alone for an unsolved result, for a set-valued goal (where
+/// the listed targets are not a lower bound, see `exact_targets`), and for a
+/// run whose driver already bounded and so already measured its own gap. The
+/// pruning counters stay zero: the bound certified the plan, it cut nothing.
+fn attach_anytime_gap<Go: Goal>(
+    result: &mut SolveResult,
+    goal: &Go,
+    root: &Config,
+    ctx: &SearchContext,
+    objective: &UniformCost,
+) {
+    if result.status != SolveStatus::Solved || result.bound_stats.bound_enabled {
+        return;
     }
+    let Some(targets) = goal.exact_targets() else {
+        return;
+    };
+    let bound = WeightedDistanceBound::new(objective, targets, ctx.index, ctx.blocked);
+    result.bound_stats.root_lower_bound = bound.estimate(root);
+    result.bound_stats.incumbent_cost = Some(result.cost);
+    result.bound_stats.bound_enabled = true;
 }
 
 /// Dispatch to the appropriate frontier-based search strategy.
@@ -426,6 +493,7 @@ fn run_strategy_v2<Go, Gen, Hmax>(
     heuristic_fn: Hmax,
     max_expansions: Option<u32>,
     weight: f64,
+    deadline: Option<&Deadline>,
 ) -> SearchResult
 where
     Go: Goal,
@@ -444,6 +512,7 @@ where
                 max_expansions,
                 None,
                 None,
+                deadline,
             )
         }
         Strategy::Bfs => {
@@ -457,6 +526,7 @@ where
                 max_expansions,
                 None,
                 None,
+                deadline,
             )
         }
         Strategy::GreedyBestFirst => {
@@ -470,6 +540,7 @@ where
                 max_expansions,
                 None,
                 None,
+                deadline,
             )
         }
         // Push and Rotate needs a concrete target placement, which this path
@@ -489,6 +560,7 @@ where
                 max_expansions,
                 None,
                 None,
+                deadline,
             )
         }
         _ => {
@@ -584,6 +656,45 @@ mod tests {
         )
     }
 
+    /// An unsolved search is a budget verdict only when a budget actually cut
+    /// it short: a drained frontier is `Unsolvable` even if the deadline
+    /// passed by the time it was extracted.
+    #[test]
+    fn extract_reports_a_deadline_only_when_it_stopped_the_search() {
+        let spec: bloqade_lanes_bytecode_core::arch::types::ArchSpec =
+            serde_json::from_str(example_arch_json()).expect("example arch json parses");
+        let index = LaneIndex::new(spec);
+        let dist_table = DistanceTable::new(&[], &index);
+        let blocked = HashSet::new();
+        let ctx = SearchContext {
+            index: &index,
+            dist_table: &dist_table,
+            blocked: &blocked,
+            targets: &[],
+            cz_pairs: None,
+        };
+        let unsolved = |deadline_hit: bool| SearchResult {
+            goal: None,
+            nodes_expanded: 3,
+            max_depth_reached: 1,
+            graph: crate::primitives::graph::SearchGraph::new(
+                Config::new(start()).expect("root is a valid config"),
+            ),
+            bound_stats: crate::bounds::BoundStats::default(),
+            telemetry: crate::telemetry::SearchTelemetry::default(),
+            deadline_hit,
+        };
+
+        assert_eq!(
+            extract(unsolved(false), 0, Some(2000), &ctx).status,
+            SolveStatus::Unsolvable
+        );
+        assert_eq!(
+            extract(unsolved(true), 0, Some(2000), &ctx).status,
+            SolveStatus::BudgetExceeded
+        );
+    }
+
     /// The placement `solve_with`'s fixed targets are stated against: two
     /// qubits, both away from their targets.
     fn start() -> Vec<(u32, bloqade_lanes_bytecode_core::arch::addr::LocationAddr)> {
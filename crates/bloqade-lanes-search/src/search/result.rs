@@ -7,6 +7,7 @@ use crate::bounds::BoundStats;
 use crate::drivers::entropy::EntropyTrace;
 use crate::primitives::config::Config;
 use crate::primitives::graph::MoveSet;
+use crate::telemetry::SearchTelemetry;
 
 /// Outcome status of a solve attempt.
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
@@ -88,6 +89,9 @@ pub struct SolveResult {
     /// populated either way. The Python surface reports an unbounded run as an
     /// *empty* dict rather than zeros.
     pub bound_stats: BoundStats,
+    /// Counters and phase timings from the search that produced this result
+    /// (the restart that won, for multi-restart strategies).
+    pub telemetry: SearchTelemetry,
 }
 
 impl SolveResult {
@@ -108,6 +112,7 @@ impl SolveResult {
             deadlocks,
             entropy_trace: None,
             bound_stats: BoundStats::default(),
+            telemetry: SearchTelemetry::default(),
         }
     }
 
@@ -133,6 +138,7 @@ impl SolveResult {
             deadlocks,
             entropy_trace: None,
             bound_stats: BoundStats::default(),
+            telemetry: SearchTelemetry::default(),
         }
     }
 
@@ -10,9 +10,12 @@
 
 use std::collections::HashSet;
 use std::sync::Arc;
+use std::time::Duration;
 
 use bloqade_lanes_bytecode_core::arch::addr::LocationAddr;
 
+use crate::bounds::{CompletionBound, WeightedDistanceBound};
+use crate::cost::UniformCost;
 use crate::generators::HeuristicGenerator;
 use crate::generators::heuristic::DeadlockPolicy;
 use crate::goals::AllAtTarget;
@@ -20,14 +23,17 @@ use crate::primitives::config::{
     Config, ConfigError, validate_initial_placement, validate_target_assignment,
 };
 use crate::primitives::context::SearchContext;
-use crate::primitives::distance::{DistanceTable, HopDistanceHeuristic};
+use crate::primitives::distance::{
+    DistanceTable, HopDistanceHeuristic, IncrementalMax, IncrementalSum,
+};
 use crate::push_rotate::{DEFAULT_MOVE_BUDGET, solve_push_rotate};
 use crate::search::engine::SearchEngine;
 use crate::search::move_search::MoveSearch;
 use crate::search::options::{EntropyOptions, SolveOptions, Strategy};
-use crate::search::restarts::run_with_components;
+use crate::search::restarts::{pick_best, run_with_components};
 use crate::search::result::SolveResult;
 use crate::search::result::SolveStatus;
+use crate::search::warm_start::WarmStart;
 
 /// Single-target move-synthesis solver.
 ///
@@ -68,6 +74,10 @@ impl TargetSolver {
     /// * `blocked` — Locations occupied by external atoms (immovable obstacles).
     /// * `max_expansions` — Optional limit on node expansions.
     ///
+    /// The wall-clock budget, if any, comes from
+    /// [`SolveOptions::time_budget`]; use [`Self::solve_within`] to set one per
+    /// call.
+    ///
     /// # Errors
     ///
     /// Returns [`ConfigError`] if `initial` contains duplicate qubit IDs.
@@ -88,6 +98,132 @@ impl TargetSolver {
             max_expansions,
         )
     }
+
+    /// [`Self::solve`] under a per-call wall-clock budget.
+    ///
+    /// Overrides [`SolveOptions::time_budget`] for this call only, so a caller
+    /// spreading one latency budget over several solves (one per candidate
+    /// target layout, say) can hand each the time that is left.
+    ///
+    /// # Errors
+    ///
+    /// Returns [`ConfigError`] if `initial` contains duplicate qubit IDs.
+    pub fn solve_within(
+        &self,
+        initial: impl IntoIterator<Item = (u32, LocationAddr)>,
+        target: impl IntoIterator<Item = (u32, LocationAddr)>,
+        blocked: impl IntoIterator<Item = LocationAddr>,
+        max_expansions: Option<u32>,
+        time_budget: Duration,
+    ) -> Result<SolveResult, ConfigError> {
+        let opts = SolveOptions {
+            time_budget: Some(time_budget),
+            ..self.search.options.clone()
+        };
+        solve_with_engine(
+            &self.engine,
+            &opts,
+            Some(&self.search.entropy_options),
+            initial,
+            target,
+            blocked,
+            max_expansions,
+        )
+    }
+
+    /// [`Self::solve`] seeded from the previous stage's plan.
+    ///
+    /// `warm` is the handle carried between consecutive solves. Its seed plan
+    /// is replayed first, forward and then inverted (see [`WarmStart`]). A
+    /// replay that reaches the target is an initial incumbent:
+    ///
+    /// - If the incumbent meets the root lower bound, it is returned without
+    ///   searching.
+    /// - Otherwise the search runs and the incumbent is kept only if the
+    ///   search does not match it.
+    ///
+    /// Either way, a solved result becomes `warm`'s next seed.
+    ///
+    /// `time_budget`, when `Some`, overrides [`SolveOptions::time_budget`]
+    /// as in [`Self::solve_within`].
+    ///
+    /// # Errors
+    ///
+    /// Returns [`ConfigError`] if `initial` contains duplicate qubit IDs.
+    pub fn solve_warm(
+        &self,
+        initial: impl IntoIterator<Item = (u32, LocationAddr)>,
+        target: impl IntoIterator<Item = (u32, LocationAddr)>,
+        blocked: impl IntoIterator<Item = LocationAddr>,
+        max_expansions: Option<u32>,
+        time_budget: Option<Duration>,
+        warm: &mut WarmStart,
+    ) -> Result<SolveResult, ConfigError> {
+        let root = Config::new(initial)?;
+        validate_initial_placement(&root)?;
+        let target_pairs: Vec<(u32, LocationAddr)> = target.into_iter().collect();
+        validate_target_assignment(&target_pairs)?;
+        let blocked_locs: Vec<LocationAddr> = blocked.into_iter().collect();
+
+        let opts = SolveOptions {
+            time_budget: time_budget.or(self.search.options.time_budget),
+            ..self.search.options.clone()
+        };
+        let search = || {
+            solve_with_engine(
+                &self.engine,
+                &opts,
+                Some(&self.search.entropy_options),
+                root.iter(),
+                target_pairs.iter().copied(),
+                blocked_locs.iter().copied(),
+                max_expansions,
+            )
+        };
+
+        let seed = warm.seed_plan(
+            &root,
+            &target_pairs,
+            &blocked_locs,
+            self.engine.index().arch_spec(),
+        );
+        let result = match seed {
+            None => search()?,
+            Some((layers, goal_config)) => {
+                // `UniformCost`, the objective every solve here runs: one
+                // unit per move set.
+                let cost = layers.len() as f64;
+                let target_encoded: Vec<(u32, u64)> =
+                    target_pairs.iter().map(|&(q, l)| (q, l.encode())).collect();
+                let blocked_encoded: HashSet<u64> =
+                    blocked_locs.iter().map(|l| l.encode()).collect();
+                let bound = WeightedDistanceBound::new(
+                    &UniformCost,
+                    &target_encoded,
+                    self.engine.index(),
+                    &blocked_encoded,
+                );
+                let mut seeded = SolveResult::solved(goal_config, layers, cost, 0, 0);
+                seeded.bound_stats.root_lower_bound = bound.estimate(&root);
+                seeded.bound_stats.incumbent_cost = Some(cost);
+                seeded.bound_stats.bound_enabled = true;
+                if cost <= seeded.bound_stats.root_lower_bound {
+                    seeded
+                } else {
+                    let searched = search()?;
+                    // The search did the work either way, so its effort is
+                    // what gets reported even when the seed wins.
+                    seeded.nodes_expanded = searched.nodes_expanded;
+                    seeded.deadlocks = searched.deadlocks;
+                    // `pick_best` keeps the first of equal-cost plans, so a
+                    // search that matches the seed wins the tie.
+                    pick_best(vec![searched, seeded]).expect("two-element vec is non-empty")
+                }
+            }
+        };
+        warm.absorb(&result);
+        Ok(result)
+    }
 }
 
 /// Whether swapping `initial` and `target` would change the instance's
@@ -282,8 +418,8 @@ pub(crate) fn solve_with_engine(
         DistanceTable::new(&target_locs, engine.index())
     };
     let heuristic = HopDistanceHeuristic::new(target_pairs.iter().copied(), &dist_table);
-    let h_max = |config: &Config| -> f64 { heuristic.estimate_max(config) };
-    let h_sum = |config: &Config| -> f64 { heuristic.estimate_sum(config) };
+    let h_max = IncrementalMax(&heuristic);
+    let h_sum = IncrementalSum(&heuristic);
 
     let goal_obj = AllAtTarget::new(&target_encoded);
     let blocked_encoded: HashSet<u64> = blocked_locs.iter().map(|l| l.encode()).collect();
@@ -448,6 +584,183 @@ mod tests {
             }
         }
     }
+    // ── `SolveOptions::time_budget` ──
+
+    #[test]
+    fn an_expired_time_budget_stops_astar_before_expanding() {
+        // A zero budget is already past when the solve starts, and tick 0
+        // always reads the clock: nothing is expanded, no incumbent exists,
+        // and the verdict is a budget verdict rather than `Unsolvable`.
+        let solver = TargetSolver::new(make_engine(), MoveSearch::astar(1.0));
+        let result = solver
+            .solve_within(
+                [(0, loc(0, 0))],
+                [(0, loc(0, 5))],
+                std::iter::empty(),
+                None,
+                Duration::ZERO,
+            )
+            .unwrap();
+
+        assert_eq!(result.status, SolveStatus::BudgetExceeded);
+        assert_eq!(result.nodes_expanded, 0);
+        assert!(result.move_layers.is_empty());
+        assert_eq!(result.goal_config.location_of(0), Some(loc(0, 0)));
+    }
+
+    #[test]
+    fn a_generous_time_budget_returns_the_same_plan_with_a_gap() {
+        // A deadline the solve never reaches must not change the plan, and the
+        // plan now carries a certified optimality gap. Plain A* is optimal, so
+        // the gap is non-negative (and never the inadmissible negative case).
+        let initial = [(0, loc(0, 0)), (1, loc(0, 1))];
+        let target = [(0, loc(1, 5)), (1, loc(1, 6))];
+        let solver = TargetSolver::new(make_engine(), MoveSearch::astar(1.0));
+        let plain = solver
+            .solve(initial, target, std::iter::empty(), Some(2000))
+            .unwrap();
+        let timed = solver
+            .solve_within(
+                initial,
+                target,
+                std::iter::empty(),
+                Some(2000),
+                Duration::from_secs(3600),
+            )
+            .unwrap();
+
+        assert_eq!(plain.status, SolveStatus::Solved);
+        assert_eq!(timed.status, SolveStatus::Solved);
+        assert_eq!(timed.move_layers, plain.move_layers);
+        assert_eq!(plain.bound_stats.optimality_gap(), None);
+        let gap = timed
+            .bound_stats
+            .optimality_gap()
+            .expect("a deadline-limited fixed-target solve reports its gap");
+        assert!(gap >= 0.0, "gap {gap} must not be negative");
+        assert_eq!(timed.bound_stats.total_cuts(), 0);
+    }
+
+    #[test]
+    fn an_expired_time_budget_still_lets_entropy_fall_back() {
+        // Entropy treats a deadline exit like an exhausted budget, so the
+        // rule-based budget-exhaustion fallback still gets its chance.
+        let solver = TargetSolver::new(make_engine(), MoveSearch::entropy());
+        let result = solver
+            .solve_within(
+                [(0, loc(0, 0))],
+                [(0, loc(0, 5))],
+                std::iter::empty(),
+                Some(2000),
+                Duration::ZERO,
+            )
+            .unwrap();
+
+        assert_eq!(result.status, SolveStatus::Solved);
+        assert_eq!(result.goal_config.location_of(0), Some(loc(0, 5)));
+    }
+
+    // ── `TargetSolver::solve_warm` ──
+
+    #[test]
+    fn a_repeated_stage_reuses_the_seed_without_searching() {
+        let initial = [(0, loc(0, 0)), (1, loc(0, 1))];
+        let target = [(0, loc(1, 5)), (1, loc(1, 6))];
+        let solver = TargetSolver::new(make_engine(), MoveSearch::astar(1.0));
+        let mut warm = WarmStart::new();
+
+        let cold = solver
+            .solve_warm(
+                initial,
+                target,
+                std::iter::empty(),
+                Some(2000),
+                None,
+                &mut warm,
+            )
+            .unwrap();
+        assert_eq!(cold.status, SolveStatus::Solved);
+        assert_eq!(warm.move_layers(), cold.move_layers.as_slice());
+
+        let again = solver
+            .solve_warm(
+                initial,
+                target,
+                std::iter::empty(),
+                Some(2000),
+                None,
+                &mut warm,
+            )
+            .unwrap();
+        assert_eq!(again.status, SolveStatus::Solved);
+        assert_eq!(again.move_layers, cold.move_layers);
+        assert_eq!(again.cost, cold.cost);
+        // A* on this instance is optimal, so the seed meets the root bound.
+        assert_eq!(again.nodes_expanded, 0);
+        assert_eq!(again.bound_stats.optimality_gap(), Some(0.0));
+    }
+
+    #[test]
+    fn the_return_leg_is_seeded_by_the_inverted_plan() {
+        let there = [(0, loc(0, 0))];
+        let back = [(0, loc(0, 5))];
+        let solver = TargetSolver::new(make_engine(), MoveSearch::astar(1.0));
+        let mut warm = WarmStart::new();
+
+        let forward = solver
+            .solve_warm(there, back, std::iter::empty(), Some(2000), None, &mut warm)
+            .unwrap();
+        let reverse = solver
+            .solve_warm(back, there, std::iter::empty(), Some(2000), None, &mut warm)
+            .unwrap();
+
+        assert_eq!(reverse.status, SolveStatus::Solved);
+        assert_eq!(reverse.goal_config.location_of(0), Some(loc(0, 0)));
+        assert_eq!(reverse.cost, forward.cost);
+        assert_eq!(reverse.nodes_expanded, 0);
+    }
+
+    #[test]
+    fn a_seed_that_no_longer_applies_falls_back_to_a_cold_solve() {
+        let solver = TargetSolver::new(make_engine(), MoveSearch::astar(1.0));
+        let mut warm = WarmStart::new();
+        solver
+            .solve_warm(
+                [(0, loc(0, 0))],
+                [(0, loc(0, 5))],
+                std::iter::empty(),
+                Some(2000),
+                None,
+                &mut warm,
+            )
+            .unwrap();
+
+        // A different start and target: neither the seed nor its inverse
+        // carries qubit 0 from here to there, so the seed is ignored.
+        let cold = solver
+            .solve(
+                [(0, loc(0, 1))],
+                [(0, loc(1, 6))],
+                std::iter::empty(),
+                Some(2000),
+            )
+            .unwrap();
+        let warmed = solver
+            .solve_warm(
+                [(0, loc(0, 1))],
+                [(0, loc(1, 6))],
+                std::iter::empty(),
+                Some(2000),
+                None,
+                &mut warm,
+            )
+            .unwrap();
+        assert_eq!(cold.status, SolveStatus::Solved);
+        assert_eq!(warmed.move_layers, cold.move_layers);
+        assert_eq!(warmed.nodes_expanded, cold.nodes_expanded);
+        assert_eq!(warm.move_layers(), cold.move_layers.as_slice());
+    }
+
     // ── `SolveOptions::backwards_search` ──
     //
     // The transform under test is "reverse the layer list AND invert each
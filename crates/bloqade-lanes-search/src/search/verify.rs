@@ -11,8 +11,9 @@
 //! before a [`SolveResult`](crate::search::result::SolveResult) is handed
 //! back, its layers are replayed from the root configuration through the
 //! canonical execution model in `bloqade-lanes-bytecode-core`
-//! ([`AtomStateData::validate_moves`] + [`AtomStateData::apply_validated`]) —
-//! the same code the IR analysis and bytecode validator use. A plan that
+//! ([`AtomStateData::validate_moves`] + [`AtomStateData::apply_validated`],
+//! stepped in place through [`DenseAtomState`]) — the same code the IR
+//! analysis and bytecode validator use. A plan that
 //! cannot execute is therefore caught at its source, with the offending layer
 //! named, instead of surfacing as a confusing IR-level error later.
 //!
@@ -24,7 +25,7 @@ use std::collections::HashMap;
 
 use bloqade_lanes_bytecode_core::arch::addr::LocationAddr;
 use bloqade_lanes_bytecode_core::arch::types::ArchSpec;
-use bloqade_lanes_bytecode_core::atom_state::AtomStateData;
+use bloqade_lanes_bytecode_core::atom_state::{AtomStateData, DenseAtomState};
 
 use crate::primitives::config::Config;
 use crate::primitives::graph::MoveSet;
@@ -40,19 +41,20 @@ pub(crate) fn replay_move_layers(
     arch: &ArchSpec,
 ) -> Result<HashMap<u32, LocationAddr>, String> {
     let atoms: Vec<_> = root.iter().collect();
-    let mut state = AtomStateData::from_locations(&atoms);
+    let mut state = DenseAtomState::from_state(&AtomStateData::from_locations(&atoms), arch)
+        .ok_or_else(|| "root configuration has a location outside the architecture".to_string())?;
 
     for (layer_idx, move_set) in layers.iter().enumerate() {
         let lanes = move_set.decode();
         let validated = state
             .validate_moves(&lanes, arch)
             .map_err(|errors| format_layer_error(layer_idx, layers.len(), &errors))?;
-        state = state
+        state
             .apply_validated(&validated)
             .map_err(|errors| format_layer_error(layer_idx, layers.len(), &errors))?;
     }
 
-    Ok(state.qubit_to_locations)
+    Ok(state.qubit_locations().collect())
 }
 
 /// Replay `layers` from `root` and check the result against the placement the
@@ -0,0 +1,154 @@
+//! Cross-stage warm start for consecutive fixed-target solves.
+//!
+//! A circuit compiles to one routing solve per CZ stage, and consecutive
+//! stages of Trotter- and adder-style circuits are often the same routing
+//! problem again (the same layer repeated) or its mirror image (the return
+//! leg of the previous stage). Each solve otherwise starts from scratch and
+//! rediscovers the same AOD move sets.
+//!
+//! A [`WarmStart`] is the handle a caller threads from one stage to the next.
+//! It remembers the last solved plan, and before the next search runs,
+//! [`TargetSolver::solve_warm`](crate::search::target_solver::TargetSolver::solve_warm)
+//! replays that plan, and then its inverse, from the new root. A replay
+//! that executes and lands every target qubit on its target, without
+//! disturbing a blocked atom, is a valid plan. It becomes the solve's
+//! initial incumbent:
+//!
+//! - If its cost already meets the root lower bound, it is provably optimal
+//!   and the search is skipped.
+//! - Otherwise the search runs as usual and the cheaper of the two plans
+//!   wins, so a warm solve never returns a worse plan than a cold one.
+
+use std::collections::HashSet;
+
+use bloqade_lanes_bytecode_core::arch::addr::LocationAddr;
+use bloqade_lanes_bytecode_core::arch::types::ArchSpec;
+use bloqade_lanes_bytecode_core::atom_state::{AtomStateData, DenseAtomState};
+
+use crate::primitives::config::Config;
+use crate::primitives::graph::MoveSet;
+use crate::search::result::{SolveResult, SolveStatus};
+
+/// Reusable seed carried from one solve into the next.
+///
+/// Starts empty; every solved [`TargetSolver::solve_warm`](crate::search::target_solver::TargetSolver::solve_warm)
+/// replaces the seed with the plan it returned, and an unsolved one leaves it
+/// alone, so a single failed stage does not discard a seed the stage after it
+/// could still use.
+#[derive(Debug, Clone, Default)]
+pub struct WarmStart {
+    layers: Vec<MoveSet>,
+}
+
+impl WarmStart {
+    /// An empty warm start: the first solve through it runs cold.
+    pub fn new() -> Self {
+        Self::default()
+    }
+
+    /// Seed from a plan obtained elsewhere (a previous compile, say).
+    pub fn from_plan(layers: Vec<MoveSet>) -> Self {
+        Self { layers }
+    }
+
+    /// The plan the next solve will try to reuse.
+    pub fn move_layers(&self) -> &[MoveSet] {
+        &self.layers
+    }
+
+    /// Whether there is no seed plan yet.
+    pub fn is_empty(&self) -> bool {
+        self.layers.is_empty()
+    }
+
+    /// Drop the seed, e.g. when the caller moves on to an unrelated circuit.
+    pub fn clear(&mut self) {
+        self.layers.clear();
+    }
+
+    /// Take `result`'s plan as the next seed if it solved with a non-empty
+    /// plan.
+    pub(crate) fn absorb(&mut self, result: &SolveResult) {
+        if result.status == SolveStatus::Solved && !result.move_layers.is_empty() {
+            self.layers.clone_from(&result.move_layers);
+        }
+    }
+
+    /// The seed plan, or its inverse, if either solves `root → target` with
+    /// `blocked` held fixed. Returns the layers and the placement they land
+    /// on.
+    ///
+    /// The forward plan is tried first (a repeated stage), then the inverse
+    /// (the return leg of the previous stage). Replay goes through the
+    /// canonical execution model, the same one `verify` uses.
+    pub(crate) fn seed_plan(
+        &self,
+        root: &Config,
+        target: &[(u32, LocationAddr)],
+        blocked: &[LocationAddr],
+        arch: &ArchSpec,
+    ) -> Option<(Vec<MoveSet>, Config)> {
+        if self.layers.is_empty() {
+            return None;
+        }
+        if let Some(goal) = replay_onto(root, &self.layers, target, blocked, arch) {
+            return Some((self.layers.clone(), goal));
+        }
+        let inverse: Vec<MoveSet> = self.layers.iter().rev().map(MoveSet::inverse).collect();
+        replay_onto(root, &inverse, target, blocked, arch).map(|goal| (inverse, goal))
+    }
+}
+
+/// Replay `layers` from `root` with `blocked` as immovable atoms and return
+/// the final placement if it satisfies `target`.
+///
+/// Blocked locations join the replay as pseudo-qubits numbered past every
+/// real qubit, so a lane landing on one is a collision and a lane carrying
+/// one is caught by the check that they have not moved. A root that overlaps
+/// `blocked` is not seeded at all: the replay state cannot represent two
+/// atoms on one site.
+fn replay_onto(
+    root: &Config,
+    layers: &[MoveSet],
+    target: &[(u32, LocationAddr)],
+    blocked: &[LocationAddr],
+    arch: &ArchSpec,
+) -> Option<Config> {
+    let first_blocked = root
+        .iter()
+        .map(|(q, _)| q)
+        .max()
+        .map_or(Some(0), |q| q.checked_add(1))?;
+    let mut atoms: Vec<(u32, LocationAddr)> = root.iter().collect();
+    for (i, &loc) in blocked.iter().enumerate() {
+        atoms.push((first_blocked.checked_add(u32::try_from(i).ok()?)?, loc));
+    }
+    let distinct: HashSet<LocationAddr> = atoms.iter().map(|&(_, loc)| loc).collect();
+    if distinct.len() != atoms.len() {
+        return None;
+    }
+
+    let mut state = DenseAtomState::from_state(&AtomStateData::from_locations(&atoms), arch)?;
+    for move_set in layers {
+        let validated = state.validate_moves(&move_set.decode(), arch).ok()?;
+        state.apply_validated(&validated).ok()?;
+    }
+    if !state.collision().is_empty() {
+        return None;
+    }
+
+    let unmoved = atoms[root.len()..]
+        .iter()
+        .all(|&(q, loc)| state.location_of(q) == Some(loc));
+    let on_target = target
+        .iter()
+        .all(|&(q, loc)| state.location_of(q) == Some(loc));
+    if !(unmoved && on_target) {
+        return None;
+    }
+    let placed: Option<Vec<_>> = root
+        .iter()
+        .map(|(q, _)| state.location_of(q).map(|loc| (q, loc)))
+        .collect();
+    Config::new(placed?).ok()
+}
@@ -0,0 +1,499 @@
+//! Low-overhead search telemetry.
+//!
+//! Two layers, for two different questions:
+//!
+//! - [`SearchTelemetry`] is a compact set of counters and per-depth
+//!   histograms that every driver fills in natively and returns on every
+//!   [`SearchResult`](crate::drivers::result::SearchResult). It costs a few
+//!   integer adds and clock reads per expansion, so it is always on: when a
+//!   CZ stage regresses, the numbers for the slow solve are already there.
+//!   Pruning counts are not repeated here; they live in
+//!   [`BoundStats`](crate::bounds::BoundStats) on the same result.
+//! - [`EventSampler`] is a [`SearchObserver`] that writes a sample of the
+//!   full event stream to a compact binary file for offline replay by the
+//!   Python `visualize.entropy_tree` tooling. It replaces the Python-callback
+//!   trace when a search is too long to trace in full.
+//!
+//! ## Sample file format
+//!
+//! Little-endian throughout. The file starts with [`SAMPLE_MAGIC`] and a
+//! `u32` format version ([`SAMPLE_VERSION`]), followed by one record per
+//! sampled event:
+//!
+//! | field          | type                      | notes                          |
+//! |----------------|---------------------------|--------------------------------|
+//! | `kind`         | `u8`                      | [`SampledEventKind`]           |
+//! | `node_id`      | `u32`                     |                                |
+//! | `parent`       | `u32`                     | `u32::MAX` = none              |
+//! | `depth`        | `u32`                     |                                |
+//! | `entropy`      | `u32`                     | `0` for frontier events        |
+//! | `unresolved`   | `u32`                     | `u32::MAX` = not reported      |
+//! | `n_lanes`      | `u32`                     | moveset size, `0` = none       |
+//! | lanes          | `n_lanes × u64`           | `LaneAddr::encode_u64`         |
+//! | `n_qubits`     | `u32`                     |                                |
+//! | configuration  | `n_qubits × (u32, u64)`   | `(qubit_id, LocationAddr::encode)` |
+
+use std::io::{self, Write};
+use std::time::{Duration, Instant};
+
+use crate::observer::{SearchEvent, SearchObserver};
+use crate::primitives::config::Config;
+use crate::primitives::graph::{MoveSet, NodeId};
+
+// ── SearchTelemetry ─────────────────────────────────────────────────
+
+/// Counters for the nodes expanded at one depth.
+#[derive(Debug, Clone, Copy, Default, PartialEq, Eq)]
+pub struct DepthCounts {
+    /// Nodes expanded at this depth.
+    pub expanded: u64,
+    /// Candidates the generator produced for them.
+    pub candidates: u64,
+    /// Candidates that became new graph nodes (the rest were transpositions).
+    pub new_nodes: u64,
+}
+
+impl DepthCounts {
+    /// Mean new children per expanded node; `0.0` when nothing was expanded.
+    pub fn branching_factor(&self) -> f64 {
+        if self.expanded == 0 {
+            0.0
+        } else {
+            self.new_nodes as f64 / self.expanded as f64
+        }
+    }
+}
+
+/// Aggregate counters and timings for one search.
+///
+/// Filled in by the drivers themselves rather than through a
+/// [`SearchObserver`], so collecting it needs no event payloads and no
+/// virtual calls. Phase timings cover the driver's own loop: time spent in
+/// the move generator, in ranking candidates, and in inserting children
+/// into the graph and frontier. Whatever is left of `wall_time` is goal
+/// checks, bookkeeping and the observer.
+#[derive(Debug, Clone, Default, PartialEq)]
+pub struct SearchTelemetry {
+    /// Wall-clock time spent inside the driver.
+    pub wall_time: Duration,
+    /// Time spent generating candidates.
+    pub generate_time: Duration,
+    /// Time spent ranking candidates (frontier driver only).
+    pub score_time: Duration,
+    /// Time spent inserting children into the graph and frontier.
+    pub insert_time: Duration,
+    /// Nodes expanded.
+    pub expansions: u64,
+    /// Candidates generated across all expansions.
+    pub candidates: u64,
+    /// Candidates that became new graph nodes.
+    pub new_nodes: u64,
+    /// Candidates that landed on an already-seen configuration.
+    pub transpositions: u64,
+    /// Goal nodes found (the entropy driver collects several per solve).
+    pub goals: u64,
+    /// Largest frontier size observed after an expansion (frontier driver
+    /// only).
+    pub peak_frontier: u64,
+    /// Per-depth counters; `by_depth[d]` covers nodes expanded at depth `d`.
+    pub by_depth: Vec<DepthCounts>,
+}
+
+impl SearchTelemetry {
+    /// Record the expansion of a node at `depth` that produced `candidates`
+    /// candidates, `new_nodes` of which were new graph nodes.
+    pub(crate) fn record_expansion(&mut self, depth: u32, candidates: usize, new_nodes: usize) {
+        let (candidates, new_nodes) = (candidates as u64, new_nodes as u64);
+        self.expansions += 1;
+        self.candidates += candidates;
+        self.new_nodes += new_nodes;
+        self.transpositions += candidates.saturating_sub(new_nodes);
+        let row = self.depth_row(depth);
+        row.expanded += 1;
+        row.candidates += candidates;
+        row.new_nodes += new_nodes;
+    }
+
+    /// Record one candidate tried from a node at `depth`, for drivers that
+    /// try candidates one at a time (the entropy driver). `first_from_node`
+    /// marks the node's first attempt, which is when it counts as expanded.
+    pub(crate) fn record_attempt(&mut self, depth: u32, first_from_node: bool, is_new: bool) {
+        let (expanded, new_nodes) = (u64::from(first_from_node), u64::from(is_new));
+        self.expansions += expanded;
+        self.candidates += 1;
+        self.new_nodes += new_nodes;
+        self.transpositions += 1 - new_nodes;
+        let row = self.depth_row(depth);
+        row.expanded += expanded;
+        row.candidates += 1;
+        row.new_nodes += new_nodes;
+    }
+
+    fn depth_row(&mut self, depth: u32) -> &mut DepthCounts {
+        let d = depth as usize;
+        if d >= self.by_depth.len() {
+            self.by_depth.resize(d + 1, DepthCounts::default());
+        }
+        &mut self.by_depth[d]
+    }
+
+    /// Stamp `wall_time` as the time since `started`.
+    pub(crate) fn finished(mut self, started: Instant) -> Self {
+        self.wall_time = started.elapsed();
+        self
+    }
+
+    /// Mean new children per expanded node over the whole search.
+    pub fn branching_factor(&self) -> f64 {
+        if self.expansions == 0 {
+            0.0
+        } else {
+            self.new_nodes as f64 / self.expansions as f64
+        }
+    }
+
+    /// Fold another search's telemetry into this one, e.g. to total the
+    /// restarts of one solve.
+    pub fn merge(&mut self, other: &SearchTelemetry) {
+        self.wall_time += other.wall_time;
+        self.generate_time += other.generate_time;
+        self.score_time += other.score_time;
+        self.insert_time += other.insert_time;
+        self.expansions += other.expansions;
+        self.candidates += other.candidates;
+        self.new_nodes += other.new_nodes;
+        self.transpositions += other.transpositions;
+        self.goals += other.goals;
+        self.peak_frontier = self.peak_frontier.max(other.peak_frontier);
+        if other.by_depth.len() > self.by_depth.len() {
+            self.by_depth
+                .resize(other.by_depth.len(), DepthCounts::default());
+        }
+        for (row, theirs) in self.by_depth.iter_mut().zip(&other.by_depth) {
+            row.expanded += theirs.expanded;
+            row.candidates += theirs.candidates;
+            row.new_nodes += theirs.new_nodes;
+        }
+    }
+}
+
+/// Add the time since `*mark` to `slot` and move `mark` to now.
+///
+/// One clock read per phase boundary: consecutive phases share a reading.
+#[inline]
+pub(crate) fn lap(mark: &mut Instant, slot: &mut Duration) {
+    let now = Instant::now();
+    *slot += now - *mark;
+    *mark = now;
+}
+
+// ── EventSampler ────────────────────────────────────────────────────
+
+/// Magic bytes opening an [`EventSampler`] file.
+pub const SAMPLE_MAGIC: &[u8; 8] = b"BLQTRACE";
+
+/// Version of the [`EventSampler`] record layout.
+pub const SAMPLE_VERSION: u32 = 1;
+
+/// Record tag for each [`SearchEvent`] variant.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+#[repr(u8)]
+pub enum SampledEventKind {
+    GoalFound = 0,
+    NodeExpanded = 1,
+    EntropyDescend = 2,
+    EntropyGoal = 3,
+    EntropyBump = 4,
+    EntropyRevert = 5,
+    EntropyFallbackStart = 6,
+}
+
+/// Observer that writes every `stride`-th event, and every goal event, to a
+/// binary sink in the layout described in the [module docs](self).
+///
+/// Goal events are always kept so a sampled replay still ends where the
+/// search did. A write error stops further writes; it is reported by
+/// [`finish`](Self::finish), since `on_event` cannot return one.
+///
+/// The sampler asks for events, so drivers build event payloads for every
+/// event, sampled or not. That is still far cheaper than a Python callback
+/// per event, but use a large stride on long searches.
+pub struct EventSampler<W: Write> {
+    sink: W,
+    stride: u64,
+    seen: u64,
+    written: u64,
+    error: Option<io::Error>,
+}
+
+impl<W: Write> EventSampler<W> {
+    /// Start a sample file on `sink`, keeping one event in `stride` (a
+    /// `stride` of 0 or 1 keeps every event).
+    pub fn new(mut sink: W, stride: u64) -> io::Result<Self> {
+        sink.write_all(SAMPLE_MAGIC)?;
+        sink.write_all(&SAMPLE_VERSION.to_le_bytes())?;
+        Ok(Self {
+            sink,
+            stride: stride.max(1),
+            seen: 0,
+            written: 0,
+            error: None,
+        })
+    }
+
+    /// Events seen so far, sampled or not.
+    pub fn events_seen(&self) -> u64 {
+        self.seen
+    }
+
+    /// Events written so far.
+    pub fn events_written(&self) -> u64 {
+        self.written
+    }
+
+    /// Flush and return the sink, or the first write error.
+    pub fn finish(mut self) -> io::Result<W> {
+        if let Some(err) = self.error.take() {
+            return Err(err);
+        }
+        self.sink.flush()?;
+        Ok(self.sink)
+    }
+
+    #[allow(clippy::too_many_arguments)]
+    fn write_record(
+        &mut self,
+        kind: SampledEventKind,
+        node_id: NodeId,
+        parent: Option<NodeId>,
+        depth: u32,
+        entropy: u32,
+        unresolved: Option<u32>,
+        moveset: Option<&MoveSet>,
+        config: &Config,
+    ) -> io::Result<()> {
+        let w = &mut self.sink;
+        w.write_all(&[kind as u8])?;
+        w.write_all(&node_id.0.to_le_bytes())?;
+        w.write_all(&parent.map_or(u32::MAX, |p| p.0).to_le_bytes())?;
+        w.write_all(&depth.to_le_bytes())?;
+        w.write_all(&entropy.to_le_bytes())?;
+        w.write_all(&unresolved.unwrap_or(u32::MAX).to_le_bytes())?;
+        let lanes = moveset.map_or(&[][..], MoveSet::encoded_lanes);
+        w.write_all(&(lanes.len() as u32).to_le_bytes())?;
+        for lane in lanes {
+            w.write_all(&lane.to_le_bytes())?;
+        }
+        let entries = config.as_entries();
+        w.write_all(&(entries.len() as u32).to_le_bytes())?;
+        for &(qid, loc) in entries {
+            w.write_all(&qid.to_le_bytes())?;
+            w.write_all(&loc.to_le_bytes())?;
+        }
+        Ok(())
+    }
+}
+
+impl<W: Write> SearchObserver for EventSampler<W> {
+    fn on_event(&mut self, event: SearchEvent<'_>) {
+        let keep = self.seen.is_multiple_of(self.stride)
+            || matches!(
+                event,
+                SearchEvent::GoalFound { .. } | SearchEvent::EntropyGoal { .. }
+            );
+        self.seen += 1;
+        if !keep || self.error.is_some() {
+            return;
+        }
+        use SampledEventKind as K;
+        let result = match event {
+            SearchEvent::GoalFound {
+                depth,
+                node_id,
+                config,
+            } => self.write_record(K::GoalFound, node_id, None, depth, 0, None, None, config),
+            SearchEvent::NodeExpanded {
+                depth,
+                node_id,
+                config,
+                ..
+            } => self.write_record(K::NodeExpanded, node_id, None, depth, 0, None, None, config),
+            SearchEvent::EntropyDescend {
+                node_id,
+                parent_node_id,
+                depth,
+                entropy,
+                unresolved_count,
+                moveset,
+                configuration,
+                ..
+            } => self.write_record(
+                K::EntropyDescend,
+                node_id,
+                Some(parent_node_id),
+                depth,
+                entropy,
+                Some(unresolved_count),
+                Some(moveset),
+                configuration,
+            ),
+            SearchEvent::EntropyGoal {
+                node_id,
+                parent_node_id,
+                depth,
+                entropy,
+                moveset,
+                configuration,
+                ..
+            } => self.write_record(
+                K::EntropyGoal,
+                node_id,
+                parent_node_id,
+                depth,
+                entropy,
+                None,
+                moveset,
+                configuration,
+            ),
+            SearchEvent::EntropyBump {
+                node_id,
+                parent_node_id,
+                depth,
+                entropy,
+                unresolved_count,
+                moveset,
+                configuration,
+                ..
+            } => self.write_record(
+                K::EntropyBump,
+                node_id,
+                parent_node_id,
+                depth,
+                entropy,
+                Some(unresolved_count),
+                moveset,
+                configuration,
+            ),
+            SearchEvent::EntropyRevert {
+                node_id,
+                parent_node_id,
+                depth,
+                entropy,
+                unresolved_count,
+                configuration,
+                ..
+            } => self.write_record(
+                K::EntropyRevert,
+                node_id,
+                parent_node_id,
+                depth,
+                entropy,
+                Some(unresolved_count),
+                None,
+                configuration,
+            ),
+            SearchEvent::EntropyFallbackStart {
+                node_id,
+                parent_node_id,
+                depth,
+                unresolved_count,
+                configuration,
+                ..
+            } => self.write_record(
+                K::EntropyFallbackStart,
+                node_id,
+                parent_node_id,
+                depth,
+                0,
+                Some(unresolved_count),
+                None,
+                configuration,
+            ),
+        };
+        match result {
+            Ok(()) => self.written += 1,
+            Err(err) => self.error = Some(err),
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::test_utils::loc;
+
+    #[test]
+    fn record_expansion_fills_depth_rows_and_transpositions() {
+        let mut t = SearchTelemetry::default();
+        t.record_expansion(0, 4, 3);
+        t.record_expansion(2, 2, 2);
+        assert_eq!(t.expansions, 2);
+        assert_eq!(t.candidates, 6);
+        assert_eq!(t.transpositions, 1);
+        assert_eq!(t.by_depth.len(), 3);
+        assert_eq!(t.by_depth[1], DepthCounts::default());
+        assert_eq!(t.by_depth[0].branching_factor(), 3.0);
+        assert_eq!(t.branching_factor(), 2.5);
+    }
+
+    #[test]
+    fn record_attempt_counts_a_node_once() {
+        let mut t = SearchTelemetry::default();
+        t.record_attempt(1, true, true);
+        t.record_attempt(1, false, false);
+        t.record_attempt(1, false, true);
+        assert_eq!(t.expansions, 1);
+        assert_eq!(t.transpositions, 1);
+        assert_eq!(t.by_depth[1].branching_factor(), 2.0);
+    }
+
+    #[test]
+    fn merge_sums_counters_and_keeps_peak_frontier() {
+        let mut a = SearchTelemetry {
+            peak_frontier: 7,
+            ..SearchTelemetry::default()
+        };
+        a.record_expansion(0, 1, 1);
+        let mut b = SearchTelemetry {
+            peak_frontier: 3,
+            ..SearchTelemetry::default()
+        };
+        b.record_expansion(1, 2, 0);
+        a.merge(&b);
+        assert_eq!(a.expansions, 2);
+        assert_eq!(a.transpositions, 2);
+        assert_eq!(a.peak_frontier, 7);
+        assert_eq!(a.by_depth[1].candidates, 2);
+    }
+
+    #[test]
+    fn sampler_keeps_every_stride_th_event_and_all_goals() {
+        let config = Config::new([(0, loc(0, 1)), (3, loc(1, 2))]).unwrap();
+        let mut sampler = EventSampler::new(Vec::new(), 3).unwrap();
+        for i in 0..5 {
+            sampler.on_event(SearchEvent::NodeExpanded {
+                depth: i,
+                num_candidates: 0,
+                node_id: NodeId(i),
+                config: &config,
+            });
+        }
+        sampler.on_event(SearchEvent::GoalFound {
+            depth: 5,
+            node_id: NodeId(5),
+            config: &config,
+        });
+        assert_eq!(sampler.events_seen(), 6);
+        // Events 0 and 3 by stride, plus the goal.
+        assert_eq!(sampler.events_written(), 3);
+
+        let bytes = sampler.finish().unwrap();
+        assert_eq!(&bytes[..8], SAMPLE_MAGIC);
+        assert_eq!(bytes[8..12], SAMPLE_VERSION.to_le_bytes());
+        // header + 3 × (25-byte fixed part + u32 n_qubits + 2 × 12-byte entries)
+        assert_eq!(bytes.len(), 12 + 3 * (25 + 4 + 2 * 12));
+        assert_eq!(bytes[12], SampledEventKind::NodeExpanded as u8);
+        let last = 12 + 2 * (25 + 4 + 24);
+        assert_eq!(bytes[last], SampledEventKind::GoalFound as u8);
+    }
+}
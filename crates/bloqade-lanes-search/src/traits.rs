@@ -4,6 +4,7 @@ use bloqade_lanes_bytecode_core::arch::addr::LaneAddr;
 
 use crate::primitives::config::Config;
 use crate::primitives::context::{MoveCandidate, SearchContext, SearchState};
+use crate::primitives::distance::CostProfile;
 use crate::primitives::graph::{MoveSet, NodeId};
 
 /// Produces candidate move sets from a configuration.
@@ -127,6 +128,23 @@ pub trait Goal {
 /// Must be admissible (never overestimates) for A* optimality.
 pub trait Heuristic {
     fn estimate(&self, config: &Config) -> f64;
+
+    /// Estimate `config` given its parent's configuration and the profile
+    /// this method returned for the parent (`None` for the root, or when the
+    /// parent kept no profile).
+    ///
+    /// Returns the estimate and the profile to hand to `config`'s children.
+    /// The default ignores the parent and keeps no profile; heuristics built
+    /// from [`ProfiledHeuristic`](crate::primitives::distance::ProfiledHeuristic)
+    /// override it to re-cost only the qubits a move set relocated.
+    fn estimate_incremental(
+        &self,
+        parent: Option<(&Config, &CostProfile)>,
+        config: &Config,
+    ) -> (f64, Option<CostProfile>) {
+        let _ = parent;
+        (self.estimate(config), None)
+    }
 }
 
 /// Blanket impl: any `Fn(&Config) -> f64` closure satisfies `Heuristic`.
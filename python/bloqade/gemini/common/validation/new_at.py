@@ -2,8 +2,9 @@
 
 Registered against the lanes validation interpreter key (``move.address.validation``).
 The impl checks (1) const-foldability of the three SSA int args and (2) that the
-resulting LocationAddress is valid for the architecture (via the existing
-ArchSpec.check_location_group called by ``_ValidationAnalysis.report_location_errors``).
+resulting LocationAddress is valid for the architecture (via
+``_ValidationAnalysis.report_location_errors``, which batches the check into
+one ArchSpec.check_many call).
 """
 
 from __future__ import annotations
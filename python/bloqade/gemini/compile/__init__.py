@@ -1,3 +1,4 @@
+from bloqade.gemini.compile.batch import BatchCompiler as BatchCompiler
 from bloqade.gemini.compile.stim import (
     compile_to_stim_program as compile_to_stim_program,
 )
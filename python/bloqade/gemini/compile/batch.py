@@ -0,0 +1,192 @@
+"""Compile batches of independent logical kernels in a process pool.
+
+Kirin methods cannot be pickled, so ``BatchCompiler`` ships each kernel to a
+worker as Kirin JSON. The worker runs ``compile_task`` and sends the logical
+and physical move kernels back as JSON, together with importable references
+to the dialects of the move kernel, which the calling process needs to decode
+it. The calling process only decodes the kernels and rebuilds the
+post-processing closures, which cannot be pickled either, so every kernel is
+compiled exactly as a serial ``compile_task`` call compiles it.
+"""
+
+import sys
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from importlib import import_module
+from typing import Any
+
+from kirin import ir
+from typing_extensions import Self
+
+from .task import _task_artifacts, compile_task
+
+__all__ = ["BatchCompiler"]
+
+_DialectRef = tuple[str, str]
+"""``(module, attribute)`` naming a module-level ``ir.Dialect``."""
+
+_Compiled = tuple[str, str, list[_DialectRef]]
+"""``(logical kernel JSON, move kernel JSON, move kernel dialects)``."""
+
+_dialect_refs_by_name: dict[str, _DialectRef] = {}
+
+
+def _load_dialect(ref: _DialectRef) -> ir.Dialect:
+    module_name, attr = ref
+    return getattr(import_module(module_name), attr)
+
+
+def _dialect_ref(dialect: ir.Dialect) -> _DialectRef:
+    """An importable reference to ``dialect``.
+
+    Kirin keeps no registry of dialects, so the loaded modules are scanned for
+    module-level dialects once and the references are cached by name.
+    """
+    if dialect.name not in _dialect_refs_by_name:
+        for module_name, module in list(sys.modules.items()):
+            for attr, value in list(getattr(module, "__dict__", {}).items()):
+                if isinstance(value, ir.Dialect):
+                    _dialect_refs_by_name.setdefault(value.name, (module_name, attr))
+    ref = _dialect_refs_by_name.get(dialect.name)
+    if ref is None or _load_dialect(ref) is not dialect:
+        raise ValueError(f"dialect {dialect.name!r} cannot be imported by name")
+    return ref
+
+
+def _dialect_refs(group: ir.DialectGroup) -> list[_DialectRef]:
+    return sorted(_dialect_ref(dialect) for dialect in group.data)
+
+
+def _dialect_group(refs: list[_DialectRef], run_pass=None) -> ir.DialectGroup:
+    return ir.DialectGroup([_load_dialect(ref) for ref in refs], run_pass=run_pass)
+
+
+def _warm_up_worker() -> None:
+    """Build the architectures once per worker instead of once per kernel."""
+    from bloqade.lanes.arch.gemini import logical, physical
+
+    logical.get_arch_spec()
+    physical.get_arch_spec()
+
+
+def _compile_remote(
+    kernel_json: str,
+    kernel_dialects: list[_DialectRef],
+    m2dets: list[list[int]] | None,
+    m2obs: list[list[int]] | None,
+) -> _Compiled:
+    kernel = _dialect_group(kernel_dialects).decode_json(kernel_json)
+    logical_squin_kernel, _, physical_move_kernel, _ = compile_task(
+        kernel, m2dets, m2obs
+    )
+    return (
+        logical_squin_kernel.dialects.encode_json(logical_squin_kernel),
+        physical_move_kernel.dialects.encode_json(physical_move_kernel),
+        _dialect_refs(physical_move_kernel.dialects),
+    )
+
+
+def _encode(
+    kernel: ir.Method | Callable[..., Any],
+) -> tuple[str, list[_DialectRef]] | None:
+    """The kernel and its dialects, or ``None`` when it cannot be shipped."""
+    if not isinstance(kernel, ir.Method):
+        return None
+    try:
+        return kernel.dialects.encode_json(kernel), _dialect_refs(kernel.dialects)
+    except (TypeError, ValueError):
+        return None
+
+
+def _decode(kernel: ir.Method, compiled: _Compiled) -> tuple:
+    logical_json, move_json, move_dialects = compiled
+    move_group = _dialect_group(move_dialects, run_pass=kernel.dialects.run_pass_gen)
+    return _task_artifacts(
+        kernel.dialects.decode_json(logical_json), move_group.decode_json(move_json)
+    )
+
+
+class BatchCompiler:
+    """Compile independent logical kernels with ``compile_task`` in a process pool.
+
+    The pool is started on first use and reused by later batches, so worker
+    start-up and architecture construction are paid once; call ``close`` (or
+    use the compiler as a context manager) to shut it down.
+
+    Kernels that cannot be serialized (for example CUDA-Q kernels), and
+    kernels whose worker fails, including when the compiled kernel cannot be
+    serialized, are compiled in the calling process. Compile errors are
+    therefore raised in submission order, exactly as a serial loop would
+    raise them. A pool broken by a dying worker is shut down, and the next
+    submission starts a fresh one.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=_warm_up_worker
+            )
+        return self._executor
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def compile(
+        self,
+        kernels: Sequence[ir.Method | Callable[..., Any]],
+        m2dets: list[list[int]] | None = None,
+        m2obs: list[list[int]] | None = None,
+    ) -> list[tuple]:
+        """Compile ``kernels`` with ``compile_task``, in submission order.
+
+        Returns:
+            One ``compile_task`` result tuple per kernel.
+        """
+        futures: list[Future[_Compiled] | None] = [
+            (
+                None
+                if (payload := _encode(kernel)) is None
+                else self._submit(payload, m2dets, m2obs)
+            )
+            for kernel in kernels
+        ]
+
+        results = []
+        for kernel, future in zip(kernels, futures):
+            error = None if future is None else future.exception()
+            if future is not None and error is None:
+                assert isinstance(kernel, ir.Method)
+                results.append(_decode(kernel, future.result()))
+                continue
+            if isinstance(error, BrokenProcessPool):
+                self.close()
+            # Compiling here either succeeds or raises the worker's error.
+            results.append(compile_task(kernel, m2dets, m2obs))
+        return results
+
+    def _submit(
+        self,
+        payload: tuple[str, list[_DialectRef]],
+        m2dets: list[list[int]] | None,
+        m2obs: list[list[int]] | None,
+    ) -> Future[_Compiled] | None:
+        """Submit one kernel, or return ``None`` if the pool is broken."""
+        try:
+            return self.executor.submit(_compile_remote, *payload, m2dets, m2obs)
+        except BrokenProcessPool:
+            self.close()
+            return None
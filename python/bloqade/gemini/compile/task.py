@@ -231,10 +231,17 @@ def compile_task(
 
     run_squin_kernel_validation(logical_squin_kernel).raise_if_invalid()
 
-    physical_arch_spec = physical.get_arch_spec()
     physical_move_kernel = LogicalPipeline(transversal_rewrite=True).emit(
         logical_squin_kernel
     )
+    return _task_artifacts(logical_squin_kernel, physical_move_kernel)
+
+
+def _task_artifacts(
+    logical_squin_kernel: ir.Method, physical_move_kernel: ir.Method
+) -> tuple:
+    """The ``compile_task`` result for an already compiled move kernel."""
+    physical_arch_spec = physical.get_arch_spec()
     post_processing = atom.AtomInterpreter(
         physical_move_kernel.dialects, arch_spec=physical_arch_spec
     ).get_post_processing(physical_move_kernel)
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -17,20 +19,17 @@ _TABLE_DECODER_MISSING_MSG = (
     "with `bloqade-lanes[decoding]`."
 )
 
+_HAS_TABLE_DECODER = True
+
 if TYPE_CHECKING:
     from bloqade.decoders import TableDecoder
-    from bloqade.decoders._decoders.mld.utils import (
-        pack_boolean_array,
-        shots_to_counts,
-    )
+    from bloqade.decoders._decoders.mld.utils import pack_boolean_array
 else:
     try:
         from bloqade.decoders import TableDecoder
-        from bloqade.decoders._decoders.mld.utils import (
-            pack_boolean_array,
-            shots_to_counts,
-        )
+        from bloqade.decoders._decoders.mld.utils import pack_boolean_array
     except ImportError:
+        _HAS_TABLE_DECODER = False
 
         class TableDecoder:  # type: ignore[no-redef]
             """Runtime stub used when the optional TableDecoder is absent."""
@@ -42,12 +41,20 @@ else:
             raise ImportError(_TABLE_DECODER_MISSING_MSG)
 
         pack_boolean_array = _missing_table_decoder
-        shots_to_counts = _missing_table_decoder
 
 logger = logging.getLogger(__name__)
 
 _COUNT_DTYPE = np.uint32
 _COUNT_MAX = np.iinfo(_COUNT_DTYPE).max
+_KEY_DTYPE = np.uint64
+
+# Widest detector+observable pattern that still gets a dense ``2**n`` count
+# table (4 GiB of uint32 at 30 bits). Wider patterns use the sparse table.
+_DENSE_TABLE_MAX_BITS = 30
+
+# Shots per training chunk when ``step_size`` is not given. Bounds the size of
+# each sampled batch, and so peak training memory, independently of num_shots.
+_DEFAULT_STEP_SIZE = 2**16
 
 
 def _as_uint32_count_table(counts: np.ndarray) -> np.ndarray:
@@ -61,6 +68,136 @@ def _as_uint32_count_table(counts: np.ndarray) -> np.ndarray:
     return arr.astype(_COUNT_DTYPE, copy=False)
 
 
+def _bytes_to_keys(packed: np.ndarray) -> np.ndarray:
+    """View little-endian bit-packed rows of at most 8 bytes as ``uint64`` keys."""
+
+    padded = np.zeros((packed.shape[0], 8), dtype=np.uint8)
+    padded[:, : packed.shape[1]] = packed
+    return padded.view("<u8").reshape(-1).astype(_KEY_DTYPE, copy=False)
+
+
+def _pack_det_obs_keys(bits: np.ndarray) -> np.ndarray:
+    """Pack each row of ``bits`` into a ``uint64`` key, column ``i`` -> bit ``i``.
+
+    Same bit order as ``pack_boolean_array``, but done bytewise with
+    ``np.packbits`` so 64-bit patterns do not wrap through int64.
+    """
+
+    bits = np.asarray(bits, dtype=np.bool_)
+    return _bytes_to_keys(np.packbits(bits, axis=1, bitorder="little"))
+
+
+def _iter_det_obs_key_chunks(
+    dem: stim.DetectorErrorModel,
+    *,
+    num_shots: int,
+    seed: int | None,
+    step_size: int,
+) -> Iterator[np.ndarray]:
+    """Sample ``num_shots`` from one seeded stream, ``step_size`` at a time.
+
+    Samples arrive bit-packed from stim and are turned into packed det+obs keys
+    without ever expanding to one byte per bit.
+    """
+
+    sampler = dem.compile_sampler(seed=seed)
+    detector_shift = _KEY_DTYPE(dem.num_detectors)
+    for offset in range(0, num_shots, step_size):
+        det_packed, obs_packed = sampler.sample(
+            shots=min(step_size, num_shots - offset),
+            bit_packed=True,
+        )[:2]
+        keys = _bytes_to_keys(det_packed)
+        if dem.num_observables:
+            keys |= _bytes_to_keys(obs_packed) << detector_shift
+        yield keys
+
+
+def _add_dense_counts(counts: np.ndarray, keys: np.ndarray) -> None:
+    """Count ``keys`` into the dense table ``counts`` in place."""
+
+    if counts.size <= keys.size:
+        step_counts = np.bincount(keys.astype(np.intp), minlength=counts.size)
+        index = np.flatnonzero(step_counts)
+        step_counts = step_counts[index]
+    else:
+        # A chunk much smaller than the table: avoid a 2**n-sized bincount.
+        index, step_counts = np.unique(keys, return_counts=True)
+    if np.any(step_counts > _COUNT_MAX - counts[index]):
+        raise OverflowError(
+            f"TableDecoder count table would exceed uint32 max ({_COUNT_MAX})."
+        )
+    counts[index] += step_counts.astype(_COUNT_DTYPE, copy=False)
+
+
+def _add_sparse_counts(
+    keys_table: np.ndarray,
+    counts: np.ndarray,
+    keys: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Count ``keys`` into the sparse table ``(keys_table, counts)``."""
+
+    new_keys, new_counts = np.unique(keys, return_counts=True)
+    return _merge_sparse_counts(
+        keys_table,
+        counts,
+        new_keys,
+        new_counts.astype(np.uint64, copy=False),
+    )
+
+
+def _merge_sparse_counts(
+    keys: np.ndarray,
+    counts: np.ndarray,
+    new_keys: np.ndarray,
+    new_counts: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Merge two sorted, duplicate-free ``(keys, counts)`` tables."""
+
+    merged_keys = np.union1d(keys, new_keys).astype(_KEY_DTYPE, copy=False)
+    merged_counts = np.zeros(merged_keys.shape, dtype=np.uint64)
+    # Each side is duplicate-free, so fancy-index accumulation is exact.
+    merged_counts[np.searchsorted(merged_keys, keys)] += counts
+    merged_counts[np.searchsorted(merged_keys, new_keys)] += new_counts
+    if merged_counts.size and int(merged_counts.max()) > _COUNT_MAX:
+        raise OverflowError(
+            f"TableDecoder count table would exceed uint32 max ({_COUNT_MAX})."
+        )
+    return merged_keys, merged_counts.astype(_COUNT_DTYPE)
+
+
+def _train_count_table(
+    dem_text: str,
+    *,
+    num_shots: int,
+    seed: int,
+    step_size: int,
+    sparse: bool,
+) -> tuple[np.ndarray | None, np.ndarray]:
+    """Build one worker's count table as ``(keys or None, counts)``.
+
+    Runs in a worker process, so it takes the DEM as text and returns a fresh
+    table for the parent to merge rather than touching a decoder.
+    """
+
+    dem = stim.DetectorErrorModel(dem_text)
+    data_len = dem.num_detectors + dem.num_observables
+    keys_table: np.ndarray | None = None
+    if sparse:
+        keys_table = np.zeros(0, dtype=_KEY_DTYPE)
+        counts = np.zeros(0, dtype=_COUNT_DTYPE)
+    else:
+        counts = np.zeros(2**data_len, dtype=_COUNT_DTYPE)
+    for keys in _iter_det_obs_key_chunks(
+        dem, num_shots=num_shots, seed=seed, step_size=step_size
+    ):
+        if keys_table is None:
+            _add_dense_counts(counts, keys)
+        else:
+            keys_table, counts = _add_sparse_counts(keys_table, counts, keys)
+    return keys_table, counts
+
+
 # NOTE: When we migrate TableDecoderWithConfidence, we will add a shim import
 # from bloqade.decoders import TableDecoderWithConfidence
 # as well as a deprecation warning saying that this is not the "preferred" import path and that users should import from bloqade.decoders.
@@ -70,7 +207,14 @@ def _as_uint32_count_table(counts: np.ndarray) -> np.ndarray:
 class TableDecoderWithConfidence(TableDecoder, ConfidenceDecoder):
     # make private most stuff that other decoders don't have.
     # TODO: only expose decode_with_confidence.
-    """Dense table decoder with empirical per-syndrome confidence."""
+    """Table decoder with empirical per-syndrome confidence.
+
+    Up to ``_DENSE_TABLE_MAX_BITS`` detector+observable bits the counts live in
+    a dense ``2**n`` table. Wider patterns, or ``sparse=True``, store only the
+    observed packed patterns: a sorted ``uint64`` key column with a parallel
+    ``uint32`` count column, so memory scales with the number of distinct
+    syndromes rather than ``2**n``.
+    """
 
     def __init__(
         self,
@@ -79,6 +223,8 @@ class TableDecoderWithConfidence(TableDecoder, ConfidenceDecoder):
         num_shots: int = 10**7,
         seed: int | None = None,
         step_size: int | None = None,
+        sparse: bool | None = None,
+        num_workers: int = 1,
     ) -> None:
         data_len = dem.num_detectors + dem.num_observables
         if data_len > 64:
@@ -86,17 +232,57 @@ class TableDecoderWithConfidence(TableDecoder, ConfidenceDecoder):
                 f"Total data length {data_len} (detectors + observables) "
                 "exceeds 64 bits and cannot be packed into int64."
             )
-
-        counts_table = np.zeros(2**data_len, dtype=_COUNT_DTYPE)
-
-        super().__init__(dem=dem, det_obs_counts=counts_table)
-        self._det_obs_counts = _as_uint32_count_table(self._det_obs_counts)
+        if sparse is None:
+            sparse = data_len > _DENSE_TABLE_MAX_BITS
+
+        # Sparse backend only: sorted packed det+obs patterns, parallel to
+        # ``_det_obs_counts``, and the sorted detector syndromes that the
+        # cached correction/confidence arrays are indexed by.
+        self._det_obs_keys: np.ndarray | None = None
+        self._syndrome_keys: np.ndarray | None = None
         self._correction_confidence: np.ndarray | None = None
 
+        if sparse:
+            self._init_sparse_table(dem)
+        else:
+            counts_table = np.zeros(2**data_len, dtype=_COUNT_DTYPE)
+            super().__init__(dem=dem, det_obs_counts=counts_table)
+            self._det_obs_counts = _as_uint32_count_table(self._det_obs_counts)
+
         if data_len == 0:
-            self._det_obs_counts[0] = max(1, min(int(num_shots), _COUNT_MAX))
+            count = max(1, min(int(num_shots), _COUNT_MAX))
+            if self._det_obs_keys is not None:
+                self._det_obs_keys = np.zeros(1, dtype=_KEY_DTYPE)
+                self._det_obs_counts = np.array([count], dtype=_COUNT_DTYPE)
+            else:
+                self._det_obs_counts[0] = count
             return
-        self._train_from_dem(num_shots=num_shots, seed=seed, step_size=step_size)
+        self._train_from_dem(
+            num_shots=num_shots,
+            seed=seed,
+            step_size=step_size,
+            num_workers=num_workers,
+        )
+
+    def _init_sparse_table(self, dem: stim.DetectorErrorModel) -> None:
+        """Set up the ``TableDecoder`` state around an empty sparse table.
+
+        ``TableDecoder.__init__`` only accepts a dense ``2**n`` count table, so
+        the sparse backend initializes the base decoder and the attributes
+        ``TableDecoder.__init__`` would set here instead. This is the only
+        place that mirrors that state.
+        """
+
+        if not _HAS_TABLE_DECODER:
+            raise ImportError(_TABLE_DECODER_MISSING_MSG)
+        super(TableDecoder, self).__init__(dem)
+        self._dem = dem
+        self._df = None
+        self._is_cached_df = False
+        self._maximum_likelihood_correction = None
+        self._is_cached_correction = False
+        self._det_obs_keys = np.zeros(0, dtype=_KEY_DTYPE)
+        self._det_obs_counts = np.zeros(0, dtype=_COUNT_DTYPE)
 
     def _train_from_dem(
         self,
@@ -104,33 +290,65 @@ class TableDecoderWithConfidence(TableDecoder, ConfidenceDecoder):
         num_shots: int,
         seed: int | None,
         step_size: int | None,
+        num_workers: int = 1,
     ) -> None:
+        """Sample ``num_shots`` from the DEM into the count table.
+
+        Shots are drawn in chunks of ``step_size`` (``_DEFAULT_STEP_SIZE`` if
+        not given), so peak memory does not grow with ``num_shots``. With
+        ``num_workers > 1`` the shots are split across worker processes, each
+        sampling an independent stream seeded from ``seed`` through
+        ``np.random.SeedSequence.spawn``. Worker tables are merged in worker
+        order, so a seeded parallel run is reproducible.
+        """
+
         if num_shots < 0:
             raise ValueError("num_shots must be non-negative.")
+        if num_workers <= 0:
+            raise ValueError("num_workers must be positive.")
         if num_shots == 0:
             return
         if step_size is None:
-            step_size = num_shots
+            step_size = min(num_shots, _DEFAULT_STEP_SIZE)
         if step_size <= 0:
             raise ValueError("step_size must be positive.")
 
         from tqdm import tqdm
 
-        sampler = self._dem.compile_sampler(seed=seed)
-        progress_bar_steps = ((num_shots - 1) // step_size) + 1
-        total_sampled = 0
-
         logger.info("Building decoder from detector error model...")
-        for _ in tqdm(range(progress_bar_steps)):
-            next_shots = min(step_size, num_shots - total_sampled)
-            total_sampled += next_shots
-            det_samples, obs_samples = sampler.sample(
-                shots=next_shots,
-                bit_packed=False,
-            )[:2]
-            self._update_det_obs_counts(
-                np.concatenate([det_samples, obs_samples], axis=1)
+        if num_workers == 1:
+            chunks = _iter_det_obs_key_chunks(
+                self._dem, num_shots=num_shots, seed=seed, step_size=step_size
             )
+            for keys in tqdm(chunks, total=((num_shots - 1) // step_size) + 1):
+                self._add_det_obs_keys(keys)
+            return
+
+        worker_seeds = [
+            int(child.generate_state(1, dtype=np.uint64)[0])
+            for child in np.random.SeedSequence(seed).spawn(num_workers)
+        ]
+        worker_shots = [
+            num_shots // num_workers + int(i < num_shots % num_workers)
+            for i in range(num_workers)
+        ]
+        dem_text = str(self._dem)
+        sparse = self._det_obs_keys is not None
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = [
+                executor.submit(
+                    _train_count_table,
+                    dem_text,
+                    num_shots=shots,
+                    seed=worker_seed,
+                    step_size=step_size,
+                    sparse=sparse,
+                )
+                for worker_seed, shots in zip(worker_seeds, worker_shots)
+                if shots
+            ]
+            for future in tqdm(futures):
+                self._merge_count_table(*future.result())
 
     def _update_det_obs_counts(self, det_obs_shots: np.ndarray) -> None:
         shots = np.asarray(det_obs_shots, dtype=np.uint8)
@@ -140,16 +358,40 @@ class TableDecoderWithConfidence(TableDecoder, ConfidenceDecoder):
                 f"Expected det_obs_shots with shape (N, {expected_width}), "
                 f"got {shots.shape}."
             )
-
-        step_counts = shots_to_counts(shots)
-        if np.any(step_counts > _COUNT_MAX - self._det_obs_counts):
-            raise OverflowError(
-                f"TableDecoder count table would exceed uint32 max ({_COUNT_MAX})."
+        self._add_det_obs_keys(_pack_det_obs_keys(shots))
+
+    def _add_det_obs_keys(self, keys: np.ndarray) -> None:
+        if self._det_obs_keys is None:
+            _add_dense_counts(self._det_obs_counts, keys)
+        else:
+            self._det_obs_keys, self._det_obs_counts = _add_sparse_counts(
+                self._det_obs_keys, self._det_obs_counts, keys
             )
-        self._det_obs_counts += step_counts.astype(_COUNT_DTYPE, copy=False)
+        self._invalidate_caches()
+
+    def _merge_count_table(self, keys: np.ndarray | None, counts: np.ndarray) -> None:
+        if self._det_obs_keys is None:
+            if np.any(counts > _COUNT_MAX - self._det_obs_counts):
+                raise OverflowError(
+                    "TableDecoder count table would exceed uint32 max "
+                    f"({_COUNT_MAX})."
+                )
+            self._det_obs_counts += counts
+        else:
+            assert keys is not None
+            self._det_obs_keys, self._det_obs_counts = _merge_sparse_counts(
+                self._det_obs_keys,
+                self._det_obs_counts,
+                keys,
+                counts.astype(np.uint64),
+            )
+        self._invalidate_caches()
+
+    def _invalidate_caches(self) -> None:
         self._is_cached_df = False
         self._is_cached_correction = False
         self._correction_confidence = None
+        self._syndrome_keys = None
 
     def decode(self, detector_bits: np.ndarray) -> np.ndarray:
         """Decode detector bits after validating the detector-shot width."""
@@ -160,7 +402,35 @@ class TableDecoderWithConfidence(TableDecoder, ConfidenceDecoder):
             allow_batch=True,
             method_name="decode",
         )
-        return super().decode(validated_bits)
+        if self._det_obs_keys is None:
+            return super().decode(validated_bits)
+
+        self._cache_correction()
+        assert self._maximum_likelihood_correction is not None
+        index, found = self._lookup_syndromes(validated_bits)
+        packed_correction = np.zeros(index.shape, dtype=_KEY_DTYPE)
+        packed_correction[found] = self._maximum_likelihood_correction[index[found]]
+        shifts = np.arange(self.num_observables, dtype=_KEY_DTYPE)
+        corrections = ((packed_correction[:, None] >> shifts) & _KEY_DTYPE(1)).astype(
+            np.bool_
+        )
+        return corrections[0] if validated_bits.ndim == 1 else corrections
+
+    def _lookup_syndromes(
+        self, detector_bits: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Locate detector syndromes in the sparse correction cache.
+
+        Returns an index into the cached arrays per shot, and whether that shot's
+        syndrome was ever observed; unobserved shots have a meaningless index.
+        """
+
+        assert self._syndrome_keys is not None
+        syndromes = _pack_det_obs_keys(np.atleast_2d(detector_bits))
+        index = np.searchsorted(self._syndrome_keys, syndromes)
+        found = index < self._syndrome_keys.size
+        found[found] = self._syndrome_keys[index[found]] == syndromes[found]
+        return index, found
 
     def cache_correction(self) -> None:
         # TableDecoder.decode dispatches to this method name, so keep the
@@ -172,6 +442,9 @@ class TableDecoderWithConfidence(TableDecoder, ConfidenceDecoder):
 
         if self._is_cached_correction and self._correction_confidence is not None:
             return
+        if self._det_obs_keys is not None:
+            self._cache_sparse_correction()
+            return
 
         # NOTE: this current implementation with cache both the correction AND the confidence
         # even if you don't use it (simplifies the implementation a bit). In the future,
@@ -195,6 +468,38 @@ class TableDecoderWithConfidence(TableDecoder, ConfidenceDecoder):
         self._correction_confidence = confidence
         self._is_cached_correction = True
 
+    def _cache_sparse_correction(self) -> None:
+        """Sparse counterpart of ``_cache_correction``, one row per seen syndrome.
+
+        Matches the dense ``argmax`` exactly: the most frequent observable
+        pattern wins and ties go to the smallest one.
+        """
+
+        assert self._det_obs_keys is not None
+        keys = self._det_obs_keys
+        counts = self._det_obs_counts
+        num_detectors = self.num_detectors
+        syndromes = keys & _KEY_DTYPE((1 << num_detectors) - 1)
+        if self.num_observables:
+            observables = keys >> _KEY_DTYPE(num_detectors)
+        else:
+            observables = np.zeros_like(keys)
+
+        order = np.lexsort((observables, -counts.astype(np.int64), syndromes))
+        syndromes = syndromes[order]
+        group_start = np.ones(syndromes.shape, dtype=np.bool_)
+        group_start[1:] = syndromes[1:] != syndromes[:-1]
+        starts = np.flatnonzero(group_start)
+        sorted_counts = counts[order].astype(np.uint64)
+        total_counts = np.add.reduceat(sorted_counts, starts)
+
+        self._syndrome_keys = syndromes[starts]
+        self._maximum_likelihood_correction = observables[order][starts]
+        self._correction_confidence = sorted_counts[starts].astype(
+            np.float64
+        ) / total_counts.astype(np.float64)
+        self._is_cached_correction = True
+
     def decode_with_confidence(
         self,
         detector_bits: np.ndarray,
@@ -209,6 +514,11 @@ class TableDecoderWithConfidence(TableDecoder, ConfidenceDecoder):
         )
         correction = np.asarray(self.decode(validated_bits), dtype=np.bool_)
         assert self._correction_confidence is not None
+        if self._det_obs_keys is not None:
+            index, found = self._lookup_syndromes(validated_bits)
+            if not found[0]:
+                return correction, np.float64(np.nan)
+            return correction, np.float64(self._correction_confidence[index[0]])
         packed = int(
             pack_boolean_array(
                 np.asarray(validated_bits, dtype=np.uint8).reshape(1, -1)
@@ -14,10 +14,11 @@ from typing import (
 )
 
 import numpy as np
-from bloqade.analysis.fidelity import FidelityAnalysis
 from kirin import ir
 from stim import DetectorErrorModel
 
+from bloqade.lanes.analysis import fidelity as fidelity_analysis
+
 from .simulator_backend import (
     AbstractSimulatorBackend,
     _get_tsim_circuit,
@@ -271,19 +272,18 @@ class _SimulatorTaskBase(Generic[RetType]):
     def fidelity_bounds(self) -> tuple[float, float]:
         """Compute the fidelity bounds for the physical squin kernel.
 
+        The bounds depend only on the compiled kernel, so they are computed
+        on the first call and reused by every later call and :meth:`run`.
+
         Returns:
             tuple[float, float]: The (min, max) fidelity bounds.
 
         """
-        analysis = FidelityAnalysis(self._physical_kernel.dialects)
-        analysis.run(self._physical_kernel)
-
-        min_fidelity = 1.0
-        max_fidelity = 1.0
-        for gate_fidelity in analysis.gate_fidelities:
-            min_fidelity *= gate_fidelity.min
-            max_fidelity *= gate_fidelity.max
-        return min_fidelity, max_fidelity
+        return self._fidelity_bounds
+
+    @cached_property
+    def _fidelity_bounds(self) -> tuple[float, float]:
+        return fidelity_analysis.fidelity_bounds(self._physical_kernel)
 
     @staticmethod
     def _normalize_matrix(payload: Any, *, name: str, shots: int) -> list[list[bool]]:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from functools import cached_property
 from typing import (
@@ -19,6 +20,7 @@ from ._task_runtime import (
 from .simulator_backend import AbstractSimulatorBackend, TsimSimulatorBackend
 
 if TYPE_CHECKING:
+    from bloqade.gemini.compile import BatchCompiler
     from bloqade.lanes.analysis import atom
     from bloqade.lanes.arch.spec import ArchSpec
     from bloqade.lanes.rewrite.move2squin.noise import LogicalNoiseModelABC
@@ -139,3 +141,53 @@ class GeminiLogicalSimulator:
             post_processing,
             self.backend,
         )
+
+    def tasks(
+        self,
+        logical_kernels: Sequence[ir.Method[[], Any]],
+        compiler: BatchCompiler | None = None,
+    ) -> list[GeminiLogicalSimulatorTask[Any]]:
+        """Create simulation tasks for independent kernels in one batch.
+
+        Equivalent to calling :meth:`task` on each kernel, but the kernels
+        are compiled in parallel worker processes (see
+        :class:`~bloqade.gemini.compile.BatchCompiler`).
+
+        Args:
+            logical_kernels (Sequence[ir.Method[[], Any]]): The logical squin
+                kernels to compile.
+            compiler (BatchCompiler | None): A compiler whose worker pool is
+                reused across batches. Defaults to a compiler that is shut down
+                once this batch is compiled.
+
+        Returns:
+            list[GeminiLogicalSimulatorTask[Any]]: The compiled tasks, in the
+                order of ``logical_kernels``.
+        """
+        if not all(isinstance(kernel, ir.Method) for kernel in logical_kernels):
+            raise TypeError("GeminiLogicalSimulator.tasks() requires Squin ir.Methods")
+
+        from bloqade.gemini.compile import BatchCompiler
+
+        if compiler is None:
+            with BatchCompiler() as batch_compiler:
+                compiled = batch_compiler.compile(logical_kernels)
+        else:
+            compiled = compiler.compile(logical_kernels)
+
+        return [
+            GeminiLogicalSimulatorTask(
+                logical_squin_kernel,
+                self.noise_model,
+                physical_arch_spec,
+                physical_move_kernel,
+                post_processing,
+                self.backend,
+            )
+            for (
+                logical_squin_kernel,
+                physical_arch_spec,
+                physical_move_kernel,
+                post_processing,
+            ) in compiled
+        ]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from functools import cached_property
 from types import MappingProxyType
 
@@ -170,6 +171,25 @@ class AtomStateData(RustWrapper[_RustAtomStateData]):
         """
         return AtomStateData.from_inner(self._inner.apply_validated(moves))
 
+    def apply_many(
+        self,
+        lane_layers: Sequence[tuple[LaneAddress, ...]],
+        arch_spec: ArchSpec,
+        validate: bool = True,
+    ) -> AtomStateData | None:
+        """Replay several lane groups in one call and return the final state.
+
+        Equivalent to chaining :meth:`validate_moves` and
+        :meth:`apply_validated` (or :meth:`apply_moves` when ``validate`` is
+        false) once per group, without building the intermediate states.
+        Returns None if ``validate`` is false and any lane is invalid.
+        """
+        rust_layers = [[lane._inner for lane in lanes] for lanes in lane_layers]
+        result = self._inner.apply_many(rust_layers, arch_spec._inner, validate)
+        if result is None:
+            return None
+        return AtomStateData.from_inner(result)
+
     def get_qubit(self, location: LocationAddress):
         return self._inner.get_qubit(location._inner)
 
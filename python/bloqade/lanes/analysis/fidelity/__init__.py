@@ -0,0 +1,4 @@
+from .analysis import (
+    ArrayFidelityAnalysis as ArrayFidelityAnalysis,
+    fidelity_bounds as fidelity_bounds,
+)
@@ -0,0 +1,114 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+from bloqade.analysis.address import AddressReg
+from bloqade.analysis.fidelity import FidelityAnalysis, FidelityRange
+from kirin import ir
+
+
+@dataclass
+class ArrayFidelityAnalysis(FidelityAnalysis):
+    """:class:`FidelityAnalysis` that defers the per-statement fidelity products.
+
+    The upstream analysis multiplies each noise statement's fidelity into
+    every addressed qubit's :class:`FidelityRange` as the statement is
+    visited. This subclass only records ``(qubit, fidelity)`` pairs while the
+    IR is walked and folds them into the ranges as one log-sum per qubit
+    whenever the ranges are observed: before a branch resets them and after
+    :meth:`run` returns. The statement handlers and branch semantics are the
+    upstream ones, so ``gate_fidelities`` and ``qubit_survival_fidelities``
+    hold the same values once :meth:`run` is done.
+
+    Fidelities are clamped at zero before taking the logarithm.
+    """
+
+    _gate_qubits: list[int] = field(init=False, default_factory=list)
+    _gate_factors: list[float] = field(init=False, default_factory=list)
+    _survival_qubits: list[int] = field(init=False, default_factory=list)
+    _survival_factors: list[float] = field(init=False, default_factory=list)
+
+    def initialize(self):
+        for pending in (
+            self._gate_qubits,
+            self._gate_factors,
+            self._survival_qubits,
+            self._survival_factors,
+        ):
+            pending.clear()
+        return super().initialize()
+
+    def run(self, method: ir.Method, *args, **kwargs):
+        result = super().run(method, *args, **kwargs)
+        self.flush()
+        return result
+
+    def update_fidelities(  # type: ignore[override]
+        self,
+        fidelities: list[FidelityRange],
+        fidelity: float,
+        addresses: AddressReg,
+    ):
+        if fidelities is self.gate_fidelities:
+            qubits, factors = self._gate_qubits, self._gate_factors
+        elif fidelities is self.qubit_survival_fidelities:
+            qubits, factors = self._survival_qubits, self._survival_factors
+        else:
+            FidelityAnalysis.update_fidelities(fidelities, fidelity, addresses)
+            return
+        qubits.extend(addresses.data)
+        factors.extend([fidelity] * len(addresses.data))
+
+    def reset_fidelities(self):
+        # The branch handler keeps references to the current ranges across
+        # the reset, so they must be complete before new ones replace them.
+        self.flush()
+        super().reset_fidelities()
+
+    def flush(self):
+        """Fold the recorded fidelities into the current ranges."""
+        _fold(self.gate_fidelities, self._gate_qubits, self._gate_factors)
+        _fold(
+            self.qubit_survival_fidelities,
+            self._survival_qubits,
+            self._survival_factors,
+        )
+
+
+def _fold(
+    fidelities: list[FidelityRange], qubits: list[int], factors: list[float]
+) -> None:
+    if len(qubits) == 0:
+        return
+    with np.errstate(divide="ignore"):
+        log_factors = np.log(np.maximum(np.asarray(factors, dtype=np.float64), 0.0))
+    scales = np.exp(
+        np.bincount(
+            np.asarray(qubits, dtype=np.int64),
+            weights=log_factors,
+            minlength=len(fidelities),
+        )
+    )
+    for fidelity, scale in zip(fidelities, scales.tolist()):
+        fidelity.min *= scale
+        fidelity.max *= scale
+    qubits.clear()
+    factors.clear()
+
+
+def fidelity_bounds(kernel: ir.Method) -> tuple[float, float]:
+    """Return the ``(min, max)`` product of the per-qubit gate fidelities.
+
+    The kernel is analyzed once with :class:`ArrayFidelityAnalysis` and the
+    products over qubits are taken as a log-sum.
+    """
+    analysis = ArrayFidelityAnalysis(kernel.dialects)
+    analysis.run(kernel)
+    ranges = np.array(
+        [(fidelity.min, fidelity.max) for fidelity in analysis.gate_fidelities],
+        dtype=np.float64,
+    ).reshape(-1, 2)
+    with np.errstate(divide="ignore"):
+        min_fidelity, max_fidelity = np.exp(
+            np.log(np.maximum(ranges, 0.0)).sum(axis=0)
+        ).tolist()
+    return min_fidelity, max_fidelity
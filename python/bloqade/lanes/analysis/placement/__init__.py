@@ -13,7 +13,16 @@ from .lattice import (
     Permuted as Permuted,
     UserMoved as UserMoved,
 )
+from .memo import (
+    MemoizedPlacementStrategy as MemoizedPlacementStrategy,
+    PlacementMemo as PlacementMemo,
+)
+from .profile import (
+    CZStageProfile as CZStageProfile,
+    ProfiledPlacementStrategy as ProfiledPlacementStrategy,
+)
 from .strategy import (
+    DelegatingPlacementStrategy as DelegatingPlacementStrategy,
     MoveToPlacementStrategyABC as MoveToPlacementStrategyABC,
     PalindromePlacementStrategy as PalindromePlacementStrategy,
     PlacementStrategyABC as PlacementStrategyABC,
@@ -0,0 +1,299 @@
+"""Memoization of CZ-stage placements across kernels.
+
+Benchmark suites and parameter sweeps place the same CZ stage — the same
+atom positions, move counts, CZ pairs and lookahead — many times.
+``PlacementMemo`` is a bounded LRU keyed by a canonical stage signature and
+``MemoizedPlacementStrategy`` wraps any strategy to consult it before
+solving. Signatures are written in terms of locations rather than qubit ids,
+so a stage reached by a relabelled register in another kernel still hits.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+from functools import cached_property
+from pathlib import Path
+
+from bloqade.lanes.bytecode._native import (
+    LaneAddress as _RustLaneAddress,
+    LocationAddress as _RustLocationAddress,
+    ZoneAddress as _RustZoneAddress,
+)
+from bloqade.lanes.bytecode.encoding import LaneAddress, LocationAddress, ZoneAddress
+
+from .lattice import AtomState, ConcreteState, ExecuteCZ
+from .strategy import DelegatingPlacementStrategy, PlacementStrategyABC
+
+StageKey = tuple[object, ...]
+"""Canonical stage signature; nested tuples of strings and packed addresses."""
+
+StageEntry = tuple[
+    tuple[tuple[int, int, int], ...],
+    tuple[tuple[int, ...], ...],
+    tuple[int, ...],
+]
+"""``(atom moves, move layers, active CZ zones)`` with packed addresses.
+
+Each atom move is ``(source, destination, move-count increment)`` for an atom
+the stage moved or charged a move to.
+"""
+
+_FORMAT_VERSION = 2
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _config_repr(value: object) -> str:
+    """A process-independent description of a strategy's configuration.
+
+    Strategies are described by their class and public configuration
+    (dataclass ``init``/``repr`` fields, or public attributes otherwise), with
+    nested strategies expanded recursively. ``arch_spec`` is left out; it is
+    hashed separately.
+    """
+    if not isinstance(value, PlacementStrategyABC):
+        return repr(value)
+    if is_dataclass(value):
+        items = [
+            (f.name, getattr(value, f.name))
+            for f in fields(value)
+            if f.init and f.repr and f.name != "arch_spec"
+        ]
+    else:
+        items = [
+            (name, attr)
+            for name, attr in vars(value).items()
+            if not name.startswith("_") and name != "arch_spec"
+        ]
+    body = ", ".join(f"{name}={_config_repr(attr)}" for name, attr in items)
+    return f"{type(value).__module__}.{type(value).__qualname__}({body})"
+
+
+def _canonical_layers(
+    layout: tuple[LocationAddress, ...],
+    layers: tuple[tuple[tuple[int, ...], tuple[int, ...]], ...],
+) -> tuple[tuple[tuple[int, int], ...], ...]:
+    """CZ layers as sorted ``(control, target)`` location pairs."""
+    return tuple(
+        tuple(
+            sorted(
+                (layout[c].encode(), layout[t].encode())
+                for c, t in zip(controls, targets)
+            )
+        )
+        for controls, targets in layers
+    )
+
+
+def _to_tuple(value: object) -> object:
+    if isinstance(value, list):
+        return tuple(_to_tuple(item) for item in value)
+    return value
+
+
+class PlacementMemo:
+    """Bounded LRU of solved CZ stages, optionally persisted to disk.
+
+    A memo may be shared by any number of ``MemoizedPlacementStrategy``
+    instances; the stage signature includes the strategy configuration and
+    architecture, so entries from different strategies never collide. With a
+    ``path``, existing entries are loaded on construction and ``save`` writes
+    the memo back as JSON.
+    """
+
+    def __init__(self, max_entries: int = 4096, path: str | Path | None = None):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        self.max_entries = max_entries
+        self.path = None if path is None else Path(path)
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[StageKey, StageEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            self.load(self.path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: StageKey) -> StageEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: StageKey, entry: StageEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def load(self, path: str | Path) -> None:
+        """Merge the entries stored at ``path``, keeping the most recent ones."""
+        data = json.loads(Path(path).read_text())
+        if data.get("version") != _FORMAT_VERSION:
+            raise ValueError(
+                f"unsupported placement memo format {data.get('version')!r} "
+                f"in {path}, expected {_FORMAT_VERSION}"
+            )
+        for key, entry in data["entries"]:
+            self.put(_to_tuple(key), _to_tuple(entry))  # type: ignore[arg-type]
+
+    def save(self, path: str | Path | None = None) -> None:
+        """Write the memo to ``path`` (default: the memo's own ``path``).
+
+        The file is replaced atomically so concurrent readers never observe a
+        partial write.
+        """
+        target = self.path if path is None else Path(path)
+        if target is None:
+            raise ValueError("PlacementMemo.save needs a path")
+        with self._lock:
+            entries = list(self._entries.items())
+        text = json.dumps({"version": _FORMAT_VERSION, "entries": entries})
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        tmp.write_text(text)
+        os.replace(tmp, target)
+
+
+class MemoizedPlacementStrategy(DelegatingPlacementStrategy):
+    """Wraps a placement strategy to reuse CZ-stage solutions from a memo.
+
+    ``cz_placements`` looks up the stage signature — the locations of the
+    qubit atoms with their move counts, the external occupied locations, the
+    CZ and lookahead layers as location pairs, the inner strategy's
+    configuration and the architecture — and replays the stored moves on a
+    hit. Move counts are part of the signature because solvers use them to
+    choose which atom of a pair moves. On a miss it
+    delegates to ``inner`` and records plain ``ExecuteCZ`` results. A replayed
+    placement is the one solved for the first kernel that reached the stage,
+    so it is valid but may differ from what the solver would return for a
+    relabelled register.
+
+    All other methods delegate to ``inner``. Wrap the solver strategy, not a
+    ``PalindromePlacementStrategy``: the palindrome return is derived from the
+    incoming state and is cheap to recompute.
+    """
+
+    def __init__(
+        self, *, inner: PlacementStrategyABC, memo: PlacementMemo | None = None
+    ) -> None:
+        super().__init__(inner=inner)
+        self.memo = PlacementMemo() if memo is None else memo
+
+    @cached_property
+    def _strategy_key(self) -> tuple[str, str]:
+        return (
+            _digest(_config_repr(self.inner)),
+            _digest(self.arch_spec.to_json()),
+        )
+
+    def stage_key(
+        self,
+        state: ConcreteState,
+        controls: tuple[int, ...],
+        targets: tuple[int, ...],
+        lookahead_cz_layers: tuple[tuple[tuple[int, ...], tuple[int, ...]], ...],
+    ) -> StageKey:
+        """The canonical signature of placing ``controls``/``targets`` from
+        ``state``."""
+        layout = state.layout
+        return (
+            *self._strategy_key,
+            tuple(
+                sorted(
+                    (loc.encode(), count)
+                    for loc, count in zip(layout, state.move_count, strict=True)
+                )
+            ),
+            tuple(sorted(loc.encode() for loc in state.occupied)),
+            _canonical_layers(layout, ((controls, targets),))[0],
+            _canonical_layers(layout, lookahead_cz_layers),
+        )
+
+    def cz_placements(
+        self,
+        state: AtomState,
+        controls: tuple[int, ...],
+        targets: tuple[int, ...],
+        lookahead_cz_layers: tuple[tuple[tuple[int, ...], tuple[int, ...]], ...] = (),
+    ) -> AtomState:
+        home = self._unwrap_cz_input(state)
+        if not isinstance(home, ConcreteState) or len(controls) != len(targets):
+            return self.inner.cz_placements(
+                state, controls, targets, lookahead_cz_layers
+            )
+
+        key = self.stage_key(home, controls, targets, lookahead_cz_layers)
+        if (entry := self.memo.get(key)) is not None:
+            return self._replay(home, entry)
+
+        result = self.inner.cz_placements(state, controls, targets, lookahead_cz_layers)
+        if type(result) is ExecuteCZ:
+            self.memo.put(key, self._record(home, result))
+        return result
+
+    @staticmethod
+    def _record(state: ConcreteState, result: ExecuteCZ) -> StageEntry:
+        moves = tuple(
+            (src.encode(), dst.encode(), after - before)
+            for src, dst, before, after in zip(
+                state.layout, result.layout, state.move_count, result.move_count
+            )
+            if src != dst or after != before
+        )
+        return (
+            moves,
+            tuple(
+                tuple(lane.encode() for lane in layer) for layer in result.move_layers
+            ),
+            tuple(sorted(zone.encode() for zone in result.active_cz_zones)),
+        )
+
+    @staticmethod
+    def _replay(state: ConcreteState, entry: StageEntry) -> ExecuteCZ:
+        moves, move_layers, zones = entry
+        by_source = {src: (dst, delta) for src, dst, delta in moves}
+        layout: list[LocationAddress] = []
+        move_count: list[int] = []
+        for loc, count in zip(state.layout, state.move_count):
+            if (move := by_source.get(loc.encode())) is None:
+                layout.append(loc)
+                move_count.append(count)
+            else:
+                dst, delta = move
+                layout.append(
+                    LocationAddress.from_inner(_RustLocationAddress.decode(dst))
+                )
+                move_count.append(count + delta)
+        return ExecuteCZ(
+            occupied=state.occupied,
+            layout=tuple(layout),
+            move_count=tuple(move_count),
+            active_cz_zones=frozenset(
+                ZoneAddress.from_inner(_RustZoneAddress.decode(zone)) for zone in zones
+            ),
+            move_layers=tuple(
+                tuple(
+                    LaneAddress.from_inner(_RustLaneAddress.decode(lane))
+                    for lane in layer
+                )
+                for layer in move_layers
+            ),
+        )
@@ -0,0 +1,91 @@
+"""Per-CZ-stage timing of a placement strategy.
+
+``ProfiledPlacementStrategy`` wraps any strategy and records one
+``CZStageProfile`` per ``cz_placements`` call: the wall time of the call and,
+for strategies backed by the Rust solver, how many search nodes it expanded
+and whether it fell back to the entropy-exhaustion router.
+"""
+
+import time
+from dataclasses import dataclass
+
+from .lattice import AtomState
+from .strategy import DelegatingPlacementStrategy, PlacementStrategyABC
+
+
+@dataclass(frozen=True)
+class CZStageProfile:
+    """Profile of a single ``cz_placements`` call."""
+
+    start_s: float
+    """``time.perf_counter()`` at the start of the call."""
+    wall_time_s: float
+    """Wall time spent placing the stage, including nested strategies."""
+    num_pairs: int
+    """Number of CZ pairs in the stage."""
+    nodes_expanded: int | None
+    """Solver node expansions, or ``None`` if the strategy does not count them."""
+    fallbacks: int | None
+    """Entropy-fallback solves, or ``None`` if the strategy does not count them."""
+
+
+def _counter(strategy: PlacementStrategyABC, name: str) -> int | None:
+    """Read ``name`` from the first strategy in the ``inner`` chain that has it."""
+    current: object = strategy
+    while current is not None:
+        value = getattr(current, name, None)
+        if isinstance(value, int):
+            return value
+        current = getattr(current, "inner", None)
+    return None
+
+
+class ProfiledPlacementStrategy(DelegatingPlacementStrategy):
+    """Wraps a placement strategy to profile every CZ stage it places.
+
+    Profiles are appended to ``stages`` in call order. Node expansion and
+    fallback counts are differences of the running totals exposed by the
+    Rust-backed strategies (``rust_nodes_expanded_total`` and
+    ``rust_entropy_fallback_count``), looked up through the ``inner`` chain;
+    they are ``None`` for strategies that expose neither.
+
+    All other methods delegate to ``inner``.
+    """
+
+    def __init__(self, *, inner: PlacementStrategyABC) -> None:
+        super().__init__(inner=inner)
+        self.stages: list[CZStageProfile] = []
+
+    def cz_placements(
+        self,
+        state: AtomState,
+        controls: tuple[int, ...],
+        targets: tuple[int, ...],
+        lookahead_cz_layers: tuple[tuple[tuple[int, ...], tuple[int, ...]], ...] = (),
+    ) -> AtomState:
+        nodes_before = _counter(self.inner, "rust_nodes_expanded_total")
+        fallbacks_before = _counter(self.inner, "rust_entropy_fallback_count")
+        start = time.perf_counter()
+        result = self.inner.cz_placements(state, controls, targets, lookahead_cz_layers)
+        wall_time = time.perf_counter() - start
+
+        nodes_after = _counter(self.inner, "rust_nodes_expanded_total")
+        fallbacks_after = _counter(self.inner, "rust_entropy_fallback_count")
+        self.stages.append(
+            CZStageProfile(
+                start_s=start,
+                wall_time_s=wall_time,
+                num_pairs=len(controls),
+                nodes_expanded=(
+                    None
+                    if nodes_before is None or nodes_after is None
+                    else nodes_after - nodes_before
+                ),
+                fallbacks=(
+                    None
+                    if fallbacks_before is None or fallbacks_after is None
+                    else fallbacks_after - fallbacks_before
+                ),
+            )
+        )
+        return result
@@ -57,6 +57,16 @@ class PlacementStrategyABC(abc.ABC):
 
     arch_spec: ArchSpec
 
+    @property
+    def returns_to_entry_layout(self) -> bool:
+        """Whether every placed block ends with the atoms in its entry layout.
+
+        Loop-preserving compilation places the body of a ``place.Repeat`` once
+        and reuses it for every iteration, which is only valid when this holds.
+        Defaults to ``False``.
+        """
+        return False
+
     @abc.abstractmethod
     def validate_initial_layout(
         self,
@@ -398,6 +408,91 @@ class SingleZonePlacementStrategyABC(MoveToPlacementStrategyABC):
         return self._strip_user_moved(state)
 
 
+class DelegatingPlacementStrategy(MoveToPlacementStrategyABC):
+    """Base for strategies that wrap ``inner`` and delegate every method to it.
+
+    Subclasses override only the methods they change. User-directed movement
+    is forwarded when ``inner`` is a ``MoveToPlacementStrategyABC`` and
+    rejected otherwise.
+    """
+
+    def __init__(self, *, inner: PlacementStrategyABC) -> None:
+        self.inner = inner
+
+    @property  # type: ignore[reportIncompatibleVariableOverride]
+    def arch_spec(self) -> ArchSpec:  # type: ignore[reportIncompatibleVariableOverride]
+        return self.inner.arch_spec
+
+    @property
+    def returns_to_entry_layout(self) -> bool:
+        return self.inner.returns_to_entry_layout
+
+    def _move_to_inner(self, requested: str) -> MoveToPlacementStrategyABC:
+        if not isinstance(self.inner, MoveToPlacementStrategyABC):
+            raise PlacementError(
+                f"{type(self).__name__} inner strategy "
+                f"{type(self.inner).__name__} does not support user-directed "
+                "movement (not a MoveToPlacementStrategyABC), but a "
+                f"{requested} was requested"
+            )
+        return self.inner
+
+    def validate_initial_layout(
+        self, initial_layout: tuple[LocationAddress, ...]
+    ) -> None:
+        self.inner.validate_initial_layout(initial_layout)
+
+    def cz_placements(
+        self,
+        state: AtomState,
+        controls: tuple[int, ...],
+        targets: tuple[int, ...],
+        lookahead_cz_layers: tuple[tuple[tuple[int, ...], tuple[int, ...]], ...] = (),
+    ) -> AtomState:
+        return self.inner.cz_placements(state, controls, targets, lookahead_cz_layers)
+
+    def sq_placements(self, state: AtomState, qubits: tuple[int, ...]) -> AtomState:
+        return self.inner.sq_placements(state, qubits)
+
+    def measure_placements(
+        self, state: AtomState, qubits: tuple[int, ...]
+    ) -> AtomState:
+        return self.inner.measure_placements(state, qubits)
+
+    def compute_moves(
+        self,
+        state_before: ConcreteState,
+        state_after: ConcreteState,
+    ) -> tuple[tuple[LaneAddress, ...], ...]:
+        if not isinstance(self.inner, MoveToPlacementStrategyABC):
+            raise NotImplementedError(
+                f"inner strategy {type(self.inner).__name__} does not support "
+                "user-directed movement (not a MoveToPlacementStrategyABC)"
+            )
+        return self.inner.compute_moves(state_before, state_after)
+
+    def move_to_placements(
+        self,
+        state: AtomState,
+        qubits: tuple[int, ...],
+        locations: tuple[LocationAddress, ...],
+    ) -> AtomState:
+        return self._move_to_inner("move_to").move_to_placements(
+            state, qubits, locations
+        )
+
+    def permute_placements(
+        self,
+        state: AtomState,
+        qubits: tuple[int, ...],
+        permutation: tuple[int, ...],
+        insert_moves: bool = False,
+    ) -> AtomState:
+        return self._move_to_inner("permute").permute_placements(
+            state, qubits, permutation, insert_moves=insert_moves
+        )
+
+
 class PalindromePlacementStrategy(MoveToPlacementStrategyABC):
     """Wraps any PlacementStrategyABC to emit ExecuteCZReturn for every CZ.
 
@@ -429,6 +524,11 @@ class PalindromePlacementStrategy(MoveToPlacementStrategyABC):
     def arch_spec(self) -> ArchSpec:  # type: ignore[reportIncompatibleVariableOverride]
         return self.inner.arch_spec
 
+    @property
+    def returns_to_entry_layout(self) -> bool:
+        # every CZ is followed by its return moves
+        return True
+
     def _unwrap(self, state: AtomState) -> AtomState:
         """Return home ConcreteState when state is ExecuteCZReturn, else pass through."""
         if isinstance(state, ExecuteCZReturn):
@@ -14,6 +14,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from bloqade.lanes.bytecode._native import ArchSpec as _RustArchSpec
 from bloqade.lanes.bytecode.encoding import Direction, LaneAddress, MoveType
 
@@ -90,6 +92,41 @@ class ArchSpecGeometry:
                     sites.append((x, y))
         return sites
 
+    def location_positions(self) -> np.ndarray:
+        """Physical position of every location, indexed by location ordinal.
+
+        Returns:
+            A read-only ``float64`` array of shape ``(num_locations, 2)``
+            holding ``(x, y)``, NaN where a location has no position. Use
+            ``location_ordinal`` on the Rust spec to index it.
+        """
+        table = np.frombuffer(self._inner.location_position_table(), dtype="<f8")
+        return table.reshape(-1, 2)
+
+    def cz_partner_ordinals(self) -> np.ndarray:
+        """CZ partner of every location, indexed by location ordinal.
+
+        Returns:
+            A read-only ``int64`` array of partner ordinals, ``-1`` where a
+            location has no partner.
+        """
+        return np.frombuffer(self._inner.cz_partner_table(), dtype="<i8")
+
+    def lane_endpoint_ordinals(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Every valid lane of the architecture with its endpoints.
+
+        Returns:
+            Read-only ``(lanes, src, dst)`` arrays: ``uint64`` encoded lane
+            addresses (see ``LaneAddress.decode``) and ``int64`` source and
+            destination location ordinals.
+        """
+        lanes, src, dst = self._inner.lane_table()
+        return (
+            np.frombuffer(lanes, dtype="<u8"),
+            np.frombuffer(src, dtype="<i8"),
+            np.frombuffer(dst, dtype="<i8"),
+        )
+
     def get_available_buses(self, zone_id: int) -> list[BusDescriptor]:
         """Enumerate all valid bus descriptors for a zone.
 
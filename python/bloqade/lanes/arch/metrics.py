@@ -1,8 +1,11 @@
 import itertools
 import math
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+
 from bloqade.lanes.bytecode import MotionModel
 
 
@@ -15,9 +18,12 @@ class MoveMetricCalculator:
     :class:`~bloqade.lanes.bytecode.MotionModel`, the single source of truth
     shared with the move-search solver.  This calculator delegates all timing
     to that object (defaulting to the FLAIR constants) and adds cached lane
-    duration / cost lookups on top.  Lives in the ``arch`` package so that
-    ``PathFinder`` and heuristics can consume it without pulling in the heavy
-    compilation imports of ``Metrics``.
+    duration / cost lookups on top: a dense duration vector over every lane
+    ordinal of the arch, computed once per amplitude in Rust, backs the
+    vectorized ``lane_durations_us`` / ``layer_move_times_us`` queries.
+    Lives in the ``arch`` package so that ``PathFinder`` and heuristics can
+    consume it without pulling in the heavy compilation imports of
+    ``Metrics``.
 
     Pass a non-default ``motion_model`` to price durations with a different
     motion profile.
@@ -29,6 +35,7 @@ class MoveMetricCalculator:
     def __post_init__(self) -> None:
         self._lane_duration_cache_us: dict[tuple[Any, float], float] = {}
         self._max_lane_duration_cache_us: dict[float, float] = {}
+        self._lane_duration_table_us: dict[float, np.ndarray] = {}
 
     def path_segment_distances_um(
         self, path: tuple[tuple[float, float], ...]
@@ -55,8 +62,76 @@ class MoveMetricCalculator:
         self._lane_duration_cache_us[cache_key] = duration_us
         return duration_us
 
-    def _iter_lane_addresses(self) -> tuple[Any, ...]:
-        return tuple(self.arch_spec.iter_all_lanes())
+    def lane_duration_table_us(self, *, amplitude_delta: float = 1.0) -> np.ndarray:
+        """Duration (µs) of every lane of the arch, indexed by lane ordinal.
+
+        Lane ordinals are the rows of ``ArchSpec.lane_table`` (see
+        :meth:`lane_ordinals`). Computed in one native call per amplitude
+        and cached; the returned array is read-only.
+        """
+        normalized_amp = abs(float(amplitude_delta))
+        if (table := self._lane_duration_table_us.get(normalized_amp)) is None:
+            table = np.frombuffer(
+                self.motion_model.lane_duration_table(
+                    self.arch_spec._inner, normalized_amp
+                ),
+                dtype="<f8",
+            )
+            self._lane_duration_table_us[normalized_amp] = table
+        return table
+
+    def lane_ordinals(self, lanes: Sequence[Any]) -> np.ndarray:
+        """Lane ordinal of every lane in ``lanes``, ``-1`` for invalid lanes."""
+        encoded = np.fromiter(
+            (lane.encode() for lane in lanes), dtype="<u8", count=len(lanes)
+        )
+        return np.frombuffer(
+            self.arch_spec._inner.lane_ordinals(encoded.tobytes()), dtype="<i8"
+        )
+
+    def lane_durations_us(
+        self, lanes: Sequence[Any], *, amplitude_delta: float = 1.0
+    ) -> np.ndarray:
+        """Durations (µs) of ``lanes``, gathered from the duration table.
+
+        Lanes that are not valid in the arch fall back to
+        :meth:`get_lane_duration_us`.
+        """
+        table = self.lane_duration_table_us(amplitude_delta=amplitude_delta)
+        ordinals = self.lane_ordinals(lanes)
+        valid = ordinals >= 0
+        durations = np.empty(len(ordinals))
+        durations[valid] = table[ordinals[valid]]
+        for index in np.flatnonzero(~valid).tolist():
+            durations[index] = self.get_lane_duration_us(
+                lanes[index], amplitude_delta=amplitude_delta
+            )
+        return durations
+
+    def layer_move_times_us(
+        self,
+        lanes: Sequence[Any],
+        offsets: Sequence[int],
+        *,
+        amplitude_delta: float = 1.0,
+    ) -> tuple[np.ndarray, float]:
+        """Per-layer and total move time (µs) of a sequence of lane layers.
+
+        ``lanes`` is every layer's lanes back to back; layer ``k`` is
+        ``lanes[offsets[k]:offsets[k + 1]]``. A layer lasts as long as its
+        slowest lane, and an empty layer takes no time.
+
+        Returns:
+            A ``float64`` array of layer durations and their sum.
+        """
+        durations = self.lane_durations_us(lanes, amplitude_delta=amplitude_delta)
+        bounds = np.asarray(offsets, dtype=np.int64)
+        starts, stops = bounds[:-1], bounds[1:]
+        layer_times = np.zeros(len(starts))
+        non_empty = stops > starts
+        if non_empty.any():
+            layer_times[non_empty] = np.maximum.reduceat(durations, starts[non_empty])
+        return layer_times, float(layer_times.sum())
 
     def _max_lane_duration_us(self, *, amplitude_delta: float = 1.0) -> float:
         normalized_amp = abs(float(amplitude_delta))
@@ -65,14 +140,8 @@ class MoveMetricCalculator:
         ) is not None:
             return max_duration_us
 
-        lane_addresses = self._iter_lane_addresses()
-        if len(lane_addresses) == 0:
-            max_duration_us = 0.0
-        else:
-            max_duration_us = max(
-                self.get_lane_duration_us(lane, amplitude_delta=normalized_amp)
-                for lane in lane_addresses
-            )
+        table = self.lane_duration_table_us(amplitude_delta=normalized_amp)
+        max_duration_us = float(np.nanmax(table)) if len(table) else 0.0
         self._max_lane_duration_cache_us[normalized_amp] = max_duration_us
         return max_duration_us
 
@@ -5,6 +5,8 @@ from functools import cached_property
 from types import MappingProxyType
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from bloqade.lanes.bytecode._native import (
     ArchSpec as _RustArchSpec,
     LaneAddress as _RustLaneAddress,
@@ -31,6 +33,21 @@ if TYPE_CHECKING:
     from bloqade.lanes.bytecode.exceptions import LaneGroupError, LocationGroupError
 
 
+def _pack_groups(
+    groups: Sequence[Sequence[LocationAddress]] | Sequence[Sequence[LaneAddress]],
+) -> tuple[bytes, bytes]:
+    """Encoded addresses of ``groups`` and their boundaries, as ``uint64``
+    buffers."""
+    offsets = np.zeros(len(groups) + 1, dtype="<u8")
+    np.cumsum([len(group) for group in groups], out=offsets[1:])
+    encoded = np.fromiter(
+        (address.encode() for group in groups for address in group),
+        dtype="<u8",
+        count=int(offsets[-1]),
+    )
+    return encoded.tobytes(), offsets.tobytes()
+
+
 class ArchSpec(RustWrapper[_RustArchSpec]):
     """Architecture specification for a quantum device."""
 
@@ -379,6 +396,25 @@ class ArchSpec(RustWrapper[_RustArchSpec]):
         rust_addrs = [lane._inner for lane in lanes]
         return self._inner.check_lanes(rust_addrs)
 
+    def check_many(
+        self,
+        location_groups: Sequence[Sequence[LocationAddress]] = (),
+        lane_groups: Sequence[Sequence[LaneAddress]] = (),
+    ) -> tuple[list[tuple[int, LocationGroupError]], list[tuple[int, LaneGroupError]]]:
+        """Validate many location and lane groups in a single Rust call.
+
+        Equivalent to calling :meth:`check_location_group` on every location
+        group and :meth:`check_lane_group` on every lane group, but the groups
+        are passed as flat buffers and checked in parallel.
+
+        Returns:
+            ``(location_errors, lane_errors)``: ``(group index, error)`` pairs
+            in group order.
+        """
+        locations, location_offsets = _pack_groups(location_groups)
+        lanes, lane_offsets = _pack_groups(lane_groups)
+        return self._inner.check_many(locations, location_offsets, lanes, lane_offsets)
+
     def get_lane_address(
         self, src: LocationAddress, dst: LocationAddress
     ) -> LaneAddress | None:
@@ -5,6 +5,9 @@ bytecode programs targeting the Bloqade quantum computing platform.
 
 Core types:
     - :class:`Program` -- bytecode program (construct, parse, serialize, validate)
+    - :class:`ProgramReplay` -- columnar record of :meth:`Program.replay`
+    - :mod:`~bloqade.lanes.bytecode.columns` -- NumPy instruction columns
+      (:meth:`Program.to_columns` / :meth:`Program.from_columns`)
     - :class:`Instruction` -- individual bytecode instruction (factory methods)
     - :class:`ArchSpec` -- device architecture specification
 
@@ -66,6 +69,7 @@ from bloqade.lanes.bytecode._native import (
     PolicyRunner as PolicyRunner,
     PolicySolveResult as PolicySolveResult,
     Program as Program,
+    ProgramReplay as ProgramReplay,
     RecedingHorizonCzPlacement as RecedingHorizonCzPlacement,
     RecedingHorizonOptions as RecedingHorizonOptions,
     SearchEngine as SearchEngine,
@@ -78,6 +82,7 @@ from bloqade.lanes.bytecode._native import (
     TargetSolver as TargetSolver,
     TransportPath as TransportPath,
     ValidatedMoves as ValidatedMoves,
+    WarmStart as WarmStart,
     Word as Word,
     WordBus as WordBus,
     Zone as Zone,
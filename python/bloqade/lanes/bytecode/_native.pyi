@@ -669,6 +669,25 @@ class MotionModel:
         """
         ...
 
+    def lane_duration_table(
+        self, arch: ArchSpec, amplitude_delta: float = 1.0
+    ) -> bytes:
+        """Duration (µs) of every lane of ``arch``, indexed by lane ordinal.
+
+        Lanes are priced over their transport path, or the straight segment
+        between their endpoints when they have none.
+
+        Args:
+            arch (ArchSpec): Architecture whose lanes to price.
+            amplitude_delta (float): Pick/drop amplitude. Default: 1.0.
+
+        Returns:
+            bytes: Little-endian ``float64`` buffer aligned with the rows of
+                :meth:`ArchSpec.lane_table`; NaN where an endpoint has no
+                position.
+        """
+        ...
+
     def __repr__(self) -> str: ...
     def __eq__(self, other: object) -> bool: ...
 
@@ -929,9 +948,8 @@ class ArchSpec:
     ) -> Optional[LaneAddress]:
         """Reverse-lookup: find the lane connecting ``src`` to ``dst``.
 
-        Searches SiteBus, WordBus, and ZoneBus lanes. Exploits the
-        LaneAddr encoding to narrow the search to
-        ``O(site_buses + word_buses + zone_buses)`` per direction.
+        Answered from the spec's precomputed lookup tables; picks the same
+        lane as a search over SiteBus, WordBus, then ZoneBus lanes.
 
         Args:
             src (LocationAddress): Source location.
@@ -949,6 +967,57 @@ class ArchSpec:
         zone matches ``zone_id`` and the word/site are in range, else None.
         """
         ...
+    # -- Bulk lookup tables --
+    #
+    # Built once per ArchSpec (eagerly by ``from_json_validated``) and
+    # returned as little-endian byte buffers for ``numpy.frombuffer``; see
+    # ``bloqade.lanes.arch.geometry.ArchSpecGeometry`` for NumPy views.
+
+    @property
+    def num_locations(self) -> int:
+        """Number of location ordinals: ``zones × words × sites_per_word``."""
+        ...
+
+    def location_ordinal(self, loc: LocationAddress) -> Optional[int]:
+        """Dense ordinal of a location, or None if it is out of range.
+
+        Zone-major: ``(zone_id * num_words + word_id) * sites_per_word +
+        site_id``.
+        """
+        ...
+
+    def location_position_table(self) -> bytes:
+        """``float64`` ``(x, y)`` per location ordinal, NaN where unresolvable."""
+        ...
+
+    def cz_partner_table(self) -> bytes:
+        """``int64`` CZ-partner ordinal per location ordinal, ``-1`` for none."""
+        ...
+
+    def lane_table(self) -> tuple[bytes, bytes, bytes]:
+        """Every valid lane with its endpoints.
+
+        Returns:
+            tuple[bytes, bytes, bytes]: Parallel buffers of ``uint64`` encoded
+                lane addresses and ``int64`` source and destination location
+                ordinals.
+        """
+        ...
+
+    def lane_ordinals(self, lanes: bytes) -> bytes:
+        """Lane ordinal (row of :meth:`lane_table`) of every encoded lane.
+
+        Args:
+            lanes (bytes): Little-endian ``uint64`` encoded lane addresses.
+
+        Returns:
+            bytes: Little-endian ``int64`` ordinals, ``-1`` for lanes that are
+                not valid in this architecture.
+
+        Raises:
+            ValueError: If ``lanes`` is not a whole number of 8-byte words.
+        """
+        ...
 
     def check_zone(self, addr: ZoneAddress) -> Optional[str]:
         """Check whether a zone address is valid.
@@ -990,6 +1059,40 @@ class ArchSpec:
         """
         ...
 
+    def check_many(
+        self,
+        locations: bytes,
+        location_offsets: bytes,
+        lanes: bytes,
+        lane_offsets: bytes,
+    ) -> tuple[list[tuple[int, LocationGroupError]], list[tuple[int, LaneGroupError]]]:
+        """Validate many location and lane groups in one call.
+
+        Group ``i`` spans ``offsets[i]:offsets[i + 1]`` of its address buffer,
+        so each offsets buffer has one more entry than there are groups.
+        Groups are checked in parallel.
+
+        Args:
+            locations (bytes): Little-endian ``uint64`` encoded locations.
+            location_offsets (bytes): Little-endian ``uint64`` group
+                boundaries into ``locations``.
+            lanes (bytes): Little-endian ``uint64`` encoded lanes.
+            lane_offsets (bytes): Little-endian ``uint64`` group boundaries
+                into ``lanes``.
+
+        Returns:
+            tuple[list[tuple[int, LocationGroupError]], list[tuple[int, LaneGroupError]]]:
+                ``(group index, error)`` pairs for the location groups and the
+                lane groups, in group order, with the errors
+                :meth:`check_locations`/:meth:`check_lanes` report.
+
+        Raises:
+            ValueError: If a buffer is not a whole number of 8-byte words, the
+                offsets are decreasing or out of range, or a lane does not
+                decode.
+        """
+        ...
+
     def __repr__(self) -> str: ...
     def __eq__(self, other: object) -> bool: ...
 
@@ -1044,6 +1147,7 @@ class SolveOptions:
         top_c: int | None = None,
         fallback_push_rotate: bool = False,
         backwards_search: bool = False,
+        time_budget_s: float | None = None,
     ) -> None: ...
     @property
     def strategy(self) -> SearchStrategy: ...
@@ -1061,6 +1165,18 @@ class SolveOptions:
     def fallback_push_rotate(self) -> bool: ...
     @property
     def backwards_search(self) -> bool: ...
+    @property
+    def time_budget_s(self) -> float | None:
+        """Wall-clock budget per solve in seconds, or ``None`` for no deadline.
+
+        A search cut short by the deadline returns its best plan so far as
+        ``"solved"`` (with ``bound_stats["optimality_gap"]`` when a bound is
+        available), or ``"budget_exceeded"`` if it has none. A search that
+        finishes before the deadline keeps its own verdict. The constructor
+        raises ``ValueError`` for NaN, infinite, negative or overly large
+        budgets.
+        """
+
     def __repr__(self) -> str: ...
 
 @final
@@ -1253,6 +1369,19 @@ class SolveResult:
         """
         ...
 
+    @property
+    def telemetry(self) -> dict[str, object]:
+        """Search telemetry, collected natively on every solve.
+
+        Keys: ``wall_time_s``, ``generate_time_s``, ``score_time_s`` and
+        ``insert_time_s`` (phase timings in seconds), ``expansions``,
+        ``candidates``, ``new_nodes``, ``transpositions``, ``goals``,
+        ``peak_frontier``, ``branching_factor``, and ``by_depth`` — a list
+        indexed by depth of ``(expanded, candidates, new_nodes)`` tuples.
+        Pruning counts are reported by ``bound_stats``.
+        """
+        ...
+
     @property
     def deadlocks(self) -> int:
         """Number of nodes at which the generator had nothing useful to offer.
@@ -1589,12 +1718,40 @@ class TargetSolver:
         target: dict[int, LocationAddress],
         blocked: list[LocationAddress],
         max_expansions: int | None = None,
+        time_budget_s: float | None = None,
+        warm_start: WarmStart | None = None,
     ) -> SolveResult:
-        """Solve a fixed-target routing problem."""
+        """Solve a fixed-target routing problem.
+
+        ``time_budget_s`` overrides ``SolveOptions.time_budget_s`` for this
+        call. ``warm_start`` seeds the solve with the previous stage's plan
+        and is updated with this solve's plan when it succeeds.
+        """
         ...
 
     def __repr__(self) -> str: ...
 
+@final
+class WarmStart:
+    """Seed handle carried between consecutive ``TargetSolver.solve`` calls.
+
+    Before searching, the previous stage's plan is replayed forward and then
+    inverted. If either replay reaches the new target, it is an incumbent the
+    search must beat, and it is returned without searching when it already
+    meets the root lower bound.
+    """
+
+    def __init__(self) -> None: ...
+    @property
+    def move_layers(self) -> list[list[LaneAddress]]:
+        """The seed plan the next solve will try."""
+
+    def clear(self) -> None:
+        """Drop the seed so the next solve runs cold."""
+
+    def __len__(self) -> int: ...
+    def __repr__(self) -> str: ...
+
 @final
 class SingleHeuristicCzPlacement:
     """CZ placement via a target generator + single-heuristic routing.
@@ -1954,6 +2111,37 @@ class AtomStateData:
         """
         ...
 
+    def apply_many(
+        self,
+        lane_layers: list[list[LaneAddress]],
+        arch_spec: ArchSpec,
+        validate: bool = True,
+    ) -> Optional[AtomStateData]:
+        """Replay a sequence of lane groups and return the final state.
+
+        Same result as chaining ``validate_moves`` + ``apply_validated`` (or,
+        with ``validate=False``, ``apply_moves``) once per group, but the
+        replay runs on one index-addressed state updated in place, so no
+        intermediate states are built.
+
+        Args:
+            lane_layers (list[list[LaneAddress]]): Lane groups, in execution
+                order.
+            arch_spec (ArchSpec): Architecture for lane resolution.
+            validate (bool): Validate each group before applying it.
+                Defaults to True.
+
+        Returns:
+            Optional[AtomStateData]: The state after the last group, or None
+                if ``validate`` is False and any lane is invalid.
+
+        Raises:
+            MoveValidationError: If ``validate`` is True and a group fails
+                validation.
+            ValueError: If this state has a location outside ``arch_spec``.
+        """
+        ...
+
     def get_qubit(self, location: LocationAddress) -> Optional[int]:
         """Look up which qubit (if any) occupies the given location.
 
@@ -2507,6 +2695,46 @@ class Program:
         """
         ...
 
+    @staticmethod
+    def from_columns(
+        version: tuple[int, int],
+        ops: bytes,
+        operand0: bytes,
+        operand1: bytes,
+        operand2: bytes,
+    ) -> Program:
+        """Build a program from instruction column buffers.
+
+        ``bloqade.lanes.bytecode.columns.from_columns`` accepts NumPy arrays.
+
+        Args:
+            version (tuple[int, int]): Program version as ``(major, minor)``.
+            ops (bytes): One ``uint8`` op id per instruction.
+            operand0 (bytes): Little-endian ``uint64`` primary operands.
+            operand1 (bytes): Little-endian ``uint32`` ``new_array`` ``dim0``.
+            operand2 (bytes): Little-endian ``uint32`` ``new_array`` ``dim1``.
+
+        Returns:
+            Program: The program.
+
+        Raises:
+            ValueError: If the columns differ in length, an op id is
+                unknown, or an operand does not fit its instruction.
+        """
+        ...
+
+    def to_columns(self) -> tuple[bytes, bytes, bytes, bytes]:
+        """The instructions as ``(ops, operand0, operand1, operand2)`` buffers.
+
+        See :meth:`from_columns` for the dtypes;
+        ``bloqade.lanes.bytecode.columns.columns`` wraps them in NumPy arrays.
+
+        Raises:
+            ValueError: If the program holds a nested CPU op that has no
+                :class:`Instruction` factory.
+        """
+        ...
+
     def validate(
         self,
         arch: Optional[ArchSpec] = None,
@@ -2528,6 +2756,41 @@ class Program:
         """
         ...
 
+    def replay(
+        self,
+        arch: ArchSpec,
+        motion_model: Optional[MotionModel] = None,
+        amplitude_delta: float = 1.0,
+        validate: bool = True,
+    ) -> ProgramReplay:
+        """Replay the program's atom moves in one native pass.
+
+        Runs ``initial_fill``/``fill``/``move`` on an in-place atom state,
+        times every lane, and pairs qubits at every ``cz``. Qubit ids follow
+        load order; execution stops at the first ``return``/``halt``.
+
+        Args:
+            arch (ArchSpec): Architecture the program runs on.
+            motion_model (Optional[MotionModel]): Lane timing model. Defaults
+                to the FLAIR constants.
+            amplitude_delta (float): Pick/drop amplitude. Default: 1.0.
+            validate (bool): Validate each lane group before applying it.
+                When False, collisions are applied and recorded instead.
+                Default: True.
+
+        Returns:
+            ProgramReplay: Columnar replay record. See
+                ``bloqade.lanes.bytecode.replay.replay`` for NumPy arrays.
+
+        Raises:
+            MoveValidationError: If ``validate`` is True and a lane group
+                cannot execute.
+            ValueError: If the stack does not hold a consumed operand, a
+                fill location is occupied or off the architecture, a lane
+                does not resolve, or a ``cz`` zone is invalid.
+        """
+        ...
+
     @property
     def version(self) -> tuple[int, int]:
         """Program version as ``(major, minor)``."""
@@ -2542,6 +2805,102 @@ class Program:
     def __len__(self) -> int: ...
     def __eq__(self, other: object) -> bool: ...
 
+@final
+class ProgramReplay:
+    """Columnar result of :meth:`Program.replay`.
+
+    Every column is a ``bytes`` buffer of little-endian values.
+    ``bloqade.lanes.bytecode.replay.replay`` wraps them in NumPy arrays.
+    """
+
+    @property
+    def num_qubits(self) -> int:
+        """Number of qubits the program loads."""
+        ...
+
+    @property
+    def num_layers(self) -> int:
+        """Number of executed ``move`` layers."""
+        ...
+
+    @property
+    def num_czs(self) -> int:
+        """Number of executed ``cz`` instructions."""
+        ...
+
+    @property
+    def total_move_time_us(self) -> float:
+        """Sum of the layer durations in microseconds."""
+        ...
+
+    @property
+    def locations(self) -> bytes:
+        """``int32`` ``(zone_id, word_id, site_id)`` per qubit per row, -1
+        where a qubit is not on a site; ``(num_layers + 1, num_qubits, 3)``."""
+        ...
+
+    @property
+    def collided(self) -> bytes:
+        """``bool`` collision flags; ``(num_layers, num_qubits)``."""
+        ...
+
+    @property
+    def layer_pcs(self) -> bytes:
+        """``int64`` program counter of each layer's ``move``."""
+        ...
+
+    @property
+    def layer_durations_us(self) -> bytes:
+        """``float64`` duration of each layer (its slowest lane)."""
+        ...
+
+    @property
+    def lane_offsets(self) -> bytes:
+        """``int64`` offsets into the lane columns; ``num_layers + 1``."""
+        ...
+
+    @property
+    def lanes(self) -> bytes:
+        """``uint64`` encoded address of every lane, layer by layer."""
+        ...
+
+    @property
+    def lane_qubits(self) -> bytes:
+        """``int64`` qubit carried by each lane, -1 for an empty source."""
+        ...
+
+    @property
+    def lane_durations_us(self) -> bytes:
+        """``float64`` duration of each lane."""
+        ...
+
+    @property
+    def cz_pcs(self) -> bytes:
+        """``int64`` program counter of each ``cz``."""
+        ...
+
+    @property
+    def cz_layers(self) -> bytes:
+        """``int64`` number of layers executed before each ``cz``."""
+        ...
+
+    @property
+    def cz_offsets(self) -> bytes:
+        """``int64`` offsets into the CZ pair columns; ``num_czs + 1``."""
+        ...
+
+    @property
+    def cz_controls(self) -> bytes:
+        """``int64`` control qubit of each CZ pair."""
+        ...
+
+    @property
+    def cz_targets(self) -> bytes:
+        """``int64`` target qubit of each CZ pair."""
+        ...
+
+    def __repr__(self) -> str: ...
+
 # ── Starlark DSL sidecar ──
 #
 # Move Policy DSL and Target Generator DSL surfaces. Sidecars to the typed
@@ -24,12 +24,18 @@ See issue #466 for design rationale.
 
 from __future__ import annotations
 
-from typing import Generic, TypeVar
+from abc import abstractmethod
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 from kirin import ir, types
 from kirin.print import Printer
+from kirin.serialization.core.serializationunit import SerializationUnit
 from typing_extensions import Self
 
+if TYPE_CHECKING:
+    from kirin.serialization.base.deserializer import Deserializer
+    from kirin.serialization.base.serializer import Serializer
+
 R = TypeVar("R")
 
 
@@ -96,9 +102,13 @@ class KirinRustWrapper(RustWrapper[R], ir.Data):
       (most address types implement it). Override if the Rust type does not.
     * :meth:`print_impl` — prints the encoded address as a hex literal,
       matching the legacy ``Encoder`` formatting.
+    * :meth:`serialize` / :meth:`deserialize` — Kirin serialization through
+      the encoded integer, so IR holding these attributes round-trips
+      through ``DialectGroup.encode_json``/``decode_json``.
 
     Subclasses must still define ``__init__`` to construct ``self._inner``
-    and call ``self.__post_init__()``.
+    and call ``self.__post_init__()``, and implement the abstract
+    :meth:`decode` that deserialization relies on.
     """
 
     def __post_init__(self) -> None:
@@ -116,6 +126,26 @@ class KirinRustWrapper(RustWrapper[R], ir.Data):
     def encode(self) -> int:
         return self._inner.encode()  # type: ignore[attr-defined]
 
+    @classmethod
+    @abstractmethod
+    def decode(cls, encoded: int) -> Self:
+        """Inverse of :meth:`encode`."""
+        ...
+
+    def serialize(self, serializer: Serializer) -> SerializationUnit:
+        return SerializationUnit(
+            kind="rust-wrapper",
+            module_name=type(self).__module__,
+            class_name=type(self).__name__,
+            data={"encoded": serializer.serialize_int(self.encode())},
+        )
+
+    @classmethod
+    def deserialize(
+        cls, serUnit: SerializationUnit, deserializer: Deserializer
+    ) -> Self:
+        return cls.decode(deserializer.deserialize_int(serUnit.data["encoded"]))
+
     def print_impl(self, printer: Printer) -> None:
         printer.plain_print(f"0x{self.encode():016x}")
 
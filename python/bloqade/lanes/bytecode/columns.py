@@ -0,0 +1,297 @@
+"""Columnar NumPy views of a program's instructions.
+
+:meth:`Program.to_columns` returns one buffer per column in a single call,
+and :meth:`Program.from_columns` builds a program from those buffers.
+:func:`columns` and :func:`from_columns` wrap both directions in NumPy so
+large programs can be inspected, filtered and generated with array
+operations instead of one :class:`~bloqade.lanes.bytecode.Instruction`
+object per row.
+
+Each instruction is one row of four columns:
+
+* ``ops`` (``uint8``): index into :data:`OP_NAMES`.
+* ``operand0`` (``uint64``): address bits for ``const_loc``/``const_lane``/
+  ``const_zone``; the arity of ``initial_fill``/``fill``/``move``/
+  ``local_r``/``local_rz``/``measure``; ``get_item``'s ``ndims``;
+  ``new_array``'s ``type_tag``; the raw IEEE-754 bits of ``const_float``
+  and the two's-complement bits of ``const_int``.
+* ``operand1``/``operand2`` (``uint32``): ``new_array``'s ``dim0``/``dim1``.
+
+Unused operands are zero.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+import numpy as np
+
+from bloqade.lanes.bytecode._native import (
+    LaneAddress,
+    LocationAddress,
+    Program,
+    ZoneAddress,
+)
+
+OP_NAMES: tuple[str, ...] = (
+    "pop",
+    "swap",
+    "return",
+    "const_loc",
+    "const_lane",
+    "const_zone",
+    "initial_fill",
+    "fill",
+    "move",
+    "local_rz",
+    "local_r",
+    "global_rz",
+    "global_r",
+    "cz",
+    "measure",
+    "await_measure",
+    "new_array",
+    "get_item",
+    "set_detector",
+    "set_observable",
+    "const_float",
+    "const_int",
+    "dup",
+    "halt",
+)
+"""Op name of each column op id; must match the Rust ``isa::columns``."""
+
+OP_IDS: dict[str, int] = {name: op for op, name in enumerate(OP_NAMES)}
+
+_U64_MASK = (1 << 64) - 1
+
+
+def _float_bits(value: float) -> int:
+    return struct.unpack("<Q", struct.pack("<d", value))[0]
+
+
+class InstructionRow(NamedTuple):
+    """One decoded row of :class:`InstructionColumns`.
+
+    Mirrors the accessors of :class:`~bloqade.lanes.bytecode.Instruction`
+    without a native object per instruction.
+    """
+
+    name: str
+    operand0: int
+    operand1: int
+    operand2: int
+
+    def op_name(self) -> str:
+        return self.name
+
+    def float_value(self) -> float:
+        return struct.unpack("<d", struct.pack("<Q", self.operand0))[0]
+
+    def int_value(self) -> int:
+        value = self.operand0
+        return value - (1 << 64) if value >> 63 else value
+
+    def location_address(self) -> LocationAddress:
+        return LocationAddress.decode(self.operand0)
+
+    def lane_address(self) -> LaneAddress:
+        return LaneAddress.decode(self.operand0)
+
+    def zone_address(self) -> ZoneAddress:
+        return ZoneAddress.decode(self.operand0)
+
+    def arity(self) -> int:
+        return self.operand0
+
+    def type_tag(self) -> int:
+        return self.operand0
+
+    def dim0(self) -> int:
+        return self.operand1
+
+    def dim1(self) -> int:
+        return self.operand2
+
+    def ndims(self) -> int:
+        return self.operand0
+
+
+@dataclass(frozen=True)
+class InstructionColumns:
+    """Struct-of-arrays view of a program's instructions."""
+
+    ops: np.ndarray
+    """``uint8`` op id of each instruction (see :data:`OP_NAMES`)."""
+    operand0: np.ndarray
+    """``uint64`` primary operand of each instruction."""
+    operand1: np.ndarray
+    """``uint32`` ``new_array`` ``dim0``, zero elsewhere."""
+    operand2: np.ndarray
+    """``uint32`` ``new_array`` ``dim1``, zero elsewhere."""
+
+    def __len__(self) -> int:
+        return len(self.ops)
+
+    def op_names(self) -> np.ndarray:
+        """The op name of every instruction, as a string array."""
+        return np.asarray(OP_NAMES)[self.ops]
+
+    def mask(self, *op_names: str) -> np.ndarray:
+        """Boolean mask of the instructions whose op is one of ``op_names``."""
+        return np.isin(self.ops, [OP_IDS[name] for name in op_names])
+
+    @property
+    def float_values(self) -> np.ndarray:
+        """``operand0`` reinterpreted as ``float64`` (valid for ``const_float``)."""
+        return self.operand0.view("<f8")
+
+    @property
+    def int_values(self) -> np.ndarray:
+        """``operand0`` reinterpreted as ``int64`` (valid for ``const_int``)."""
+        return self.operand0.view("<i8")
+
+    def location_fields(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """``(zone_id, word_id, site_id)`` decoded from ``operand0``.
+
+        Valid for ``const_loc`` rows.
+        """
+        bits = self.operand0
+        return (
+            ((bits >> 56) & 0xFF).astype(np.int64),
+            ((bits >> 40) & 0xFFFF).astype(np.int64),
+            ((bits >> 24) & 0xFFFF).astype(np.int64),
+        )
+
+    def lane_fields(self) -> dict[str, np.ndarray]:
+        """Lane address fields decoded from ``operand0``.
+
+        Valid for ``const_lane`` rows. Keys are ``direction`` (0 forward,
+        1 backward), ``move_type`` (0 site, 1 word, 2 zone), ``zone_id``,
+        ``word_id``, ``site_id`` and ``bus_id``.
+        """
+        bits = self.operand0
+        data0 = bits & 0xFFFF_FFFF
+        data1 = bits >> 32
+        return {
+            "direction": ((data1 >> 31) & 0x1).astype(np.int64),
+            "move_type": ((data1 >> 29) & 0x3).astype(np.int64),
+            "zone_id": ((data1 >> 21) & 0xFF).astype(np.int64),
+            "word_id": ((data0 >> 16) & 0xFFFF).astype(np.int64),
+            "site_id": (data0 & 0xFFFF).astype(np.int64),
+            "bus_id": (data1 & 0xFFFF).astype(np.int64),
+        }
+
+    def rows(self) -> Iterator[InstructionRow]:
+        """Iterate the instructions as :class:`InstructionRow` tuples."""
+        names = OP_NAMES
+        for op, operand0, operand1, operand2 in zip(
+            self.ops.tolist(),
+            self.operand0.tolist(),
+            self.operand1.tolist(),
+            self.operand2.tolist(),
+        ):
+            yield InstructionRow(names[op], operand0, operand1, operand2)
+
+
+def _column(buffer: bytes, dtype: str) -> np.ndarray:
+    return np.frombuffer(buffer, dtype=np.dtype(dtype).newbyteorder("<"))
+
+
+def columns(program: Program) -> InstructionColumns:
+    """View ``program``'s instructions as NumPy columns.
+
+    The arrays are read-only views of the buffers Rust produced.
+
+    Raises:
+        ValueError: If the program holds a nested CPU op that has no
+            :class:`~bloqade.lanes.bytecode.Instruction` factory.
+    """
+    ops, operand0, operand1, operand2 = program.to_columns()
+    return InstructionColumns(
+        ops=_column(ops, "u1"),
+        operand0=_column(operand0, "u8"),
+        operand1=_column(operand1, "u4"),
+        operand2=_column(operand2, "u4"),
+    )
+
+
+def from_columns(
+    version: tuple[int, int],
+    ops: np.ndarray,
+    operand0: np.ndarray,
+    operand1: np.ndarray | None = None,
+    operand2: np.ndarray | None = None,
+) -> Program:
+    """Build a program from instruction columns.
+
+    ``operand1``/``operand2`` default to zeros, which is correct for any
+    program without ``new_array``. Columns are cast to their little-endian
+    dtypes before crossing into Rust.
+
+    Raises:
+        ValueError: If the columns differ in length, an op id is unknown, or
+            an operand does not fit its instruction.
+    """
+    num_instructions = len(ops)
+    if operand1 is None:
+        operand1 = np.zeros(num_instructions, dtype="<u4")
+    if operand2 is None:
+        operand2 = np.zeros(num_instructions, dtype="<u4")
+    return Program.from_columns(
+        version,
+        np.ascontiguousarray(ops, dtype="u1").tobytes(),
+        np.ascontiguousarray(operand0, dtype="<u8").tobytes(),
+        np.ascontiguousarray(operand1, dtype="<u4").tobytes(),
+        np.ascontiguousarray(operand2, dtype="<u4").tobytes(),
+    )
+
+
+@dataclass
+class ColumnBuilder:
+    """Append-only instruction columns, built into a program in one call.
+
+    The row methods mirror the :class:`~bloqade.lanes.bytecode.Instruction`
+    factories; :meth:`build` crosses into Rust once for the whole program.
+    """
+
+    ops: list[int] = field(default_factory=list)
+    operand0: list[int] = field(default_factory=list)
+    operand1: list[int] = field(default_factory=list)
+    operand2: list[int] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ops)
+
+    def append(
+        self, op_name: str, operand0: int = 0, operand1: int = 0, operand2: int = 0
+    ) -> None:
+        """Append one row by op name."""
+        self.ops.append(OP_IDS[op_name])
+        self.operand0.append(operand0)
+        self.operand1.append(operand1)
+        self.operand2.append(operand2)
+
+    def const_float(self, value: float) -> None:
+        self.append("const_float", _float_bits(value))
+
+    def const_int(self, value: int) -> None:
+        if not -(1 << 63) <= value < (1 << 63):
+            raise OverflowError(f"const_int value {value} does not fit in int64")
+        self.append("const_int", value & _U64_MASK)
+
+    def to_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """The rows appended so far as ``(ops, operand0, operand1, operand2)``."""
+        return (
+            np.asarray(self.ops, dtype="u1"),
+            np.asarray(self.operand0, dtype="<u8"),
+            np.asarray(self.operand1, dtype="<u4"),
+            np.asarray(self.operand2, dtype="<u4"),
+        )
+
+    def build(self, version: tuple[int, int] = (1, 0)) -> Program:
+        """Build the program from the rows appended so far."""
+        return from_columns(version, *self.to_arrays())
@@ -12,8 +12,9 @@ must be normalised by ``stackify`` before encoding.
 Implemented as a kirin ``EmitABC`` pass: each dialect registers its
 own ``MethodTable`` under the key ``"emit.bytecode"``, and the encoder
 dispatches via the standard kirin interpreter machinery.  The encoded
-instructions accumulate in ``BytecodeEncoder.instructions``; call
-``dump_program`` for the one-shot public API.
+instructions accumulate as columns in ``BytecodeEncoder.builder`` and
+cross into Rust once, via ``Program.from_columns``; call ``dump_program``
+for the one-shot public API.
 """
 
 from __future__ import annotations
@@ -26,6 +27,7 @@ from kirin.emit import EmitABC, EmitFrame
 from kirin.interp import MethodTable, impl
 
 from bloqade.lanes.bytecode import Instruction, Program
+from bloqade.lanes.bytecode.columns import ColumnBuilder
 from bloqade.lanes.dialects import stack_move
 
 
@@ -43,14 +45,20 @@ class BytecodeEncoder(EmitABC[EmitFrame, Program]):
 
     Constructed with the method's dialect group
     (``BytecodeEncoder(dialects=method.dialects)``).  Call ``run(method)``
-    to populate ``self.instructions``, then build the ``Program`` from them.
+    to populate ``self.builder``, then ``self.builder.build(version)`` for
+    the ``Program``.
     Prefer ``dump_program`` for the one-shot public API.
     """
 
     keys = ("emit.bytecode",)
     void = Program(version=(1, 0), instructions=[])
 
-    instructions: list[Instruction] = field(default_factory=list)
+    builder: ColumnBuilder = field(default_factory=ColumnBuilder)
+
+    @property
+    def instructions(self) -> list[Instruction]:
+        """The instructions encoded so far."""
+        return self.builder.build().instructions
 
     def initialize_frame(
         self, node: ir.Statement, *, has_parent_access: bool = False
@@ -58,7 +66,7 @@ class BytecodeEncoder(EmitABC[EmitFrame, Program]):
         return EmitFrame(node, has_parent_access=has_parent_access)
 
     def reset(self) -> None:
-        self.instructions = []
+        self.builder = ColumnBuilder()
 
     def eval_fallback(self, frame: EmitFrame, node: ir.Statement) -> tuple:  # type: ignore[override]
         raise EncodingError(node)
@@ -73,41 +81,35 @@ class _StackMoveEmit(MethodTable):
     def const_float(
         self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.ConstFloat
     ) -> tuple:
-        emit.instructions.append(Instruction.const_float(stmt.value))
+        emit.builder.const_float(stmt.value)
         return ()
 
     @impl(stack_move.ConstInt)
     def const_int(
         self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.ConstInt
     ) -> tuple:
-        emit.instructions.append(Instruction.const_int(stmt.value))
+        emit.builder.const_int(stmt.value)
         return ()
 
     @impl(stack_move.ConstLoc)
     def const_loc(
         self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.ConstLoc
     ) -> tuple:
-        v = stmt.value
-        emit.instructions.append(Instruction.const_loc(v.zone_id, v.word_id, v.site_id))
+        emit.builder.append("const_loc", stmt.value.encode())
         return ()
 
     @impl(stack_move.ConstLane)
     def const_lane(
         self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.ConstLane
     ) -> tuple:
-        v = stmt.value
-        emit.instructions.append(
-            Instruction.const_lane(
-                v.move_type, v.zone_id, v.word_id, v.site_id, v.bus_id, v.direction
-            )
-        )
+        emit.builder.append("const_lane", stmt.value.encode())
         return ()
 
     @impl(stack_move.ConstZone)
     def const_zone(
         self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.ConstZone
     ) -> tuple:
-        emit.instructions.append(Instruction.const_zone(stmt.value.zone_id))
+        emit.builder.append("const_zone", stmt.value.encode())
         return ()
 
     # ── Stack manipulation ─────────────────────────────────────────────────
@@ -116,21 +118,21 @@ class _StackMoveEmit(MethodTable):
     def pop(
         self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.Pop
     ) -> tuple:
-        emit.instructions.append(Instruction.pop())
+        emit.builder.append("pop")
         return ()
 
     @impl(stack_move.Dup)
     def dup(
         self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.Dup
     ) -> tuple:
-        emit.instructions.append(Instruction.dup())
+        emit.builder.append("dup")
         return ()
 
     @impl(stack_move.Swap)
     def swap(
         self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.Swap
     ) -> tuple:
-        emit.instructions.append(Instruction.swap())
+        emit.builder.append("swap")
         return ()
 
     # ── Atom operations ────────────────────────────────────────────────────
@@ -140,7 +142,7 @@ class _StackMoveEmit(MethodTable):
         self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.InitialFill
     ) -> tuple:
         arity = stmt.get_present_trait(stack_move.HasArity).arity(stmt)
-        emit.instructions.append(Instruction.initial_fill(arity))
+        emit.builder.append("initial_fill", arity)
         return ()
 
     @impl(stack_move.Fill)
@@ -148,7 +150,7 @@ class _StackMoveEmit(MethodTable):
         self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.Fill
     ) -> tuple:
         arity = stmt.get_present_trait(stack_move.HasArity).arity(stmt)
-        emit.instructions.append(Instruction.fill(arity))
+        emit.builder.append("fill", arity)
         return ()
 
     @impl(stack_move.Move)
@@ -156,7 +158,7 @@ class _StackMoveEmit(MethodTable):
         self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.Move
     ) -> tuple:
         arity = stmt.get_present_trait(stack_move.HasArity).arity(stmt)
-        emit.instructions.append(Instruction.move_(arity))
+        emit.builder.append("move", arity)
         return ()
 
     # ── Gates ──────────────────────────────────────────────────────────────
@@ -166,7 +168,7 @@ class _StackMoveEmit(MethodTable):
         self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.LocalR
     ) -> tuple:
         arity = stmt.get_present_trait(stack_move.HasArity).arity(stmt)
-        emit.instructions.append(Instruction.local_r(arity))
+        emit.builder.append("local_r", arity)
         return ()
 
     @impl(stack_move.LocalRz)
@@ -174,26 +176,26 @@ class _StackMoveEmit(MethodTable):
         self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.LocalRz
     ) -> tuple:
         arity = stmt.get_present_trait(stack_move.HasArity).arity(stmt)
-        emit.instructions.append(Instruction.local_rz(arity))
+        emit.builder.append("local_rz", arity)
         return ()
 
     @impl(stack_move.GlobalR)
     def global_r(
         self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.GlobalR
     ) -> tuple:
-        emit.instructions.append(Instruction.global_r())
+        emit.builder.append("global_r")
         return ()
 
     @impl(stack_move.GlobalRz)
     def global_rz(
         self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.GlobalRz
     ) -> tuple:
-        emit.instructions.append(Instruction.global_rz())
+        emit.builder.append("global_rz")
         return ()
 
     @impl(stack_move.CZ)
     def cz(self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.CZ) -> tuple:
-        emit.instructions.append(Instruction.cz())
+        emit.builder.append("cz")
         return ()
 
     # ── Measurement ────────────────────────────────────────────────────────
@@ -203,14 +205,14 @@ class _StackMoveEmit(MethodTable):
         self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.Measure
     ) -> tuple:
         arity = stmt.get_present_trait(stack_move.HasArity).arity(stmt)
-        emit.instructions.append(Instruction.measure(arity))
+        emit.builder.append("measure", arity)
         return ()
 
     @impl(stack_move.AwaitMeasure)
     def await_measure(
         self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.AwaitMeasure
     ) -> tuple:
-        emit.instructions.append(Instruction.await_measure())
+        emit.builder.append("await_measure")
         return ()
 
     # ── Arrays ─────────────────────────────────────────────────────────────
@@ -219,9 +221,7 @@ class _StackMoveEmit(MethodTable):
     def new_array(
         self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.NewArray
     ) -> tuple:
-        emit.instructions.append(
-            Instruction.new_array(stmt.type_tag, stmt.dim0, stmt.dim1)
-        )
+        emit.builder.append("new_array", stmt.type_tag, stmt.dim0, stmt.dim1)
         return ()
 
     @impl(stack_move.GetItem)
@@ -229,7 +229,7 @@ class _StackMoveEmit(MethodTable):
         self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.GetItem
     ) -> tuple:
         arity = stmt.get_present_trait(stack_move.HasArity).arity(stmt)
-        emit.instructions.append(Instruction.get_item(arity))
+        emit.builder.append("get_item", arity)
         return ()
 
     # ── Annotations ────────────────────────────────────────────────────────
@@ -238,14 +238,14 @@ class _StackMoveEmit(MethodTable):
     def set_detector(
         self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.SetDetector
     ) -> tuple:
-        emit.instructions.append(Instruction.set_detector())
+        emit.builder.append("set_detector")
         return ()
 
     @impl(stack_move.SetObservable)
     def set_observable(
         self, emit: BytecodeEncoder, frame: EmitFrame, stmt: stack_move.SetObservable
     ) -> tuple:
-        emit.instructions.append(Instruction.set_observable())
+        emit.builder.append("set_observable")
         return ()
 
 
@@ -276,9 +276,9 @@ class _FuncEmit(MethodTable):
             and isinstance(stmt.args[0], ir.ResultValue)
             and isinstance(stmt.args[0].owner, func.ConstantNone)
         ):
-            emit.instructions.append(Instruction.halt())
+            emit.builder.append("halt")
         else:
-            emit.instructions.append(Instruction.return_())
+            emit.builder.append("return")
         return ()
 
 
@@ -296,4 +296,4 @@ def dump_program(method: ir.Method, version: tuple[int, int] = (1, 0)) -> Progra
     """
     encoder = BytecodeEncoder(dialects=method.dialects)
     encoder.run(method)
-    return Program(version=version, instructions=encoder.instructions)
+    return encoder.builder.build(version)
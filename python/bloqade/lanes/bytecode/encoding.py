@@ -22,6 +22,10 @@ class ZoneAddress(KirinRustWrapper[_RustZoneAddress]):
         self._inner = _RustZoneAddress(zone_id)
         self.__post_init__()
 
+    @classmethod
+    def decode(cls, encoded: int) -> Self:
+        return cls.from_inner(_RustZoneAddress.decode(encoded))
+
     @property
     def zone_id(self) -> int:
         return self._inner.zone_id
@@ -39,6 +43,10 @@ class LocationAddress(KirinRustWrapper[_RustLocationAddress]):
         self._inner = _RustLocationAddress(zone_id, word_id, site_id)
         self.__post_init__()
 
+    @classmethod
+    def decode(cls, encoded: int) -> Self:
+        return cls.from_inner(_RustLocationAddress.decode(encoded))
+
     @property
     def zone_id(self) -> int:
         return self._inner.zone_id
@@ -97,6 +105,10 @@ class LaneAddress(KirinRustWrapper[_RustLaneAddress]):
         )
         self.__post_init__()
 
+    @classmethod
+    def decode(cls, encoded: int) -> Self:
+        return cls.from_inner(_RustLaneAddress.decode(encoded))
+
     @property
     def move_type(self) -> MoveType:
         return self._inner.move_type
@@ -0,0 +1,120 @@
+"""Whole-program replay as NumPy arrays.
+
+:meth:`Program.replay` runs a program's atom moves once in Rust and returns
+a :class:`~bloqade.lanes.bytecode.ProgramReplay` of raw column buffers;
+:func:`replay` views those buffers as typed NumPy arrays so analyses and
+renderers can vectorize over whole layers instead of crossing into Rust
+once per lane.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from bloqade.lanes.bytecode import (
+    ArchSpec,
+    LaneAddress,
+    MotionModel,
+    Program,
+)
+
+
+@dataclass(frozen=True)
+class ReplayArrays:
+    """Per-layer, per-lane and per-CZ columns of a program replay.
+
+    A layer is one executed ``move``. Variable-length per-layer and per-CZ
+    data is flat with an offsets column: layer ``k``'s lanes are
+    ``lanes[lane_offsets[k]:lane_offsets[k + 1]]``, and likewise for the
+    pairs of CZ ``k`` with ``cz_offsets``.
+    """
+
+    num_qubits: int
+    locations: np.ndarray
+    """``int32`` ``(num_layers + 1, num_qubits, 3)``: ``(zone_id, word_id,
+    site_id)`` when the first layer starts (row 0) and after each layer,
+    ``-1`` where a qubit is not on a site."""
+    collided: np.ndarray
+    """``bool`` ``(num_layers, num_qubits)``: the qubit was lost to a
+    collision in that layer (only possible with ``validate=False``)."""
+    layer_pcs: np.ndarray
+    """``int64`` program counter of each layer's ``move``."""
+    move_times_us: np.ndarray
+    """``float64`` duration of each layer: its slowest lane."""
+    lane_offsets: np.ndarray
+    """``int64`` ``(num_layers + 1,)`` offsets into the lane columns."""
+    lanes: np.ndarray
+    """``uint64`` encoded lane addresses."""
+    lane_qubits: np.ndarray
+    """``int64`` qubit carried by each lane, ``-1`` for an empty source."""
+    lane_durations_us: np.ndarray
+    """``float64`` duration of each lane."""
+    cz_pcs: np.ndarray
+    """``int64`` program counter of each ``cz``."""
+    cz_layers: np.ndarray
+    """``int64`` layers executed before each ``cz`` (its row in
+    ``locations``)."""
+    cz_offsets: np.ndarray
+    """``int64`` ``(num_czs + 1,)`` offsets into the CZ pair columns."""
+    cz_controls: np.ndarray
+    """``int64`` control qubit of each CZ pair."""
+    cz_targets: np.ndarray
+    """``int64`` target qubit of each CZ pair."""
+
+    @property
+    def num_layers(self) -> int:
+        return len(self.layer_pcs)
+
+    @property
+    def total_move_time_us(self) -> float:
+        return float(self.move_times_us.sum())
+
+    def layer_lanes(self, layer: int) -> list[LaneAddress]:
+        """Decode the lane addresses of one layer."""
+        start, stop = self.lane_offsets[layer], self.lane_offsets[layer + 1]
+        return [LaneAddress.decode(int(bits)) for bits in self.lanes[start:stop]]
+
+
+def _column(buffer: bytes, dtype: str) -> np.ndarray:
+    return np.frombuffer(buffer, dtype=np.dtype(dtype).newbyteorder("<"))
+
+
+def replay(
+    program: Program,
+    arch_spec: ArchSpec,
+    *,
+    motion_model: MotionModel | None = None,
+    amplitude_delta: float = 1.0,
+    validate: bool = True,
+) -> ReplayArrays:
+    """Replay ``program`` against ``arch_spec`` and return NumPy columns.
+
+    See :meth:`Program.replay` for the execution semantics and the errors
+    raised. The arrays are read-only views of the buffers Rust produced.
+    """
+    raw = program.replay(
+        arch_spec,
+        motion_model=motion_model,
+        amplitude_delta=amplitude_delta,
+        validate=validate,
+    )
+    num_qubits = raw.num_qubits
+    num_layers = raw.num_layers
+    return ReplayArrays(
+        num_qubits=num_qubits,
+        locations=_column(raw.locations, "i4").reshape(num_layers + 1, num_qubits, 3),
+        collided=_column(raw.collided, "?").reshape(num_layers, num_qubits),
+        layer_pcs=_column(raw.layer_pcs, "i8"),
+        move_times_us=_column(raw.layer_durations_us, "f8"),
+        lane_offsets=_column(raw.lane_offsets, "i8"),
+        lanes=_column(raw.lanes, "u8"),
+        lane_qubits=_column(raw.lane_qubits, "i8"),
+        lane_durations_us=_column(raw.lane_durations_us, "f8"),
+        cz_pcs=_column(raw.cz_pcs, "i8"),
+        cz_layers=_column(raw.cz_layers, "i8"),
+        cz_offsets=_column(raw.cz_offsets, "i8"),
+        cz_controls=_column(raw.cz_controls, "i8"),
+        cz_targets=_column(raw.cz_targets, "i8"),
+    )
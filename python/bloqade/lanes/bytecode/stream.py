@@ -0,0 +1,581 @@
+"""StreamingEncoder -- move ir.Method → Program in a single pass.
+
+``dump_program`` encodes ``stack_move`` IR, so a ``move`` kernel first has to
+be lowered by ``MoveToStackMove``: ``RewriteMoveToStackMove``, DCE + CSE and
+``stackify`` each rewrite a full copy of the kernel before a single
+instruction is encoded. ``StreamingEncoder`` walks the ``move`` block once
+and appends the instructions that pipeline would produce straight to
+instruction columns:
+
+* address attributes and ``py.Constant`` operands are pushed immediately
+  before their consumer, deepest argument first (``CloneConstants``);
+* ``GetFutureResult`` becomes ``await_measure`` (on the first access to a
+  measurement) and ``const_int``/``get_item``; accesses to the same result
+  share one ``get_item`` and unused results emit nothing (CSE + DCE);
+* a value consumed by several instructions is ``dup``-ed before every
+  consumer but the last and ``swap``-ed back after it (``stackify``).
+
+Use counts come from the SSA use lists of the ``move`` IR, so no state
+beyond the values still waiting for a consumer is kept. Encoded rows are
+compacted into NumPy column chunks every ``chunk_size`` rows and cross into
+Rust once, via ``Program.from_columns``. With ``validate=True`` the address
+groups of every chunk are checked with one ``ArchSpec.check_many`` call
+before the next chunk is encoded.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from functools import singledispatchmethod
+from typing import Any, NamedTuple
+
+import numpy as np
+from bloqade.decoders.dialects import annotate as _annotate
+from kirin import ir
+from kirin.dialects import func, ilist as kirin_ilist, py as kirin_py
+
+from bloqade.lanes.arch.spec import ArchSpec
+from bloqade.lanes.bytecode import Program
+from bloqade.lanes.bytecode.columns import ColumnBuilder, from_columns
+from bloqade.lanes.bytecode.encode import EncodingError
+from bloqade.lanes.bytecode.encoding import LaneAddress, LocationAddress, ZoneAddress
+from bloqade.lanes.dialects import move, stack_move
+
+# Op of each stack_move constant statement that may already appear in a move
+# kernel, and the bytecode type_tag of each constant op (see
+# ``stack_move.TYPE_TAG``). Every other value is tagged Int, like
+# ``RewriteMoveToStackMove`` tags values of types it does not recognise.
+_CONST_OPS: dict[type[ir.Statement], str] = {
+    stack_move.ConstFloat: "const_float",
+    stack_move.ConstInt: "const_int",
+    stack_move.ConstLoc: "const_loc",
+    stack_move.ConstLane: "const_lane",
+    stack_move.ConstZone: "const_zone",
+}
+_CONST_TAGS: dict[str, int] = {
+    "const_float": 0,
+    "const_int": 1,
+    "const_loc": 3,
+    "const_lane": 4,
+    "const_zone": 5,
+}
+_INT_TAG = 1
+
+
+class _Const(NamedTuple):
+    """A constant operand, pushed right before each instruction consuming it."""
+
+    op: str
+    value: Any
+
+
+@dataclass(eq=False)
+class _StackValue:
+    """An instruction result waiting on the stack for its consumers."""
+
+    uses: int
+    """Number of operand slots consuming the value."""
+    type_tag: int = _INT_TAG
+    remaining: int = field(init=False)
+    aliases: list[ir.SSAValue] = field(default_factory=list, init=False)
+    """The ``move`` SSA values encoded as this stack value."""
+
+    def __post_init__(self) -> None:
+        self.remaining = self.uses
+
+
+_Operand = _Const | _StackValue
+
+
+@dataclass(eq=False)
+class _Future:
+    """A measurement future and the results read from it so far."""
+
+    zone_addresses: tuple[ZoneAddress, ...]
+    awaited: bool = False
+    indices: dict[ir.Statement, int] = field(default_factory=dict)
+    """Flat result index of each ``GetFutureResult`` not yet encoded."""
+    key_uses: dict[int, int] = field(default_factory=dict)
+    """Operand slots consuming each flat result index, across all reads."""
+    items: dict[int, _StackValue | None] = field(default_factory=dict)
+    """The ``get_item`` result of each flat index encoded so far."""
+    result: _StackValue | None = None
+
+
+class _Row(NamedTuple):
+    """A 1-D ``ilist.New`` deferred until it is flattened into a 2-D array."""
+
+    operands: list[_Operand]
+    type_tag: int
+
+
+def _stack_uses(value: ir.SSAValue) -> int:
+    """Operand slots consuming ``value`` once lowered to stack_move.
+
+    ``SetDetector``'s coordinates have no bytecode counterpart and are dropped.
+    """
+    return sum(
+        1
+        for use in value.uses
+        if not (
+            isinstance(use.stmt, _annotate.stmts.SetDetector)
+            and use.stmt.measurements is not value
+        )
+    )
+
+
+@dataclass
+class StreamingEncoder:
+    """Encode a single-block move ir.Method into bytecode in one pass.
+
+    Produces the same instructions as ``MoveToStackMove.emit_bytecode``
+    without materialising the intermediate stack_move IR. Call
+    ``run(method)`` to encode, then ``build(version)`` for the ``Program``;
+    prefer ``stream_program`` for the one-shot public API.
+
+    Constructor args:
+    - arch_spec: required. Resolves the flat index of a measured location
+      and, with ``validate``, checks address groups.
+    - chunk_size: rows buffered as Python ints before they are compacted
+      into NumPy columns (and, with ``validate``, checked).
+    - validate: check every ``fill``/``local_r``/``local_rz``/``move`` group
+      and measured location against ``arch_spec`` while encoding, raising
+      ``EncodingError`` on the first invalid one.
+    """
+
+    arch_spec: ArchSpec
+    chunk_size: int = 1 << 16
+    validate: bool = False
+
+    _builder: ColumnBuilder = field(default_factory=ColumnBuilder, init=False)
+    _chunks: list[tuple[np.ndarray, ...]] = field(default_factory=list, init=False)
+    _first_fill_emitted: bool = field(default=False, init=False)
+    _values: dict[ir.SSAValue, _StackValue] = field(default_factory=dict, init=False)
+    _futures: dict[ir.SSAValue, _Future] = field(default_factory=dict, init=False)
+    _rows: dict[ir.SSAValue, _Row] = field(default_factory=dict, init=False)
+    _zone_sizes: dict[ZoneAddress, int] = field(default_factory=dict, init=False)
+    _location_groups: list[tuple[ir.Statement, tuple[LocationAddress, ...]]] = field(
+        default_factory=list, init=False
+    )
+    _lane_groups: list[tuple[ir.Statement, tuple[LaneAddress, ...]]] = field(
+        default_factory=list, init=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {self.chunk_size}")
+
+    def __len__(self) -> int:
+        """Number of instructions encoded so far."""
+        return len(self._builder) + sum(len(chunk[0]) for chunk in self._chunks)
+
+    def reset(self) -> None:
+        self._builder = ColumnBuilder()
+        self._chunks = []
+        self._first_fill_emitted = False
+        self._values = {}
+        self._futures = {}
+        self._rows = {}
+        self._location_groups = []
+        self._lane_groups = []
+
+    def run(self, method: ir.Method) -> None:
+        """Encode ``method``, replacing anything encoded before.
+
+        Raises ``ValueError`` if the method has more than one block, like
+        ``stackify``, and ``EncodingError`` for a statement or operand with
+        no bytecode counterpart.
+        """
+        blocks = method.callable_region.blocks
+        if len(blocks) != 1:
+            raise ValueError(
+                "StreamingEncoder only supports single-block methods; "
+                f"got {len(blocks)} blocks"
+            )
+        self.reset()
+        for stmt in blocks[0].stmts:
+            self._encode(stmt)
+            if len(self._builder) >= self.chunk_size:
+                self._flush()
+        self._flush()
+
+    def build(self, version: tuple[int, int] = (1, 0)) -> Program:
+        """Build the program from the instructions encoded so far."""
+        self._flush()
+        if not self._chunks:
+            return self._builder.build(version)
+        return from_columns(
+            version, *(np.concatenate(column) for column in zip(*self._chunks))
+        )
+
+    # ── Buffering ──────────────────────────────────────────────────────────
+
+    def _flush(self) -> None:
+        if self.validate:
+            self._check_address_groups()
+        if len(self._builder):
+            self._chunks.append(self._builder.to_arrays())
+            self._builder = ColumnBuilder()
+
+    def _check_address_groups(self) -> None:
+        if not self._location_groups and not self._lane_groups:
+            return
+        location_groups, self._location_groups = self._location_groups, []
+        lane_groups, self._lane_groups = self._lane_groups, []
+        location_errors, lane_errors = self.arch_spec.check_many(
+            [locations for _, locations in location_groups],
+            [lanes for _, lanes in lane_groups],
+        )
+        if location_errors:
+            group, error = location_errors[0]
+            stmt, _ = location_groups[group]
+            raise EncodingError(stmt, f"Invalid location address: {error}")
+        if lane_errors:
+            group, error = lane_errors[0]
+            stmt, lanes = lane_groups[group]
+            raise EncodingError(
+                stmt, f"Invalid lane group (count={len(lanes)}): {error}"
+            )
+
+    def _check_locations(
+        self, stmt: ir.Statement, locations: tuple[LocationAddress, ...]
+    ) -> None:
+        if self.validate:
+            self._location_groups.append((stmt, locations))
+
+    # ── Operands ───────────────────────────────────────────────────────────
+
+    def _operand(self, value: ir.SSAValue, consumer: ir.Statement) -> _Operand:
+        """The stack_move operand ``value`` lowers to as an arg of ``consumer``."""
+        stack_value = self._values.get(value)
+        if stack_value is not None:
+            return stack_value
+        if isinstance(value, ir.ResultValue):
+            owner = value.owner
+            if isinstance(owner, kirin_py.Constant):
+                val = owner.value.unwrap()
+                if isinstance(val, float):
+                    return _Const("const_float", val)
+                if isinstance(val, int) and not isinstance(val, bool):
+                    return _Const("const_int", val)
+            elif (op := _CONST_OPS.get(type(owner))) is not None:
+                return _Const(op, owner.value)  # type: ignore[attr-defined]
+        source = (
+            type(value.owner).__name__
+            if isinstance(value, ir.ResultValue)
+            else "a block argument"
+        )
+        raise EncodingError(
+            consumer,
+            f"{type(consumer).__name__} operand defined by {source} has no "
+            "bytecode counterpart",
+        )
+
+    def _define(self, value: ir.SSAValue, type_tag: int = _INT_TAG) -> None:
+        """Track ``value`` as the stack result of the instruction just encoded."""
+        uses = _stack_uses(value)
+        if uses:
+            self._alias(_StackValue(uses, type_tag), value)
+
+    def _alias(self, stack_value: _StackValue, value: ir.SSAValue) -> None:
+        stack_value.aliases.append(value)
+        self._values[value] = stack_value
+
+    def _push(self, const: _Const) -> None:
+        if const.op == "const_float":
+            self._builder.const_float(const.value)
+        elif const.op == "const_int":
+            self._builder.const_int(const.value)
+        else:
+            self._builder.append(const.op, const.value.encode())
+
+    def _emit(
+        self,
+        op: str,
+        operands: Sequence[_Operand] = (),
+        operand0: int = 0,
+        operand1: int = 0,
+        operand2: int = 0,
+        *,
+        has_result: bool = False,
+    ) -> None:
+        """Append ``op`` and the stack manipulation ``stackify`` puts around it.
+
+        ``operands`` are in stack_move argument order (top of stack first).
+        """
+        slots = Counter(
+            operand for operand in operands if isinstance(operand, _StackValue)
+        )
+        # Every slot of a multi-use value is dup-ed unless no later
+        # instruction consumes the value.
+        dups = sum(
+            count
+            for value, count in slots.items()
+            if value.uses > 1 and value.remaining != count
+        )
+        for _ in range(dups):
+            self._builder.append("dup")
+        for operand in reversed(operands):
+            if isinstance(operand, _Const):
+                self._push(operand)
+        self._builder.append(op, operand0, operand1, operand2)
+        if has_result:
+            for _ in range(dups):
+                self._builder.append("swap")
+        for value, count in slots.items():
+            value.remaining -= count
+            if value.remaining <= 0:
+                for alias in value.aliases:
+                    self._values.pop(alias, None)
+
+    # ── Statements ─────────────────────────────────────────────────────────
+
+    @singledispatchmethod
+    def _encode(self, stmt: ir.Statement) -> None:
+        """Default: pure statements are encoded by their consumers, if any."""
+        if not stmt.has_trait(ir.Pure):
+            raise EncodingError(stmt)
+
+    @_encode.register(move.Load)
+    @_encode.register(move.Store)
+    @_encode.register(func.ConstantNone)
+    def _(self, stmt: ir.Statement) -> None:
+        pass
+
+    @_encode.register(move.Fill)
+    def _(self, stmt: move.Fill) -> None:
+        self._check_locations(stmt, stmt.location_addresses)
+        op = "fill" if self._first_fill_emitted else "initial_fill"
+        self._first_fill_emitted = True
+        locations = [_Const("const_loc", addr) for addr in stmt.location_addresses]
+        self._emit(op, locations, len(locations))
+
+    @_encode.register(move.Move)
+    def _(self, stmt: move.Move) -> None:
+        if self.validate and stmt.lanes:
+            self._lane_groups.append((stmt, stmt.lanes))
+        lanes = [_Const("const_lane", addr) for addr in stmt.lanes]
+        self._emit("move", lanes, len(lanes))
+
+    @_encode.register(move.LocalR)
+    def _(self, stmt: move.LocalR) -> None:
+        self._check_locations(stmt, stmt.location_addresses)
+        locations = [_Const("const_loc", addr) for addr in stmt.location_addresses]
+        operands = [
+            self._operand(stmt.axis_angle, stmt),
+            self._operand(stmt.rotation_angle, stmt),
+            *locations,
+        ]
+        self._emit("local_r", operands, len(locations))
+
+    @_encode.register(move.LocalRz)
+    def _(self, stmt: move.LocalRz) -> None:
+        self._check_locations(stmt, stmt.location_addresses)
+        locations = [_Const("const_loc", addr) for addr in stmt.location_addresses]
+        operands = [self._operand(stmt.rotation_angle, stmt), *locations]
+        self._emit("local_rz", operands, len(locations))
+
+    @_encode.register(move.GlobalR)
+    def _(self, stmt: move.GlobalR) -> None:
+        operands = [
+            self._operand(stmt.axis_angle, stmt),
+            self._operand(stmt.rotation_angle, stmt),
+        ]
+        self._emit("global_r", operands)
+
+    @_encode.register(move.GlobalRz)
+    def _(self, stmt: move.GlobalRz) -> None:
+        self._emit("global_rz", [self._operand(stmt.rotation_angle, stmt)])
+
+    @_encode.register(move.CZ)
+    def _(self, stmt: move.CZ) -> None:
+        self._emit("cz", [_Const("const_zone", stmt.zone_address)])
+
+    @_encode.register(move.Measure)
+    def _(self, stmt: move.Measure) -> None:
+        self._measure(stmt.zone_addresses, stmt.future)
+
+    @_encode.register(move.EndMeasure)
+    def _(self, stmt: move.EndMeasure) -> None:
+        self._measure(stmt.zone_addresses, stmt.result)
+
+    def _measure(
+        self, zone_addresses: tuple[ZoneAddress, ...], future: ir.SSAValue
+    ) -> None:
+        zones = [_Const("const_zone", addr) for addr in zone_addresses]
+        self._emit("measure", zones, len(zones), has_result=True)
+        if future.uses:
+            self._futures[future] = _Future(zone_addresses)
+
+    @_encode.register(move.GetFutureResult)
+    def _(self, stmt: move.GetFutureResult) -> None:
+        future = self._futures.get(stmt.measurement_future)
+        if future is None:
+            raise EncodingError(
+                stmt, "GetFutureResult does not read a measurement future"
+            )
+        if not future.awaited:
+            self._await(stmt.measurement_future, future)
+
+        self._check_locations(stmt, (stmt.location_address,))
+        index = future.indices.pop(stmt)
+        if index not in future.items:
+            # The first read of an index carries the get_item for all of them;
+            # CSE keeps the first of equal GetItems and DCE drops unused ones.
+            item = None
+            uses = future.key_uses.get(index, 0)
+            if uses:
+                assert future.result is not None
+                self._emit(
+                    "get_item",
+                    [future.result, _Const("const_int", index)],
+                    1,
+                    has_result=True,
+                )
+                item = _StackValue(uses)
+            future.items[index] = item
+        item = future.items[index]
+        if item is not None and _stack_uses(stmt.result):
+            self._alias(item, stmt.result)
+        if not future.indices:
+            del self._futures[stmt.measurement_future]
+
+    def _await(self, value: ir.SSAValue, future: _Future) -> None:
+        """Encode ``await_measure`` before the first read of ``future``."""
+        for use in value.uses:
+            read = use.stmt
+            if not isinstance(read, move.GetFutureResult):
+                continue
+            index = self._measure_flat_index(
+                future.zone_addresses, read.zone_address, read.location_address
+            )
+            future.indices[read] = index
+            uses = _stack_uses(read.result)
+            if uses:
+                future.key_uses[index] = future.key_uses.get(index, 0) + uses
+        self._emit("await_measure", has_result=True)
+        future.awaited = True
+        if future.key_uses:
+            future.result = _StackValue(len(future.key_uses))
+
+    def _measure_flat_index(
+        self,
+        zone_addresses: tuple[ZoneAddress, ...],
+        target_zone: ZoneAddress,
+        target_loc: LocationAddress,
+    ) -> int:
+        """Flat index of (target_zone, target_loc) in the measurement array."""
+        offset = 0
+        for zone in zone_addresses:
+            if zone == target_zone:
+                within = self.arch_spec.get_zone_index(target_loc, zone)
+                if within is None:
+                    raise ValueError(
+                        f"location {target_loc!r} not found in zone {zone!r}"
+                    )
+                return offset + within
+            size = self._zone_sizes.get(zone)
+            if size is None:
+                size = sum(1 for _ in self.arch_spec.yield_zone_locations(zone))
+                self._zone_sizes[zone] = size
+            offset += size
+        raise ValueError(
+            f"zone {target_zone!r} not found in measurement zone_addresses"
+        )
+
+    @_encode.register(kirin_ilist.New)
+    def _(self, stmt: kirin_ilist.New) -> None:
+        values = tuple(stmt.values)
+        if not values:
+            return  # empty ilist placeholder — no bytecode counterpart
+
+        # 2-D: every value is a row deferred below; flatten the rows.
+        rows = [row for value in values if (row := self._rows.get(value)) is not None]
+        if len(rows) == len(values):
+            operands = [operand for row in rows for operand in row.operands]
+            self._emit(
+                "new_array",
+                operands,
+                rows[0].type_tag,
+                len(rows),
+                len(rows[0].operands),
+                has_result=True,
+            )
+            for value in values:
+                if len(value.uses) == 1:
+                    self._rows.pop(value, None)
+            self._define(stmt.result)
+            return
+
+        operands = [self._operand(value, stmt) for value in values]
+        first_operand = operands[0]
+        type_tag = (
+            _CONST_TAGS[first_operand.op]
+            if isinstance(first_operand, _Const)
+            else first_operand.type_tag
+        )
+        if self._is_row(stmt):
+            self._rows[stmt.result] = _Row(operands, type_tag)
+            return
+        self._emit("new_array", operands, type_tag, len(values), has_result=True)
+        self._define(stmt.result)
+
+    @staticmethod
+    def _is_row(stmt: kirin_ilist.New) -> bool:
+        """Whether ``stmt`` is only used as a row of 2-D ``ilist.New``s."""
+        return bool(stmt.result.uses) and all(
+            isinstance(use.stmt, kirin_ilist.New)
+            and all(
+                isinstance(value, ir.ResultValue)
+                and isinstance(value.owner, kirin_ilist.New)
+                and len(value.owner.values) > 0
+                for value in use.stmt.values
+            )
+            for use in stmt.result.uses
+        )
+
+    @_encode.register(_annotate.stmts.SetDetector)
+    def _(self, stmt: _annotate.stmts.SetDetector) -> None:
+        operands = [self._operand(stmt.measurements, stmt)]
+        self._emit("set_detector", operands, has_result=True)
+        self._define(stmt.result, type_tag=7)
+
+    @_encode.register(_annotate.stmts.SetObservable)
+    def _(self, stmt: _annotate.stmts.SetObservable) -> None:
+        operands = [self._operand(stmt.measurements, stmt)]
+        self._emit("set_observable", operands, has_result=True)
+        self._define(stmt.result, type_tag=8)
+
+    @_encode.register(func.Return)
+    def _(self, stmt: func.Return) -> None:
+        value = stmt.value
+        if isinstance(value, ir.ResultValue) and isinstance(
+            value.owner, func.ConstantNone
+        ):
+            self._emit("halt")
+        else:
+            self._emit("return", [self._operand(value, stmt)])
+
+
+def stream_program(
+    method: ir.Method,
+    arch_spec: ArchSpec,
+    version: tuple[int, int] = (1, 0),
+    *,
+    chunk_size: int = 1 << 16,
+    validate: bool = False,
+) -> Program:
+    """Encode a single-block move ir.Method into a bytecode Program.
+
+    Equivalent to ``MoveToStackMove(arch_spec).emit_bytecode(method, version)``
+    but encodes the move IR in one pass, without building the stack_move IR
+    or mutating ``method``. See ``StreamingEncoder`` for ``chunk_size`` and
+    ``validate``.
+    """
+    encoder = StreamingEncoder(
+        arch_spec=arch_spec, chunk_size=chunk_size, validate=validate
+    )
+    encoder.run(method)
+    return encoder.build(version)
@@ -1,8 +1,9 @@
 from bloqade.analysis import address
 from kirin import exception, interp, ir, types
+from kirin.analysis import TypeInference, const
 from kirin.analysis.forward import ForwardFrame
 from kirin.decl import info, statement
-from kirin.dialects import ilist
+from kirin.dialects import ilist, scf
 from kirin.lattice.empty import EmptyLattice
 
 from bloqade import types as bloqade_types
@@ -12,6 +13,7 @@ from bloqade.lanes.analysis.placement import (
     AtomState,
     ConcreteState,
     ExecuteCZ,
+    ExecuteCZReturn,
     MoveToPlacementStrategyABC,
     PlacementAnalysis,
     PlacementError,
@@ -285,6 +287,59 @@ class StaticPlacement(ir.Statement):
             )
 
 
+@statement(dialect=dialect)
+class Repeat(ir.Statement):
+    """Execute the body region ``count`` times.
+
+    Produced from ``scf.For`` loops over a constant iterable whose body does
+    not use the loop variable (see ``rewrite.repeat``). The body is a single
+    block without arguments, terminated by ``scf.Yield``; it carries no loop
+    state and the statement has no results.
+
+    Analyses evaluate the body once. Placement additionally requires every
+    StaticPlacement in the body to end in the layout it started from, so that
+    a single placement of the body is valid for every iteration.
+    """
+
+    traits = frozenset({ir.SSACFG(), ir.HasCFG()})
+    count: int = info.attribute()
+    body: ir.Region = info.region(multi=False)
+
+    def check(self) -> None:
+        if self.count < 1:
+            raise exception.StaticCheckError(
+                f"Repeat count must be positive, got {self.count}"
+            )
+
+        if len(self.body.blocks) != 1:
+            raise exception.StaticCheckError("Repeat body must have exactly one block")
+
+        body_block = self.body.blocks[0]
+        if len(body_block.args) != 0:
+            raise exception.StaticCheckError("Repeat body must not take arguments")
+
+        if not isinstance(body_block.last_stmt, scf.Yield):
+            raise exception.StaticCheckError(
+                "Repeat body must end with an scf.Yield statement"
+            )
+
+
+def _eval_repeat_body(
+    _interp: interp.BaseInterpreter, frame: ForwardFrame, stmt: Repeat
+) -> None:
+    """Evaluate the body of ``stmt`` once and expose its values to ``frame``."""
+    with _interp.new_frame(stmt, has_parent_access=True) as body_frame:
+        _interp.frame_call_region(body_frame, stmt, stmt.body)
+    frame.set_values(body_frame.entries.keys(), body_frame.entries.values())
+
+
+def _exit_layout(state: ConcreteState) -> tuple[LocationAddress, ...]:
+    """Layout the atoms occupy once the moves of ``state`` have executed."""
+    if isinstance(state, ExecuteCZReturn):
+        return state.initial_layout
+    return state.layout
+
+
 @dialect.register(key="runtime.placement")
 class PlacementMethods(interp.MethodTable):
     @interp.impl(CZ)
@@ -403,6 +458,15 @@ class PlacementMethods(interp.MethodTable):
 
         match frame_call_result:
             case (ConcreteState() as final_state, *ret):
+                if isinstance(stmt.parent_stmt, Repeat) and (
+                    _exit_layout(final_state) != initial_state.layout
+                ):
+                    _interp.cz_lookahead_buffers.pop(body_block, None)
+                    _interp.cz_lookahead_stmt_positions.pop(body_block, None)
+                    raise PlacementError(
+                        "StaticPlacement inside a Repeat must end in the layout "
+                        "it started from"
+                    )
                 for qid, qubit in enumerate(stmt.qubits):
                     _interp.move_count[qubit] += final_state.move_count[qid]
                 _interp.cz_lookahead_buffers.pop(body_block, None)
@@ -415,6 +479,28 @@ class PlacementMethods(interp.MethodTable):
                     "StaticPlacement body did not return a ConcreteState"
                 )
 
+    @interp.impl(Repeat)
+    def impl_repeat(
+        self,
+        _interp: PlacementAnalysis,
+        frame: ForwardFrame[AtomState],
+        stmt: Repeat,
+    ):
+        strategy = _interp.placement_strategy
+        if not strategy.returns_to_entry_layout:
+            raise PlacementError(
+                f"placement strategy {type(strategy).__name__} does not return "
+                "atoms to their entry layout, so a Repeat body cannot be placed "
+                "once for all iterations"
+            )
+        # place the body once; every iteration performs the same moves
+        move_count_before = dict(_interp.move_count)
+        _eval_repeat_body(_interp, frame, stmt)
+        for qubit, count in list(_interp.move_count.items()):
+            body_moves = count - move_count_before.get(qubit, 0)
+            _interp.move_count[qubit] += body_moves * (stmt.count - 1)
+        return ()
+
     @interp.impl(EndMeasure)
     def end_measure(
         self,
@@ -487,6 +573,20 @@ class InitialLayoutMethods(interp.MethodTable):
 
         return tuple(EmptyLattice.bottom() for _ in stmt.results)
 
+    @interp.impl(Repeat)
+    def repeat(
+        self,
+        _interp: LayoutAnalysis,
+        frame: ForwardFrame[EmptyLattice],
+        stmt: Repeat,
+    ):
+        # the layout heuristic weighs CZ stages by how often they execute, so
+        # record the body's stages once per iteration without re-evaluating it
+        num_stages = len(_interp.stages)
+        _eval_repeat_body(_interp, frame, stmt)
+        _interp.stages.extend(_interp.stages[num_stages:] * (stmt.count - 1))
+        return ()
+
 
 @dialect.register(key="qubit.address")
 class QubitAddressAnalysis(interp.MethodTable):
@@ -502,3 +602,41 @@ class QubitAddressAnalysis(interp.MethodTable):
         addr = address.AddressQubit(_interp.next_address)
         _interp.next_address += 1
         return (addr,)
+
+    @interp.impl(Repeat)
+    def repeat(
+        self,
+        _interp: address.AddressAnalysis,
+        frame: ForwardFrame[address.Address],
+        stmt: Repeat,
+    ):
+        _eval_repeat_body(_interp, frame, stmt)
+        return ()
+
+
+@dialect.register(key="constprop")
+class RepeatConstProp(interp.MethodTable):
+    """Propagate constants into a Repeat body so it folds like straight-line code.
+
+    The body has no loop variable, so one evaluation yields the values of
+    every iteration.
+    """
+
+    @interp.impl(Repeat)
+    def repeat(self, _interp: const.Propagate, frame: const.Frame, stmt: Repeat):
+        _eval_repeat_body(_interp, frame, stmt)
+        return ()
+
+
+@dialect.register(key="typeinfer")
+class RepeatTypeInfer(interp.MethodTable):
+
+    @interp.impl(Repeat)
+    def repeat(
+        self,
+        _interp: TypeInference,
+        frame: ForwardFrame[types.TypeAttribute],
+        stmt: Repeat,
+    ):
+        _eval_repeat_body(_interp, frame, stmt)
+        return ()
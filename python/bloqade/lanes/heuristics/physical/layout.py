@@ -5,6 +5,9 @@ from collections import defaultdict
 from dataclasses import dataclass, field
 
 import kahip
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import shortest_path
 
 from bloqade.lanes.analysis.layout import LayoutHeuristicABC
 from bloqade.lanes.arch.gemini.physical import (
@@ -114,21 +117,18 @@ class PhysicalLayoutHeuristicGraphPartitionCenterOut(LayoutHeuristicABC):
         if k_words == 1:
             return {qid: 0 for qid in qids}
 
-        # Build a weighted undirected CSR graph expected by KaHIP.
-        adjacency: list[list[int]] = [[] for _ in range(n)]
-        adjacency_w: list[list[int]] = [[] for _ in range(n)]
-        for (u, v), w in sorted(edge_weights.items()):
-            adjacency[u].append(v)
-            adjacency[v].append(u)
-            adjacency_w[u].append(w)
-            adjacency_w[v].append(w)
-        xadj = [0]
-        adjncy: list[int] = []
-        adjcwgt: list[int] = []
-        for node in range(n):
-            adjncy.extend(adjacency[node])
-            adjcwgt.extend(adjacency_w[node])
-            xadj.append(len(adjncy))
+        # Build a weighted undirected CSR graph expected by KaHIP. Each node's
+        # neighbours are listed in sorted edge order.
+        edges = sorted(edge_weights.items())
+        pairs = np.array([edge for edge, _ in edges], dtype=np.int64).reshape(-1, 2)
+        weights = np.array([w for _, w in edges], dtype=np.int64)
+        src = np.concatenate((pairs[:, 0], pairs[:, 1]))
+        dst = np.concatenate((pairs[:, 1], pairs[:, 0]))
+        edge_index = np.tile(np.arange(len(edges)), 2)
+        order = np.lexsort((edge_index, src))
+        xadj = [0] + np.cumsum(np.bincount(src, minlength=n)).tolist()
+        adjncy = dst[order].tolist()
+        adjcwgt = np.tile(weights, 2)[order].tolist()
 
         # KaHIP exposes a global imbalance tolerance (epsilon). We keep it strict.
         imbalance = max(float(self.u_factor) / 1000.0, 1e-6)
@@ -245,50 +245,35 @@ class PhysicalLayoutHeuristicGraphPartitionCenterOut(LayoutHeuristicABC):
 
         return placed
 
-    def _site_distance_matrix(self) -> list[list[int]]:
+    def _site_distance_matrix(self) -> np.ndarray:
         """Site distance weighted toward index similarity and bus proximity."""
         self._validate_single_zone()
         n_sites = self.sites_per_partition
         zone = self.arch_spec.zones[0]
-        adjacency: list[set[int]] = [set() for _ in range(n_sites)]
+        sites = np.arange(n_sites)
+        index_distance = np.abs(sites[:, None] - sites[None, :])
+
+        adjacency = np.zeros((n_sites, n_sites), dtype=bool)
         for bus in zone.site_buses:
             for src, dst in zip(bus.src, bus.dst, strict=True):
-                if 0 <= src < n_sites and 0 <= dst < n_sites:
-                    adjacency[src].add(dst)
-                    adjacency[dst].add(src)
+                if 0 <= src < n_sites and 0 <= dst < n_sites and src != dst:
+                    adjacency[src, dst] = adjacency[dst, src] = True
 
         # Fall back to linear site distance when no site-bus edges exist.
-        if all(len(neighbors) == 0 for neighbors in adjacency):
-            return [
-                [abs(src - dst) for dst in range(n_sites)] for src in range(n_sites)
-            ]
+        if not adjacency.any():
+            return index_distance
 
-        distance: list[list[int]] = [
-            [n_sites for _ in range(n_sites)] for _ in range(n_sites)
-        ]
-        for src in range(n_sites):
-            distance[src][src] = 0
-            frontier = [src]
-            while frontier:
-                next_frontier: list[int] = []
-                for node in frontier:
-                    d = distance[src][node]
-                    for nbr in adjacency[node]:
-                        if d + 1 < distance[src][nbr]:
-                            distance[src][nbr] = d + 1
-                            next_frontier.append(nbr)
-                frontier = next_frontier
+        bus_distance = shortest_path(
+            csr_matrix(adjacency), method="D", directed=False, unweighted=True
+        )
+        bus_distance = np.where(
+            np.isinf(bus_distance), index_distance, bus_distance
+        ).astype(np.int64)
 
         # Blend a strong site-index term with site-bus shortest-path proximity.
         # This keeps "same site id across words" as the primary objective while
         # still preferring closer points in the site-bus graph as a tie-breaker.
-        for src in range(n_sites):
-            for dst in range(n_sites):
-                bus_distance = distance[src][dst]
-                if bus_distance >= n_sites:
-                    bus_distance = abs(src - dst)
-                distance[src][dst] = (100 * abs(src - dst)) + bus_distance
-        return distance
+        return 100 * index_distance + bus_distance
 
     def _candidate_slots(
         self, k_words: int, target_sizes: tuple[int, ...]
@@ -310,108 +295,99 @@ class PhysicalLayoutHeuristicGraphPartitionCenterOut(LayoutHeuristicABC):
         q_to_node: dict[int, int],
         slots: list[LocationAddress],
     ) -> dict[int, LocationAddress]:
+        """Assign qubits to slots minimizing interaction-weighted site distance.
+
+        A greedy center-out seed is refined by first-improvement pairwise swaps
+        in qubit order. Both phases work on a dense interaction-weight matrix
+        ``W`` and the slot distance matrix, so each swap candidate costs O(1)
+        and each accepted swap O(n) per interacting qubit.
+        """
         if len(qubits) != len(slots):
             raise RuntimeError("Qubit count and slot count must match for assignment.")
 
-        site_distance = self._site_distance_matrix()
         qids = tuple(sorted(qubits))
-        node_to_q = {node: qid for qid, node in q_to_node.items()}
-
-        edge_weight_by_q: dict[int, dict[int, int]] = {qid: {} for qid in qids}
-        for (u, v), weight in weighted_edges.items():
-            q_u = node_to_q[u]
-            q_v = node_to_q[v]
-            edge_weight_by_q[q_u][q_v] = weight
-            edge_weight_by_q[q_v][q_u] = weight
-
-        weighted_degree = {qid: sum(edge_weight_by_q[qid].values()) for qid in qids}
-        unweighted_degree = {qid: len(edge_weight_by_q[qid]) for qid in qids}
+        n = len(qids)
+        node_to_index = {q_to_node[qid]: i for i, qid in enumerate(qids)}
+
+        weight = np.zeros((n, n))
+        for (u, v), w in weighted_edges.items():
+            i = node_to_index[u]
+            j = node_to_index[v]
+            weight[i, j] = weight[j, i] = w
+
+        site_ids = np.array([slot.site_id for slot in slots], dtype=np.int64)
+        word_ids = np.array([slot.word_id for slot in slots], dtype=np.int64)
+        slot_indices = np.arange(n)
+        slot_distance = self._site_distance_matrix()[np.ix_(site_ids, site_ids)]
+        slot_distance = slot_distance.astype(np.float64)
+
+        weighted_degree = weight.sum(axis=1)
+        unweighted_degree = np.count_nonzero(weight, axis=1)
         qubit_order = sorted(
-            qids,
-            key=lambda qid: (
-                weighted_degree[qid],
-                unweighted_degree[qid],
-                -qid,
-            ),
+            range(n),
+            key=lambda i: (weighted_degree[i], unweighted_degree[i], -qids[i]),
             reverse=True,
         )
-
-        slot_centrality = []
-        for i, slot in enumerate(slots):
-            centrality = sum(
-                site_distance[slot.site_id][other.site_id] for other in slots
-            )
-            slot_centrality.append((centrality, slot.site_id, slot.word_id, i))
-        slot_order = [idx for _, _, _, idx in sorted(slot_centrality)]
-
-        q_to_slot_idx: dict[int, int] = {}
-        used_slots: set[int] = set()
-        first_q = qubit_order[0]
-        first_slot = slot_order[0]
-        q_to_slot_idx[first_q] = first_slot
-        used_slots.add(first_slot)
-
-        for qid in qubit_order[1:]:
-            best_slot_idx: int | None = None
-            best_key: tuple[float, int, int, int] | None = None
-            for slot_idx in slot_order:
-                if slot_idx in used_slots:
-                    continue
-                slot = slots[slot_idx]
-                incremental = 0.0
-                for other_qid, other_slot_idx in q_to_slot_idx.items():
-                    w = edge_weight_by_q[qid].get(other_qid, 0)
-                    if w == 0:
-                        continue
-                    other_slot = slots[other_slot_idx]
-                    incremental += w * site_distance[slot.site_id][other_slot.site_id]
-                key = (incremental, slot.site_id, slot.word_id, slot_idx)
-                if best_key is None or key < best_key:
-                    best_key = key
-                    best_slot_idx = slot_idx
-            assert best_slot_idx is not None
-            q_to_slot_idx[qid] = best_slot_idx
-            used_slots.add(best_slot_idx)
-
-        def swap_delta(qid_a: int, qid_b: int) -> int:
-            slot_a = slots[q_to_slot_idx[qid_a]]
-            slot_b = slots[q_to_slot_idx[qid_b]]
-            delta = 0
-            for other_qid in qids:
-                if other_qid == qid_a or other_qid == qid_b:
-                    continue
-                slot_other = slots[q_to_slot_idx[other_qid]]
-                w_a = edge_weight_by_q[qid_a].get(other_qid, 0)
-                w_b = edge_weight_by_q[qid_b].get(other_qid, 0)
-                if w_a:
-                    delta += w_a * (
-                        site_distance[slot_b.site_id][slot_other.site_id]
-                        - site_distance[slot_a.site_id][slot_other.site_id]
-                    )
-                if w_b:
-                    delta += w_b * (
-                        site_distance[slot_a.site_id][slot_other.site_id]
-                        - site_distance[slot_b.site_id][slot_other.site_id]
-                    )
-            return delta
-
-        # Deterministic hill-climbing over pairwise swaps.
-        max_passes = max(1, len(qids))
+        slot_order = np.lexsort(
+            (slot_indices, word_ids, site_ids, slot_distance.sum(axis=1))
+        )
+        tie_order = np.lexsort((slot_indices, word_ids, site_ids))
+
+        # Greedy seed: the heaviest qubit takes the most central slot, then each
+        # qubit takes the free slot closest to its already placed neighbours.
+        slot_of = np.full(n, -1, dtype=np.int64)
+        used = np.zeros(n, dtype=bool)
+        slot_of[qubit_order[0]] = slot_order[0]
+        used[slot_order[0]] = True
+        for i in qubit_order[1:]:
+            neighbours = np.flatnonzero((weight[i] != 0) & (slot_of >= 0))
+            incremental = weight[i, neighbours] @ slot_distance[slot_of[neighbours]]
+            incremental = np.where(used, np.inf, incremental)[tie_order]
+            best = tie_order[np.argmin(incremental)]
+            slot_of[i] = best
+            used[best] = True
+
+        # Deterministic hill-climbing over pairwise swaps. With S the distance
+        # between the slots of two qubits and M = W @ S, swapping a and b
+        # changes the cost by M[a,b] + M[b,a] - M[a,a] - M[b,b] + 2 W[a,b] S[a,b].
+        dist = slot_distance[np.ix_(slot_of, slot_of)]
+        m = weight @ dist
+
+        def swap(a: int, b: int) -> None:
+            # Only rows of qubits interacting with a or b change, by a rank-1
+            # term; the columns of a and b then trade places.
+            diff = weight[:, a] - weight[:, b]
+            rows = np.flatnonzero(diff)
+            m[rows] += np.outer(diff[rows], dist[b] - dist[a])
+            m[:, [a, b]] = m[:, [b, a]]
+            dist[[a, b]] = dist[[b, a]]
+            dist[:, [a, b]] = dist[:, [b, a]]
+            slot_of[[a, b]] = slot_of[[b, a]]
+
+        max_passes = max(1, n)
         for _ in range(max_passes):
             improved = False
-            for i, qid_a in enumerate(qids):
-                for qid_b in qids[i + 1 :]:
-                    delta = swap_delta(qid_a, qid_b)
-                    if delta < 0:
-                        q_to_slot_idx[qid_a], q_to_slot_idx[qid_b] = (
-                            q_to_slot_idx[qid_b],
-                            q_to_slot_idx[qid_a],
-                        )
-                        improved = True
+            for a in range(n):
+                start = a + 1
+                while start < n:
+                    delta = (
+                        m[a, start:]
+                        + m[start:, a]
+                        - m[a, a]
+                        - np.diagonal(m)[start:]
+                        + 2 * weight[a, start:] * dist[a, start:]
+                    )
+                    candidates = np.flatnonzero(delta < 0)
+                    if len(candidates) == 0:
+                        break
+                    b = start + int(candidates[0])
+                    swap(a, b)
+                    improved = True
+                    start = b + 1
             if not improved:
                 break
 
-        return {qid: slots[q_to_slot_idx[qid]] for qid in qids}
+        return {qid: slots[slot_of[i]] for i, qid in enumerate(qids)}
 
     def _compute_layout_from_cz_layers(
         self,
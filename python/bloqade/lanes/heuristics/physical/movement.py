@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from typing import Literal
 
@@ -103,6 +104,24 @@ class RustPlacementTraversal:
     (sometimes increase) move counts (e.g. DFS may relocate a spectator to
     shorten a participant's path); the search-effort reduction is not always
     move-count-free."""
+    time_budget_s: float | None = None
+    """Wall-clock budget in seconds for each CZ stage.
+
+    ``None`` (default) imposes no deadline. Otherwise the budget is shared by
+    every candidate target tried for the stage, like ``max_expansions``: each
+    solve gets whatever time the earlier candidates left. A solve cut short
+    while holding a plan returns it as ``"solved"`` (anytime search), and the
+    gap to the lower bound is folded into ``bound_stats_total`` when the
+    strategy can bound it."""
+    warm_start: bool = False
+    """Seed each CZ stage's solve with the previous stage's plan.
+
+    Off by default. When ``True`` the strategy keeps one
+    :class:`~bloqade.lanes.bytecode._native.WarmStart` across stages: each
+    solve first replays the last solved plan, forward and inverted, and
+    treats a replay that reaches the new target as an incumbent. Repeated
+    layers and return legs then cost no search at all, and the returned plan
+    is never worse than the cold solve's."""
 
 
 def _move_search_from_traversal(
@@ -147,6 +166,7 @@ class PhysicalPlacementStrategy(MoveToPlacementStrategyABC):
     _cz_counter: int = field(default=0, init=False, repr=False)
     _trace_cz_index: int | None = field(default=None, init=False, repr=False)
     _engine: SearchEngine | None = field(default=None, init=False, repr=False)
+    _warm_start: _native.WarmStart | None = field(default=None, init=False, repr=False)
     _rust_nodes_expanded_total: int = field(default=0, init=False, repr=False)
     _rust_entropy_fallback_count: int = field(default=0, init=False, repr=False)
     _bound_stats_total: dict[str, float] = field(
@@ -377,12 +397,22 @@ class PhysicalPlacementStrategy(MoveToPlacementStrategyABC):
             ),
         )
         solver = self._make_target_solver(move_search)
+        if self.traversal.warm_start and self._warm_start is None:
+            self._warm_start = _native.WarmStart()
 
         remaining = self.traversal.max_expansions
+        deadline = (
+            None
+            if self.traversal.time_budget_s is None
+            else time.monotonic() + self.traversal.time_budget_s
+        )
         winning_result = None
         for candidate in candidates:
             if remaining is not None and remaining <= 0:
                 break
+            time_left = None if deadline is None else deadline - time.monotonic()
+            if time_left is not None and time_left <= 0.0:
+                break
             target_native = {
                 qid: loc._inner for qid, loc in candidate.items() if qid in participants
             }
@@ -391,6 +421,8 @@ class PhysicalPlacementStrategy(MoveToPlacementStrategyABC):
                 target_native,
                 blocked_native,
                 remaining,
+                time_left,
+                self._warm_start,
             )
             self._rust_nodes_expanded_total += int(result.nodes_expanded)
             self._accumulate_bound_stats(result.bound_stats)
@@ -417,7 +449,8 @@ class PhysicalPlacementStrategy(MoveToPlacementStrategyABC):
         if winning_result is None:
             raise PlacementError(
                 f"CZ routing solver failed for pairs {list(zip(controls, targets))}; "
-                "no candidate target layout was solved within the expansion budget"
+                "no candidate target layout was solved within the expansion or "
+                "time budget"
             )
 
         move_layers = convert_move_layers(winning_result.move_layers)
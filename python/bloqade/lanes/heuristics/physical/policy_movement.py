@@ -11,6 +11,7 @@ means main can keep evolving ``movement.py`` without colliding with DSL work.
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -55,6 +56,8 @@ class PolicyTraversal:
     policy_params: dict[str, Any] | None = None
     max_expansions: int | None = 300
     timeout_s: float | None = None
+    """Wall-clock budget in seconds per CZ stage, shared across candidate
+    targets the same way ``max_expansions`` is."""
 
 
 def _is_acceptable_solve(result: object) -> bool:
@@ -194,10 +197,18 @@ class PolicyPlacementStrategy(PlacementStrategyABC):
         blocked_native = [loc._inner for loc in state.occupied]
 
         remaining = self.traversal.max_expansions
+        deadline = (
+            None
+            if self.traversal.timeout_s is None
+            else time.monotonic() + self.traversal.timeout_s
+        )
         winning_result = None
         for candidate in candidates:
             if remaining is not None and remaining <= 0:
                 break
+            time_left = None if deadline is None else deadline - time.monotonic()
+            if time_left is not None and time_left <= 0.0:
+                break
             target_native = {qid: loc._inner for qid, loc in candidate.items()}
             result = runner.solve(
                 initial_native,
@@ -206,7 +217,7 @@ class PolicyPlacementStrategy(PlacementStrategyABC):
                 self.traversal.policy_path,
                 policy_params=self.traversal.policy_params,
                 max_expansions=remaining,
-                timeout_s=self.traversal.timeout_s,
+                timeout_s=time_left,
             )
             self._rust_nodes_expanded_total += int(result.nodes_expanded)
             if remaining is not None:
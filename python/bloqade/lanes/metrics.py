@@ -1,10 +1,12 @@
 from dataclasses import dataclass, field
 from typing import Any
 
-from bloqade.analysis.fidelity import FidelityAnalysis, FidelityRange
+import numpy as np
+from bloqade.analysis.fidelity import FidelityRange
 from kirin import ir
 
 from bloqade.lanes.analysis.atom.atom_state_data import AtomStateData
+from bloqade.lanes.analysis.fidelity import ArrayFidelityAnalysis
 from bloqade.lanes.analysis.layout import LayoutHeuristicABC
 from bloqade.lanes.analysis.placement.strategy import PlacementStrategyABC
 from bloqade.lanes.arch.gemini.physical import get_arch_spec as get_physical_arch_spec
@@ -65,6 +67,48 @@ class KernelMoveTimeMetrics:
     timing_model: str
 
 
+@dataclass(frozen=True)
+class KernelMetrics:
+    """Every kernel-level metric, derived from one compilation."""
+
+    fidelity: KernelFidelityMetrics
+    moves: KernelMoveMetrics
+    move_time: KernelMoveTimeMetrics
+    avg_hops_per_cz: float
+    avg_distance_um_per_cz: float
+
+
+@dataclass(frozen=True)
+class _MoveIRSummary:
+    """The statements of a move IR that the move analyses consume.
+
+    Collected in a single walk so each analysis reads the same lists instead
+    of re-walking the method.
+    """
+
+    moves: list[tuple[int, move.Move]]
+    """Every ``move`` with its position in the walk."""
+    timeline: list[move.Move | move.CZ]
+    """Every ``move`` and ``cz``, in program order."""
+    initial_layout: dict[int, Any] | None
+    """Qubit id -> location of the first ``logical_initialize``."""
+
+
+def _summarize_move_ir(move_mt: ir.Method) -> _MoveIRSummary:
+    moves: list[tuple[int, move.Move]] = []
+    timeline: list[move.Move | move.CZ] = []
+    initial_layout: dict[int, Any] | None = None
+    for index, stmt in enumerate(move_mt.callable_region.walk()):
+        if isinstance(stmt, move.Move):
+            moves.append((index, stmt))
+            timeline.append(stmt)
+        elif isinstance(stmt, move.CZ):
+            timeline.append(stmt)
+        elif isinstance(stmt, move.LogicalInitialize) and initial_layout is None:
+            initial_layout = dict(enumerate(stmt.location_addresses))
+    return _MoveIRSummary(moves=moves, timeline=timeline, initial_layout=initial_layout)
+
+
 def _logical_squin_to_move(
     mt: ir.Method,
     *,
@@ -95,23 +139,51 @@ class Metrics:
     Owns kernel-level analysis methods and delegates all move-metric
     computation (lane durations, costs, distances) to a
     ``MoveMetricCalculator`` instance.
+
+    The move IR of a kernel is compiled once per ``(kernel,
+    placement_strategy)`` pair, keyed by object identity, and shared by
+    every high-level analysis; ``analyze_all`` derives all metrics from that
+    single compilation. No analysis mutates the kernel or the memoized move
+    IR. Call ``clear_cache`` after mutating a kernel in place.
     """
 
     arch_spec: Any  # ArchSpec — use Any to avoid circular import
     noise_model: LogicalNoiseModelABC | None = None
     move_calc: MoveMetricCalculator = field(init=False, repr=False)
+    _move_ir_cache: dict[
+        tuple[int, int], tuple[ir.Method, PlacementStrategyABC, ir.Method]
+    ] = field(init=False, repr=False, default_factory=dict)
 
     def __post_init__(self) -> None:
         self.move_calc = MoveMetricCalculator(arch_spec=self.arch_spec)
 
+    def clear_cache(self) -> None:
+        """Drop every memoized move IR."""
+        self._move_ir_cache.clear()
+
     # --- Private helpers ---
 
-    def _compile_to_noisy_physical_squin(
+    def _compile_to_move(
         self,
         mt: ir.Method,
         *,
         placement_strategy: PlacementStrategyABC,
     ) -> ir.Method:
+        """Memoized move IR of ``mt``; callers must not mutate the result."""
+        key = (id(mt), id(placement_strategy))
+        if (entry := self._move_ir_cache.get(key)) is not None:
+            return entry[2]
+        move_mt = _logical_squin_to_move(
+            mt,
+            layout_heuristic=logical_layout.LogicalLayoutHeuristic(),
+            placement_strategy=placement_strategy,
+        )
+        # Hold the kernel and strategy so their ids cannot be reused while
+        # the entry is alive.
+        self._move_ir_cache[key] = (mt, placement_strategy, move_mt)
+        return move_mt
+
+    def _compile_to_noisy_physical_squin(self, move_mt: ir.Method) -> ir.Method:
         noise_model: LogicalNoiseModelABC
         if self.noise_model is None:
             noise_model = generate_logical_noise_model()
@@ -120,12 +192,9 @@ class Metrics:
         else:
             noise_model = generate_logical_noise_model()
 
-        move_mt = _logical_squin_to_move(
-            mt,
-            layout_heuristic=logical_layout.LogicalLayoutHeuristic(),
-            placement_strategy=placement_strategy,
-        )
-        move_mt = transversal_rewrites(move_mt)
+        # ``transversal_rewrites`` rewrites in place; work on a copy so the
+        # memoized move IR stays logical.
+        move_mt = transversal_rewrites(move_mt.similar())
         # Post-transversal move IR is physically addressed (the Steane
         # expansion emits one lane per physical site), so the emit-time
         # atom analysis and noise insertion must run against the physical
@@ -140,22 +209,41 @@ class Metrics:
 
     # --- High-level analysis methods ---
 
+    def analyze_all(
+        self,
+        mt: ir.Method,
+        *,
+        placement_strategy: PlacementStrategyABC,
+        flair_amplitude_delta: float = 1.0,
+    ) -> KernelMetrics:
+        """Fidelity, move counts, move time and per-CZ motion of ``mt``.
+
+        Compiles ``mt`` once (or reuses the memoized move IR) and runs the
+        move analyses over a single walk of it.
+
+        Raises:
+            MoveValidationError: If any move statement cannot execute
+                against the atom state it is applied to.
+        """
+        move_mt = self._compile_to_move(mt, placement_strategy=placement_strategy)
+        summary = _summarize_move_ir(move_mt)
+        avg_hops, avg_distance_um = self._per_cz_motion(summary)
+        return KernelMetrics(
+            fidelity=self._fidelity_metrics(move_mt),
+            moves=_move_metrics(summary),
+            move_time=self._move_time_metrics(summary, flair_amplitude_delta),
+            avg_hops_per_cz=avg_hops,
+            avg_distance_um_per_cz=avg_distance_um,
+        )
+
     def analyze_fidelity(
         self,
         mt: ir.Method,
         *,
         placement_strategy: PlacementStrategyABC,
     ) -> KernelFidelityMetrics:
-        physical_squin = self._compile_to_noisy_physical_squin(
-            mt,
-            placement_strategy=placement_strategy,
-        )
-        analysis = FidelityAnalysis(physical_squin.dialects)
-        analysis.run(physical_squin)
-        gate_fidelities = [_collapse_range(fid) for fid in analysis.gate_fidelities]
-        return KernelFidelityMetrics(
-            gate_fidelities=gate_fidelities,
-            gate_fidelity_product=_product_fidelity(gate_fidelities),
+        return self._fidelity_metrics(
+            self._compile_to_move(mt, placement_strategy=placement_strategy)
         )
 
     def analyze_moves(
@@ -164,18 +252,8 @@ class Metrics:
         *,
         placement_strategy: PlacementStrategyABC,
     ) -> KernelMoveMetrics:
-        move_mt = _logical_squin_to_move(
-            mt,
-            layout_heuristic=logical_layout.LogicalLayoutHeuristic(),
-            placement_strategy=placement_strategy,
-        )
-        move_event_count, moved_lane_count = _count_move_events_and_lanes(move_mt)
-        return KernelMoveMetrics(
-            approx_lane_parallelism=_compute_approx_lane_parallelism(
-                move_event_count, moved_lane_count
-            ),
-            moved_lane_count=moved_lane_count,
-        )
+        move_mt = self._compile_to_move(mt, placement_strategy=placement_strategy)
+        return _move_metrics(_summarize_move_ir(move_mt))
 
     def analyze_move_time(
         self,
@@ -184,11 +262,7 @@ class Metrics:
         placement_strategy: PlacementStrategyABC,
         flair_amplitude_delta: float = 1.0,
     ) -> KernelMoveTimeMetrics:
-        move_mt = _logical_squin_to_move(
-            mt,
-            layout_heuristic=logical_layout.LogicalLayoutHeuristic(),
-            placement_strategy=placement_strategy,
-        )
+        move_mt = self._compile_to_move(mt, placement_strategy=placement_strategy)
         return self.analyze_move_time_from_move_ir(
             move_mt,
             flair_amplitude_delta=flair_amplitude_delta,
@@ -201,46 +275,64 @@ class Metrics:
         move_mt: ir.Method,
         flair_amplitude_delta: float = 1.0,
     ) -> KernelMoveTimeMetrics:
-        mc = self.move_calc
-        timing_model = "flair_extracted_const_jerk"
-        events: list[MoveTimeEvent] = []
-        for event_index, stmt in enumerate(move_mt.callable_region.walk()):
-            if not isinstance(stmt, move.Move):
-                continue
+        return self._move_time_metrics(
+            _summarize_move_ir(move_mt), flair_amplitude_delta
+        )
 
-            lane_durations_us: list[float] = []
-            lane_segment_distances_um: list[list[float]] = []
-            lane_segment_durations_us: list[list[float]] = []
-            lane_pick_times_us: list[float] = []
-            lane_drop_times_us: list[float] = []
-
-            for lane in stmt.lanes:
-                path = self.arch_spec.get_path(lane)
-                segment_distances_um = list(mc.path_segment_distances_um(path))
-                segment_durations_us = [
-                    mc.motion_model.const_jerk_min_duration_us(d)
-                    for d in segment_distances_um
-                ]
-                normalized_amp = abs(float(flair_amplitude_delta))
-                ramp_time_us = normalized_amp / mc.motion_model.max_ramp_us
-                lane_duration_us = (
-                    ramp_time_us + sum(segment_durations_us) + ramp_time_us
-                )
+    def analyze_per_cz_motion(
+        self,
+        move_mt: ir.Method,
+    ) -> tuple[float, float]:
+        """Average hops and traveled distance per moving qubit per CZ episode.
 
-                lane_durations_us.append(lane_duration_us)
-                lane_segment_distances_um.append(segment_distances_um)
-                lane_segment_durations_us.append(segment_durations_us)
-                lane_pick_times_us.append(ramp_time_us)
-                lane_drop_times_us.append(ramp_time_us)
+        Raises:
+            MoveValidationError: If any move statement cannot execute
+                against the atom state it is applied to.
+        """
+        return self._per_cz_motion(_summarize_move_ir(move_mt))
 
-            event_duration_us = _compute_event_duration_us(lane_durations_us)
-            if len(lane_durations_us) == 0:
-                continue
+    # --- Analyses over a compiled move IR ---
 
-            rep_index = max(
-                range(len(lane_durations_us)), key=lane_durations_us.__getitem__
+    def _fidelity_metrics(self, move_mt: ir.Method) -> KernelFidelityMetrics:
+        physical_squin = self._compile_to_noisy_physical_squin(move_mt)
+        analysis = ArrayFidelityAnalysis(physical_squin.dialects)
+        analysis.run(physical_squin)
+        gate_fidelities = [_collapse_range(fid) for fid in analysis.gate_fidelities]
+        return KernelFidelityMetrics(
+            gate_fidelities=gate_fidelities,
+            gate_fidelity_product=_product_fidelity(gate_fidelities),
+        )
+
+    def _move_time_metrics(
+        self, summary: _MoveIRSummary, flair_amplitude_delta: float
+    ) -> KernelMoveTimeMetrics:
+        mc = self.move_calc
+        timing_model = "flair_extracted_const_jerk"
+        normalized_amp = abs(float(flair_amplitude_delta))
+        moves = [(index, stmt) for index, stmt in summary.moves if len(stmt.lanes) > 0]
+        # Gather every lane's duration from the arch-wide table in one pass,
+        # then take each event's maximum as a segmented max over the flat
+        # lane array.
+        lanes = [lane for _, stmt in moves for lane in stmt.lanes]
+        offsets = np.cumsum([0] + [len(stmt.lanes) for _, stmt in moves])
+        lane_durations = mc.lane_durations_us(lanes, amplitude_delta=normalized_amp)
+        event_durations = (
+            np.maximum.reduceat(lane_durations, offsets[:-1])
+            if len(moves) > 0
+            else np.zeros(0)
+        )
+        ramp_time_us = normalized_amp / mc.motion_model.max_ramp_us
+
+        events: list[MoveTimeEvent] = []
+        for (event_index, stmt), start, stop, event_duration_us in zip(
+            moves, offsets[:-1], offsets[1:], event_durations.tolist()
+        ):
+            lane_durations_us = lane_durations[start:stop]
+            rep_lane = stmt.lanes[int(np.argmax(lane_durations_us))]
+            # Only the representative (slowest) lane reports its segments.
+            segment_distances_um = list(
+                mc.path_segment_distances_um(self.arch_spec.get_path(rep_lane))
             )
-            rep_lane = stmt.lanes[rep_index]
             events.append(
                 MoveTimeEvent(
                     event_index=event_index,
@@ -248,12 +340,15 @@ class Metrics:
                     move_type=rep_lane.move_type.name,
                     bus_id=rep_lane.bus_id,
                     direction=rep_lane.direction.name,
-                    lane_durations_us=lane_durations_us,
+                    lane_durations_us=lane_durations_us.tolist(),
                     event_duration_us=event_duration_us,
-                    segment_distances_um=lane_segment_distances_um[rep_index],
-                    segment_durations_us=lane_segment_durations_us[rep_index],
-                    pick_time_us=lane_pick_times_us[rep_index],
-                    drop_time_us=lane_drop_times_us[rep_index],
+                    segment_distances_um=segment_distances_um,
+                    segment_durations_us=[
+                        mc.motion_model.const_jerk_min_duration_us(d)
+                        for d in segment_distances_um
+                    ],
+                    pick_time_us=ramp_time_us,
+                    drop_time_us=ramp_time_us,
                     timing_model=timing_model,
                 )
             )
@@ -265,17 +360,8 @@ class Metrics:
             timing_model=timing_model,
         )
 
-    def analyze_per_cz_motion(
-        self,
-        move_mt: ir.Method,
-    ) -> tuple[float, float]:
-        """Average hops and traveled distance per moving qubit per CZ episode.
-
-        Raises:
-            MoveValidationError: If any move statement cannot execute
-                against the atom state it is applied to.
-        """
-        initial_layout = _infer_initial_qubit_layout(move_mt)
+    def _per_cz_motion(self, summary: _MoveIRSummary) -> tuple[float, float]:
+        initial_layout = summary.initial_layout
         if initial_layout is None or len(initial_layout) == 0:
             return 0.0, 0.0
 
@@ -285,7 +371,7 @@ class Metrics:
         per_cz_distance_um: list[float] = []
         episode_stats: dict[int, tuple[int, float]] = {}
 
-        for stmt in move_mt.callable_region.walk():
+        for stmt in summary.timeline:
             if isinstance(stmt, move.Move):
                 # Delegate move semantics to the canonical execution model:
                 # ``validate_moves`` rejects a group that cannot execute
@@ -332,16 +418,15 @@ def _product_fidelity(fidelities: list[float]) -> float:
     return product
 
 
-def _count_move_events_and_lanes(move_mt: ir.Method) -> tuple[int, int]:
-    move_event_count = 0
-    moved_lane_count = 0
-
-    for stmt in move_mt.callable_region.walk():
-        if isinstance(stmt, move.Move):
-            move_event_count += 1
-            moved_lane_count += len(stmt.lanes)
-
-    return move_event_count, moved_lane_count
+def _move_metrics(summary: _MoveIRSummary) -> KernelMoveMetrics:
+    move_event_count = len(summary.moves)
+    moved_lane_count = sum(len(stmt.lanes) for _, stmt in summary.moves)
+    return KernelMoveMetrics(
+        approx_lane_parallelism=_compute_approx_lane_parallelism(
+            move_event_count, moved_lane_count
+        ),
+        moved_lane_count=moved_lane_count,
+    )
 
 
 def _compute_approx_lane_parallelism(
@@ -350,21 +435,3 @@ def _compute_approx_lane_parallelism(
     if move_event_count == 0:
         return 0.0
     return moved_lane_count / move_event_count
-
-
-def _compute_event_duration_us(lane_durations_us: list[float]) -> float:
-    if len(lane_durations_us) == 0:
-        return 0.0
-    return max(lane_durations_us)
-
-
-def _infer_initial_qubit_layout(
-    move_mt: ir.Method,
-) -> dict[int, Any] | None:
-    for stmt in move_mt.callable_region.walk():
-        if isinstance(stmt, move.LogicalInitialize):
-            return {
-                qubit_id: location
-                for qubit_id, location in enumerate(stmt.location_addresses)
-            }
-    return None
@@ -9,14 +9,13 @@ from kirin.rewrite.abc import RewriteResult
 
 from bloqade.lanes.rewrite import circuit2place
 from bloqade.lanes.rewrite.circuit2place import (
+    BulkMergeStaticPlacement,
     HoistNewQubitsUp,
-    MergeStaticPlacement,
     always_merge,
 )
-from bloqade.lanes.rewrite.fuse_gates import FuseAdjacentGates
 from bloqade.lanes.rewrite.remove_debug import RemoveDebugStatements
 from bloqade.lanes.rewrite.reorder_static_placement import (
-    ReorderStaticPlacement,
+    ScheduleStaticPlacement,
     alap_reorder_policy,
     asap_reorder_policy,
 )
@@ -50,15 +49,11 @@ class SequentialPlacePass(passes.Pass):
             rewrite.Walk(circuit2place.HoistConstants()).rewrite(mt.code)
         )
         result = result.join(
-            rewrite.Fixpoint(rewrite.Walk(MergeStaticPlacement(always_merge))).rewrite(
-                mt.code
-            )
+            rewrite.Walk(BulkMergeStaticPlacement(always_merge)).rewrite(mt.code)
         )
         result = result.join(rewrite.Walk(HoistNewQubitsUp()).rewrite(mt.code))
         result = result.join(
-            rewrite.Fixpoint(rewrite.Walk(MergeStaticPlacement(always_merge))).rewrite(
-                mt.code
-            )
+            rewrite.Walk(BulkMergeStaticPlacement(always_merge)).rewrite(mt.code)
         )
         return result
 
@@ -67,8 +62,9 @@ class SequentialPlacePass(passes.Pass):
 class ASAPPlacePass(passes.Pass):
     """ASAP scheduling optimization for the place dialect.
 
-    Merges all adjacent StaticPlacement blocks, reorders gates by ASAP
-    dependency scheduling, then fuses adjacent compatible gates.
+    Merges all adjacent StaticPlacement blocks, then reorders gates by ASAP
+    dependency scheduling and fuses adjacent compatible gates in the same
+    pass over each placement body.
 
     ``debug.Info`` statements are stripped at the start of this pass.
     ASAP scheduling cannot reorder across opaque debug nodes, so they must
@@ -85,21 +81,14 @@ class ASAPPlacePass(passes.Pass):
             rewrite.Walk(circuit2place.HoistConstants()).rewrite(mt.code)
         )
         result = result.join(
-            rewrite.Fixpoint(rewrite.Walk(MergeStaticPlacement(always_merge))).rewrite(
-                mt.code
-            )
+            rewrite.Walk(BulkMergeStaticPlacement(always_merge)).rewrite(mt.code)
         )
         result = result.join(rewrite.Walk(HoistNewQubitsUp()).rewrite(mt.code))
         result = result.join(
-            rewrite.Fixpoint(rewrite.Walk(MergeStaticPlacement(always_merge))).rewrite(
-                mt.code
-            )
+            rewrite.Walk(BulkMergeStaticPlacement(always_merge)).rewrite(mt.code)
         )
         result = result.join(
-            rewrite.Walk(ReorderStaticPlacement(asap_reorder_policy)).rewrite(mt.code)
-        )
-        result = result.join(
-            rewrite.Fixpoint(rewrite.Walk(FuseAdjacentGates())).rewrite(mt.code)
+            rewrite.Walk(ScheduleStaticPlacement(asap_reorder_policy)).rewrite(mt.code)
         )
         return result
 
@@ -126,21 +115,14 @@ class ALAPPlacePass(passes.Pass):
             rewrite.Walk(circuit2place.HoistConstants()).rewrite(mt.code)
         )
         result = result.join(
-            rewrite.Fixpoint(rewrite.Walk(MergeStaticPlacement(always_merge))).rewrite(
-                mt.code
-            )
+            rewrite.Walk(BulkMergeStaticPlacement(always_merge)).rewrite(mt.code)
         )
         result = result.join(rewrite.Walk(HoistNewQubitsUp()).rewrite(mt.code))
         result = result.join(
-            rewrite.Fixpoint(rewrite.Walk(MergeStaticPlacement(always_merge))).rewrite(
-                mt.code
-            )
-        )
-        result = result.join(
-            rewrite.Walk(ReorderStaticPlacement(alap_reorder_policy)).rewrite(mt.code)
+            rewrite.Walk(BulkMergeStaticPlacement(always_merge)).rewrite(mt.code)
         )
         result = result.join(
-            rewrite.Fixpoint(rewrite.Walk(FuseAdjacentGates())).rewrite(mt.code)
+            rewrite.Walk(ScheduleStaticPlacement(alap_reorder_policy)).rewrite(mt.code)
         )
         return result
 
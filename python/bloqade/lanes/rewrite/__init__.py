@@ -3,5 +3,6 @@ from . import (
     move2squin as move2squin,
     move2stack_move as move2stack_move,
     place2move as place2move,
+    repeat as repeat,
     state as state,
 )
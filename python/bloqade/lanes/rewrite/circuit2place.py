@@ -684,6 +684,108 @@ def always_merge(sp1: place.StaticPlacement, sp2: place.StaticPlacement) -> bool
     return True
 
 
+_MERGED_STMT_TYPES = (
+    place.R,
+    place.Rz,
+    place.StarRz,
+    place.CZ,
+    place.EndMeasure,
+    place.Initialize,
+    place.MoveTo,
+    place.Permute,
+)
+
+
+def _append_remapped_body(
+    new_block: ir.Block,
+    curr_state: ir.SSAValue,
+    current_yields: list[ir.SSAValue],
+    sp: place.StaticPlacement,
+    input_map: list[int],
+) -> ir.SSAValue:
+    """Append ``sp``'s body to ``new_block``, threading ``curr_state``.
+
+    Qubit indices are remapped through ``input_map`` (``sp``'s qubit index
+    to the merged placement's), the classical results each statement
+    produces are appended to ``current_yields``, and the final state is
+    returned.
+    """
+    for stmt in sp.body.blocks[0].stmts:
+        if not isinstance(stmt, _MERGED_STMT_TYPES):
+            continue
+        attributes: dict[str, ir.Attribute] = {
+            "qubits": ir.PyAttr(tuple(input_map[i] for i in stmt.qubits))
+        }
+        if isinstance(stmt, place.StarRz):
+            attributes["qubit_indices"] = ir.PyAttr(stmt.qubit_indices)
+        if isinstance(stmt, place.MoveTo):
+            attributes["locations"] = ir.PyAttr(stmt.locations)
+            attributes["multi_move_warning"] = ir.PyAttr(stmt.multi_move_warning)
+        if isinstance(stmt, place.Permute):
+            attributes["perm"] = ir.PyAttr(stmt.perm)
+            attributes["insert_moves"] = ir.PyAttr(stmt.insert_moves)
+        remapped_stmt = stmt.from_stmt(
+            stmt,
+            args=(curr_state, *stmt.args[1:]),
+            attributes=attributes,
+        )
+        curr_state = remapped_stmt.results[0]
+        new_block.stmts.append(remapped_stmt)
+        for old_result, new_result in zip(stmt.results[1:], remapped_stmt.results[1:]):
+            old_result.replace_by(new_result)
+            current_yields.append(new_result)
+    return curr_state
+
+
+def _merge_placements(run: list[place.StaticPlacement]) -> place.StaticPlacement:
+    """Replace a run of adjacent placements with one merged placement.
+
+    The first placement's body is cloned and every later body is appended
+    to it in order; the merged placement is inserted before ``run[0]``,
+    takes over all of the run's results, and the run is deleted.
+    """
+    first = run[0]
+    qubit_index = {qbit: index for index, qbit in enumerate(first.qubits)}
+    new_qubits = list(first.qubits)
+
+    new_body = first.body.clone()
+    new_block = new_body.blocks[0]
+
+    curr_yield = new_block.last_stmt
+    assert isinstance(curr_yield, place.Yield)
+
+    curr_state = curr_yield.final_state
+    current_yields = list(curr_yield.classical_results)
+    curr_yield.delete()
+
+    for sp in run[1:]:
+        input_map: list[int] = []
+        for qbit in sp.qubits:
+            if (index := qubit_index.get(qbit)) is None:
+                index = qubit_index[qbit] = len(new_qubits)
+                new_qubits.append(qbit)
+            input_map.append(index)
+        curr_state = _append_remapped_body(
+            new_block, curr_state, current_yields, sp, input_map
+        )
+
+    new_block.stmts.append(place.Yield(curr_state, *current_yields))
+
+    new_static_circuit = place.StaticPlacement(tuple(new_qubits), new_body)
+    new_static_circuit.insert_before(first)
+
+    old_results = [result for sp in run for result in sp.results]
+    for old_result, new_result in zip(
+        old_results, new_static_circuit.results, strict=True
+    ):
+        old_result.replace_by(new_result)
+
+    for sp in run:
+        sp.delete()
+
+    return new_static_circuit
+
+
 @dataclass
 class MergeStaticPlacement(abc.RewriteRule):
     """Merge adjacent StaticPlacement statements using a caller-supplied policy.
@@ -706,77 +808,45 @@ class MergeStaticPlacement(abc.RewriteRule):
         if not self.merge_policy(node, next_node):
             return abc.RewriteResult()
 
-        new_qubits = node.qubits
-        new_input_map: dict[int, int] = {}
-        for old_qid, qbit in enumerate(next_node.qubits):
-            if qbit not in new_qubits:
-                new_input_map[old_qid] = len(new_qubits)
-                new_qubits = new_qubits + (qbit,)
-            else:
-                new_input_map[old_qid] = new_qubits.index(qbit)
-
-        new_body = node.body.clone()
-        new_block = new_body.blocks[0]
-
-        curr_yield = new_block.last_stmt
-        assert isinstance(curr_yield, place.Yield)
+        _merge_placements([node, next_node])
 
-        curr_state = curr_yield.final_state
-        current_yields = list(curr_yield.classical_results)
-        curr_yield.delete()
+        return abc.RewriteResult(has_done_something=True)
 
-        for stmt in next_node.body.blocks[0].stmts:
-            if isinstance(
-                stmt,
-                (
-                    place.R,
-                    place.Rz,
-                    place.StarRz,
-                    place.CZ,
-                    place.EndMeasure,
-                    place.Initialize,
-                    place.MoveTo,
-                    place.Permute,
-                ),
-            ):
-                attributes: dict[str, ir.Attribute] = {
-                    "qubits": ir.PyAttr(tuple(new_input_map[i] for i in stmt.qubits))
-                }
-                if isinstance(stmt, place.StarRz):
-                    attributes["qubit_indices"] = ir.PyAttr(stmt.qubit_indices)
-                if isinstance(stmt, place.MoveTo):
-                    attributes["locations"] = ir.PyAttr(stmt.locations)
-                    attributes["multi_move_warning"] = ir.PyAttr(
-                        stmt.multi_move_warning
-                    )
-                if isinstance(stmt, place.Permute):
-                    attributes["perm"] = ir.PyAttr(stmt.perm)
-                    attributes["insert_moves"] = ir.PyAttr(stmt.insert_moves)
-                remapped_stmt = stmt.from_stmt(
-                    stmt,
-                    args=(curr_state, *stmt.args[1:]),
-                    attributes=attributes,
-                )
-                curr_state = remapped_stmt.results[0]
-                new_block.stmts.append(remapped_stmt)
-                for old_result, new_result in zip(
-                    stmt.results[1:], remapped_stmt.results[1:]
-                ):
-                    old_result.replace_by(new_result)
-                    current_yields.append(new_result)
 
-        new_block.stmts.append(place.Yield(curr_state, *current_yields))
+@dataclass
+class BulkMergeStaticPlacement(abc.RewriteRule):
+    """Merge every maximal run of adjacent StaticPlacements in one pass.
+
+    Each block is scanned once: a run grows while ``merge_policy`` accepts
+    the last placement of the run and the next one, and every run of two or
+    more placements is rebuilt into a single merged placement. A single
+    ``Walk`` therefore reaches the fixpoint that
+    ``Fixpoint(Walk(MergeStaticPlacement(policy)))`` reaches by merging one
+    pair per rewrite, in time linear in the size of the block, for every
+    policy that accepts a merged placement exactly when it accepts its parts
+    (all policies in this module).
+    """
 
-        new_static_circuit = place.StaticPlacement(new_qubits, new_body)
-        new_static_circuit.insert_before(node)
+    merge_policy: Callable[[place.StaticPlacement, place.StaticPlacement], bool] = (
+        always_merge
+    )
 
-        old_results = list(node.results) + list(next_node.results)
-        for old_result, new_result in zip(
-            old_results, new_static_circuit.results, strict=True
-        ):
-            old_result.replace_by(new_result)
+    def rewrite_Block(self, node: ir.Block) -> abc.RewriteResult:
+        runs: list[list[place.StaticPlacement]] = []
+        run: list[place.StaticPlacement] = []
+        for stmt in node.stmts:
+            if not isinstance(stmt, place.StaticPlacement):
+                run = []
+            elif run and self.merge_policy(run[-1], stmt):
+                run.append(stmt)
+            else:
+                run = [stmt]
+                runs.append(run)
 
-        node.delete()
-        next_node.delete()
+        has_done_something = False
+        for run in runs:
+            if len(run) > 1:
+                _merge_placements(run)
+                has_done_something = True
 
-        return abc.RewriteResult(has_done_something=True)
+        return abc.RewriteResult(has_done_something=has_done_something)
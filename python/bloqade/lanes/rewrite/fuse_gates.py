@@ -45,7 +45,7 @@ class GateGroup(ABC, Generic[T]):
         """
         if len(self.statements) < 2:
             return False
-        merged = self._build_merged()
+        merged = self.build_merged(self.statements[0].state_before)
         self.statements[-1].replace_by(merged)
         for stmt in reversed(self.statements[:-1]):
             stmt.delete()
@@ -61,7 +61,7 @@ class GateGroup(ABC, Generic[T]):
     def can_extend(self, stmt: T) -> bool: ...
 
     @abstractmethod
-    def _build_merged(self) -> ir.Statement: ...
+    def build_merged(self, state_before: ir.SSAValue) -> ir.Statement: ...
 
 
 class RGroup(GateGroup[place.R]):
@@ -74,10 +74,10 @@ class RGroup(GateGroup[place.R]):
             and stmt.rotation_angle is head.rotation_angle
         )
 
-    def _build_merged(self) -> place.R:
+    def build_merged(self, state_before: ir.SSAValue) -> place.R:
         head = self.statements[0]
         return place.R(
-            head.state_before,
+            state_before,
             axis_angle=head.axis_angle,
             rotation_angle=head.rotation_angle,
             qubits=tuple(q for s in self.statements for q in s.qubits),
@@ -93,10 +93,10 @@ class RzGroup(GateGroup[place.Rz]):
             and stmt.rotation_angle is head.rotation_angle
         )
 
-    def _build_merged(self) -> place.Rz:
+    def build_merged(self, state_before: ir.SSAValue) -> place.Rz:
         head = self.statements[0]
         return place.Rz(
-            head.state_before,
+            state_before,
             rotation_angle=head.rotation_angle,
             qubits=tuple(q for s in self.statements for q in s.qubits),
         )
@@ -112,10 +112,10 @@ class StarRzGroup(GateGroup[place.StarRz]):
             and stmt.qubit_indices == head.qubit_indices
         )
 
-    def _build_merged(self) -> place.StarRz:
+    def build_merged(self, state_before: ir.SSAValue) -> place.StarRz:
         head = self.statements[0]
         return place.StarRz(
-            head.state_before,
+            state_before,
             head.rotation_angle,
             qubits=tuple(q for s in self.statements for q in s.qubits),
             qubit_indices=head.qubit_indices,
@@ -127,13 +127,12 @@ class CZGroup(GateGroup[place.CZ]):
         # CZ has no non-qubit SSA args.
         return self._state_chain_ok(stmt) and self._qubits_disjoint(stmt)
 
-    def _build_merged(self) -> place.CZ:
-        head = self.statements[0]
+    def build_merged(self, state_before: ir.SSAValue) -> place.CZ:
         # Re-interleave so place.CZ.controls (first half of qubits) and
         # place.CZ.targets (second half) keep returning the right halves.
         controls = tuple(c for s in self.statements for c in s.controls)
         targets = tuple(t for s in self.statements for t in s.targets)
-        return place.CZ(head.state_before, qubits=controls + targets)
+        return place.CZ(state_before, qubits=controls + targets)
 
 
 @dataclass
@@ -6,7 +6,7 @@ Strips move.Load / move.Store state threading, materialises address
 attributes as stack_move.Const* SSA values, converts py.Constant
 float/int values to stack_move.ConstFloat/Int, and reconstructs
 stack_move.Measure + stack_move.AwaitMeasure + stack_move.GetItem from
-the move.Measure + move.GetFutureResult pattern.
+the move.Measure (or move.EndMeasure) + move.GetFutureResult pattern.
 """
 
 from __future__ import annotations
@@ -52,10 +52,11 @@ class RewriteMoveToStackMove(RewriteRule):
     Mutable state carried across the block walk:
     - _first_fill_emitted: True after the first move.Fill is processed,
       so subsequent fills lower to stack_move.Fill instead of InitialFill.
-    - _future_to_sm_measure: maps move.Measure.future SSA → (stack_move.Measure
-      stmt, zone_addresses tuple). Populated by move.Measure; used by
+    - _future_to_sm_measure: maps a measurement future SSA (move.Measure.future
+      or move.EndMeasure.result) → (stack_move.Measure stmt, zone_addresses
+      tuple). Populated by move.Measure and move.EndMeasure; used by
       GetFutureResult to emit AwaitMeasure lazily on first access.
-    - _future_to_await: maps move.Measure.future SSA → AwaitMeasure result SSA.
+    - _future_to_await: maps a measurement future SSA → AwaitMeasure result SSA.
       Populated on the first GetFutureResult for each future so that the
       AwaitMeasure is inserted at the right program point.
     """
@@ -222,6 +223,18 @@ class RewriteMoveToStackMove(RewriteRule):
 
     @_rewrite.register(move.Measure)
     def _(self, stmt: move.Measure, to_delete: list[ir.Statement]) -> RewriteResult:
+        return self._rewrite_measure(stmt, stmt.future, to_delete)
+
+    @_rewrite.register(move.EndMeasure)
+    def _(self, stmt: move.EndMeasure, to_delete: list[ir.Statement]) -> RewriteResult:
+        return self._rewrite_measure(stmt, stmt.result, to_delete)
+
+    def _rewrite_measure(
+        self,
+        stmt: move.Measure | move.EndMeasure,
+        future: ir.SSAValue,
+        to_delete: list[ir.Statement],
+    ) -> RewriteResult:
         zone_consts = tuple(
             stack_move.ConstZone(value=addr) for addr in stmt.zone_addresses
         )
@@ -229,7 +242,7 @@ class RewriteMoveToStackMove(RewriteRule):
             zc.insert_before(stmt)
         sm_measure = stack_move.Measure(zones=tuple(zc.result for zc in zone_consts))
         sm_measure.insert_before(stmt)
-        self._future_to_sm_measure[stmt.future] = (sm_measure, stmt.zone_addresses)
+        self._future_to_sm_measure[future] = (sm_measure, stmt.zone_addresses)
         to_delete.append(stmt)
         return RewriteResult(has_done_something=True)
 
@@ -5,6 +5,7 @@ from functools import singledispatchmethod
 from kirin import ir
 from kirin.dialects import func
 from kirin.rewrite.abc import RewriteResult, RewriteRule
+from kirin.rewrite.dce import DeadCodeElimination
 
 from bloqade.lanes.analysis import placement
 from bloqade.lanes.bytecode.encoding import LocationAddress
@@ -308,6 +309,36 @@ class RemoveNoOpStaticPlacements(RewriteRule):
         return RewriteResult(has_done_something=True)
 
 
+class LiftStaticPlacement(RewriteRule):
+    """Lift the lowered body of a ``place.StaticPlacement`` in front of it.
+
+    Applies ``LiftMoveStatements`` to every statement of the body and then
+    ``RemoveNoOpStaticPlacements`` to the placement. ``Walk`` visits a body
+    before the statement owning it, so putting this rule in the same ``Walk``
+    as the rules lowering the body lifts each placement right after its body
+    is lowered, without another pass over the IR.
+    """
+
+    def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
+        if not isinstance(node, place.StaticPlacement):
+            return RewriteResult()
+
+        lift = LiftMoveStatements()
+        has_done_something = False
+        for block in node.body.blocks:
+            stmt = block.first_stmt
+            while stmt is not None:
+                next_stmt = stmt.next_stmt
+                if lift.rewrite_Statement(stmt).has_done_something:
+                    has_done_something = True
+                stmt = next_stmt
+
+        result = RemoveNoOpStaticPlacements().rewrite_Statement(node)
+        return RewriteResult(
+            has_done_something=has_done_something or result.has_done_something
+        )
+
+
 class InsertInitialize(RewriteRule):
     """Emit move.LogicalInitialize for all NewLogicalQubits in a block,
     with location_addresses, thetas, phis, lams collected directly from
@@ -423,3 +454,42 @@ class DeleteInitialize(RewriteRule):
         node.delete()
 
         return RewriteResult(has_done_something=True)
+
+
+class DeleteDeadStatements(RewriteRule):
+    """Delete unused qubit allocations and dead pure statements.
+
+    Gives the same result as
+    ``Fixpoint(Walk(Chain(DeleteQubitNew(), DeadCodeElimination())))`` in a
+    single sweep. Statements are visited users first, and deleting one only
+    revisits the statements defining its operands, the only statements the
+    deletion can have made dead.
+    """
+
+    def rewrite(self, node: ir.IRNode) -> RewriteResult:
+        rules = (DeleteQubitNew(), DeadCodeElimination())
+        worklist = list(node.walk())
+        deleted: set[ir.Statement] = set()
+        has_done_something = False
+        while worklist:
+            stmt = worklist.pop()
+            if stmt in deleted or any(result.uses for result in stmt.results):
+                continue
+
+            removed = list(stmt.walk())
+            producers = [
+                arg.owner
+                for removed_stmt in removed
+                for arg in removed_stmt.args
+                if isinstance(arg.owner, ir.Statement)
+            ]
+            if not any(
+                rule.rewrite_Statement(stmt).has_done_something for rule in rules
+            ):
+                continue
+
+            has_done_something = True
+            deleted.update(removed)
+            worklist.extend(producers)
+
+        return RewriteResult(has_done_something=has_done_something)
@@ -7,3 +7,6 @@ from bloqade.lanes.rewrite.reorder_static_placement.asap import (
 from bloqade.lanes.rewrite.reorder_static_placement.rule import (
     ReorderStaticPlacement as ReorderStaticPlacement,
 )
+from bloqade.lanes.rewrite.reorder_static_placement.schedule import (
+    ScheduleStaticPlacement as ScheduleStaticPlacement,
+)
@@ -0,0 +1,138 @@
+"""ScheduleStaticPlacement: reorder and fuse a StaticPlacement body in one pass."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from kirin import ir
+from kirin.rewrite import abc
+
+from bloqade.lanes.dialects import place
+from bloqade.lanes.rewrite.fuse_gates import (
+    CZGroup,
+    FuseAdjacentGates,
+    GateGroup,
+    RGroup,
+    RzGroup,
+    StarRzGroup,
+)
+from bloqade.lanes.rewrite.reorder_static_placement.common import (
+    _group_key,
+    _SchedulableStmt,
+)
+from bloqade.lanes.types import StateType
+
+_SUPPORTED = (
+    place.R,
+    place.Rz,
+    place.StarRz,
+    place.CZ,
+    place.Initialize,
+    place.EndMeasure,
+    place.MoveTo,
+    place.Permute,
+)
+
+_GROUP_TYPES: dict[type, type[GateGroup]] = {
+    place.R: RGroup,
+    place.Rz: RzGroup,
+    place.StarRz: StarRzGroup,
+    place.CZ: CZGroup,
+}
+
+
+def _fusion_runs(
+    stmts: list[_SchedulableStmt],
+) -> list[list[_SchedulableStmt]]:
+    """Split ``stmts`` into the runs ``FuseAdjacentGates`` would fuse.
+
+    A run grows while the next statement is a fusable gate with the same
+    opcode and non-qubit arguments as the run and touches none of its qubits.
+    """
+    runs: list[list[_SchedulableStmt]] = []
+    run_key: tuple | None = None
+    run_qubits: set[int] = set()
+    for stmt in stmts:
+        key = _group_key(stmt) if type(stmt) in _GROUP_TYPES else None
+        if key is not None and key == run_key and run_qubits.isdisjoint(stmt.qubits):
+            runs[-1].append(stmt)
+            run_qubits.update(stmt.qubits)
+            continue
+        runs.append([stmt])
+        run_key = key
+        run_qubits = set(stmt.qubits)
+    return runs
+
+
+@dataclass
+class ScheduleStaticPlacement(abc.RewriteRule):
+    """Reorder a StaticPlacement body with a policy and fuse it in one pass.
+
+    Equivalent to ``ReorderStaticPlacement(reorder_policy)`` followed by
+    ``Fixpoint(Walk(FuseAdjacentGates()))``, but the policy's dependency DAG
+    is built once, the fusable runs of the scheduled order are found in one
+    scan, and the body is rebuilt exactly once with the fused statements
+    emitted directly.
+
+    Bodies with a statement outside the schedulable set are not reordered;
+    their adjacent gates are still fused in place.
+    """
+
+    reorder_policy: Callable[[list[_SchedulableStmt]], list[_SchedulableStmt]]
+
+    def rewrite_Statement(self, node: ir.Statement) -> abc.RewriteResult:
+        if not isinstance(node, place.StaticPlacement):
+            return abc.RewriteResult()
+
+        body_block = node.body.blocks[0]
+        old_yield = body_block.last_stmt
+        assert isinstance(old_yield, place.Yield)
+
+        stmts: list[_SchedulableStmt] = []
+        for s in body_block.stmts:
+            if isinstance(s, place.Yield):
+                continue
+            if not isinstance(s, _SUPPORTED):
+                changed = FuseAdjacentGates()._fuse_block(body_block)
+                return abc.RewriteResult(has_done_something=changed)
+            stmts.append(s)
+
+        if not stmts:
+            return abc.RewriteResult()
+
+        new_stmts = self.reorder_policy(stmts)
+        runs = _fusion_runs(new_stmts)
+
+        if len(runs) == len(stmts) and all(
+            run[0] is stmt for run, stmt in zip(runs, stmts)
+        ):
+            return abc.RewriteResult()
+
+        new_body = ir.Region(new_block := ir.Block())
+        curr_state = new_block.args.append_from(StateType, "entry_state")
+
+        for run in runs:
+            if len(run) > 1:
+                group = _GROUP_TYPES[type(run[0])]()
+                for stmt in run:
+                    group.append(stmt)
+                merged = group.build_merged(curr_state)
+                new_block.stmts.append(merged)
+                curr_state = merged.results[0]
+                continue
+            (stmt,) = run
+            remapped = stmt.from_stmt(stmt, args=(curr_state, *stmt.args[1:]))
+            new_block.stmts.append(remapped)
+            curr_state = remapped.state_after
+            for old_r, new_r in zip(stmt.results[1:], remapped.results[1:]):
+                old_r.replace_by(new_r)
+
+        new_block.stmts.append(place.Yield(curr_state, *old_yield.classical_results))
+
+        new_sp = place.StaticPlacement(node.qubits, new_body)
+        new_sp.insert_before(node)
+
+        for old_r, new_r in zip(node.results, new_sp.results, strict=True):
+            old_r.replace_by(new_r)
+
+        node.delete()
+        return abc.RewriteResult(has_done_something=True)
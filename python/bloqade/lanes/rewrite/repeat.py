@@ -0,0 +1,173 @@
+"""Rewrites for loop-preserving compilation with ``place.Repeat``.
+
+``RewriteLoopsToRepeat`` turns qualifying ``scf.For`` loops into
+``place.Repeat`` before ``AggressiveUnroll`` so the loop body is lowered,
+placed and move-synthesized once. ``ExpandRepeat`` clones the body back out,
+either as a fallback for bodies that cannot be placed as a unit or once
+placement is done and the move IR is emitted.
+"""
+
+from collections.abc import Callable, Sized
+from dataclasses import dataclass
+
+from bloqade.native.dialects.gate import stmts as gate
+from kirin import ir
+from kirin.analysis import const
+from kirin.dialects import func, scf
+from kirin.rewrite import abc
+
+from bloqade.gemini.logical.dialects.operations import stmts as gemini_stmts
+from bloqade.lanes.dialects import place
+
+_GATE_STMT_TYPES = (gate.CZ, gate.R, gate.Rz, gemini_stmts.StarRz)
+
+
+def _forward_invariant_carried_values(node: scf.For) -> bool:
+    """Replace the loop-carried values ``node`` yields back unchanged.
+
+    The Python lowering threads every variable a loop touches through it as
+    a loop-carried value. A carried value is invariant when the body yields
+    its initial value, directly or through another invariant carried value;
+    its block argument and loop result are then replaced by that initial
+    value. Returns whether any use was replaced.
+    """
+    body_block = node.body.blocks[0]
+    yield_stmt = body_block.last_stmt
+    if not isinstance(yield_stmt, scf.Yield):
+        return False
+
+    carried = body_block.args[1:]
+    position = {arg: k for k, arg in enumerate(carried)}
+    initializers = node.initializers
+    invariant = {
+        k
+        for k, value in enumerate(yield_stmt.values)
+        if value is initializers[k]
+        or value in position
+        and initializers[position[value]] is initializers[k]
+    }
+    # drop positions that yield a carried value which itself changes
+    changed = True
+    while changed:
+        changed = False
+        for k in list(invariant):
+            source = position.get(yield_stmt.values[k])
+            if source is not None and source not in invariant:
+                invariant.discard(k)
+                changed = True
+
+    forwarded = False
+    for k in invariant:
+        for value in (carried[k], node.results[k]):
+            if len(value.uses) > 0:
+                value.replace_by(initializers[k])
+                forwarded = True
+    return forwarded
+
+
+class RewriteLoopsToRepeat(abc.RewriteRule):
+    """Rewrite ``scf.For`` loops with a constant trip count into ``place.Repeat``.
+
+    A loop qualifies when its iterable has a constant hint with at least two
+    elements (run ``HintConst`` first), its body neither reads the loop
+    variable nor returns early, and every loop-carried value is invariant.
+    Invariant carried values are forwarded to their initial values in every
+    loop visited, so an enclosing loop can still qualify when an inner one
+    does not.
+    """
+
+    def rewrite_Statement(self, node: ir.Statement) -> abc.RewriteResult:
+        if not isinstance(node, scf.For):
+            return abc.RewriteResult()
+
+        forwarded = _forward_invariant_carried_values(node)
+
+        body_block = node.body.blocks[0]
+        yield_stmt = body_block.last_stmt
+        if not (
+            isinstance(hint := node.iterable.hints.get("const"), const.Value)
+            and isinstance(hint.data, Sized)
+            and len(hint.data) >= 2
+            and len(body_block.args[0].uses) == 0
+            and isinstance(yield_stmt, scf.Yield)
+            and all(
+                value is init
+                for value, init in zip(yield_stmt.values, node.initializers)
+            )
+        ):
+            return abc.RewriteResult(has_done_something=forwarded)
+
+        yield_stmt.delete()
+        new_block = ir.Block()
+        for stmt in list(body_block.stmts):
+            stmt.detach()
+            new_block.stmts.append(stmt)
+        new_block.stmts.append(scf.Yield())
+
+        place.Repeat(count=len(hint.data), body=ir.Region(new_block)).insert_before(
+            node
+        )
+        node.delete()
+        return abc.RewriteResult(has_done_something=True)
+
+
+def repeat_inline_heuristic(node: ir.Statement) -> bool:
+    """Inline heuristic that keeps ``place.Repeat`` bodies single-block.
+
+    Intended as ``AggressiveUnroll(additional_inline_heuristic=...)``: calls
+    directly inside a Repeat body are only inlined when the callee is a
+    single block. Calls that stay behind make the Repeat unplaceable, so it
+    is expanded and the call inlined after all.
+    """
+    if not isinstance(node.parent_stmt, place.Repeat):
+        return True
+    return not (
+        isinstance(node, func.Invoke) and len(node.callee.callable_region.blocks) > 1
+    )
+
+
+def is_placeable_repeat(node: place.Repeat) -> bool:
+    """Whether the body of ``node`` can be placed once for all iterations.
+
+    The body may only contain native gates, pure statements and nested
+    placeable Repeats: no allocations, measurements, calls or control flow.
+    """
+    for stmt in node.body.blocks[0].stmts:
+        if isinstance(stmt, place.Repeat):
+            if not is_placeable_repeat(stmt):
+                return False
+        elif not (
+            isinstance(stmt, (scf.Yield, *_GATE_STMT_TYPES))
+            or stmt.has_trait(ir.Pure)
+            or (maybe_pure := stmt.get_trait(ir.MaybePure)) is not None
+            and maybe_pure.is_pure(stmt)
+        ):
+            return False
+    return True
+
+
+@dataclass
+class ExpandRepeat(abc.RewriteRule):
+    """Replace a ``place.Repeat`` with ``count`` copies of its body.
+
+    ``should_expand`` selects the Repeats to expand; by default all of them.
+    Nested Repeats are visited before the Repeat containing them, so a single
+    ``Walk`` expands them all.
+    """
+
+    should_expand: Callable[[place.Repeat], bool] = lambda node: True
+
+    def rewrite_Statement(self, node: ir.Statement) -> abc.RewriteResult:
+        if not (isinstance(node, place.Repeat) and self.should_expand(node)):
+            return abc.RewriteResult()
+
+        for _ in range(node.count):
+            body_block = node.body.clone().blocks[0]
+            stmt = body_block.first_stmt
+            while stmt is not None and not stmt.has_trait(ir.IsTerminator):
+                stmt.detach()
+                stmt.insert_before(node)
+                stmt = body_block.first_stmt
+
+        node.delete()
+        return abc.RewriteResult(has_done_something=True)
@@ -103,3 +103,30 @@ class RewriteBranches(RewriteRule):
             )
         )
         return RewriteResult(has_done_something=True)
+
+
+@dataclass
+class RewriteBlockStates(RewriteRule):
+    """Thread the atom state through every block of a region.
+
+    Applies ``RewriteBranches`` to each block's terminator and then
+    ``RewriteLoadStore`` to the block, in one pass over the blocks rather than
+    a ``Walk`` of every statement per rule. Branches only appear as
+    terminators, and each block's load/store rewrite only depends on its own
+    statements and arguments, so the result is the same.
+    """
+
+    def rewrite_Region(self, node: ir.Region) -> RewriteResult:
+        branches = RewriteBranches()
+        load_store = RewriteLoadStore()
+        has_done_something = False
+        for block in node.blocks:
+            terminator = block.last_stmt
+            if (
+                terminator is not None
+                and branches.rewrite_Statement(terminator).has_done_something
+            ):
+                has_done_something = True
+            if load_store.rewrite_Block(block).has_done_something:
+                has_done_something = True
+        return RewriteResult(has_done_something=has_done_something)
@@ -22,3 +22,7 @@ from bloqade.lanes.transform.pipeline import (
     transversal_rewrites as transversal_rewrites,
 )
 from bloqade.lanes.transform.place_to_move import PlaceToMove as PlaceToMove
+from bloqade.lanes.transform.report import (
+    CompileReport as CompileReport,
+    StageReport as StageReport,
+)
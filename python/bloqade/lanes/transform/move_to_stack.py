@@ -5,6 +5,7 @@ from kirin import ir, rewrite
 from bloqade.lanes.arch.spec import ArchSpec
 from bloqade.lanes.bytecode import Program
 from bloqade.lanes.bytecode.encode import dump_program
+from bloqade.lanes.bytecode.stream import stream_program
 from bloqade.lanes.dialects import move, stack_move
 from bloqade.lanes.rewrite.move2stack_move import RewriteMoveToStackMove
 from bloqade.lanes.rewrite.stackify import stackify
@@ -34,7 +35,9 @@ class MoveToStackMove:
     otherwise slip through and fail lazily inside ``dump_program``.
 
     ``emit_bytecode`` runs ``emit`` and encodes the result to a bytecode
-    ``Program`` via ``dump_program``.
+    ``Program`` via ``dump_program``. ``stream_bytecode`` encodes the same
+    ``Program`` in a single pass over the ``move`` kernel via
+    ``stream_program``, without building the stack_move IR.
     """
 
     arch_spec: ArchSpec
@@ -91,3 +94,11 @@ class MoveToStackMove:
         no_raise: bool = True,
     ) -> Program:
         return dump_program(self.emit(main, no_raise=no_raise), version=version)
+
+    def stream_bytecode(
+        self,
+        main: ir.Method,
+        version: tuple[int, int] = (1, 0),
+        validate: bool = False,
+    ) -> Program:
+        return stream_program(main, self.arch_spec, version, validate=validate)
@@ -33,7 +33,13 @@ from bloqade.gemini.logical.validation.measurement.analysis import (
 from bloqade.lanes.arch.spec import ArchSpec
 from bloqade.lanes.dialects import place
 from bloqade.lanes.dialects.arch import BindArchSpec
-from bloqade.lanes.rewrite import circuit2place
+from bloqade.lanes.rewrite import circuit2place, repeat
+from bloqade.lanes.transform.report import (
+    CompileReport,
+    Stage,
+    record_fixpoint,
+    record_stage,
+)
 from bloqade.lanes.validation.address import get_validation
 
 
@@ -65,9 +71,25 @@ class NativeToPlaceBase:
     validation is unconditional for both pipelines.  Set ``arch_spec=None``
     only when constructing a ``NativeToPlaceBase`` subclass directly and
     you explicitly want to skip address validation.
+
+    ``preserve_loops`` keeps ``scf.For`` loops with a constant trip count whose
+    body ignores the loop variable as ``place.Repeat`` instead of unrolling
+    them, so the body is lowered and placed once. Bodies that turn out to hold
+    anything but gates and pure statements are unrolled as usual. Only enable
+    it with a placement strategy whose ``returns_to_entry_layout`` is true.
+    This is a placement-only option: the loop only exists in place IR.
+    ``PlaceToMove`` expands every ``place.Repeat``, so move IR, stim circuits
+    and bytecode are still fully unrolled; what shrinks is the place IR and
+    the placement work. Carrying the loop through move IR into a stim
+    ``REPEAT`` block is left to a follow-up.
+
+    When ``report`` is set, ``emit`` records its squin-to-native,
+    unrolling and place-lowering steps on it.
     """
 
     arch_spec: ArchSpec | None = field(default=None)
+    preserve_loops: bool = field(default=False)
+    report: CompileReport | None = field(default=None, repr=False, compare=False)
 
     def _pre_native_rewrites(self, mt: Method, out: Method, no_raise: bool) -> Method:
         return out
@@ -78,18 +100,53 @@ class NativeToPlaceBase:
     def _lower_qubits(self, out: Method) -> None:
         raise NotImplementedError
 
-    def emit(self, mt: Method, no_raise: bool = True) -> Method:
-        out = mt.similar(mt.dialects.add(place))
-        out = self._pre_native_rewrites(mt, out, no_raise)
+    def _unroll_preserving_loops(
+        self, out: Method, no_raise: bool, handle: Stage
+    ) -> None:
+        passes.HintConst(out.dialects, no_raise=no_raise)(out)
+        rewrite.Walk(repeat.RewriteLoopsToRepeat()).rewrite(out.code)
 
-        if self.arch_spec is not None:
-            # Bind arch_spec on every arch-resolved statement (Loc, CzPartner) reachable
-            # so const-prop resolves them during AggressiveUnroll.
-            CallGraphPass(out.dialects, rewrite.Walk(BindArchSpec(self.arch_spec)))(out)
+        unroll = AggressiveUnroll(
+            out.dialects,
+            no_raise=no_raise,
+            additional_inline_heuristic=repeat.repeat_inline_heuristic,
+        )
+        record_fixpoint(unroll, out, handle)
 
-        out = SquinToNative().emit(out, no_raise=no_raise)
-        AggressiveUnroll(out.dialects, no_raise=no_raise).fixpoint(out)
+        expanded = rewrite.Walk(
+            repeat.ExpandRepeat(lambda node: not repeat.is_placeable_repeat(node))
+        ).rewrite(out.code)
+        if expanded.has_done_something:
+            record_fixpoint(unroll, out, handle)
+
+    def emit(self, mt: Method, no_raise: bool = True) -> Method:
+        with record_stage(self.report, "squin_to_native", mt) as handle:
+            out = mt.similar(mt.dialects.add(place))
+            out = self._pre_native_rewrites(mt, out, no_raise)
+
+            if self.arch_spec is not None:
+                # Bind arch_spec on every arch-resolved statement (Loc, CzPartner)
+                # reachable so const-prop resolves them during AggressiveUnroll.
+                CallGraphPass(out.dialects, rewrite.Walk(BindArchSpec(self.arch_spec)))(
+                    out
+                )
+
+            out = handle.output = SquinToNative().emit(out, no_raise=no_raise)
+
+        with record_stage(self.report, "aggressive_unroll", out) as handle:
+            if self.preserve_loops:
+                self._unroll_preserving_loops(out, no_raise, handle)
+            else:
+                record_fixpoint(
+                    AggressiveUnroll(out.dialects, no_raise=no_raise), out, handle
+                )
+
+        with record_stage(self.report, "lower_to_place", out) as handle:
+            out = handle.output = self._lower_to_place(out, no_raise)
+
+        return out
 
+    def _lower_to_place(self, out: Method, no_raise: bool) -> Method:
         self._post_unroll_validation(out, no_raise)
 
         rewrite.Walk(scf2cf.ScfToCfRule()).rewrite(out.code)
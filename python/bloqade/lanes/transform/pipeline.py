@@ -24,6 +24,7 @@ from bloqade.lanes.transform.native_to_place import (
     PhysicalNativeToPlace,
 )
 from bloqade.lanes.transform.place_to_move import PlaceToMove
+from bloqade.lanes.transform.report import CompileReport, record_stage
 
 
 def transversal_rewrites(mt: Method, rewrite_logical_initialize: bool = True) -> Method:
@@ -49,6 +50,20 @@ def transversal_rewrites(mt: Method, rewrite_logical_initialize: bool = True) ->
     return mt
 
 
+def _preserve_loops(
+    preserve_loops: bool, placement_strategy: placement.PlacementStrategyABC
+) -> bool:
+    if preserve_loops and not placement_strategy.returns_to_entry_layout:
+        warnings.warn(
+            "preserve_loops requires a placement strategy that returns atoms to "
+            f"their entry layout, which {type(placement_strategy).__name__} does "
+            "not; loops are unrolled instead.",
+            stacklevel=3,
+        )
+        return False
+    return preserve_loops
+
+
 @dataclass
 class PhysicalPipeline:
     """Compile a physical squin kernel to the move dialect.
@@ -62,12 +77,26 @@ class PhysicalPipeline:
     ``emit`` using ``self.arch_spec``, guaranteeing consistency.  Pass explicit
     instances only when you need a fully custom heuristic or strategy; in that
     case the caller is responsible for arch-spec consistency.
+
+    ``preserve_loops=True`` places the body of constant-trip-count loops once
+    instead of unrolling them first (see ``NativeToPlaceBase``). It only takes
+    effect when the placement strategy returns atoms to their entry layout.
+    It is placement-only: the emitted move IR, and anything built from it, is
+    still fully unrolled.
+
+    ``profile=True`` makes ``emit`` record a ``CompileReport`` of every stage
+    and CZ placement in ``report``, replacing the report of the previous call.
     """
 
     arch_spec: ArchSpec = field(default_factory=get_physical_arch_spec)
     layout_heuristic: layout.LayoutHeuristicABC | None = None
     placement_strategy: placement.PlacementStrategyABC | None = None
     place_opt_type: type[passes.Pass] = field(default=SequentialPlacePass)
+    preserve_loops: bool = False
+    profile: bool = False
+    report: CompileReport | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def resolved_layout_heuristic(self) -> layout.LayoutHeuristicABC:
@@ -111,16 +140,24 @@ class PhysicalPipeline:
         return self.placement_strategy
 
     def emit(self, mt: Method, no_raise: bool = True) -> Method:
-        out = PhysicalNativeToPlace(arch_spec=self.arch_spec).emit(
-            mt, no_raise=no_raise
-        )
-        self.place_opt_type(out.dialects, no_raise=no_raise)(out)
-
-        out = PlaceToMove(
-            layout_heuristic=self.resolved_layout_heuristic,
-            placement_strategy=self.resolved_placement_strategy,
-            insert_initialize=False,
-        ).emit(out, no_raise=no_raise)
+        report = self.report = CompileReport() if self.profile else None
+        placement_strategy = self.resolved_placement_strategy
+        with record_stage(report, "native_to_place", mt) as handle:
+            out = handle.output = PhysicalNativeToPlace(
+                arch_spec=self.arch_spec,
+                preserve_loops=_preserve_loops(self.preserve_loops, placement_strategy),
+                report=report,
+            ).emit(mt, no_raise=no_raise)
+        with record_stage(report, "place_opt", out):
+            self.place_opt_type(out.dialects, no_raise=no_raise)(out)
+
+        with record_stage(report, "place_to_move", out) as handle:
+            out = handle.output = PlaceToMove(
+                layout_heuristic=self.resolved_layout_heuristic,
+                placement_strategy=placement_strategy,
+                insert_initialize=False,
+                report=report,
+            ).emit(out, no_raise=no_raise)
 
         return out
 
@@ -137,6 +174,15 @@ class LogicalPipeline:
     ``emit`` using ``self.arch_spec``, guaranteeing consistency.  Pass explicit
     instances only when you need a fully custom heuristic or strategy; in that
     case the caller is responsible for arch-spec consistency.
+
+    ``preserve_loops=True`` places the body of constant-trip-count loops once
+    instead of unrolling them first (see ``NativeToPlaceBase``). It only takes
+    effect when the placement strategy returns atoms to their entry layout.
+    It is placement-only: the emitted move IR, and anything built from it, is
+    still fully unrolled.
+
+    ``profile=True`` makes ``emit`` record a ``CompileReport`` of every stage
+    and CZ placement in ``report``, replacing the report of the previous call.
     """
 
     arch_spec: ArchSpec = field(default_factory=get_logical_arch_spec)
@@ -145,6 +191,11 @@ class LogicalPipeline:
     place_opt_type: type[passes.Pass] = field(default=SequentialPlacePass)
     transversal_rewrite: bool = False
     simulation: bool = True
+    preserve_loops: bool = False
+    profile: bool = False
+    report: CompileReport | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def resolved_layout_heuristic(self) -> layout.LayoutHeuristicABC:
@@ -187,20 +238,30 @@ class LogicalPipeline:
         return self.placement_strategy
 
     def emit(self, mt: Method, no_raise: bool = True) -> Method:
-        out = LogicalNativeToPlace(
-            arch_spec=self.arch_spec, transversal_rewrite=self.transversal_rewrite
-        ).emit(mt, no_raise=no_raise)
-        self.place_opt_type(out.dialects, no_raise=no_raise)(out)
-
-        out = PlaceToMove(
-            layout_heuristic=self.resolved_layout_heuristic,
-            placement_strategy=self.resolved_placement_strategy,
-            insert_initialize=True,
-        ).emit(out, no_raise=no_raise)
+        report = self.report = CompileReport() if self.profile else None
+        placement_strategy = self.resolved_placement_strategy
+        with record_stage(report, "native_to_place", mt) as handle:
+            out = handle.output = LogicalNativeToPlace(
+                arch_spec=self.arch_spec,
+                transversal_rewrite=self.transversal_rewrite,
+                preserve_loops=_preserve_loops(self.preserve_loops, placement_strategy),
+                report=report,
+            ).emit(mt, no_raise=no_raise)
+        with record_stage(report, "place_opt", out):
+            self.place_opt_type(out.dialects, no_raise=no_raise)(out)
+
+        with record_stage(report, "place_to_move", out) as handle:
+            out = handle.output = PlaceToMove(
+                layout_heuristic=self.resolved_layout_heuristic,
+                placement_strategy=placement_strategy,
+                insert_initialize=True,
+                report=report,
+            ).emit(out, no_raise=no_raise)
 
         if self.transversal_rewrite:
             # If running this compilation for simulation purposes we
             # need to rewrite the logical initialize statement
-            transversal_rewrites(out, rewrite_logical_initialize=self.simulation)
+            with record_stage(report, "transversal_rewrite", out):
+                transversal_rewrites(out, rewrite_logical_initialize=self.simulation)
 
         return out
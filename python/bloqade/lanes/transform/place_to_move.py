@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from bloqade.analysis import address
 from kirin import passes, rewrite
@@ -9,7 +9,12 @@ from kirin.rewrite.abc import RewriteRule
 
 from bloqade.lanes.analysis import layout, placement
 from bloqade.lanes.dialects import move
-from bloqade.lanes.rewrite import place2move, resolve_pinned, state
+from bloqade.lanes.rewrite import place2move, repeat, resolve_pinned, state
+from bloqade.lanes.transform.report import (
+    CompileReport,
+    CountRewrites,
+    record_stage,
+)
 
 
 @dataclass
@@ -19,86 +24,104 @@ class PlaceToMove:
     The only difference between the physical and logical pipelines at this
     stage is whether ``InsertInitialize`` is included in the rewrite rules.
     Pass ``insert_initialize=True`` for the logical pipeline.
+
+    ``place.Repeat`` bodies are placed once and the resulting move IR is
+    cloned for each iteration, so the emitted move IR is flat.
+
+    When ``report`` is set, ``emit`` records its layout, placement,
+    move-insertion, state-rewrite and type-inference steps on it, and the
+    placement strategy is wrapped to profile every CZ stage.
     """
 
     layout_heuristic: layout.LayoutHeuristicABC
     placement_strategy: placement.PlacementStrategyABC
     insert_initialize: bool = False
+    report: CompileReport | None = field(default=None, repr=False, compare=False)
 
     def emit(self, mt: Method, no_raise: bool = True) -> Method:
-        out = mt.similar(mt.dialects.add(move))
-
-        address_analysis = address.AddressAnalysis(out.dialects)
-        if no_raise:
-            address_frame, _ = address_analysis.run_no_raise(out)
-            all_qubits = tuple(range(address_analysis.next_address))
-            initial_layout = layout.LayoutAnalysis(
-                out.dialects,
-                self.layout_heuristic,
-                address_frame.entries,
-                all_qubits,
-            ).get_layout_no_raise(out)
-        else:
-            address_frame, _ = address_analysis.run(out)
-            all_qubits = tuple(range(address_analysis.next_address))
-            initial_layout = layout.LayoutAnalysis(
-                out.dialects,
-                self.layout_heuristic,
-                address_frame.entries,
-                all_qubits,
-            ).get_layout(out)
+        with record_stage(self.report, "initial_layout", mt) as handle:
+            out = handle.output = mt.similar(mt.dialects.add(move))
+
+            address_analysis = address.AddressAnalysis(out.dialects)
+            if no_raise:
+                address_frame, _ = address_analysis.run_no_raise(out)
+                all_qubits = tuple(range(address_analysis.next_address))
+                initial_layout = layout.LayoutAnalysis(
+                    out.dialects,
+                    self.layout_heuristic,
+                    address_frame.entries,
+                    all_qubits,
+                ).get_layout_no_raise(out)
+            else:
+                address_frame, _ = address_analysis.run(out)
+                all_qubits = tuple(range(address_analysis.next_address))
+                initial_layout = layout.LayoutAnalysis(
+                    out.dialects,
+                    self.layout_heuristic,
+                    address_frame.entries,
+                    all_qubits,
+                ).get_layout(out)
 
-        rewrite.Walk(
-            resolve_pinned.ResolvePinnedAddresses(
-                address_entries=address_frame.entries,
-                initial_layout=initial_layout,
-            )
-        ).rewrite(out.code)
-
-        placement_analysis = placement.PlacementAnalysis(
-            out.dialects,
-            initial_layout,
-            address_frame.entries,
-            self.placement_strategy,
-        )
-        if no_raise:
-            placement_frame, _ = placement_analysis.run_no_raise(out)
-        else:
-            placement_frame, _ = placement_analysis.run(out)
-
-        rules: list[RewriteRule] = [place2move.InsertFill()]
-        if self.insert_initialize:
-            rules.append(place2move.InsertInitialize())
-        rules += [
-            place2move.InsertMoves(placement_frame.entries),
-            place2move.RewriteGates(placement_frame.entries),
-            place2move.InsertMeasure(placement_frame.entries),
-        ]
-        rewrite.Walk(rewrite.Chain(*rules)).rewrite(out.code)
-
-        rewrite.Walk(
-            rewrite.Chain(
-                place2move.LiftMoveStatements(), place2move.DeleteInitialize()
-            )
-        ).rewrite(out.code)
-        rewrite.Walk(place2move.RemoveNoOpStaticPlacements()).rewrite(out.code)
-        rewrite.Fixpoint(rewrite.Walk(rewrite.CFGCompactify())).rewrite(out.code)
-
-        state.InsertBlockArgs().rewrite(out.code)
-        rewrite.Walk(state.RewriteBranches()).rewrite(out.code)
-        rewrite.Walk(state.RewriteLoadStore()).rewrite(out.code)
-
-        rewrite.Fixpoint(
             rewrite.Walk(
-                rewrite.Chain(
-                    place2move.DeleteQubitNew(), rewrite.DeadCodeElimination()
+                resolve_pinned.ResolvePinnedAddresses(
+                    address_entries=address_frame.entries,
+                    initial_layout=initial_layout,
+                )
+            ).rewrite(out.code)
+
+        with record_stage(self.report, "placement", out):
+            strategy = self.placement_strategy
+            profiled = None
+            if self.report is not None:
+                strategy = profiled = placement.ProfiledPlacementStrategy(
+                    inner=strategy
                 )
+            placement_analysis = placement.PlacementAnalysis(
+                out.dialects,
+                initial_layout,
+                address_frame.entries,
+                strategy,
             )
-        ).rewrite(out.code)
-
-        passes.TypeInfer(out.dialects, no_raise=no_raise)(out)
-        if not no_raise:
-            out.verify()
-            out.verify_type()
+            if no_raise:
+                placement_frame, _ = placement_analysis.run_no_raise(out)
+            else:
+                placement_frame, _ = placement_analysis.run(out)
+            if self.report is not None and profiled is not None:
+                self.report.placements.extend(profiled.stages)
+
+        with record_stage(self.report, "insert_moves", out) as handle:
+            # One walk lowers every placed statement: a StaticPlacement is
+            # visited after its body, so it is lifted right after the body is
+            # lowered, and a Repeat after its lifted body, whose move IR is
+            # then emitted once per iteration.
+            rules: list[RewriteRule] = [place2move.InsertFill()]
+            if self.insert_initialize:
+                rules.append(place2move.InsertInitialize())
+            rules += [
+                place2move.InsertMoves(placement_frame.entries),
+                place2move.RewriteGates(placement_frame.entries),
+                place2move.InsertMeasure(placement_frame.entries),
+                place2move.DeleteInitialize(),
+                place2move.LiftStaticPlacement(),
+                repeat.ExpandRepeat(),
+            ]
+            rewrite.Walk(rewrite.Chain(*rules)).rewrite(out.code)
+
+            # an unrolled kernel is a single block with nothing to compactify
+            if len(out.callable_region.blocks) > 1:
+                compactify = CountRewrites(rewrite.Walk(rewrite.CFGCompactify()))
+                rewrite.Fixpoint(compactify).rewrite(out.code)
+                handle.iterations = compactify.count
+
+        with record_stage(self.report, "state_rewrites", out):
+            state.InsertBlockArgs().rewrite(out.code)
+            state.RewriteBlockStates().rewrite(out.callable_region)
+            place2move.DeleteDeadStatements().rewrite(out.code)
+
+        with record_stage(self.report, "type_infer", out):
+            passes.TypeInfer(out.dialects, no_raise=no_raise)(out)
+            if not no_raise:
+                out.verify()
+                out.verify_type()
 
         return out
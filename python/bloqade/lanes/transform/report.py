@@ -0,0 +1,199 @@
+"""Profiling reports for the squin → move compilation pipelines.
+
+A ``CompileReport`` is filled in by ``PhysicalPipeline``/``LogicalPipeline``
+when they are constructed with ``profile=True``. It records, per compilation
+stage and per rewrite pass inside a stage, the wall time, the number of
+statements before and after and, for passes run to a fixpoint, how many
+iterations the fixpoint took. The placement analysis adds one
+``CZStageProfile`` per CZ stage.
+
+Statements are only counted at stage boundaries, so profiling costs one walk
+of the IR per recorded stage.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from kirin import passes
+from kirin.ir import IRNode
+from kirin.ir.method import Method
+from kirin.rewrite.abc import RewriteResult, RewriteRule
+
+from bloqade.lanes.analysis.placement import CZStageProfile
+
+
+def count_statements(mt: Method) -> int:
+    """Number of statements in the body of ``mt``, nested regions included."""
+    return sum(1 for _ in mt.callable_region.walk())
+
+
+@dataclass
+class StageReport:
+    """Profile of one compilation stage or rewrite pass."""
+
+    name: str
+    start_s: float
+    """``time.perf_counter()`` at the start of the stage."""
+    wall_time_s: float
+    stmts_before: int
+    stmts_after: int
+    iterations: int | None = None
+    """Fixpoint iterations, or ``None`` for passes that run once."""
+    depth: int = 0
+    """Nesting depth; sub-passes of a pipeline stage have depth 1."""
+
+
+@dataclass
+class Stage:
+    """Handle for the stage being recorded by ``CompileReport.stage``.
+
+    Set ``output`` when the stage produces a new method rather than rewriting
+    its input in place, and ``iterations`` when it ran a fixpoint.
+    """
+
+    output: Method | None = None
+    iterations: int | None = None
+
+
+@dataclass
+class CompileReport:
+    """Structured profile of one pipeline ``emit`` call."""
+
+    stages: list[StageReport] = field(default_factory=list)
+    """Stages in the order they finished, so sub-passes precede their parent."""
+    placements: list[CZStageProfile] = field(default_factory=list)
+    """One entry per CZ stage placed, in placement order."""
+    origin_s: float = field(default_factory=time.perf_counter)
+    """``time.perf_counter()`` when the report was created."""
+    _depth: int = field(default=0, init=False, repr=False)
+
+    @property
+    def wall_time_s(self) -> float:
+        """Total wall time of the top-level stages."""
+        return sum(stage.wall_time_s for stage in self.stages if stage.depth == 0)
+
+    @contextmanager
+    def stage(self, name: str, mt: Method) -> Iterator[Stage]:
+        """Record the stage run inside the ``with`` block on ``mt``."""
+        handle = Stage()
+        depth = self._depth
+        stmts_before = count_statements(mt)
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield handle
+        finally:
+            wall_time = time.perf_counter() - start
+            self._depth = depth
+        self.stages.append(
+            StageReport(
+                name=name,
+                start_s=start,
+                wall_time_s=wall_time,
+                stmts_before=stmts_before,
+                stmts_after=count_statements(handle.output or mt),
+                iterations=handle.iterations,
+                depth=depth,
+            )
+        )
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """The report in Chrome trace event format.
+
+        Load the JSON written by ``write_chrome_trace`` in ``chrome://tracing``
+        or Perfetto. Stages and CZ placements are complete (``"X"``) events on
+        separate threads, timestamped in microseconds since ``origin_s``.
+        """
+
+        def micros(seconds: float) -> float:
+            return seconds * 1e6
+
+        events: list[dict[str, Any]] = [
+            {
+                "name": stage.name,
+                "cat": "stage",
+                "ph": "X",
+                "ts": micros(stage.start_s - self.origin_s),
+                "dur": micros(stage.wall_time_s),
+                "pid": 0,
+                "tid": 0,
+                "args": {
+                    "stmts_before": stage.stmts_before,
+                    "stmts_after": stage.stmts_after,
+                    "iterations": stage.iterations,
+                },
+            }
+            for stage in self.stages
+        ]
+        events += [
+            {
+                "name": f"cz_stage[{index}]",
+                "cat": "placement",
+                "ph": "X",
+                "ts": micros(profile.start_s - self.origin_s),
+                "dur": micros(profile.wall_time_s),
+                "pid": 0,
+                "tid": 1,
+                "args": {
+                    "num_pairs": profile.num_pairs,
+                    "nodes_expanded": profile.nodes_expanded,
+                    "fallbacks": profile.fallbacks,
+                },
+            }
+            for index, profile in enumerate(self.placements)
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str | os.PathLike[str]) -> None:
+        """Write ``to_chrome_trace()`` to ``path`` as JSON."""
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+@contextmanager
+def _no_stage() -> Iterator[Stage]:
+    yield Stage()
+
+
+def record_stage(
+    report: CompileReport | None, name: str, mt: Method
+) -> AbstractContextManager[Stage]:
+    """``report.stage(name, mt)``, or a no-op context when ``report`` is None."""
+    if report is None:
+        return _no_stage()
+    return report.stage(name, mt)
+
+
+def record_fixpoint(
+    pass_: passes.Pass, mt: Method, handle: Stage, max_iter: int = 32
+) -> RewriteResult:
+    """``pass_.fixpoint(mt)`` that records its iteration count on ``handle``."""
+    result = RewriteResult()
+    iterations = 0
+    for iterations in range(1, max_iter + 1):
+        result_ = pass_.unsafe_run(mt)
+        result = result_.join(result)
+        if not result_.has_done_something:
+            break
+    mt.verify()
+    handle.iterations = (handle.iterations or 0) + iterations
+    return result
+
+
+@dataclass
+class CountRewrites(RewriteRule):
+    """Counts how often ``rule`` is applied, e.g. inside ``rewrite.Fixpoint``."""
+
+    rule: RewriteRule
+    count: int = field(default=0, init=False)
+
+    def rewrite(self, node: IRNode) -> RewriteResult:
+        self.count += 1
+        return self.rule.rewrite(node)
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from itertools import chain
 from typing import Any, ClassVar
 
@@ -14,10 +14,31 @@ from bloqade.lanes.dialects import move
 
 @dataclass
 class _ValidationAnalysis(Forward[EmptyLattice]):
+    """Validates addresses against ``arch_spec``.
+
+    Statement impls register address groups with ``report_location_errors``
+    and ``report_lane_errors``; the groups are collected during the walk and
+    checked with a single ``ArchSpec.check_many`` call at the end of ``run``,
+    with each error reported on the statement that registered the group.
+    """
+
     lattice = EmptyLattice
     keys = ("move.address.validation",)
 
     arch_spec: ArchSpec
+    _location_groups: dict[tuple[ir.Statement, tuple[LocationAddress, ...]], None] = (
+        field(default_factory=dict, init=False, repr=False)
+    )
+    _lane_groups: dict[tuple[ir.Statement, tuple[LaneAddress, ...]], None] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def run(self, method: ir.Method, *args: EmptyLattice, **kwargs: EmptyLattice):
+        self._location_groups.clear()
+        self._lane_groups.clear()
+        result = super().run(method, *args, **kwargs)
+        self._check_address_groups()
+        return result
 
     def method_self(self, method: ir.Method) -> EmptyLattice:
         return EmptyLattice.bottom()
@@ -28,8 +49,26 @@ class _ValidationAnalysis(Forward[EmptyLattice]):
     def report_location_errors(
         self, node: ir.Statement, locations: tuple[LocationAddress, ...]
     ):
-        """Validate a group of locations via Rust and report errors."""
-        for error in self.arch_spec.check_location_group(locations):
+        """Queue a group of locations to be validated via Rust."""
+        self._location_groups[(node, tuple(locations))] = None
+
+    def report_lane_errors(self, node: ir.Statement, lanes: tuple[LaneAddress, ...]):
+        """Queue a group of lanes to be validated via Rust."""
+        self._lane_groups[(node, tuple(lanes))] = None
+
+    def _check_address_groups(self) -> None:
+        """Validate every queued group in one Rust call and report errors."""
+        if not self._location_groups and not self._lane_groups:
+            return
+
+        location_groups = list(self._location_groups)
+        lane_groups = list(self._lane_groups)
+        location_errors, lane_errors = self.arch_spec.check_many(
+            [locations for _, locations in location_groups],
+            [lanes for _, lanes in lane_groups],
+        )
+        for group, error in location_errors:
+            node, _ = location_groups[group]
             self.add_validation_error(
                 node,
                 ir.ValidationError(
@@ -37,10 +76,8 @@ class _ValidationAnalysis(Forward[EmptyLattice]):
                     f"Invalid location address: {error}",
                 ),
             )
-
-    def report_lane_errors(self, node: ir.Statement, lanes: tuple[LaneAddress, ...]):
-        """Validate a group of lanes via Rust and report errors."""
-        for error in self.arch_spec.check_lane_group(lanes):
+        for group, error in lane_errors:
+            node, lanes = lane_groups[group]
             self.add_validation_error(
                 node,
                 ir.ValidationError(
@@ -18,6 +18,9 @@ from collections.abc import Sequence
 from functools import cached_property
 from typing import TYPE_CHECKING
 
+import numpy as np
+
+from bloqade.lanes.arch.geometry import ArchSpecGeometry
 from bloqade.lanes.bytecode.encoding import (
     Direction,
     LocationAddress,
@@ -71,45 +74,30 @@ class ArchVisualizer:
 
     # ── Bounds (cached) ──────────────────────────────────────────
 
+    @cached_property
+    def _site_positions(self) -> np.ndarray:
+        """``(n, 2)`` positions of every resolvable site, from the arch's
+        precomputed position table (one FFI call for all sites)."""
+        positions = ArchSpecGeometry(self.arch_spec).location_positions()
+        return positions[~np.isnan(positions).any(axis=1)]
+
     @cached_property
     def x_bounds(self) -> tuple[float, float]:
         """``(x_min, x_max)`` across every site. Falls back to
         ``(-1.0, 1.0)`` when no sites are discoverable."""
-        x_min = float("inf")
-        x_max = float("-inf")
-        arch = self.arch_spec
-        for zone_id in range(len(arch.zones)):
-            for word_id in range(len(arch.words)):
-                for site_id in range(len(arch.words[word_id].site_indices)):
-                    pos = _location_position(arch, word_id, site_id, zone_id)
-                    if pos is not None:
-                        x_min = min(x_min, pos[0])
-                        x_max = max(x_max, pos[0])
-        if x_min == float("inf"):
-            x_min = -1.0
-        if x_max == float("-inf"):
-            x_max = 1.0
-        return x_min, x_max
+        xs = self._site_positions[:, 0]
+        if len(xs) == 0:
+            return -1.0, 1.0
+        return float(xs.min()), float(xs.max())
 
     @cached_property
     def y_bounds(self) -> tuple[float, float]:
         """``(y_min, y_max)`` across every site. Falls back to
         ``(-1.0, 1.0)`` when no sites are discoverable."""
-        y_min = float("inf")
-        y_max = float("-inf")
-        arch = self.arch_spec
-        for zone_id in range(len(arch.zones)):
-            for word_id in range(len(arch.words)):
-                for site_id in range(len(arch.words[word_id].site_indices)):
-                    pos = _location_position(arch, word_id, site_id, zone_id)
-                    if pos is not None:
-                        y_min = min(y_min, pos[1])
-                        y_max = max(y_max, pos[1])
-        if y_min == float("inf"):
-            y_min = -1.0
-        if y_max == float("-inf"):
-            y_max = 1.0
-        return y_min, y_max
+        ys = self._site_positions[:, 1]
+        if len(ys) == 0:
+            return -1.0, 1.0
+        return float(ys.min()), float(ys.max())
 
     def path_bounds(self) -> tuple[float, float, float, float]:
         """``(x_min, x_max, y_min, y_max)`` covering every site **and**
@@ -3,6 +3,8 @@
 Public API:
     - :func:`build_entropy_trace` -- run the compilation pipeline and return an
       :class:`EntropyTraceBundle` wrapping the Rust solver's entropy trace.
+    - :func:`load_sampled_trace` -- read the binary event sample written by the
+      Rust ``EventSampler`` observer for offline replay.
     - :class:`TreeFrameState`, :class:`TreeStateReducer` -- frame-level state
       derived from a trace for rendering.
     - :func:`run` -- CLI entry point (also accessible via
@@ -17,6 +19,7 @@ from bloqade.lanes.visualize.entropy_tree.state import (
 from bloqade.lanes.visualize.entropy_tree.tracer import (
     EntropyTraceBundle,
     build_entropy_trace,
+    load_sampled_trace,
 )
 
 __all__ = [
@@ -24,5 +27,6 @@ __all__ = [
     "TreeFrameState",
     "TreeStateReducer",
     "build_entropy_trace",
+    "load_sampled_trace",
     "run",
 ]
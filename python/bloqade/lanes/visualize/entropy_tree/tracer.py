@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import struct
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -123,6 +124,114 @@ def convert_native_trace(
     return steps, trace.root_node_id, trace.best_buffer_size
 
 
+# Layout written by the Rust ``telemetry::EventSampler``; see that module's
+# docs for the record format.
+_SAMPLE_MAGIC = b"BLQTRACE"
+_SAMPLE_VERSION = 1
+_SAMPLE_EVENTS = {
+    0: "goal_found",
+    1: "node_expanded",
+    2: "descend",
+    3: "goal",
+    4: "entropy_bump",
+    5: "revert",
+    6: "fallback_start",
+}
+_SAMPLE_HEAD = struct.Struct("<BIIIIII")
+_SAMPLE_U32 = struct.Struct("<I")
+_SAMPLE_U64 = struct.Struct("<Q")
+_SAMPLE_ENTRY = struct.Struct("<IQ")
+_NO_VALUE = 0xFFFFFFFF
+
+
+def _split_lane(bits: int) -> tuple[int, int, int, int, int, int]:
+    data0, data1 = bits & 0xFFFFFFFF, bits >> 32
+    return (
+        (data1 >> 31) & 0x1,
+        (data1 >> 29) & 0x3,
+        (data1 >> 21) & 0xFF,
+        (data0 >> 16) & 0xFFFF,
+        data0 & 0xFFFF,
+        data1 & 0xFFFF,
+    )
+
+
+def _split_location(bits: int) -> tuple[int, int, int]:
+    return (bits >> 56) & 0xFF, (bits >> 40) & 0xFFFF, (bits >> 24) & 0xFFFF
+
+
+def load_sampled_trace(path: Path) -> tuple[TreeTraceStep, ...]:
+    """Read an event sample written by the Rust ``EventSampler`` observer.
+
+    A sample keeps every N-th search event plus every goal, so it replays the
+    shape of a long search without a Python callback per event. Fields the
+    binary format does not carry (candidate movesets, parent configurations,
+    scores) are left empty. An ``unresolved_count`` the event did not report
+    is ``0`` for goal events and ``-1`` otherwise.
+    """
+    data = Path(path).read_bytes()
+    if data[:8] != _SAMPLE_MAGIC:
+        raise ValueError(f"{path} is not an event sample file")
+    (version,) = _SAMPLE_U32.unpack_from(data, 8)
+    if version != _SAMPLE_VERSION:
+        raise ValueError(f"unsupported event sample version {version}")
+
+    steps: list[TreeTraceStep] = []
+    offset = 12
+    while offset < len(data):
+        kind, node_id, parent, depth, entropy, unresolved, n_lanes = (
+            _SAMPLE_HEAD.unpack_from(data, offset)
+        )
+        offset += _SAMPLE_HEAD.size
+        lanes = [
+            _SAMPLE_U64.unpack_from(data, offset + i * _SAMPLE_U64.size)[0]
+            for i in range(n_lanes)
+        ]
+        offset += n_lanes * _SAMPLE_U64.size
+        (n_qubits,) = _SAMPLE_U32.unpack_from(data, offset)
+        offset += _SAMPLE_U32.size
+        entries = [
+            _SAMPLE_ENTRY.unpack_from(data, offset + i * _SAMPLE_ENTRY.size)
+            for i in range(n_qubits)
+        ]
+        offset += n_qubits * _SAMPLE_ENTRY.size
+
+        event = _SAMPLE_EVENTS.get(kind)
+        if event is None:
+            raise ValueError(f"unknown event kind {kind} at byte {offset}")
+        if unresolved == _NO_VALUE:
+            unresolved = 0 if event in ("goal", "goal_found") else -1
+        steps.append(
+            TreeTraceStep(
+                step_index=len(steps),
+                event=event,
+                node_id=node_id,
+                parent_node_id=None if parent == _NO_VALUE else parent,
+                depth=depth,
+                entropy=entropy,
+                unresolved_count=unresolved,
+                moveset=(
+                    frozenset(_decode_lane(_split_lane(bits)) for bits in lanes)
+                    if lanes
+                    else None
+                ),
+                candidate_movesets=(),
+                candidate_index=None,
+                reason=None,
+                state_seen_node_id=None,
+                no_valid_moves_qubit=None,
+                trigger_node_id=None,
+                configuration=_decode_config(
+                    [(qid, *_split_location(loc)) for qid, loc in entries]
+                ),
+                parent_configuration=None,
+                moveset_score=None,
+                best_buffer_node_ids=None,
+            )
+        )
+    return tuple(steps)
+
+
 def build_entropy_trace(
     *,
     kernel: Any,
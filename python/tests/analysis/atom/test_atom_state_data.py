@@ -4,6 +4,7 @@ from kirin.interp import InterpreterError
 from bloqade.lanes.analysis.atom import atom_state_data
 from bloqade.lanes.arch.gemini import logical
 from bloqade.lanes.bytecode.encoding import (
+    Direction,
     LaneAddress,
     LocationAddress,
     MoveType,
@@ -160,6 +161,28 @@ def test_apply_validated_rejects_stale_token():
     assert moved.qubit_to_locations[0] == LocationAddress(1, 0)
 
 
+def test_apply_many_matches_step_by_step_replay():
+    atom_state = atom_state_data.AtomStateData.from_fields(
+        locations_to_qubit={LocationAddress(0, 0): 0},
+        qubit_to_locations={0: LocationAddress(0, 0)},
+    )
+    arch_spec = logical.get_arch_spec()
+    layers = [
+        (WordLaneAddress(0, 0, 0),),
+        (WordLaneAddress(0, 0, 0, Direction.BACKWARD),),
+    ]
+
+    expected = atom_state
+    for lanes in layers:
+        expected = expected.apply_validated(
+            expected.validate_moves(lanes=lanes, arch_spec=arch_spec)
+        )
+
+    assert atom_state.apply_many(layers, arch_spec) == expected
+    assert atom_state.apply_many(layers, arch_spec, validate=False) == expected
+    assert expected.move_count == {0: 2}
+
+
 def test_validate_moves_rejects_occupied_destination():
     from bloqade.lanes.bytecode.exceptions import (
         DestinationOccupiedError,
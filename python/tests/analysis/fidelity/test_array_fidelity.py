@@ -0,0 +1,69 @@
+import math
+
+from bloqade.analysis.fidelity import FidelityAnalysis
+
+from bloqade import squin
+from bloqade.lanes.analysis.fidelity import ArrayFidelityAnalysis, fidelity_bounds
+
+
+@squin.kernel
+def branched_noise():
+    q = squin.qalloc(3)
+    squin.depolarize(0.1, q[0])
+    squin.depolarize2(0.05, q[0], q[1])
+    squin.qubit_loss(0.2, q[2])
+    squin.single_qubit_pauli_channel(0.01, 0.02, 0.03, q[2])
+    if squin.qubit.measure(q[0]):
+        squin.depolarize(0.3, q[1])
+    else:
+        squin.depolarize(0.1, q[1])
+    squin.depolarize(0.1, q[0])
+    return q
+
+
+def _ranges(fidelities):
+    return [(fidelity.min, fidelity.max) for fidelity in fidelities]
+
+
+def _assert_ranges_close(actual, expected):
+    assert len(actual) == len(expected)
+    for (amin, amax), (emin, emax) in zip(actual, expected):
+        assert math.isclose(amin, emin) and math.isclose(amax, emax)
+
+
+def test_array_fidelity_analysis_matches_upstream():
+    expected = FidelityAnalysis(branched_noise.dialects)
+    expected.run(branched_noise)
+    analysis = ArrayFidelityAnalysis(branched_noise.dialects)
+    analysis.run(branched_noise)
+
+    _assert_ranges_close(
+        _ranges(analysis.gate_fidelities), _ranges(expected.gate_fidelities)
+    )
+    _assert_ranges_close(
+        _ranges(analysis.qubit_survival_fidelities),
+        _ranges(expected.qubit_survival_fidelities),
+    )
+    # The runtime branch leaves qubit 1 with a genuine (min, max) range.
+    fid_min, fid_max = _ranges(analysis.gate_fidelities)[1]
+    assert fid_min < fid_max
+
+
+def test_array_fidelity_analysis_rerun_starts_fresh():
+    analysis = ArrayFidelityAnalysis(branched_noise.dialects)
+    analysis.run(branched_noise)
+    first = _ranges(analysis.gate_fidelities)
+    analysis.run(branched_noise)
+    _assert_ranges_close(_ranges(analysis.gate_fidelities), first)
+
+
+def test_fidelity_bounds_is_product_over_qubits():
+    expected = FidelityAnalysis(branched_noise.dialects)
+    expected.run(branched_noise)
+    expected_min = math.prod(fid.min for fid in expected.gate_fidelities)
+    expected_max = math.prod(fid.max for fid in expected.gate_fidelities)
+
+    fid_min, fid_max = fidelity_bounds(branched_noise)
+
+    assert math.isclose(fid_min, expected_min)
+    assert math.isclose(fid_max, expected_max)
@@ -0,0 +1,208 @@
+"""Tests for the CZ-stage placement memo."""
+
+from dataclasses import dataclass, field
+
+import bloqade.squin as squin
+import pytest
+
+import bloqade.gemini as gemini
+from bloqade.lanes.analysis.placement import (
+    DelegatingPlacementStrategy,
+    MemoizedPlacementStrategy,
+    PalindromePlacementStrategy,
+    PlacementError,
+    PlacementMemo,
+    PlacementStrategyABC,
+    ProfiledPlacementStrategy,
+)
+from bloqade.lanes.analysis.placement.lattice import (
+    ConcreteState,
+    ExecuteCZ,
+    ExecuteCZReturn,
+)
+from bloqade.lanes.arch.gemini import logical as logical_arch
+from bloqade.lanes.bytecode.encoding import LocationAddress
+from bloqade.lanes.heuristics.logical.placement import (
+    LogicalPlacementStrategy,
+    LogicalPlacementStrategyNoHome,
+)
+from bloqade.lanes.transform import LogicalPipeline
+
+
+@dataclass
+class _CountingStrategy(LogicalPlacementStrategy):
+    calls: int = field(default=0, init=False, repr=False)
+
+    def cz_placements(self, state, controls, targets, lookahead_cz_layers=()):
+        self.calls += 1
+        return super().cz_placements(state, controls, targets, lookahead_cz_layers)
+
+
+@dataclass
+class _NoMoveToStrategy(PlacementStrategyABC):
+    def validate_initial_layout(self, initial_layout):
+        pass
+
+    def cz_placements(self, state, controls, targets, lookahead_cz_layers=()):
+        return state
+
+    def sq_placements(self, state, qubits):
+        return state
+
+
+def _loc(w: int) -> LocationAddress:
+    return LocationAddress(zone_id=0, word_id=w, site_id=0)
+
+
+def _concrete(layout, move_count=None):
+    return ConcreteState(
+        occupied=frozenset(),
+        layout=layout,
+        move_count=move_count or (0,) * len(layout),
+    )
+
+
+def _make_strategy(memo: PlacementMemo | None = None):
+    inner = _CountingStrategy(arch_spec=logical_arch.get_arch_spec())
+    return inner, MemoizedPlacementStrategy(inner=inner, memo=memo)
+
+
+def test_repeated_stage_is_solved_once():
+    inner, strat = _make_strategy()
+    state = _concrete((_loc(0), _loc(2)))
+
+    first = strat.cz_placements(state, controls=(0,), targets=(1,))
+    second = strat.cz_placements(state, controls=(0,), targets=(1,))
+
+    assert isinstance(first, ExecuteCZ)
+    assert second == first
+    assert inner.calls == 1
+    assert (strat.memo.hits, strat.memo.misses) == (1, 1)
+
+
+def test_relabelled_register_hits():
+    inner, strat = _make_strategy()
+    first = strat.cz_placements(
+        _concrete((_loc(0), _loc(2)), move_count=(3, 5)), controls=(0,), targets=(1,)
+    )
+    # same atoms, move counts and CZ pair, with the qubit ids swapped
+    swapped = strat.cz_placements(
+        _concrete((_loc(2), _loc(0)), move_count=(5, 3)), controls=(1,), targets=(0,)
+    )
+
+    assert inner.calls == 1
+    assert isinstance(swapped, ExecuteCZ)
+    assert swapped.layout == first.layout[::-1]
+    assert swapped.move_layers == first.move_layers
+    assert swapped.move_count == first.move_count[::-1]
+
+
+def test_different_move_counts_miss():
+    inner, strat = _make_strategy()
+    layout = (_loc(0), _loc(2))
+
+    strat.cz_placements(_concrete(layout), controls=(0,), targets=(1,))
+    result = strat.cz_placements(
+        _concrete(layout, move_count=(1, 0)), controls=(0,), targets=(1,)
+    )
+
+    assert inner.calls == 2
+    assert result == inner.cz_placements(
+        _concrete(layout, move_count=(1, 0)), controls=(0,), targets=(1,)
+    )
+
+
+def test_memoized_compile_matches_unmemoized():
+    @gemini.logical.kernel(aggressive_unroll=True)
+    def kernel():
+        reg = squin.qalloc(3)
+        for _ in range(3):
+            squin.cx(reg[0], reg[1])
+            squin.cx(reg[1], reg[2])
+        gemini.logical.terminal_measure(reg)
+
+    arch_spec = logical_arch.get_arch_spec()
+    memo = PlacementMemo()
+
+    def memoized_pipeline() -> LogicalPipeline:
+        return LogicalPipeline(
+            arch_spec=arch_spec,
+            placement_strategy=PalindromePlacementStrategy(
+                inner=MemoizedPlacementStrategy(
+                    inner=LogicalPlacementStrategyNoHome(arch_spec=arch_spec),
+                    memo=memo,
+                )
+            ),
+        )
+
+    expected = LogicalPipeline(arch_spec=arch_spec).emit(kernel)
+    # the second compile replays every stage solved by the first
+    for _ in range(2):
+        out = memoized_pipeline().emit(kernel)
+        assert out.callable_region.is_structurally_equal(expected.callable_region)
+    assert memo.hits > 0
+
+
+def test_memo_is_shared_and_keyed_by_strategy():
+    memo = PlacementMemo()
+    inner_a, strat_a = _make_strategy(memo)
+    inner_b, strat_b = _make_strategy(memo)
+    state = _concrete((_loc(0), _loc(2)))
+
+    strat_a.cz_placements(state, controls=(0,), targets=(1,))
+    strat_b.cz_placements(state, controls=(0,), targets=(1,))
+    assert (inner_a.calls, inner_b.calls) == (1, 0)
+
+    palindrome = PalindromePlacementStrategy(inner=strat_b)
+    assert isinstance(
+        palindrome.cz_placements(state, controls=(0,), targets=(1,)), ExecuteCZReturn
+    )
+    assert inner_b.calls == 0
+
+
+def test_lru_evicts_least_recently_used():
+    memo = PlacementMemo(max_entries=2)
+    memo.put(("a",), ((), (), ()))
+    memo.put(("b",), ((), (), ()))
+    assert memo.get(("a",)) is not None
+    memo.put(("c",), ((), (), ()))
+
+    assert memo.get(("b",)) is None
+    assert len(memo) == 2
+
+
+def test_memo_round_trips_through_disk(tmp_path):
+    path = tmp_path / "placements.json"
+    _, strat = _make_strategy(PlacementMemo(path=path))
+    state = _concrete((_loc(0), _loc(2)))
+    expected = strat.cz_placements(state, controls=(0,), targets=(1,))
+    strat.memo.save()
+
+    inner, reloaded = _make_strategy(PlacementMemo(path=path))
+
+    assert reloaded.cz_placements(state, controls=(0,), targets=(1,)) == expected
+    assert inner.calls == 0
+
+
+def test_invalid_max_entries():
+    with pytest.raises(ValueError, match="max_entries"):
+        PlacementMemo(max_entries=0)
+
+
+@pytest.mark.parametrize(
+    "wrapper", [MemoizedPlacementStrategy, ProfiledPlacementStrategy]
+)
+def test_wrappers_share_delegation(wrapper):
+    inner = _NoMoveToStrategy(arch_spec=logical_arch.get_arch_spec())
+    strat = wrapper(inner=inner)
+    state = _concrete((_loc(0), _loc(2)))
+
+    assert isinstance(strat, DelegatingPlacementStrategy)
+    assert strat.arch_spec is inner.arch_spec
+    assert strat.sq_placements(state, (0,)) is state
+    with pytest.raises(PlacementError, match=f"{wrapper.__name__} inner strategy"):
+        strat.move_to_placements(state, (0,), (_loc(4),))
+    with pytest.raises(PlacementError, match="but a permute was requested"):
+        strat.permute_placements(state, (0, 1), (1, 0))
+    with pytest.raises(NotImplementedError):
+        strat.compute_moves(state, state)
@@ -81,3 +81,22 @@ def test_negative_location_ids_rejected():
         LocationAddress(-1, 0)
     with pytest.raises(ValueError, match="must be non-negative"):
         LocationAddress(0, -1)
+
+
+def test_check_many_matches_group_checks():
+    arch_spec = logical.get_arch_spec()
+    location_groups = [
+        [LocationAddress(0, 0), LocationAddress(0, 1)],
+        [],
+        [LocationAddress(99, 0)],
+        [LocationAddress(0, 0), LocationAddress(0, 0)],
+    ]
+
+    location_errors, lane_errors = arch_spec.check_many(location_groups)
+
+    assert lane_errors == []
+    assert [(group, str(error)) for group, error in location_errors] == [
+        (group, str(error))
+        for group, locations in enumerate(location_groups)
+        for error in arch_spec.check_location_group(locations)
+    ]
@@ -611,6 +611,33 @@ MINIMAL_ARCH_JSON = """{
 }"""
 
 
+# Two words of two sites in one zone; word 0 is CZ-paired with word 1.
+PAIRED_ARCH_JSON = """{
+    "version": "2.0",
+    "words": [
+        {"sites": [[0, 0], [0, 1]]},
+        {"sites": [[1, 0], [1, 1]]}
+    ],
+    "zones": [
+        {
+            "grid": {
+                "x_start": 0.0, "y_start": 0.0,
+                "x_spacing": [5.0], "y_spacing": [3.0]
+            },
+            "site_buses": [{"src": [0], "dst": [1]}],
+            "word_buses": [{"src": [0], "dst": [1]}],
+            "words_with_site_buses": [0, 1],
+            "sites_with_word_buses": [0, 1],
+            "entangling_pairs": [[0, 1]]
+        }
+    ],
+    "zone_buses": [],
+    "modes": [
+        {"name": "default", "zones": [0], "bitstring_order": []}
+    ]
+}"""
+
+
 class TestCapabilityValidation:
     def test_single_measure_allowed(self):
         arch = ArchSpec.from_json(MINIMAL_ARCH_JSON)
@@ -741,3 +768,145 @@ class TestProgramRepr:
         assert "Program" in r
         assert "(1, 0)" in r
         assert "1" in r  # instruction count
+
+
+class TestProgramReplay:
+    def test_replay_without_moves(self):
+        from bloqade.lanes.bytecode.replay import replay
+
+        arch = ArchSpec.from_json(MINIMAL_ARCH_JSON)
+        program = Program.from_text("""\
+version 1.0;
+fn @main() {
+  const_loc 0x00000000
+  const_loc 0x00000001
+  initial_fill 2
+  halt
+}
+""")
+        arrays = replay(program, arch)
+        assert arrays.num_qubits == 2
+        assert arrays.num_layers == 0
+        assert arrays.locations.shape == (1, 2, 3)
+        assert (arrays.locations[0, :, 0] == 0).all()
+        assert tuple(arrays.locations[0, 0]) != tuple(arrays.locations[0, 1])
+        assert arrays.lane_offsets.tolist() == [0]
+        assert arrays.cz_offsets.tolist() == [0]
+        assert arrays.total_move_time_us == 0.0
+
+    def test_replay_with_moves(self):
+        from bloqade.lanes.bytecode.replay import replay
+
+        # q0 at (w0, s0) and q1 at (w1, s1); q1 steps back to (w1, s0) to
+        # face q0 for a CZ, then q0 is pushed onto q1's site.
+        arch = ArchSpec.from_json(PAIRED_ARCH_JSON)
+        program = Program(
+            version=(1, 0),
+            instructions=[
+                Instruction.const_loc(zone_id=0, word_id=0, site_id=0),
+                Instruction.const_loc(zone_id=0, word_id=1, site_id=1),
+                Instruction.initial_fill(2),
+                Instruction.const_lane(MoveType.SITE, 0, 1, 0, 0, Direction.BACKWARD),
+                Instruction.move_(1),
+                Instruction.const_zone(0),
+                Instruction.cz(),
+                Instruction.const_lane(MoveType.WORD, 0, 0, 0, 0),
+                Instruction.move_(1),
+                Instruction.halt(),
+            ],
+        )
+        arrays = replay(program, arch, validate=False)
+        assert arrays.num_qubits == 2
+        assert arrays.num_layers == 2
+        assert arrays.layer_pcs.tolist() == [4, 8]
+        assert arrays.locations.shape == (3, 2, 3)
+        assert arrays.locations.tolist() == [
+            [[0, 0, 0], [0, 1, 1]],
+            [[0, 0, 0], [0, 1, 0]],
+            [[-1, -1, -1], [-1, -1, -1]],
+        ]
+        assert arrays.collided.tolist() == [[False, False], [True, True]]
+        assert arrays.lane_offsets.tolist() == [0, 1, 2]
+        assert arrays.lane_qubits.tolist() == [1, 0]
+        assert arrays.layer_lanes(0) == [
+            LaneAddress(MoveType.SITE, 0, 1, 0, 0, Direction.BACKWARD)
+        ]
+        assert arrays.cz_layers.tolist() == [1]
+        assert arrays.cz_offsets.tolist() == [0, 1]
+        assert (arrays.cz_controls.tolist(), arrays.cz_targets.tolist()) == ([0], [1])
+        assert arrays.total_move_time_us == pytest.approx(
+            arrays.lane_durations_us.sum()
+        )
+
+
+class TestProgramColumns:
+    def _sample_program(self):
+        return Program(
+            version=(1, 2),
+            instructions=[
+                Instruction.const_loc(zone_id=1, word_id=2, site_id=3),
+                Instruction.initial_fill(1),
+                Instruction.const_float(-0.5),
+                Instruction.const_int(-7),
+                Instruction.const_lane(MoveType.WORD, 0, 4, 5, 6, Direction.BACKWARD),
+                Instruction.move_(1),
+                Instruction.new_array(1, 2, 3),
+                Instruction.halt(),
+            ],
+        )
+
+    def test_round_trip(self):
+        from bloqade.lanes.bytecode.columns import columns, from_columns
+
+        program = self._sample_program()
+        cols = columns(program)
+        assert len(cols) == len(program)
+        assert cols.op_names().tolist() == [
+            instr.op_name() for instr in program.instructions
+        ]
+        rebuilt = from_columns(
+            program.version, cols.ops, cols.operand0, cols.operand1, cols.operand2
+        )
+        assert rebuilt == program
+
+    def test_operand_views(self):
+        from bloqade.lanes.bytecode.columns import columns
+
+        cols = columns(self._sample_program())
+        assert cols.float_values[2] == -0.5
+        assert cols.int_values[3] == -7
+        zone, word, site = cols.location_fields()
+        assert (zone[0], word[0], site[0]) == (1, 2, 3)
+        lane = cols.lane_fields()
+        assert lane["direction"][4] == 1
+        assert lane["move_type"][4] == 1
+        assert lane["word_id"][4] == 4
+        assert lane["site_id"][4] == 5
+        assert lane["bus_id"][4] == 6
+        assert (cols.operand0[6], cols.operand1[6], cols.operand2[6]) == (1, 2, 3)
+        assert cols.mask("move", "halt").nonzero()[0].tolist() == [5, 7]
+
+    def test_builder_matches_factories(self):
+        from bloqade.lanes.bytecode.columns import ColumnBuilder
+
+        builder = ColumnBuilder()
+        builder.append("const_loc", LocationAddress(1, 2, 3).encode())
+        builder.append("initial_fill", 1)
+        builder.const_float(-0.5)
+        builder.const_int(-7)
+        builder.append(
+            "const_lane",
+            LaneAddress(MoveType.WORD, 0, 4, 5, 6, Direction.BACKWARD).encode(),
+        )
+        builder.append("move", 1)
+        builder.append("new_array", 1, 2, 3)
+        builder.append("halt")
+        assert builder.build((1, 2)) == self._sample_program()
+
+    def test_from_columns_rejects_unknown_op(self):
+        import numpy as np
+
+        from bloqade.lanes.bytecode.columns import from_columns
+
+        with pytest.raises(ValueError, match="unknown op id"):
+            from_columns((1, 0), np.array([200]), np.array([0]))
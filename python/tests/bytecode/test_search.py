@@ -3,12 +3,21 @@
 Covers ``SolveOptions.backwards_search`` — the flag that asks the solver to
 plan ``target -> initial`` and then reverse-and-invert the resulting layers —
 and its read-back on a built ``MoveSearch``, which exposes no ``options``
-property of its own.
+property of its own, and the validation of ``time_budget_s``.
 """
 
 from __future__ import annotations
 
-from bloqade.lanes.bytecode._native import MoveSearch, SolveOptions
+import pytest
+
+from bloqade.lanes.arch.gemini.physical import get_arch_spec
+from bloqade.lanes.bytecode._native import (
+    MoveSearch,
+    SearchEngine,
+    SolveOptions,
+    TargetSolver,
+)
+from bloqade.lanes.bytecode.encoding import LocationAddress
 
 
 def test_backwards_search_defaults_to_false():
@@ -27,3 +36,28 @@ def test_move_search_reports_the_backwards_search_flag_it_carries():
 
 def test_move_search_defaults_to_forward_solving():
     assert MoveSearch.entropy().backwards_search is False
+
+
+@pytest.mark.parametrize("time_budget_s", [float("nan"), float("inf"), -1.0, 1e300])
+def test_time_budget_s_rejects_unrepresentable_values(time_budget_s):
+    with pytest.raises(ValueError, match="time_budget_s"):
+        SolveOptions(time_budget_s=time_budget_s)
+
+
+def _solver() -> TargetSolver:
+    engine = SearchEngine.from_arch_spec(get_arch_spec()._inner)
+    return TargetSolver(engine, MoveSearch.astar())
+
+
+def test_solve_rejects_an_unrepresentable_time_budget():
+    loc = LocationAddress(0, 0, 0)._inner
+    with pytest.raises(ValueError, match="time_budget_s"):
+        _solver().solve({0: loc}, {0: loc}, [], None, time_budget_s=1e300)
+
+
+def test_a_budget_past_the_clock_range_never_expires():
+    # 1e19 s fits in a Duration but not past "now" on the monotonic clock; the
+    # deadline is dropped instead of overflowing.
+    loc = LocationAddress(0, 0, 0)._inner
+    result = _solver().solve({0: loc}, {0: loc}, [], None, time_budget_s=1e19)
+    assert result.status == "solved"
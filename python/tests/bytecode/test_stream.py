@@ -0,0 +1,315 @@
+"""Tests for StreamingEncoder: move IR → bytecode in a single pass."""
+
+import pytest
+from bloqade.decoders.dialects import annotate
+from kirin import ir, types
+from kirin.dialects import func, ilist, py
+from tests._validation_squin_kernels import select_kernels
+
+import bloqade.gemini as gemini
+from bloqade import squin
+from bloqade.lanes.arch.gemini.logical import get_arch_spec
+from bloqade.lanes.arch.gemini.physical import (
+    get_arch_spec as get_physical_arch_spec,
+)
+from bloqade.lanes.bytecode.columns import columns
+from bloqade.lanes.bytecode.encode import EncodingError
+from bloqade.lanes.bytecode.encoding import (
+    Direction,
+    LaneAddress,
+    LocationAddress,
+    MoveType,
+    ZoneAddress,
+)
+from bloqade.lanes.bytecode.stream import stream_program
+from bloqade.lanes.dialects import move, stack_move
+from bloqade.lanes.transform import LogicalPipeline, MoveToStackMove, PhysicalPipeline
+
+_ARCH = get_arch_spec()
+_ZONE = ZoneAddress(0)
+
+
+def _method(stmts: list[ir.Statement]) -> ir.Method:
+    block = ir.Block(argtypes=(types.MethodType,))
+    for s in stmts:
+        block.stmts.append(s)
+    function = func.Function(
+        sym_name="main",
+        signature=func.Signature((), types.Any),
+        slots=(),
+        body=ir.Region(blocks=block),
+    )
+    dialects = ir.DialectGroup(
+        [
+            move.dialect,
+            stack_move.dialect,
+            func.dialect,
+            py.dialect,
+            ilist.dialect,
+            annotate.dialect,
+        ]
+    )
+    return ir.Method(dialects=dialects, code=function, sym_name="main", arg_names=[])
+
+
+def _halt() -> list[ir.Statement]:
+    none_stmt = func.ConstantNone()
+    return [none_stmt, func.Return(none_stmt.result)]
+
+
+def _move_kernel() -> ir.Method:
+    """Gates, moves and a measurement read by a detector and an observable.
+
+    The first location is read twice and one read is unused, so the encoder
+    has to share, drop and dup/swap measurement results.
+    """
+    locs = list(_ARCH.yield_zone_locations(_ZONE))[:3]
+    lanes = (
+        LaneAddress(MoveType.SITE, 0, 0, 0, Direction.FORWARD),
+        LaneAddress(MoveType.SITE, 0, 1, 0, Direction.FORWARD),
+    )
+    half = py.Constant(0.5)
+    tenth = py.Constant(0.1)
+    load = move.Load()
+    fill = move.Fill(current_state=load.result, location_addresses=tuple(locs))
+    lrz = move.LocalRz(
+        current_state=fill.result,
+        rotation_angle=half.result,
+        location_addresses=(locs[0], locs[2]),
+    )
+    lr = move.LocalR(
+        current_state=lrz.result,
+        axis_angle=tenth.result,
+        rotation_angle=half.result,
+        location_addresses=(locs[1],),
+    )
+    grz = move.GlobalRz(current_state=lr.result, rotation_angle=tenth.result)
+    mv = move.Move(current_state=grz.result, lanes=lanes)
+    cz = move.CZ(current_state=mv.result, zone_address=_ZONE)
+    measure = move.Measure(current_state=cz.result, zone_addresses=(_ZONE,))
+    reads = [
+        move.GetFutureResult(
+            measurement_future=measure.future,
+            zone_address=_ZONE,
+            location_address=loc,
+        )
+        for loc in (locs[0], locs[1], locs[0], locs[2])
+    ]
+    detector_meas = ilist.New(values=(reads[0].result, reads[1].result))
+    x = py.Constant(1.0)
+    y = py.Constant(2.0)
+    coords = ilist.New(values=(x.result, y.result))
+    detector = annotate.stmts.SetDetector(
+        measurements=detector_meas.result, coordinates=coords.result
+    )
+    observable_meas = ilist.New(values=(reads[2].result,))
+    observable = annotate.stmts.SetObservable(measurements=observable_meas.result)
+    store = move.Store(current_state=measure.result)
+    return _method(
+        [
+            half,
+            tenth,
+            load,
+            fill,
+            lrz,
+            lr,
+            grz,
+            mv,
+            cz,
+            measure,
+            *reads,
+            detector_meas,
+            x,
+            y,
+            coords,
+            detector,
+            observable_meas,
+            observable,
+            store,
+            *_halt(),
+        ]
+    )
+
+
+def _stmt_types(method: ir.Method) -> list[str]:
+    return [type(s).__name__ for s in method.callable_region.blocks[0].stmts]
+
+
+def test_matches_move_to_stack_move():
+    kernel = _move_kernel()
+    expected = MoveToStackMove(arch_spec=_ARCH).emit_bytecode(kernel)
+
+    program = stream_program(kernel, _ARCH)
+
+    assert program == expected
+    op_names = list(columns(program).op_names())
+    assert op_names.count("get_item") == 2
+    assert op_names.count("dup") == op_names.count("swap") > 0
+
+
+def test_end_measure_matches_move_to_stack_move():
+    """Pipelines terminate with ``EndMeasure`` rather than ``Measure``."""
+    locs = list(_ARCH.yield_zone_locations(_ZONE))[:2]
+    load = move.Load()
+    fill = move.Fill(current_state=load.result, location_addresses=tuple(locs))
+    measure = move.EndMeasure(current_state=fill.result, zone_addresses=(_ZONE,))
+    reads = [
+        move.GetFutureResult(
+            measurement_future=measure.result, zone_address=_ZONE, location_address=loc
+        )
+        for loc in locs
+    ]
+    results = ilist.New(values=tuple(read.result for read in reads))
+    kernel = _method(
+        [load, fill, measure, *reads, results, func.Return(results.result)]
+    )
+
+    assert stream_program(kernel, _ARCH) == MoveToStackMove(
+        arch_spec=_ARCH
+    ).emit_bytecode(kernel)
+
+
+@squin.kernel
+def _ghz_measured():
+    reg = squin.qalloc(4)
+    squin.h(reg[0])
+    for i in range(1, len(reg)):
+        squin.cx(reg[i - 1], reg[i])
+    return squin.broadcast.measure(reg)
+
+
+@gemini.logical.kernel(aggressive_unroll=True)
+def _logical_bell():
+    reg = squin.qalloc(2)
+    squin.h(reg[0])
+    squin.cx(reg[0], reg[1])
+    gemini.logical.terminal_measure(reg)
+
+
+@gemini.logical.kernel(aggressive_unroll=True)
+def _logical_repeated_cz():
+    reg = squin.qalloc(3)
+    for _ in range(3):
+        squin.cx(reg[0], reg[1])
+        squin.cx(reg[1], reg[2])
+    gemini.logical.terminal_measure(reg)
+
+
+def _assert_encoders_agree(kernel: ir.Method, arch_spec) -> None:
+    expected = MoveToStackMove(arch_spec=arch_spec).emit_bytecode(kernel)
+    assert stream_program(kernel, arch_spec) == expected
+    assert stream_program(kernel, arch_spec, chunk_size=7) == expected
+
+
+def _drop_initialize(kernel: ir.Method) -> ir.Method:
+    """Remove logical/physical initialization, which has no bytecode instruction."""
+    for stmt in list(kernel.callable_region.walk()):
+        if isinstance(stmt, (move.LogicalInitialize, move.PhysicalInitialize)):
+            stmt.result.replace_by(stmt.current_state)
+            stmt.delete()
+    return kernel
+
+
+_PHYSICAL_KERNELS = {spec.name: spec.build_kernel for spec in select_kernels()}
+_PHYSICAL_KERNELS["ghz_measured"] = lambda: _ghz_measured
+
+
+@pytest.mark.parametrize("name", sorted(_PHYSICAL_KERNELS))
+def test_matches_move_to_stack_move_on_physical_pipeline(name: str):
+    kernel = PhysicalPipeline().emit(_PHYSICAL_KERNELS[name](), no_raise=False)
+    _assert_encoders_agree(kernel, get_physical_arch_spec())
+
+
+@pytest.mark.parametrize("transversal_rewrite", [False, True])
+@pytest.mark.parametrize(
+    "kernel", [_logical_bell, _logical_repeated_cz], ids=["bell", "repeated_cz"]
+)
+def test_matches_move_to_stack_move_on_logical_pipeline(
+    kernel: ir.Method, transversal_rewrite: bool
+):
+    # The transversal rewrite replaces logical with physical addresses.
+    arch_spec = get_physical_arch_spec() if transversal_rewrite else _ARCH
+    out = LogicalPipeline(transversal_rewrite=transversal_rewrite).emit(kernel)
+    _assert_encoders_agree(_drop_initialize(out), arch_spec)
+
+
+def test_chunked_encoding_matches():
+    kernel = _move_kernel()
+    assert stream_program(kernel, _ARCH, chunk_size=1) == stream_program(kernel, _ARCH)
+
+
+def test_version_passthrough():
+    program = MoveToStackMove(arch_spec=_ARCH).stream_bytecode(
+        _move_kernel(), version=(2, 3)
+    )
+    assert program.version == (2, 3)
+
+
+def test_does_not_mutate_input():
+    kernel = _move_kernel()
+    before = _stmt_types(kernel)
+    stream_program(kernel, _ARCH)
+    assert _stmt_types(kernel) == before
+
+
+def test_nested_ilist_lowers_to_2d_array():
+    locs = list(_ARCH.yield_zone_locations(_ZONE))[:3]
+    load = move.Load()
+    measure = move.Measure(current_state=load.result, zone_addresses=(_ZONE,))
+    reads = [
+        move.GetFutureResult(
+            measurement_future=measure.future, zone_address=_ZONE, location_address=loc
+        )
+        for loc in locs
+    ]
+    row0 = ilist.New(values=(reads[0].result, reads[1].result))
+    row1 = ilist.New(values=(reads[2].result, reads[1].result))
+    table = ilist.New(values=(row0.result, row1.result))
+    kernel = _method(
+        [
+            load,
+            measure,
+            *reads,
+            row0,
+            row1,
+            table,
+            move.Store(current_state=measure.result),
+            func.Return(table.result),
+        ]
+    )
+
+    cols = columns(stream_program(kernel, _ARCH))
+
+    new_arrays = cols.mask("new_array")
+    assert new_arrays.sum() == 1
+    assert cols.operand1[new_arrays].tolist() == [2]
+    assert cols.operand2[new_arrays].tolist() == [2]
+    assert cols.op_names()[-1] == "return"
+
+
+def test_validate_reports_invalid_location():
+    load = move.Load()
+    fill = move.Fill(
+        current_state=load.result, location_addresses=(LocationAddress(999, 0, 0),)
+    )
+    kernel = _method([load, fill, move.Store(current_state=fill.result), *_halt()])
+
+    stream_program(kernel, _ARCH)
+    with pytest.raises(EncodingError, match="Invalid location address"):
+        stream_program(kernel, _ARCH, validate=True)
+
+
+def test_unlowered_statement_raises():
+    zone = move.ConstZone(value=_ZONE)
+    kernel = _method([zone, func.Return(zone.result)])
+    with pytest.raises(EncodingError, match="ConstZone"):
+        stream_program(kernel, _ARCH)
+
+
+def test_non_numeric_operand_raises():
+    flag = py.Constant(True)
+    load = move.Load()
+    grz = move.GlobalRz(current_state=load.result, rotation_angle=flag.result)
+    kernel = _method([flag, load, grz, move.Store(current_state=grz.result), *_halt()])
+    with pytest.raises(EncodingError, match="GlobalRz operand"):
+        stream_program(kernel, _ARCH)
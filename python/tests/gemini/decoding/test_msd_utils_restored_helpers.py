@@ -113,6 +113,82 @@ def test_table_decoder_with_confidence_decodes_and_scores_detector_patterns():
     assert decoder._det_obs_counts.dtype == np.uint32
 
 
+def test_sparse_table_decoder_matches_dense_table_decoder():
+    dem = stim.Circuit.generated(
+        "repetition_code:memory",
+        distance=3,
+        rounds=2,
+        after_clifford_depolarization=0.05,
+    ).detector_error_model()
+    dense = TableDecoderWithConfidence(dem, num_shots=20_000, seed=1, step_size=3_000)
+    sparse = TableDecoderWithConfidence(
+        dem, num_shots=20_000, seed=1, step_size=3_000, sparse=True
+    )
+    detector_shots = dem.compile_sampler(seed=2).sample(200)[0]
+
+    assert sparse._det_obs_keys is not None
+    assert sparse._det_obs_keys.size == np.count_nonzero(dense._det_obs_counts)
+    np.testing.assert_array_equal(
+        sparse.decode(detector_shots), dense.decode(detector_shots)
+    )
+    for shot in detector_shots:
+        dense_correction, dense_confidence = dense.decode_with_confidence(shot)
+        sparse_correction, sparse_confidence = sparse.decode_with_confidence(shot)
+        np.testing.assert_array_equal(sparse_correction, dense_correction)
+        np.testing.assert_equal(sparse_confidence, dense_confidence)
+
+
+def test_wide_table_decoder_uses_sparse_table_and_scores_unseen_syndromes_nan():
+    dem = stim.DetectorErrorModel("\n".join(f"error(0.01) D{i} L0" for i in range(40)))
+    decoder = TableDecoderWithConfidence(dem, num_shots=0)
+    decoder._update_det_obs_counts(
+        np.array([[1] + [0] * 39 + [1], [1] + [0] * 39 + [0]], dtype=np.uint8)
+    )
+    decoder._update_det_obs_counts(np.array([[1] + [0] * 39 + [1]], dtype=np.uint8))
+
+    seen = np.array([1] + [0] * 39, dtype=np.uint8)
+    correction, confidence = decoder.decode_with_confidence(seen)
+    unseen_correction, unseen_confidence = decoder.decode_with_confidence(
+        np.ones(40, dtype=np.uint8)
+    )
+
+    assert decoder._det_obs_keys is not None
+    assert decoder._det_obs_counts.dtype == np.uint32
+    np.testing.assert_array_equal(correction, np.array([True]))
+    assert confidence == pytest.approx(2.0 / 3.0)
+    np.testing.assert_array_equal(unseen_correction, np.array([False]))
+    assert np.isnan(unseen_confidence)
+
+
+@pytest.mark.parametrize("sparse", [False, True], ids=["dense", "sparse"])
+def test_table_decoder_parallel_training_is_seeded_and_counts_every_shot(
+    sparse: bool,
+):
+    dem = stim.Circuit.generated(
+        "repetition_code:memory",
+        distance=3,
+        rounds=2,
+        after_clifford_depolarization=0.05,
+    ).detector_error_model()
+
+    def train() -> TableDecoderWithConfidence:
+        return TableDecoderWithConfidence(
+            dem,
+            num_shots=10_001,
+            seed=3,
+            step_size=1_000,
+            sparse=sparse,
+            num_workers=3,
+        )
+
+    first, second = train(), train()
+
+    assert int(first._det_obs_counts.sum()) == 10_001
+    np.testing.assert_array_equal(first._det_obs_counts, second._det_obs_counts)
+    if sparse:
+        np.testing.assert_array_equal(first._det_obs_keys, second._det_obs_keys)
+
+
 def test_table_decoder_with_confidence_allows_empty_dem_and_step_size_none():
     decoder = TableDecoderWithConfidence(
         stim.DetectorErrorModel(""),
@@ -1,3 +1,5 @@
+import random
+
 from bloqade.lanes.arch import (
     ArchBlueprint,
     DeviceLayout,
@@ -131,3 +133,35 @@ def test_global_assignment_minimizes_cross_word_site_mismatch_metric():
 
     # Known optimum is 150 for this constrained case; enforce near-optimality.
     assert strategy_cost <= 160
+
+
+def test_global_assignment_is_swap_local_optimum():
+    strategy = PhysicalLayoutHeuristicGraphPartitionCenterOut(
+        arch_spec=_make_arch(num_rows=8, sites_per_word=16),
+        max_words=4,
+    )
+    qubits = tuple(range(24))
+    rng = random.Random(7)
+    edge_counts: dict[tuple[int, int], int] = {}
+    for _ in range(80):
+        u, v = sorted(rng.sample(qubits, 2))
+        edge_counts[(u, v)] = edge_counts.get((u, v), 0) + 1
+
+    layout_out = strategy.compute_layout(qubits, _weighted_stages(edge_counts))
+    assert len(set(layout_out)) == len(qubits)
+
+    distance = strategy._site_distance_matrix()
+    sites = [addr.site_id for addr in layout_out]
+
+    def cost(site_of: list[int]) -> int:
+        return sum(
+            weight * int(distance[site_of[u], site_of[v]])
+            for (u, v), weight in edge_counts.items()
+        )
+
+    best = cost(sites)
+    for a in qubits:
+        for b in qubits[a + 1 :]:
+            swapped = list(sites)
+            swapped[a], swapped[b] = swapped[b], swapped[a]
+            assert cost(swapped) >= best
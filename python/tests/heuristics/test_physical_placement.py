@@ -93,6 +93,31 @@ def test_cz_placements_rust_returns_execute_cz():
     assert len(out.layout) == len(state.layout)
 
 
+def test_warm_start_repeats_a_stage_without_searching():
+    strategy = PhysicalPlacementStrategy(
+        arch_spec=logical.get_arch_spec(),
+        traversal=RustPlacementTraversal(strategy="astar", warm_start=True),
+    )
+    state = ConcreteState(
+        occupied=frozenset(),
+        layout=(
+            LocationAddress(0, 0),
+            LocationAddress(2, 0),
+        ),
+        move_count=(0, 0),
+    )
+    first = strategy.cz_placements(state, controls=(0,), targets=(1,))
+    expanded_after_first = strategy.rust_nodes_expanded_total
+    second = strategy.cz_placements(state, controls=(0,), targets=(1,))
+
+    assert isinstance(first, ExecuteCZ) and isinstance(second, ExecuteCZ)
+    assert first.move_layers
+    assert second.layout == first.layout
+    assert second.move_layers == first.move_layers
+    # The seeded plan is optimal for the repeated stage, so no search ran.
+    assert strategy.rust_nodes_expanded_total == expanded_after_first
+
+
 def test_cz_placements_rust_raises_on_failure(monkeypatch):
     strategy = PhysicalPlacementStrategy(
         arch_spec=logical.get_arch_spec(), traversal=RustPlacementTraversal()
@@ -283,7 +308,15 @@ def test_rust_path_target_generator_shared_budget(monkeypatch):
             self.bound_stats: dict[str, float] = {}
 
     class _FakeSolver:
-        def solve(self, _initial, _target, _blocked, max_expansions):
+        def solve(
+            self,
+            _initial,
+            _target,
+            _blocked,
+            max_expansions,
+            _time_budget_s=None,
+            _warm_start=None,
+        ):
             budgets_seen.append(max_expansions)
             return _FakeResult()
 
@@ -300,6 +333,70 @@ def test_rust_path_target_generator_shared_budget(monkeypatch):
     assert budgets_seen == [10, 6]
 
 
+def test_rust_path_time_budget_is_shared_across_candidates(monkeypatch):
+    arch_spec = logical.get_arch_spec()
+    state = ConcreteState(
+        occupied=frozenset(),
+        layout=(
+            LocationAddress(0, 0),
+            LocationAddress(2, 0),
+        ),
+        move_count=(0, 0),
+    )
+    alt_target = {
+        0: state.layout[0],
+        1: arch_spec.get_cz_partner(state.layout[0]),
+    }
+    time_budgets_seen: list[float | None] = []
+
+    class _FakeResult:
+        status = "unsolvable"
+        nodes_expanded = 1
+        bound_stats: ClassVar[dict[str, float]] = {}
+
+    class _FakeSolver:
+        def solve(
+            self,
+            _initial,
+            _target,
+            _blocked,
+            _max_expansions,
+            time_budget_s,
+            _warm_start=None,
+        ):
+            time_budgets_seen.append(time_budget_s)
+            return _FakeResult()
+
+    monkeypatch.setattr(
+        PhysicalPlacementStrategy,
+        "_make_target_solver",
+        lambda _self, _ms: _FakeSolver(),
+    )
+
+    generous = PhysicalPlacementStrategy(
+        arch_spec=arch_spec,
+        traversal=RustPlacementTraversal(time_budget_s=60.0),
+        target_generator=lambda ctx: [alt_target],
+    )
+    with pytest.raises(PlacementError):
+        generous.cz_placements(state, controls=(0,), targets=(1,))
+    # Both candidates ran, each against what was left of the one stage budget.
+    assert len(time_budgets_seen) == 2
+    first, second = time_budgets_seen
+    assert first is not None and second is not None
+    assert 0.0 < second <= first <= 60.0
+
+    time_budgets_seen.clear()
+    spent = PhysicalPlacementStrategy(
+        arch_spec=arch_spec,
+        traversal=RustPlacementTraversal(time_budget_s=0.0),
+        target_generator=lambda ctx: [alt_target],
+    )
+    with pytest.raises(PlacementError):
+        spent.cz_placements(state, controls=(0,), targets=(1,))
+    assert time_budgets_seen == []
+
+
 def test_rust_path_cz_counter_increments():
     """Parity fix: _cz_counter must increment on the Rust path too."""
     strategy = PhysicalPlacementStrategy(
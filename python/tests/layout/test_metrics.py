@@ -95,3 +95,24 @@ def test_metrics_caching():
     d1 = move_calc.get_lane_duration_us(lane)
     d2 = move_calc.get_lane_duration_us(lane)
     assert d1 == d2
+
+
+def test_lane_durations_gather_matches_per_lane_durations():
+    move_calc = _build_move_calc()
+    lanes = tuple(move_calc.arch_spec.iter_all_lanes())
+    durations = move_calc.lane_durations_us(lanes)
+    assert durations.shape == (len(lanes),)
+    for lane, duration in zip(lanes, durations.tolist()):
+        assert duration == pytest.approx(move_calc.get_lane_duration_us(lane))
+    assert (move_calc.lane_ordinals(lanes) >= 0).all()
+
+
+def test_layer_move_times_take_segmented_max():
+    move_calc = _build_move_calc()
+    lanes = tuple(move_calc.arch_spec.iter_all_lanes())[:5]
+    durations = move_calc.lane_durations_us(lanes)
+    layer_times, total = move_calc.layer_move_times_us(lanes, [0, 2, 2, 5])
+    assert layer_times.tolist() == pytest.approx(
+        [max(durations[:2]), 0.0, max(durations[2:5])]
+    )
+    assert total == pytest.approx(float(layer_times.sum()))
@@ -13,7 +13,8 @@ from bloqade.lanes.arch import (
     build_arch,
 )
 from bloqade.lanes.arch.geometry import ArchSpecGeometry, BusDescriptor
-from bloqade.lanes.bytecode.encoding import Direction, MoveType
+from bloqade.lanes.bytecode._native import LaneAddress as _RustLaneAddress
+from bloqade.lanes.bytecode.encoding import Direction, LocationAddress, MoveType
 
 
 def _single_zone_arch():
@@ -224,6 +225,53 @@ class TestGetGridEndpoints:
         assert fwd_dst == bwd_src
 
 
+# ── Lookup tables ──
+
+
+class TestLookupTables:
+    def test_positions_match_location_position(self):
+        arch = _two_zone_arch()
+        inner = arch._inner
+        positions = ArchSpecGeometry(arch).location_positions()
+        assert positions.shape == (inner.num_locations, 2)
+        for zone_id in range(len(inner.zones)):
+            for word_id in range(len(inner.words)):
+                for site_id in range(len(inner.words[word_id].sites)):
+                    loc = LocationAddress(word_id, site_id, zone_id)
+                    ordinal = inner.location_ordinal(loc._inner)
+                    assert ordinal is not None
+                    pos = inner.location_position(loc._inner)
+                    assert pos is not None
+                    assert tuple(positions[ordinal]) == pos
+
+    def test_cz_partners_match_get_cz_partner(self):
+        arch = _single_zone_arch()
+        inner = arch._inner
+        partners = ArchSpecGeometry(arch).cz_partner_ordinals()
+        assert len(partners) == inner.num_locations
+        for word_id in range(len(inner.words)):
+            for site_id in range(len(inner.words[word_id].sites)):
+                loc = LocationAddress(word_id, site_id, 0)
+                partner = inner.get_cz_partner(loc._inner)
+                expected = -1 if partner is None else inner.location_ordinal(partner)
+                assert partners[inner.location_ordinal(loc._inner)] == expected
+
+    def test_lane_table_matches_lane_endpoints(self):
+        arch = _two_zone_arch()
+        inner = arch._inner
+        lanes, src, dst = ArchSpecGeometry(arch).lane_endpoint_ordinals()
+        assert len(lanes) > 0
+        assert len(lanes) == len(src) == len(dst)
+        for bits, s, d in zip(lanes, src, dst, strict=True):
+            lane = _RustLaneAddress.decode(int(bits))
+            endpoints = inner.lane_endpoints(lane)
+            assert endpoints is not None
+            lane_src, lane_dst = endpoints
+            assert inner.location_ordinal(lane_src) == s
+            assert inner.location_ordinal(lane_dst) == d
+            assert inner.lane_for_endpoints(lane_src, lane_dst) is not None
+
+
 # ── ArchSpecGeometry ──
 
 
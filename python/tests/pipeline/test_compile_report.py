@@ -0,0 +1,75 @@
+"""Tests for pipeline profiling via CompileReport."""
+
+import json
+
+import bloqade.squin as squin
+from kirin.dialects import ilist
+
+import bloqade.gemini as gemini
+from bloqade.lanes.transform import LogicalPipeline, PhysicalPipeline
+
+
+def _bell_kernel():
+    @gemini.logical.kernel(aggressive_unroll=True)
+    def kernel():
+        reg = squin.qalloc(2)
+        squin.h(reg[0])
+        squin.cx(reg[0], reg[1])
+        gemini.logical.terminal_measure(reg)
+
+    return kernel
+
+
+def test_report_is_off_by_default():
+    pipeline = LogicalPipeline()
+    pipeline.emit(_bell_kernel())
+    assert pipeline.report is None
+
+
+def test_logical_pipeline_report():
+    pipeline = LogicalPipeline(transversal_rewrite=True, profile=True)
+    out = pipeline.emit(_bell_kernel())
+    report = pipeline.report
+    assert report is not None
+
+    top_level = [stage.name for stage in report.stages if stage.depth == 0]
+    assert top_level == [
+        "native_to_place",
+        "place_opt",
+        "place_to_move",
+        "transversal_rewrite",
+    ]
+    stages = {stage.name: stage for stage in report.stages}
+    assert {"aggressive_unroll", "placement", "state_rewrites"} <= stages.keys()
+    assert stages["aggressive_unroll"].iterations >= 1
+    assert stages["place_opt"].iterations is None
+    assert stages["transversal_rewrite"].stmts_after == sum(
+        1 for _ in out.callable_region.walk()
+    )
+    assert all(stage.wall_time_s >= 0 for stage in report.stages)
+    assert report.wall_time_s <= sum(stage.wall_time_s for stage in report.stages)
+
+    assert len(report.placements) == 1
+    assert report.placements[0].num_pairs == 1
+
+
+def test_chrome_trace(tmp_path):
+    @squin.kernel
+    def kernel():
+        reg = squin.qalloc(2)
+        squin.cz(reg[0], reg[1])
+        squin.qubit.measure(ilist.IList([reg[0], reg[1]]))  # type: ignore[arg-type]
+
+    pipeline = PhysicalPipeline(profile=True)
+    pipeline.emit(kernel)
+    report = pipeline.report
+    assert report is not None
+    assert report.placements[0].nodes_expanded is not None
+
+    path = tmp_path / "trace.json"
+    report.write_chrome_trace(path)
+    events = json.loads(path.read_text())["traceEvents"]
+
+    assert len(events) == len(report.stages) + len(report.placements)
+    assert all(event["ph"] == "X" and event["ts"] >= 0 for event in events)
+    assert {event["cat"] for event in events} == {"stage", "placement"}
@@ -74,6 +74,67 @@ def test_logical_pipeline_produces_logical_initialize():
     assert len(inits) >= 1
 
 
+def _repeated_bell_kernel():
+    @gemini.logical.kernel
+    def kernel():
+        reg = squin.qalloc(2)
+        for _ in range(3):
+            squin.h(reg[0])
+            squin.cx(reg[0], reg[1])
+        gemini.logical.terminal_measure(reg)
+
+    return kernel
+
+
+def test_logical_native_to_place_preserve_loops_keeps_repeat():
+    """preserve_loops lowers a constant-trip-count loop once, as a place.Repeat."""
+    out = LogicalNativeToPlace(preserve_loops=True).emit(_repeated_bell_kernel())
+
+    repeats = [s for s in out.callable_region.walk() if isinstance(s, place.Repeat)]
+    assert [r.count for r in repeats] == [3]
+    body_czs = [s for s in repeats[0].body.walk() if isinstance(s, place.CZ)]
+    assert len(body_czs) == 1
+
+
+def test_logical_pipeline_preserve_loops_matches_unrolled():
+    """Placing the loop body once emits the same CZs and moves as unrolling."""
+    kernel = _repeated_bell_kernel()
+
+    def count(out, stmt_type) -> int:
+        return sum(isinstance(s, stmt_type) for s in out.callable_region.walk())
+
+    unrolled = LogicalPipeline().emit(kernel)
+    preserved = LogicalPipeline(preserve_loops=True).emit(kernel)
+
+    assert count(preserved, place.Repeat) == 0
+    assert count(preserved, move.CZ) == count(unrolled, move.CZ) == 3
+    assert count(preserved, move.Move) == count(unrolled, move.Move)
+
+
+def test_logical_pipeline_preserve_loops_expands_repeat_in_place_to_move(
+    monkeypatch,
+):
+    """The Repeat survives place optimization and is only expanded when place
+    IR is lowered to move IR."""
+    from bloqade.lanes.transform import PlaceToMove
+
+    repeats_seen: list[int] = []
+    _orig_emit = PlaceToMove.emit
+
+    def spy_emit(self_inner, mt, no_raise=True):
+        repeats_seen.append(
+            sum(isinstance(s, place.Repeat) for s in mt.callable_region.walk())
+        )
+        return _orig_emit(self_inner, mt, no_raise=no_raise)
+
+    monkeypatch.setattr(PlaceToMove, "emit", spy_emit)
+
+    out = LogicalPipeline(preserve_loops=True).emit(_repeated_bell_kernel())
+
+    assert repeats_seen == [1]
+    assert not any(isinstance(s, place.Repeat) for s in out.callable_region.walk())
+
+
 def test_logical_pipeline_layout_heuristic_default_is_none():
     """LogicalPipeline.layout_heuristic defaults to None."""
     pipeline = LogicalPipeline()
@@ -167,3 +167,23 @@ def test_physical_pipeline_placement_strategy_mismatch_warns():
         result = pipeline.resolved_placement_strategy
 
     assert result is mismatched_strategy
+
+
+def test_physical_pipeline_preserve_loops_needs_returning_strategy():
+    """preserve_loops is ignored, with a warning, when the placement strategy
+    does not return atoms to their entry layout."""
+
+    @squin.kernel
+    def kernel():
+        reg = squin.qalloc(2)
+        for _ in range(2):
+            squin.cz(reg[0], reg[1])
+        squin.qubit.measure(reg)
+
+    pipeline = PhysicalPipeline(preserve_loops=True)
+    assert not pipeline.resolved_placement_strategy.returns_to_entry_layout
+
+    with pytest.warns(UserWarning, match="preserve_loops requires"):
+        out = pipeline.emit(kernel)
+
+    assert not any(isinstance(s, place.Repeat) for s in out.callable_region.walk())
@@ -1,3 +1,4 @@
+import itertools
 from typing import Any, cast
 
 from bloqade.native.dialects.gate import stmts as gates
@@ -16,6 +17,7 @@ from bloqade.lanes.rewrite.circuit2place import MergeStaticPlacement  # new
 from bloqade.lanes.rewrite.circuit2place import always_merge  # new
 from bloqade.lanes.rewrite.circuit2place import gate_only_merge  # new
 from bloqade.lanes.rewrite.circuit2place import (
+    BulkMergeStaticPlacement,
     InitializeNewQubits,
     MergePlacementRegions,
     RewriteLogicalInitializeToNewLogical,
@@ -710,6 +712,87 @@ def test_gate_only_merge_rejects_end_measure_block():
     assert len(remaining) == 2
 
 
+def _append_rz_placement(
+    block: ir.Block, qbit: ir.SSAValue, angle: ir.SSAValue
+) -> place.StaticPlacement:
+    body_block = ir.Block()
+    entry_state = body_block.args.append_from(types.StateType, "entry_state")
+    body_block.stmts.append(
+        g := place.Rz(entry_state, qubits=(0,), rotation_angle=angle)
+    )
+    body_block.stmts.append(place.Yield(g.state_after))
+    block.stmts.append(
+        sp := place.StaticPlacement(qubits=(qbit,), body=ir.Region(body_block))
+    )
+    return sp
+
+
+def _append_measure_placement(
+    block: ir.Block, qubits: tuple[ir.SSAValue, ...]
+) -> place.StaticPlacement:
+    body_block = ir.Block()
+    entry_state = body_block.args.append_from(types.StateType, "entry_state")
+    body_block.stmts.append(
+        em := place.EndMeasure(entry_state, qubits=tuple(range(len(qubits))))
+    )
+    body_block.stmts.append(place.Yield(*em.results))
+    block.stmts.append(
+        sp := place.StaticPlacement(qubits=qubits, body=ir.Region(body_block))
+    )
+    return sp
+
+
+def test_bulk_merge_static_placement_merges_run_in_one_walk():
+    qubits = tuple(ir.TestValue() for _ in range(3))
+    test_block = ir.Block([angle := py.Constant(0.5)])
+    _append_rz_placement(test_block, qubits[0], angle.result)
+    _append_rz_placement(test_block, qubits[1], angle.result)
+    _append_rz_placement(test_block, qubits[0], angle.result)
+    measure = _append_measure_placement(test_block, (qubits[2], qubits[0]))
+    test_block.stmts.append(consumer := ilist.New(values=tuple(measure.results)))
+
+    result = rewrite.Walk(BulkMergeStaticPlacement(always_merge)).rewrite(test_block)
+
+    assert result.has_done_something
+    merged_stmts = [s for s in test_block.stmts if isinstance(s, place.StaticPlacement)]
+    assert len(merged_stmts) == 1
+    (merged,) = merged_stmts
+    assert merged.qubits == (qubits[0], qubits[1], qubits[2])
+    body_stmts = list(merged.body.blocks[0].stmts)
+    assert [type(stmt) for stmt in body_stmts] == [
+        place.Rz,
+        place.Rz,
+        place.Rz,
+        place.EndMeasure,
+        place.Yield,
+    ]
+    assert [stmt.qubits for stmt in body_stmts[:4]] == [(0,), (1,), (0,), (2, 0)]
+    # Each statement consumes the state produced by the previous one.
+    for prev_stmt, stmt in itertools.pairwise(body_stmts):
+        assert stmt.args[0] is prev_stmt.results[0]
+    # The measurement results now come from the merged placement.
+    assert tuple(consumer.args) == tuple(merged.results)
+    assert len(merged.results) == 2
+
+
+def test_bulk_merge_static_placement_splits_runs_on_policy_and_other_stmts():
+    qubits = tuple(ir.TestValue() for _ in range(2))
+    test_block = ir.Block([angle := py.Constant(0.5)])
+    _append_rz_placement(test_block, qubits[0], angle.result)
+    _append_rz_placement(test_block, qubits[1], angle.result)
+    _append_measure_placement(test_block, (qubits[0],))
+    _append_rz_placement(test_block, qubits[0], angle.result)
+    test_block.stmts.append(py.Constant(1))
+    _append_rz_placement(test_block, qubits[1], angle.result)
+    _append_rz_placement(test_block, qubits[0], angle.result)
+
+    rewrite.Walk(BulkMergeStaticPlacement(gate_only_merge)).rewrite(test_block)
+
+    remaining = [s for s in test_block.stmts if isinstance(s, place.StaticPlacement)]
+    assert [len(sp.qubits) for sp in remaining] == [2, 1, 1, 2]
+    assert isinstance(remaining[1].body.blocks[0].first_stmt, place.EndMeasure)
+
+
 # --- Regression: every non-default attribute of a place op must survive a
 # StaticPlacement merge. Both merge sites (MergePlacementRegions and
 # MergeStaticPlacement) rebuild each inner statement from a hand-curated
@@ -298,6 +298,30 @@ def test_getfutureresult_lowers_to_getitem_on_await():
     assert indices == set(range(len(locs)))
 
 
+def test_end_measure_lowers_like_measure():
+    """Pipeline kernels end in EndMeasure, which lowers to Measure + AwaitMeasure."""
+    loc = next(iter(_ARCH.yield_zone_locations(ZoneAddress(0))))
+    load = move.Load()
+    m = move.EndMeasure(current_state=load.result, zone_addresses=(ZoneAddress(0),))
+    gfr = move.GetFutureResult(
+        measurement_future=m.result,
+        zone_address=ZoneAddress(0),
+        location_address=loc,
+    )
+    block = ir.Block()
+    for s in [load, m, gfr, func.Return(gfr.result)]:
+        block.stmts.append(s)
+
+    Walk(_rule()).rewrite(block)
+
+    assert not any(isinstance(s, move.EndMeasure) for s in block.stmts)
+    sm_m = next(s for s in block.stmts if isinstance(s, stack_move.Measure))
+    aw = next(s for s in block.stmts if isinstance(s, stack_move.AwaitMeasure))
+    gi = next(s for s in block.stmts if isinstance(s, stack_move.GetItem))
+    assert aw.future is sm_m.results[0]
+    assert gi.array is aw.result
+
+
 def test_ilist_new_lowers_to_new_array_1d():
     """ilist.New with homogeneous int elements becomes a 1-D stack_move.NewArray."""
     ci0 = stack_move.ConstInt(value=0)
@@ -25,6 +25,7 @@ from bloqade.lanes.bytecode.encoding import (
 )
 from bloqade.lanes.dialects import move, place
 from bloqade.lanes.rewrite import place2move
+from bloqade.lanes.types import StateType
 
 _word = word.Word(sites=((0, 0), (0, 1)))
 _rust_grid = RustGrid.from_positions([0.0], [0.0, 1.0])
@@ -655,3 +656,36 @@ def test_insert_initialize_none_location_address_is_noop():
     assert not result.has_done_something
     # No move.LogicalInitialize should have been inserted
     assert not any(isinstance(s, move.LogicalInitialize) for s in test_block.walk())
+
+
+def test_lift_static_placement_removes_emptied_placement():
+    body = ir.Block()
+    entry_state = body.args.append_from(StateType, name="entry_state")
+    body.stmts.append(current_state := move.Load())
+    body.stmts.append(move.Store(current_state.result))
+    body.stmts.append(place.Yield(entry_state))
+    sp = place.StaticPlacement(qubits=(), body=ir.Region(body))
+    test_block = ir.Block([sp, terminator := py.Constant(0)])
+
+    result = rewrite.Walk(place2move.LiftStaticPlacement()).rewrite(test_block)
+
+    assert result.has_done_something
+    assert [type(stmt) for stmt in test_block.stmts] == [
+        move.Load,
+        move.Store,
+        py.Constant,
+    ]
+    assert test_block.last_stmt is terminator
+
+
+def test_delete_dead_statements_follows_operands():
+    angle = py.Constant(0.5)
+    qubit = place.NewLogicalQubit(angle.result, angle.result, angle.result)
+    used = py.Constant(1)
+    test_block = ir.Block([angle, qubit, used, func.Return(used.result)])
+
+    result = place2move.DeleteDeadStatements().rewrite(test_block)
+
+    assert result.has_done_something
+    assert [type(stmt) for stmt in test_block.stmts] == [py.Constant, func.Return]
+    assert test_block.first_stmt is used
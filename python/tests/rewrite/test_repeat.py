@@ -0,0 +1,174 @@
+"""Tests for the loop-preserving place.Repeat rewrites."""
+
+from bloqade.native.dialects.gate import stmts as gate
+from kirin import ir, rewrite, types as kirin_types
+from kirin.analysis import const
+from kirin.dialects import ilist, py, scf
+
+from bloqade import qubit, types as bloqade_types
+from bloqade.lanes.dialects import place
+from bloqade.lanes.rewrite.repeat import (
+    ExpandRepeat,
+    RewriteLoopsToRepeat,
+    is_placeable_repeat,
+)
+
+
+def _qubits(n: int) -> tuple[ir.SSAValue, ...]:
+    return tuple(ir.TestValue(type=bloqade_types.QubitType) for _ in range(n))
+
+
+def _gate_body(qubits: tuple[ir.SSAValue, ...]) -> list[ir.Statement]:
+    """``CZ(q0, q1)`` with its qubit lists built inside the body."""
+    controls = ilist.New(values=(qubits[0],))
+    targets = ilist.New(values=(qubits[1],))
+    return [controls, targets, gate.CZ(controls.result, targets.result)]
+
+
+def _build_loop(count: int, *, use_loop_var: bool = False) -> tuple[ir.Block, scf.For]:
+    qubits = _qubits(2)
+    iterable = py.Constant(range(count))
+    iterable.result.hints["const"] = const.Value(range(count))
+
+    body_block = ir.Block()
+    loop_var = body_block.args.append_from(kirin_types.Int, name="i")
+    for stmt in _gate_body(qubits):
+        body_block.stmts.append(stmt)
+    if use_loop_var:
+        body_block.stmts.append(ilist.New(values=(loop_var,)))
+    body_block.stmts.append(scf.Yield())
+
+    loop = scf.For(iterable.result, ir.Region(body_block))
+    return ir.Block([iterable, loop]), loop
+
+
+def _build_repeat(count: int, stmts: list[ir.Statement]) -> place.Repeat:
+    body_block = ir.Block(stmts)
+    body_block.stmts.append(scf.Yield())
+    return place.Repeat(count=count, body=ir.Region(body_block))
+
+
+def test_loop_with_constant_trip_count_becomes_repeat():
+    block, _ = _build_loop(3)
+
+    result = rewrite.Walk(RewriteLoopsToRepeat()).rewrite(block)
+
+    assert result.has_done_something
+    (repeat,) = [s for s in block.stmts if isinstance(s, place.Repeat)]
+    assert repeat.count == 3
+    body_types = [type(s) for s in repeat.body.blocks[0].stmts]
+    assert body_types == [ilist.New, ilist.New, gate.CZ, scf.Yield]
+    assert not any(isinstance(s, scf.For) for s in block.stmts)
+    repeat.check()
+
+
+def test_loop_reading_loop_variable_is_kept():
+    block, loop = _build_loop(3, use_loop_var=True)
+
+    result = rewrite.Walk(RewriteLoopsToRepeat()).rewrite(block)
+
+    assert not result.has_done_something
+    assert loop.parent_block is block
+
+
+def _build_carried_loop(*, update: bool) -> tuple[ir.Block, scf.For, ilist.New]:
+    """Loop threading a qubit list through ``iter_args`` like the lowering does."""
+    qubits = _qubits(2)
+    reg = ilist.New(values=qubits)
+    iterable = py.Constant(range(4))
+    iterable.result.hints["const"] = const.Value(range(4))
+
+    body_block = ir.Block()
+    body_block.args.append_from(kirin_types.Int, name="i")
+    reg_arg = body_block.args.append_from(reg.result.type, name="reg")
+    index = py.Constant(0)
+    qubit_0 = py.indexing.GetItem(reg_arg, index.result)
+    body_block.stmts.append(index)
+    body_block.stmts.append(qubit_0)
+    if update:
+        new_reg = ilist.New(values=(qubit_0.result,))
+        body_block.stmts.append(new_reg)
+        body_block.stmts.append(scf.Yield(new_reg.result))
+    else:
+        body_block.stmts.append(scf.Yield(reg_arg))
+
+    loop = scf.For(iterable.result, ir.Region(body_block), reg.result)
+    consumer = ilist.New(values=tuple(loop.results))
+    return ir.Block([reg, iterable, loop, consumer]), loop, consumer
+
+
+def test_loop_invariant_carried_values_are_forwarded():
+    block, _, consumer = _build_carried_loop(update=False)
+    reg = block.first_stmt
+
+    assert rewrite.Walk(RewriteLoopsToRepeat()).rewrite(block).has_done_something
+
+    (repeat,) = [s for s in block.stmts if isinstance(s, place.Repeat)]
+    assert repeat.count == 4
+    get_item = repeat.body.blocks[0].stmts.at(1)
+    assert isinstance(get_item, py.indexing.GetItem)
+    assert get_item.args[0] is reg.result
+    assert consumer.args[0] is reg.result
+    repeat.check()
+
+
+def test_loop_updating_carried_value_is_kept():
+    block, loop, _ = _build_carried_loop(update=True)
+
+    assert not rewrite.Walk(RewriteLoopsToRepeat()).rewrite(block).has_done_something
+    assert loop.parent_block is block
+
+
+def test_single_iteration_loop_is_kept():
+    block, loop = _build_loop(1)
+
+    assert not rewrite.Walk(RewriteLoopsToRepeat()).rewrite(block).has_done_something
+    assert loop.parent_block is block
+
+
+def test_expand_repeat_clones_body_per_iteration():
+    qubits = _qubits(2)
+    repeat = _build_repeat(3, _gate_body(qubits))
+    block = ir.Block([repeat])
+
+    rewrite.Walk(ExpandRepeat()).rewrite(block)
+
+    stmts = list(block.stmts)
+    assert [type(s) for s in stmts] == [ilist.New, ilist.New, gate.CZ] * 3
+    czs = [s for s in stmts if isinstance(s, gate.CZ)]
+    # every copy reads the qubit lists built by its own iteration
+    for cz, prev in zip(czs, (stmts[1], stmts[4], stmts[7])):
+        assert cz.targets is prev.results[0]
+    assert all(cz.args[0].owner.args[0] is qubits[0] for cz in czs)
+
+
+def test_expand_nested_repeat():
+    qubits = _qubits(2)
+    inner = _build_repeat(2, _gate_body(qubits))
+    outer = _build_repeat(3, [inner])
+    block = ir.Block([outer])
+
+    rewrite.Walk(ExpandRepeat()).rewrite(block)
+
+    assert sum(isinstance(s, gate.CZ) for s in block.stmts) == 6
+    assert not any(isinstance(s, place.Repeat) for s in block.walk())
+
+
+def test_expand_repeat_respects_predicate():
+    qubits = _qubits(2)
+    measure_list = ilist.New(values=qubits)
+    unplaceable = _build_repeat(
+        2, [measure_list, qubit.stmts.Measure(measure_list.result)]
+    )
+    placeable = _build_repeat(2, _gate_body(qubits))
+    block = ir.Block([unplaceable, placeable])
+
+    assert is_placeable_repeat(placeable)
+    assert not is_placeable_repeat(unplaceable)
+
+    rewrite.Walk(ExpandRepeat(lambda node: not is_placeable_repeat(node))).rewrite(
+        block
+    )
+
+    assert [s for s in block.stmts if isinstance(s, place.Repeat)] == [placeable]
+    assert sum(isinstance(s, qubit.stmts.Measure) for s in block.stmts) == 2
@@ -0,0 +1,131 @@
+"""Tests for ScheduleStaticPlacement (one-pass reorder + fuse)."""
+
+from kirin import ir, rewrite, types as kirin_types
+from kirin.dialects import ilist
+
+from bloqade import types as bloqade_types
+from bloqade.lanes import types as lanes_types
+from bloqade.lanes.dialects import place
+from bloqade.lanes.rewrite.fuse_gates import FuseAdjacentGates
+from bloqade.lanes.rewrite.reorder_static_placement import (
+    ReorderStaticPlacement,
+    ScheduleStaticPlacement,
+    alap_reorder_policy,
+    asap_reorder_policy,
+)
+
+
+def _build_outer(num_qubits: int = 4) -> tuple[ir.Block, list[ir.Statement]]:
+    """R/Rz/CZ body with independent gates that ASAP/ALAP move and fuse:
+    ``R(q0) R(q1) CZ(q0,q2) Rz(q3) R(q2) Rz(q1) EndMeasure(q0..q3)``.
+    """
+    body_block = ir.Block()
+    state = body_block.args.append_from(lanes_types.StateType, name="entry_state")
+    axis = ir.TestValue(type=kirin_types.Float)
+    angle = ir.TestValue(type=kirin_types.Float)
+    angle_z = ir.TestValue(type=kirin_types.Float)
+
+    stmts: list[ir.Statement] = []
+
+    def push(stmt: ir.Statement) -> None:
+        nonlocal state
+        body_block.stmts.append(stmt)
+        stmts.append(stmt)
+        state = stmt.results[0]
+
+    push(place.R(state, axis_angle=axis, rotation_angle=angle, qubits=(0,)))
+    push(place.R(state, axis_angle=axis, rotation_angle=angle, qubits=(1,)))
+    push(place.CZ(state, qubits=(0, 2)))
+    push(place.Rz(state, rotation_angle=angle_z, qubits=(3,)))
+    push(place.R(state, axis_angle=axis, rotation_angle=angle, qubits=(2,)))
+    push(place.Rz(state, rotation_angle=angle_z, qubits=(1,)))
+    push(place.EndMeasure(state, qubits=(0, 1, 2, 3)))
+    body_block.stmts.append(place.Yield(state, *stmts[-1].results[1:]))
+
+    sp_qubits = tuple(
+        ir.TestValue(type=bloqade_types.QubitType) for _ in range(num_qubits)
+    )
+    sp = place.StaticPlacement(qubits=sp_qubits, body=ir.Region(body_block))
+    outer = ir.Block([sp])
+    return outer, stmts
+
+
+def _get_sp(outer: ir.Block) -> place.StaticPlacement:
+    for stmt in outer.stmts:
+        if isinstance(stmt, place.StaticPlacement):
+            return stmt
+    raise AssertionError("No StaticPlacement in outer block")
+
+
+def _signature(outer: ir.Block) -> list[tuple[type, tuple[int, ...]]]:
+    return [
+        (type(stmt), stmt.qubits)
+        for stmt in _get_sp(outer).body.blocks[0].stmts
+        if not isinstance(stmt, place.Yield)
+    ]
+
+
+def _assert_state_threaded(outer: ir.Block) -> None:
+    block = _get_sp(outer).body.blocks[0]
+    state = block.args[0]
+    for stmt in block.stmts:
+        assert stmt.args[0] is state
+        state = stmt.results[0]
+
+
+def test_schedule_matches_reorder_then_fuse():
+    for policy in (asap_reorder_policy, alap_reorder_policy):
+        expected, _ = _build_outer()
+        rewrite.Walk(ReorderStaticPlacement(policy)).rewrite(expected)
+        rewrite.Fixpoint(rewrite.Walk(FuseAdjacentGates())).rewrite(expected)
+
+        outer, _ = _build_outer()
+        result = rewrite.Walk(ScheduleStaticPlacement(policy)).rewrite(outer)
+
+        assert result.has_done_something
+        assert _signature(outer) == _signature(expected)
+        _assert_state_threaded(outer)
+
+
+def test_schedule_fuses_same_layer_gates():
+    outer, _ = _build_outer()
+    rewrite.Walk(ScheduleStaticPlacement(asap_reorder_policy)).rewrite(outer)
+
+    assert _signature(outer) == [
+        (place.R, (0, 1)),
+        (place.Rz, (3,)),
+        (place.CZ, (0, 2)),
+        (place.Rz, (1,)),
+        (place.R, (2,)),
+        (place.EndMeasure, (0, 1, 2, 3)),
+    ]
+
+
+def test_schedule_rewires_measurement_results():
+    outer, _ = _build_outer()
+    old_sp = _get_sp(outer)
+    outer.stmts.append(consumer := ilist.New(values=tuple(old_sp.results)))
+
+    rewrite.Walk(ScheduleStaticPlacement(asap_reorder_policy)).rewrite(outer)
+
+    sp = _get_sp(outer)
+    measure = [s for s in sp.body.blocks[0].stmts if isinstance(s, place.EndMeasure)]
+    assert len(measure) == 1
+    yield_stmt = sp.body.blocks[0].last_stmt
+    assert isinstance(yield_stmt, place.Yield)
+    assert tuple(yield_stmt.classical_results) == tuple(measure[0].results[1:])
+    assert tuple(consumer.args) == tuple(sp.results)
+
+
+def test_schedule_idempotence():
+    outer, _ = _build_outer()
+    assert (
+        rewrite.Walk(ScheduleStaticPlacement(asap_reorder_policy))
+        .rewrite(outer)
+        .has_done_something
+    )
+    assert (
+        not rewrite.Walk(ScheduleStaticPlacement(asap_reorder_policy))
+        .rewrite(outer)
+        .has_done_something
+    )
@@ -116,3 +116,25 @@ def test_rewrite_load():
     )
 
     assert_nodes(test_block, expected_block)
+
+
+def test_rewrite_block_states_matches_separate_walks():
+    def make_region():
+        block1 = ir.Block()
+        block1.args.append_from(state.StateType, "current_state")
+        block1.stmts.append(current_state := move.Load())
+        block1.stmts.append(move.Store(current_state.result))
+        block1.stmts.append(none := py.Constant(None))
+        block1.stmts.append(func.Return(none.result))
+        block0 = ir.Block([cf.Branch((), successor=block1)])
+        return ir.Region([block0, block1])
+
+    expected = make_region()
+    rewrite.Walk(state.RewriteBranches()).rewrite(expected)
+    rewrite.Walk(state.RewriteLoadStore()).rewrite(expected)
+
+    region = make_region()
+    state.RewriteBlockStates().rewrite(region)
+
+    for test_block, expected_block in zip(region.blocks, expected.blocks):
+        assert_nodes(test_block, expected_block)
@@ -1,7 +1,9 @@
 import importlib.util
 import inspect
 import math
+import os
 from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
 from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock
 
@@ -17,7 +19,7 @@ from bloqade.gemini import (
     SimulatorResult as GeminiSimulatorResult,
     logical as gemini_logical,
 )
-from bloqade.gemini.compile import append_measurements_and_annotations
+from bloqade.gemini.compile import BatchCompiler, append_measurements_and_annotations
 from bloqade.gemini.cudaq import cudaq_to_squin
 from bloqade.gemini.device import (
     BackendSample,
@@ -249,6 +251,63 @@ def test_result_property_caching():
     assert return_values_first is return_values_second
 
 
+@gemini_logical.kernel(aggressive_unroll=True)
+def repeated_stage_kernel():
+    reg = qubit.qalloc(3)
+    for _ in range(3):
+        squin.cx(reg[0], reg[1])
+        squin.cx(reg[1], reg[2])
+    gemini_logical.terminal_measure(reg)
+
+
+@pytest.mark.slow
+def test_tasks_match_serial_compilation():
+    """Batch compilation returns the serial results, in submission order."""
+    sim = GeminiLogicalSimulator()
+    kernels = [main, repeated_stage_kernel, small_backend_kernel, main]
+
+    with BatchCompiler(max_workers=2) as compiler:
+        batch = sim.tasks(kernels, compiler=compiler)
+
+    assert len(batch) == len(kernels)
+    for kernel, task in zip(kernels, batch):
+        serial = sim.task(kernel)
+        assert task.logical_squin_kernel.callable_region.is_structurally_equal(
+            serial.logical_squin_kernel.callable_region
+        )
+        assert task.physical_move_kernel.callable_region.is_structurally_equal(
+            serial.physical_move_kernel.callable_region
+        )
+        assert task.physical_move_kernel.dialects.data == (
+            serial.physical_move_kernel.dialects.data
+        )
+
+
+@pytest.mark.slow
+def test_batch_compiler_replaces_a_broken_pool():
+    """A worker that dies breaks the pool; later batches get a fresh one."""
+    sim = GeminiLogicalSimulator()
+    serial = sim.task(small_backend_kernel)
+
+    with BatchCompiler(max_workers=1) as compiler:
+        broken = compiler.executor
+        with pytest.raises(BrokenProcessPool):
+            broken.submit(os._exit, 1).result()
+
+        for _ in range(2):
+            (task,) = sim.tasks([small_backend_kernel], compiler=compiler)
+            assert task.physical_move_kernel.callable_region.is_structurally_equal(
+                serial.physical_move_kernel.callable_region
+            )
+        assert compiler._executor is not None
+        assert compiler._executor is not broken
+
+
+def test_tasks_rejects_non_method():
+    with pytest.raises(TypeError, match="requires Squin ir.Methods"):
+        GeminiLogicalSimulator().tasks([main, _plain_callable])  # type: ignore[list-item]
+
+
 def test_detector_result_rejects_unavailable_values():
     detector_error_model = DetectorErrorModel()
     result = DetectorResult[None](
@@ -550,6 +609,24 @@ def test_run_uses_native_backend_detector_and_observable_samples():
     assert result._observables == observables.tolist()
 
 
+def test_fidelity_bounds_are_computed_once_per_task(monkeypatch):
+    from bloqade.lanes.analysis import fidelity as fidelity_analysis
+
+    calls = []
+
+    def fake_fidelity_bounds(kernel):
+        calls.append(kernel)
+        return (0.5, 0.9)
+
+    monkeypatch.setattr(fidelity_analysis, "fidelity_bounds", fake_fidelity_bounds)
+    task = object.__new__(GeminiLogicalSimulatorTask)
+    object.__setattr__(task, "physical_squin_kernel", "noisy-kernel")
+
+    assert task.fidelity_bounds() == (0.5, 0.9)
+    assert task.fidelity_bounds() == (0.5, 0.9)
+    assert calls == ["noisy-kernel"]
+
+
 @pytest.mark.parametrize(
     "sample, message",
     [
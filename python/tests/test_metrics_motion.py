@@ -257,3 +257,64 @@ def test_analyze_move_time_prices_events_through_motion_model():
     assert event.event_duration_us == pytest.approx(max(event.lane_durations_us))
     assert event.event_duration_us > 0.0
     assert result.total_move_time_us == pytest.approx(event.event_duration_us)
+
+
+def test_move_ir_is_compiled_once_per_kernel_and_strategy(monkeypatch):
+    """The high-level analyses share one memoized compilation per kernel."""
+    import bloqade.lanes.metrics as metrics_module
+
+    arch_spec = ArchSpec(RustArchSpec.from_json_validated(CHAIN_ARCH_JSON))
+
+    @kernel
+    def main():
+        state0 = move.load()
+        state1 = move.fill(
+            state0,
+            location_addresses=(
+                move.LocationAddress(0, 0),
+                move.LocationAddress(1, 0),
+            ),
+        )
+        state2 = move.logical_initialize(
+            state1,
+            thetas=(0.0, 0.0),
+            phis=(0.0, 0.0),
+            lams=(0.0, 0.0),
+            location_addresses=(
+                move.LocationAddress(0, 0),
+                move.LocationAddress(1, 0),
+            ),
+        )
+        state3 = move.move(
+            state2,
+            lanes=(WordLaneAddress(0, 0, 0), WordLaneAddress(1, 0, 0)),
+        )
+        state4 = move.cz(state3, zone_address=ZoneAddress(0))
+        future = move.end_measure(state4, zone_addresses=(move.ZoneAddress(0),))
+        return move.get_future_result(
+            future,
+            zone_address=move.ZoneAddress(0),
+            location_address=move.LocationAddress(1, 0),
+        )
+
+    compiled: list[object] = []
+
+    def fake_compile(mt, *, layout_heuristic, placement_strategy):
+        compiled.append(mt)
+        return main
+
+    monkeypatch.setattr(metrics_module, "_logical_squin_to_move", fake_compile)
+
+    logical_kernel, strategy = object(), object()
+    metrics = Metrics(arch_spec=arch_spec)
+    moves = metrics.analyze_moves(logical_kernel, placement_strategy=strategy)
+    move_time = metrics.analyze_move_time(logical_kernel, placement_strategy=strategy)
+    assert compiled == [logical_kernel]
+    assert moves.moved_lane_count == 2
+    assert move_time.total_move_time_us > 0.0
+
+    metrics.analyze_moves(logical_kernel, placement_strategy=object())
+    assert len(compiled) == 2
+    metrics.clear_cache()
+    metrics.analyze_moves(logical_kernel, placement_strategy=strategy)
+    assert len(compiled) == 3
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import pytest
 from kirin import ir, types
 
 from bloqade.lanes.bytecode._native import LocationAddress as RustLocationAddress
@@ -24,6 +25,10 @@ class _KirinWrapped(KirinRustWrapper[RustLocationAddress]):
         self._inner = RustLocationAddress(zone_id, word_id, site_id)
         self.__post_init__()
 
+    @classmethod
+    def decode(cls, encoded: int) -> _KirinWrapped:
+        return cls.from_inner(RustLocationAddress.decode(encoded))
+
 
 # ── RustWrapper ──
 
@@ -140,3 +145,65 @@ def test_kirinwrapper_eq_and_hash_inherited() -> None:
     b = _KirinWrapped.from_inner(RustLocationAddress(1, 2, 3))
     assert a == b
     assert hash(a) == hash(b)
+
+
+def test_kirinwrapper_requires_decode() -> None:
+    """Deserialization calls decode, so a subclass must implement it."""
+
+    class _NoDecode(KirinRustWrapper[RustLocationAddress]):
+        pass
+
+    with pytest.raises(TypeError, match="decode"):
+        _NoDecode.from_inner(RustLocationAddress(1, 2, 3))
+
+    x = _KirinWrapped(1, 2, 3)
+    assert _KirinWrapped.decode(x.encode()) == x
+
+
+# ── Serialization ──
+
+
+def test_address_attributes_survive_json_round_trip() -> None:
+    """Move IR with address attributes can be shipped as Kirin JSON."""
+    from kirin.dialects import func
+
+    from bloqade.lanes.bytecode.encoding import (
+        Direction,
+        LaneAddress,
+        LocationAddress,
+        MoveType,
+        ZoneAddress,
+    )
+    from bloqade.lanes.dialects import move
+
+    zone = ZoneAddress(0)
+    locs = (LocationAddress(0, 0, 0), LocationAddress(0, 1, 0))
+    lanes = (LaneAddress(MoveType.SITE, 0, 0, 0, Direction.FORWARD),)
+    load = move.Load()
+    fill = move.Fill(current_state=load.result, location_addresses=locs)
+    mv = move.Move(current_state=fill.result, lanes=lanes)
+    cz = move.CZ(current_state=mv.result, zone_address=zone)
+    store = move.Store(current_state=cz.result)
+    none = func.ConstantNone()
+    block = ir.Block(argtypes=(types.MethodType,))
+    for stmt in (load, fill, mv, cz, store, none, func.Return(none.result)):
+        block.stmts.append(stmt)
+    code = func.Function(
+        sym_name="main",
+        signature=func.Signature((), types.NoneType),
+        slots=(),
+        body=ir.Region(blocks=block),
+    )
+    dialects = ir.DialectGroup([move.dialect, func.dialect])
+    method = ir.Method(dialects=dialects, code=code, sym_name="main", arg_names=[])
+
+    decoded = dialects.decode_json(dialects.encode_json(method))
+
+    assert decoded.callable_region.is_structurally_equal(method.callable_region)
+    stmts = list(decoded.callable_region.blocks[0].stmts)
+    assert isinstance(stmts[1], move.Fill)
+    assert stmts[1].location_addresses == locs
+    assert isinstance(stmts[2], move.Move)
+    assert stmts[2].lanes == lanes
+    assert isinstance(stmts[3], move.CZ)
+    assert stmts[3].zone_address == zone
@@ -58,3 +58,21 @@ def test_address_invalid_location(mt: ir.Method):
 
     with pytest.raises(ValidationErrorGroup):
         result.raise_if_invalid()
+
+
+def test_address_errors_are_reported_on_their_statement():
+    @lanes_kernel
+    def kernel(state: State):
+        state = move.fill(state, location_addresses=(LocationAddress(0, 0),))
+        state = move.fill(state, location_addresses=(LocationAddress(99, 0),))
+        return move.move(state, lanes=(SiteLaneAddress(0, 0, 10, Direction.FORWARD),))
+
+    _, errors = validation.AddressValidation().run(kernel)
+
+    fills = [
+        stmt for stmt in kernel.callable_region.walk() if isinstance(stmt, move.Fill)
+    ]
+    assert {error.node for error in errors} == {
+        fills[1],
+        *(s for s in kernel.callable_region.walk() if isinstance(s, move.Move)),
+    }
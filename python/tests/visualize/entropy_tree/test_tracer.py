@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import struct
+
 import pytest
 
 from bloqade import squin
@@ -13,6 +15,7 @@ from bloqade.lanes.visualize.entropy_tree.tracer import (
     _decode_config,
     _decode_lane,
     build_entropy_trace,
+    load_sampled_trace,
 )
 
 
@@ -42,6 +45,35 @@ def test_decode_config_returns_qid_mapping():
     }
 
 
+def test_load_sampled_trace_decodes_records(tmp_path):
+    # One descend record: node 4 from 1 at depth 2, one site-bus lane
+    # (word 5, site 7, bus 2, forward, zone 0), qubit 0 at (zone 1, word 2,
+    # site 3).
+    lane = (5 << 16 | 7) | (2 << 32)
+    loc = (1 << 56) | (2 << 40) | (3 << 24)
+    record = struct.pack("<BIIIIII", 2, 4, 1, 2, 1, 3, 1)
+    record += struct.pack("<Q", lane)
+    record += struct.pack("<I", 1) + struct.pack("<IQ", 0, loc)
+    path = tmp_path / "sample.bin"
+    path.write_bytes(b"BLQTRACE" + struct.pack("<I", 1) + record)
+
+    (step,) = load_sampled_trace(path)
+    assert step.event == "descend"
+    assert (step.node_id, step.parent_node_id, step.depth) == (4, 1, 2)
+    assert step.unresolved_count == 3
+    assert step.moveset == frozenset(
+        {LaneAddress(MoveType.SITE, 5, 7, 2, Direction.FORWARD, 0)}
+    )
+    assert step.configuration == {0: LocationAddress(2, 3, 1)}
+
+
+def test_load_sampled_trace_rejects_foreign_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"NOTATRACE")
+    with pytest.raises(ValueError):
+        load_sampled_trace(path)
+
+
 @pytest.mark.slow
 def test_build_entropy_trace_targets_all_qubits_without_spectator_blocking():
     """With ``block_spectators`` off (the default), every qubit in the block is